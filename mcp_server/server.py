@@ -35,6 +35,7 @@ from core.portfolio_metrics_calculator import (  # noqa: E402
     PortfolioMetrics,
     PortfolioMetricsCalculator,
 )
+from core.state_files import read_frame, read_metadata, read_rows, take_rows  # noqa: E402
 from core.statistics import (  # noqa: E402
     calculate_mae_before_win,
     calculate_mfe_before_loss,
@@ -115,6 +116,9 @@ class LoadedDataset:
 # Global session state — persists for the MCP session lifetime
 _datasets: dict[str, LoadedDataset] = {}
 
+# GUI state file each synced dataset was built from, per alias prefix
+_gui_synced_files: dict[str, dict[str, str]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -1432,9 +1436,11 @@ async def lumen_get_gui_state() -> str:
         except Exception:
             payload["staleness_seconds"] = None
 
-    # Report available parquet files
-    payload["baseline_parquet_available"] = (state_dir / "baseline_data.parquet").exists()
-    payload["filtered_parquet_available"] = (state_dir / "filtered_data.parquet").exists()
+    # Report available data files
+    baseline_file = payload.get("baseline_file")
+    filtered_file = (payload.get("filtered") or {}).get("file")
+    payload["baseline_available"] = bool(baseline_file) and (state_dir / baseline_file).exists()
+    payload["filtered_available"] = bool(filtered_file) and (state_dir / filtered_file).exists()
 
     return json.dumps(payload, indent=2, default=str)
 
@@ -1466,8 +1472,10 @@ class SyncFromGuiInput(BaseModel):
 async def lumen_sync_from_gui(params: SyncFromGuiInput) -> str:
     """Load DataFrames from the running Lumen GUI into the MCP dataset store.
 
-    Reads baseline and filtered parquet files exported by the GUI and makes
-    them available for lumen_query_data and lumen_compute_metrics.
+    Memory-maps the baseline Arrow file exported by the GUI and rebuilds the
+    filtered view by taking its selected rows from that baseline, making both
+    available for lumen_query_data and lumen_compute_metrics. Datasets whose
+    state file has not changed since the last sync are reused as they are.
 
     Args:
         params (SyncFromGuiInput): Validated input containing:
@@ -1529,52 +1537,78 @@ async def lumen_sync_from_gui(params: SyncFromGuiInput) -> str:
 
     source_file = meta.get("source_file", "gui")
 
-    # Load baseline
-    baseline_path = state_dir / "baseline_data.parquet"
-    if baseline_path.exists():
-        try:
-            df_baseline = pd.read_parquet(baseline_path)
-            alias_b = f"{prefix}_baseline"
-            _datasets[alias_b] = LoadedDataset(
-                df=df_baseline,
-                mapping=mapping,
-                file_path=source_file,
-                alias=alias_b,
-            )
-            result["synced"].append(
-                {
-                    "alias": alias_b,
-                    "rows": len(df_baseline),
-                    "columns": list(df_baseline.columns),
-                }
-            )
-        except Exception as e:
-            result["baseline_error"] = str(e)
+    synced_files = _gui_synced_files.setdefault(prefix, {})
 
-    # Load filtered
-    filtered_path = state_dir / "filtered_data.parquet"
-    if filtered_path.exists():
-        try:
-            df_filtered = pd.read_parquet(filtered_path)
-            alias_f = f"{prefix}_filtered"
-            _datasets[alias_f] = LoadedDataset(
-                df=df_filtered,
+    def _store(alias: str, df: pd.DataFrame, data_file: str, reused: bool) -> None:
+        if not reused:
+            _datasets[alias] = LoadedDataset(
+                df=df,
                 mapping=mapping,
                 file_path=source_file,
-                alias=alias_f,
+                alias=alias,
             )
-            result["synced"].append(
-                {
-                    "alias": alias_f,
-                    "rows": len(df_filtered),
-                    "columns": list(df_filtered.columns),
-                }
-            )
-        except Exception as e:
-            result["filtered_error"] = str(e)
+            synced_files[alias] = data_file
+        result["synced"].append(
+            {
+                "alias": alias,
+                "rows": len(df),
+                "columns": list(df.columns),
+                "reused": reused,
+            }
+        )
+
+    def _loaded(alias: str, data_file: str) -> pd.DataFrame | None:
+        """DataFrame already synced from data_file, if still in the store."""
+        if synced_files.get(alias) == data_file and alias in _datasets:
+            return _datasets[alias].df
+        return None
+
+    # Load baseline (memory-mapped Arrow IPC file); a baseline synced earlier
+    # from the same file is reused without reading it again
+    alias_b = f"{prefix}_baseline"
+    df_baseline: pd.DataFrame | None = None
+    baseline_file = meta.get("baseline_file")
+    if baseline_file:
+        df_baseline = _loaded(alias_b, baseline_file)
+        if df_baseline is not None:
+            _store(alias_b, df_baseline, baseline_file, reused=True)
+        elif (state_dir / baseline_file).exists():
+            try:
+                df_baseline = read_frame(state_dir / baseline_file)
+                _store(alias_b, df_baseline, baseline_file, reused=False)
+            except Exception as e:
+                result["baseline_error"] = str(e)
+
+    # Load filtered: a selection of baseline rows taken from the baseline
+    # above, or a full frame when the view is not a row subset
+    alias_f = f"{prefix}_filtered"
+    filtered = meta.get("filtered") or {}
+    filtered_file = filtered.get("file")
+    if filtered_file:
+        df_filtered = _loaded(alias_f, filtered_file)
+        if df_filtered is not None:
+            _store(alias_f, df_filtered, filtered_file, reused=True)
+        elif (state_dir / filtered_file).exists():
+            try:
+                path = state_dir / filtered_file
+                if filtered.get("kind") == "rows":
+                    if df_baseline is None:
+                        raise ValueError(
+                            "Filtered rows need the baseline, which could not be loaded"
+                        )
+                    if read_metadata(path).get("baseline_file") != baseline_file:
+                        raise ValueError("Filtered rows belong to a different baseline")
+                    df_filtered = take_rows(df_baseline, read_rows(path))
+                else:
+                    df_filtered = read_frame(path)
+                _store(alias_f, df_filtered, filtered_file, reused=False)
+            except Exception as e:
+                result["filtered_error"] = str(e)
+        if filtered.get("version") is not None:
+            result["filter_version"] = filtered["version"]
 
     if not result["synced"]:
-        result["error"] = "No parquet files found in GUI state directory."
+        result["error"] = "No data files found in GUI state directory."
         result["hint"] = "Load data in the Lumen GUI first."
 
     return json.dumps(result, indent=2, default=str)
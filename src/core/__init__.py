@@ -2,6 +2,7 @@
 
 from .export_manager import ExportManager
 from .filter_engine import FilterEngine
+from .filter_expression import FilterExpression
 from .models import FilterCriteria
 from .monte_carlo import (
     MonteCarloConfig,
@@ -9,6 +10,7 @@ from .monte_carlo import (
     MonteCarloResults,
     PositionSizingMode,
     extract_gains_from_app_state,
+    extract_trade_days_from_app_state,
 )
 from .feature_analyzer import (
     FeatureAnalyzer,
@@ -22,12 +24,14 @@ from .feature_analyzer import (
 __all__ = [
     "ExportManager",
     "FilterEngine",
+    "FilterExpression",
     "FilterCriteria",
     "MonteCarloConfig",
     "MonteCarloEngine",
     "MonteCarloResults",
     "PositionSizingMode",
     "extract_gains_from_app_state",
+    "extract_trade_days_from_app_state",
     "FeatureAnalyzer",
     "FeatureAnalyzerConfig",
     "FeatureAnalyzerResults",
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 import pandas as pd
+import pyarrow as pa
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from src.core.cache_manager import INTERNAL_COLUMNS
 from src.core.models import AdjustmentParams, MetricsUserInputs
 from src.core.visibility_tracker import VisibilityTracker
 
 if TYPE_CHECKING:
+    from src.core.column_store import ColumnStore
     from src.core.models import ColumnMapping, FilterCriteria, TradingMetrics, StopScenario, OffsetScenario
     from src.core.monte_carlo import MonteCarloResults
+    from src.core.trade_matrix import TradeMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +31,13 @@ class AppState(QObject):
 
     Attributes:
         raw_df: Original DataFrame as loaded from file.
+        column_store: Cached Parquet file holding the columns that were not
+            loaded with raw_df (column-projected loading), or None.
         baseline_df: DataFrame after first trigger algorithm applied.
         filtered_df: DataFrame after user filters applied.
         column_mapping: Mapping of required columns to DataFrame column names.
         filters: List of active filter criteria.
+        filter_expression: Filter expression text combined with the filters.
         first_trigger_enabled: Whether first trigger filtering is enabled.
         baseline_metrics: TradingMetrics calculated from baseline data.
         filtered_metrics: TradingMetrics calculated from filtered data.
@@ -83,10 +91,16 @@ class AppState(QObject):
         self.source_file_path: str = ""
         self.source_sheet: str = ""
         self.raw_df: pd.DataFrame | None = None
+        # Source of columns left on disk by a column-projected load
+        self.column_store: ColumnStore | None = None
         self.baseline_df: pd.DataFrame | None = None
         self.filtered_df: pd.DataFrame | None = None
+        # Columnar numeric view of baseline_df, built once after mapping
+        self.trade_matrix: TradeMatrix | None = None
         self.column_mapping: ColumnMapping | None = None
         self.filters: list[FilterCriteria] = []
+        # Filter expression text ANDed with the column filters ("" for none)
+        self.filter_expression: str = ""
         self.first_trigger_enabled: bool = True
         # Date/time range filter state (for Parameter Sensitivity)
         self.date_start: str | None = None
@@ -125,6 +139,76 @@ class AppState(QObject):
         """
         return self.baseline_df is not None and self.column_mapping is not None
 
+    def trade_matrix_for(self, df: pd.DataFrame) -> TradeMatrix | None:
+        """Return the trade matrix rows matching a baseline-derived DataFrame.
+
+        Rows are matched by index label, and the mapped gain column is
+        compared to make sure the labels really come from baseline_df.
+
+        Args:
+            df: DataFrame whose index labels come from baseline_df
+                (e.g. filtered_df or first triggers).
+
+        Returns:
+            TradeMatrix aligned with ``df``, or None if no matrix is available
+            or ``df`` contains rows the matrix does not know about.
+        """
+        if self.trade_matrix is None:
+            return None
+        gain_col = self.column_mapping.gain_pct if self.column_mapping is not None else None
+        gains = df[gain_col] if gain_col and gain_col in df.columns else None
+        try:
+            return self.trade_matrix.select(df.index, gains)
+        except KeyError:
+            logger.debug("Frame does not line up with the trade matrix; using DataFrames")
+            return None
+
+    def column_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Describe every column available for a frame, loaded or not.
+
+        Use it instead of ``df`` when listing columns (e.g. with
+        ``select_dtypes``) so columns still on disk are offered too, and
+        internal bookkeeping columns (INTERNAL_COLUMNS) are not.
+
+        Args:
+            df: DataFrame derived from raw_df (baseline_df, filtered_df, ...).
+
+        Returns:
+            ``df`` itself when all columns are loaded and none is internal,
+            otherwise a zero-row frame with the user-facing columns and
+            their dtypes.
+        """
+        schema = df if self.column_store is None else self.column_store.schema_frame(df)
+        internal = [column for column in INTERNAL_COLUMNS if column in schema.columns]
+        if internal:
+            schema = schema.iloc[:0].drop(columns=internal)
+        return schema
+
+    def ensure_columns(self, columns: Iterable[str]) -> list[str]:
+        """Load columns left on disk into raw_df, baseline_df and filtered_df.
+
+        Frames are updated in place, so existing references see the columns.
+        Columns that are already loaded or unknown are ignored.
+
+        Args:
+            columns: Columns about to be used.
+
+        Returns:
+            Names of the columns that were read.
+        """
+        if self.column_store is None:
+            return []
+        columns = list(columns)
+        frames: list[pd.DataFrame] = []
+        for df in (self.raw_df, self.baseline_df, self.filtered_df):
+            if df is not None and not any(df is frame for frame in frames):
+                frames.append(df)
+        try:
+            return self.column_store.fill(frames, columns)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logger.warning("Could not load columns %s: %s", columns, e)
+            return []
+
     @property
     def is_calculating_filtered(self) -> bool:
         """Check if filtered metrics calculation is in progress.
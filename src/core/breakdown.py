@@ -5,6 +5,7 @@ import logging
 import numpy as np
 import pandas as pd
 
+from src.core.date_utils import resolve_dates
 from src.core.equity import EquityCalculator
 from src.core.models import AdjustmentParams
 
@@ -69,7 +70,7 @@ class BreakdownCalculator:
         # Sort by date to ensure correct equity curve calculation
         df = df.copy()
         df = df.sort_values(date_col).reset_index(drop=True)
-        df["_year"] = pd.to_datetime(df[date_col], dayfirst=True, format="mixed").dt.year
+        df["_year"] = resolve_dates(df, date_col).dt.year
 
         # Apply adjustments if configured, otherwise use raw gains
         # Store in temporary column for use in calculations
@@ -148,7 +149,7 @@ class BreakdownCalculator:
         # Sort by date to ensure correct equity curve calculation
         df = df.copy()
         df = df.sort_values(date_col).reset_index(drop=True)
-        dates = pd.to_datetime(df[date_col], dayfirst=True, format="mixed")
+        dates = resolve_dates(df, date_col)
 
         df["_year"] = dates.dt.year
         df["_month"] = dates.dt.month
@@ -350,5 +351,5 @@ class BreakdownCalculator:
         if df.empty:
             return []
 
-        years = pd.to_datetime(df[date_col], dayfirst=True, format="mixed").dt.year.unique()
+        years = resolve_dates(df, date_col).dt.year.dropna().unique()
         return sorted(years.tolist())
@@ -1,43 +1,180 @@
 """Parquet cache management for faster file loads."""
 
 import contextlib
+import dataclasses
 import hashlib
+import json
 import logging
+import os
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from src.core.column_store import ColumnStore
+from src.core.exceptions import LoadCancelledError
+from src.core.file_loader import csv_type_overrides, probe_csv_schema
+from src.core.models import AdjustmentParams, ColumnMapping
+from src.core.trade_matrix import CHANGE_INTERVALS
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cached Parquet layout or loader output changes so that
+# caches written by older versions are never served.
+CACHE_FORMAT_VERSION = 2
+
+# Default upper bound for the total size of cached Parquet files
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024**3
+
+# Sampled fingerprint: number of blocks hashed and the size of each block.
+# Files no larger than SAMPLE_COUNT * SAMPLE_BLOCK_SIZE are hashed in full.
+SAMPLE_COUNT = 16
+SAMPLE_BLOCK_SIZE = 64 * 1024
+
+_FULL_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Bytes of CSV parsed per streamed block; the first block is also the
+# sample used to infer column types
+DEFAULT_STREAM_BLOCK_SIZE = 32 * 1024 * 1024
+
+# Columns added by MappingWorker that are stored in the derived-column sidecar
+DERIVED_COLUMNS = (
+    "trigger_number",
+    "_trigger_group",
+    "_date_ns",
+    "adjusted_gain_pct",
+    "time_minutes",
+    *(f"change_{interval}_min" for interval in CHANGE_INTERVALS),
+)
+
+# Derived columns for internal bookkeeping, never offered as user columns
+INTERNAL_COLUMNS = tuple(column for column in DERIVED_COLUMNS if column.startswith("_"))
+
+
+def file_fingerprint(file_path: Path, full_hash: bool = False) -> str:
+    """Compute a content fingerprint for a source file.
+
+    The fingerprint is the file size plus a BLAKE2b digest of evenly spaced
+    sample blocks (always including the first and last block). It does not
+    depend on the path or modification time, so moved, copied or touched
+    files keep their fingerprint. A sampled fingerprint misses same-size
+    edits outside the sampled blocks; CacheManager settles those with a full
+    hash when the file's modification time changed.
+
+    Args:
+        file_path: Path to the source file.
+        full_hash: Hash the entire file instead of sampled blocks.
+
+    Returns:
+        Fingerprint string of the form ``"<size>-<mode>-<hex digest>"``.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    size = file_path.stat().st_size
+    digest = hashlib.blake2b(digest_size=16)
+
+    with open(file_path, "rb") as f:
+        if full_hash or size <= SAMPLE_COUNT * SAMPLE_BLOCK_SIZE:
+            while chunk := f.read(_FULL_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        else:
+            last_offset = size - SAMPLE_BLOCK_SIZE
+            for i in range(SAMPLE_COUNT):
+                f.seek(last_offset * i // (SAMPLE_COUNT - 1))
+                digest.update(f.read(SAMPLE_BLOCK_SIZE))
+
+    mode = "full" if full_hash else "sampled"
+    return f"{size}-{mode}-{digest.hexdigest()}"
+
 
 class CacheManager:
     """Manage Parquet cache for faster file loads.
 
     Caches loaded DataFrames as Parquet files in `.lumen_cache/` for
     10-20x faster subsequent loads compared to Excel/CSV sources.
+
+    Cache entries are content-addressed: the key is derived from a fingerprint
+    of the file contents, the sheet name and CACHE_FORMAT_VERSION. Identical
+    files share an entry regardless of their path, and entries written by
+    other cache format versions are ignored and evicted. The total size of
+    the cache is bounded, evicting least recently used entries first.
+
+    With sampled fingerprints, each entry also has a ``.source.json`` record
+    of the size, modification time and full-content fingerprint of the file
+    it was built from. An entry is served when the size and modification
+    time still match, or when a full hash of the file matches the record;
+    otherwise the file was edited outside the sampled blocks and the entry
+    is treated as missing.
+
+    A second tier stores the columns MappingWorker derives after mapping
+    (trigger numbers, adjusted gains, time columns) as a Parquet sidecar
+    keyed on the source fingerprint, ColumnMapping and AdjustmentParams.
     """
 
-    def __init__(self, cache_dir: Path = Path(".lumen_cache")) -> None:
+    def __init__(
+        self,
+        cache_dir: Path = Path(".lumen_cache"),
+        max_size_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        full_hash: bool = False,
+    ) -> None:
         """Initialize CacheManager.
 
         Args:
             cache_dir: Directory for cache files. Created if doesn't exist.
+            max_size_bytes: Maximum total size of cached Parquet files. Least
+                recently used entries are evicted after each save.
+            full_hash: Fingerprint source files by hashing their full contents
+                instead of sampled blocks.
         """
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.full_hash = full_hash
+        # Fingerprints keyed by (path, size, mtime_ns) to avoid rehashing
+        # the same unchanged file several times per load
+        self._fingerprints: dict[tuple[str, int, int], str] = {}
+
+    def _get_fingerprint(self, file_path: Path) -> str:
+        """Return the content fingerprint of a file, memoized per file state.
+
+        Args:
+            file_path: Path to the source file.
+
+        Returns:
+            Fingerprint string from file_fingerprint().
+        """
+        stat = file_path.stat()
+        memo_key = (str(file_path.absolute()), stat.st_size, stat.st_mtime_ns)
+        fingerprint = self._fingerprints.get(memo_key)
+        if fingerprint is None:
+            fingerprint = file_fingerprint(file_path, full_hash=self.full_hash)
+            self._fingerprints[memo_key] = fingerprint
+        return fingerprint
 
     def _get_cache_key(self, file_path: Path, sheet: str | None = None) -> str:
-        """Generate MD5 hash key for cache file.
+        """Generate content-addressed key for cache file.
 
         Args:
             file_path: Path to the source file.
             sheet: Sheet name for Excel files (None for CSV/Parquet).
 
         Returns:
-            MD5 hash string of file path + sheet name.
+            32-character hex digest of cache format version, file content
+            fingerprint and sheet name.
         """
-        key_string = str(file_path.absolute()) + (sheet or "default")
-        return hashlib.md5(key_string.encode()).hexdigest()
+        key_string = "|".join(
+            [
+                f"v{CACHE_FORMAT_VERSION}",
+                self._get_fingerprint(file_path),
+                sheet or "default",
+            ]
+        )
+        return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
 
     def _get_cache_path(self, file_path: Path, sheet: str | None = None) -> Path:
         """Get the cache file path for a source file.
@@ -50,14 +187,86 @@ class CacheManager:
             Path to the cache Parquet file.
         """
         cache_key = self._get_cache_key(file_path, sheet)
-        return self.cache_dir / f"{cache_key}.parquet"
+        return self.cache_dir / f"v{CACHE_FORMAT_VERSION}_{cache_key}.parquet"
+
+    @staticmethod
+    def _source_record_path(cache_path: Path) -> Path:
+        """Path of the record describing the source a cache file was built from."""
+        return cache_path.with_name(cache_path.name + ".source.json")
+
+    def _write_source_record(self, cache_path: Path, file_path: Path) -> None:
+        """Record the source's size, modification time and full fingerprint.
+
+        Not needed with full_hash, where the cache key already covers every byte.
+
+        Args:
+            cache_path: Cache file that was just written.
+            file_path: Source file it was built from.
+        """
+        if self.full_hash:
+            return
+        try:
+            stat = file_path.stat()
+            record = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "fingerprint": file_fingerprint(file_path, full_hash=True),
+            }
+            self._source_record_path(cache_path).write_text(json.dumps(record), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to record source of %s: %s", cache_path.name, e)
+
+    def _matches_source(self, cache_path: Path, file_path: Path) -> bool:
+        """Check that a cache file was built from the source's current contents.
+
+        An unchanged size and modification time is trusted. Otherwise the
+        source is hashed in full and compared with the record, so touched or
+        moved files stay cached while edits the sampled fingerprint missed
+        are rejected. Entries without a record are rejected.
+
+        Args:
+            cache_path: Existing cache file.
+            file_path: Path to the source file.
+
+        Returns:
+            True if the cache file may be served.
+        """
+        if self.full_hash:
+            return True
+        record_path = self._source_record_path(cache_path)
+        try:
+            record = json.loads(record_path.read_text(encoding="utf-8"))
+            stat = file_path.stat()
+            if (record["size"], record["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                return True
+            if file_fingerprint(file_path, full_hash=True) != record["fingerprint"]:
+                logger.info("%s was edited since it was cached, ignoring cache", file_path.name)
+                return False
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        # Same contents; skip the full hash next time
+        record["mtime_ns"] = stat.st_mtime_ns
+        with contextlib.suppress(OSError):
+            record_path.write_text(json.dumps(record), encoding="utf-8")
+        return True
+
+    def _remove_cache_file(self, cache_path: Path) -> None:
+        """Delete a cache file and its source record.
+
+        Raises:
+            OSError: If the cache file cannot be removed.
+        """
+        cache_path.unlink()
+        with contextlib.suppress(OSError):
+            self._source_record_path(cache_path).unlink()
 
     def is_cache_valid(self, file_path: Path, sheet: str | None = None) -> bool:
         """Check if valid cache exists for file.
 
-        Cache is valid if:
-        - Cache file exists
-        - Cache file modification time is newer than source file
+        The cache path encodes the content fingerprint and format version;
+        an existing entry is valid when its source record still matches the
+        file (see _matches_source).
 
         Args:
             file_path: Path to the source file.
@@ -67,45 +276,72 @@ class CacheManager:
             True if valid cache exists, False otherwise.
         """
         cache_path = self._get_cache_path(file_path, sheet)
-
-        if not cache_path.exists():
-            return False
-
-        # Compare modification times
-        source_mtime = file_path.stat().st_mtime
-        cache_mtime = cache_path.stat().st_mtime
-
-        return cache_mtime > source_mtime
+        return cache_path.exists() and self._matches_source(cache_path, file_path)
 
     def get_cached(
         self,
         file_path: Path,
         sheet: str | None = None,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame | None:
         """Load DataFrame from cache if valid.
 
         Args:
             file_path: Path to the source file.
             sheet: Sheet name for Excel files.
+            columns: Only read these columns (names missing from the cache
+                are skipped); all columns if None.
 
         Returns:
             Cached DataFrame if valid cache exists, None otherwise.
-            Returns None and deletes cache if cache file is corrupt.
+            Returns None and deletes cache if cache file is corrupt or no
+            longer matches the source.
         """
-        if not self.is_cache_valid(file_path, sheet):
-            return None
-
         cache_path = self._get_cache_path(file_path, sheet)
 
+        if not cache_path.exists():
+            return None
+        if not self._matches_source(cache_path, file_path):
+            # Stale or unverifiable; the caller reloads and rewrites it
+            with contextlib.suppress(OSError):
+                self._remove_cache_file(cache_path)
+            return None
+
         try:
-            df = pd.read_parquet(cache_path)
-            logger.info("Loaded %d rows from cache for %s", len(df), file_path.name)
-            return df
+            if columns is not None:
+                available = set(pq.read_schema(cache_path).names)
+                columns = [column for column in columns if column in available]
+            df = pd.read_parquet(cache_path, columns=columns)
         except Exception as e:
             # Corrupt cache - delete and return None
             logger.warning("Corrupt cache for %s, deleting: %s", file_path.name, e)
             with contextlib.suppress(OSError):
-                cache_path.unlink()
+                self._remove_cache_file(cache_path)
+            return None
+
+        self._touch(cache_path)
+        logger.info("Loaded %d rows from cache for %s", len(df), file_path.name)
+        return df
+
+    def open_column_store(
+        self, file_path: Path, sheet: str | None = None
+    ) -> ColumnStore | None:
+        """Open the cached Parquet file for column-projected reads.
+
+        Args:
+            file_path: Path to the source file.
+            sheet: Sheet name for Excel files.
+
+        Returns:
+            ColumnStore over the cache file, or None if there is no readable cache.
+        """
+        cache_path = self._get_cache_path(file_path, sheet)
+        if not cache_path.exists() or not self._matches_source(cache_path, file_path):
+            return None
+        try:
+            return ColumnStore(cache_path)
+        except Exception as e:
+            logger.warning("Cannot open cache for %s: %s", file_path.name, e)
             return None
 
     def save_to_cache(
@@ -114,21 +350,295 @@ class CacheManager:
         file_path: Path,
         sheet: str | None = None,
     ) -> None:
-        """Save DataFrame to cache.
+        """Save DataFrame to cache and enforce the cache size limit.
 
         Args:
             df: DataFrame to cache.
             file_path: Path to the source file.
             sheet: Sheet name for Excel files.
         """
-        cache_path = self._get_cache_path(file_path, sheet)
-
         try:
+            cache_path = self._get_cache_path(file_path, sheet)
             df.to_parquet(cache_path, index=False)
+            self._write_source_record(cache_path, file_path)
             logger.info("Cached %d rows for %s", len(df), file_path.name)
         except Exception as e:
             logger.error("Failed to save cache for %s: %s", file_path.name, e)
             # Don't raise - caching failure shouldn't break the app
+            return
+
+        self.evict(keep=cache_path)
+
+    def _get_derived_cache_path(
+        self,
+        file_path: Path,
+        sheet: str | None,
+        mapping: ColumnMapping,
+        adjustment_params: AdjustmentParams,
+    ) -> Path:
+        """Get the derived-column sidecar path for a source file and mapping.
+
+        Args:
+            file_path: Path to the source file.
+            sheet: Sheet name for Excel files.
+            mapping: Column mapping the derived columns were computed with.
+            adjustment_params: Adjustment parameters used for adjusted gains.
+
+        Returns:
+            Path to the sidecar Parquet file.
+        """
+        settings = json.dumps(
+            {
+                "mapping": dataclasses.asdict(mapping),
+                "adjustment_params": dataclasses.asdict(adjustment_params),
+            },
+            sort_keys=True,
+        )
+        key_string = "|".join([self._get_cache_key(file_path, sheet), settings])
+        derived_key = hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"v{CACHE_FORMAT_VERSION}_{derived_key}.derived.parquet"
+
+    def get_derived(
+        self,
+        file_path: Path,
+        sheet: str | None,
+        mapping: ColumnMapping,
+        adjustment_params: AdjustmentParams,
+        num_rows: int,
+    ) -> pd.DataFrame | None:
+        """Load cached post-mapping columns for a source file.
+
+        Args:
+            file_path: Path to the source file.
+            sheet: Sheet name for Excel files.
+            mapping: Column mapping the derived columns were computed with.
+            adjustment_params: Adjustment parameters used for adjusted gains.
+            num_rows: Row count of the loaded DataFrame; a sidecar with a
+                different row count is ignored.
+
+        Returns:
+            DataFrame of derived columns in source row order, or None if there
+            is no usable sidecar. Corrupt sidecars are deleted.
+        """
+        try:
+            cache_path = self._get_derived_cache_path(
+                file_path, sheet, mapping, adjustment_params
+            )
+        except OSError as e:
+            logger.warning("Cannot fingerprint %s for derived cache: %s", file_path.name, e)
+            return None
+
+        if not cache_path.exists():
+            return None
+        if not self._matches_source(cache_path, file_path):
+            with contextlib.suppress(OSError):
+                self._remove_cache_file(cache_path)
+            return None
+
+        try:
+            derived = pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning("Corrupt derived cache for %s, deleting: %s", file_path.name, e)
+            with contextlib.suppress(OSError):
+                self._remove_cache_file(cache_path)
+            return None
+
+        if len(derived) != num_rows or "trigger_number" not in derived.columns:
+            logger.warning(
+                "Derived cache for %s does not match loaded data (%d vs %d rows), ignoring",
+                file_path.name,
+                len(derived),
+                num_rows,
+            )
+            return None
+
+        self._touch(cache_path)
+        logger.info("Loaded derived columns from cache for %s", file_path.name)
+        return derived
+
+    def save_derived(
+        self,
+        df: pd.DataFrame,
+        file_path: Path,
+        sheet: str | None,
+        mapping: ColumnMapping,
+        adjustment_params: AdjustmentParams,
+    ) -> None:
+        """Save the post-mapping columns of a baseline DataFrame as a sidecar.
+
+        Only the DERIVED_COLUMNS present in ``df`` are stored, in the order
+        they appear in ``df``.
+
+        Args:
+            df: Baseline DataFrame produced by MappingWorker.
+            file_path: Path to the source file.
+            sheet: Sheet name for Excel files.
+            mapping: Column mapping the derived columns were computed with.
+            adjustment_params: Adjustment parameters used for adjusted gains.
+        """
+        columns = [column for column in df.columns if column in DERIVED_COLUMNS]
+        try:
+            cache_path = self._get_derived_cache_path(
+                file_path, sheet, mapping, adjustment_params
+            )
+            df[columns].to_parquet(cache_path, index=False)
+            self._write_source_record(cache_path, file_path)
+            logger.info("Cached %d derived columns for %s", len(columns), file_path.name)
+        except Exception as e:
+            logger.error("Failed to save derived cache for %s: %s", file_path.name, e)
+            return
+
+        self.evict(keep=cache_path)
+
+    def stream_csv_to_cache(
+        self,
+        csv_path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+        block_size: int = DEFAULT_STREAM_BLOCK_SIZE,
+        cancel_event: threading.Event | None = None,
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> Path:
+        """Convert a CSV file to a Parquet cache entry block by block.
+
+        The CSV is parsed by pyarrow in blocks of ``block_size`` bytes and each
+        block is appended to the Parquet file, so the full DataFrame is never
+        held in memory during conversion. Column types are inferred from the
+        first block, with two adjustments so results match ``pd.read_csv``:
+
+        - Columns that are empty in the first block are read as float64
+          (string if later blocks hold non-numeric values).
+        - Date and time columns are kept as strings.
+
+        The file is written to ``<cache>.partial`` and renamed on success.
+
+        Args:
+            csv_path: Path to the CSV file.
+            progress_callback: Called with the percentage (0-100) of input
+                bytes consumed after each block.
+            block_size: Bytes of CSV parsed per block.
+            cancel_event: Checked between blocks; when set the conversion stops.
+            column_types: Explicit Arrow types for known columns (e.g. from
+                the saved column mapping); they take precedence over inference.
+
+        Returns:
+            Path to the Parquet cache file.
+
+        Raises:
+            LoadCancelledError: If cancel_event was set.
+            OSError: If the CSV cannot be read.
+            pyarrow.ArrowInvalid: If the CSV cannot be parsed.
+        """
+        cache_path = self._get_cache_path(csv_path)
+        partial_path = cache_path.with_name(cache_path.name + ".partial")
+        read_opts = pa_csv.ReadOptions(block_size=block_size)
+        inferred = self._probe_column_types(csv_path, read_opts) or {}
+        explicit = column_types or {}
+        stream_types = {**inferred, **explicit}
+
+        try:
+            try:
+                self._stream_csv(
+                    csv_path, partial_path, read_opts, stream_types,
+                    progress_callback, cancel_event,
+                )
+            except pa.ArrowInvalid:
+                # A column that was empty in the sample holds text later
+                empty_in_sample = [
+                    name for name, dtype in inferred.items()
+                    if pa.types.is_floating(dtype) and name not in explicit
+                ]
+                if not empty_in_sample:
+                    raise
+                logger.info("Retrying CSV stream of %s with text columns", csv_path.name)
+                stream_types.update({name: pa.string() for name in empty_in_sample})
+                self._stream_csv(
+                    csv_path, partial_path, read_opts, stream_types,
+                    progress_callback, cancel_event,
+                )
+            partial_path.replace(cache_path)
+            self._write_source_record(cache_path, csv_path)
+        except BaseException:
+            self._cleanup_partial(partial_path)
+            raise
+
+        logger.info("Streamed %s to cache", csv_path.name)
+        self.evict(keep=cache_path)
+        return cache_path
+
+    @staticmethod
+    def _stream_csv(
+        csv_path: Path,
+        output_path: Path,
+        read_opts: pa_csv.ReadOptions,
+        column_types: dict[str, pa.DataType] | None,
+        progress_callback: Callable[[int], None] | None,
+        cancel_event: threading.Event | None,
+    ) -> None:
+        """Stream CSV record batches into a Parquet file."""
+        # Empty strings are missing values, as in pd.read_csv
+        convert_opts = pa_csv.ConvertOptions(
+            column_types=column_types or {}, strings_can_be_null=True
+        )
+        total_bytes = max(csv_path.stat().st_size, 1)
+
+        with open(csv_path, "rb") as source:
+            reader = pa_csv.open_csv(source, read_options=read_opts, convert_options=convert_opts)
+            with pq.ParquetWriter(output_path, reader.schema) as writer:
+                for batch in reader:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise LoadCancelledError(f"Loading {csv_path.name} was cancelled")
+                    writer.write_batch(batch)
+                    if progress_callback is not None:
+                        progress_callback(min(100, source.tell() * 100 // total_bytes))
+
+        if progress_callback is not None:
+            progress_callback(100)
+
+    @staticmethod
+    def _probe_null_columns(
+        csv_path: Path, read_opts: pa_csv.ReadOptions
+    ) -> dict[str, pa.DataType] | None:
+        """Find columns that are entirely empty in the first block.
+
+        pyarrow types such columns as null and fails once a later block holds
+        values, so they are read as float64 instead.
+
+        Args:
+            csv_path: Path to the CSV file.
+            read_opts: Read options; ``block_size`` sets the sample size.
+
+        Returns:
+            Column type overrides, or None if no column is null-typed.
+        """
+        schema = probe_csv_schema(csv_path, read_opts)
+        if schema is None:
+            return None
+        overrides = {
+            field.name: pa.float64() for field in schema if pa.types.is_null(field.type)
+        }
+        return overrides or None
+
+    @staticmethod
+    def _probe_column_types(
+        csv_path: Path, read_opts: pa_csv.ReadOptions
+    ) -> dict[str, pa.DataType] | None:
+        """Column type overrides for streaming, inferred from the first block.
+
+        Args:
+            csv_path: Path to the CSV file.
+            read_opts: Read options; ``block_size`` sets the sample size.
+
+        Returns:
+            Column type overrides (see csv_type_overrides), or None if none
+            are needed.
+        """
+        return csv_type_overrides(probe_csv_schema(csv_path, read_opts)) or None
+
+    @staticmethod
+    def _cleanup_partial(partial_path: Path) -> None:
+        """Remove a partially written cache file if it exists."""
+        with contextlib.suppress(OSError):
+            partial_path.unlink()
 
     def invalidate(self, file_path: Path, sheet: str | None = None) -> None:
         """Remove cache for a specific file/sheet combination.
@@ -140,7 +650,61 @@ class CacheManager:
         cache_path = self._get_cache_path(file_path, sheet)
         if cache_path.exists():
             try:
-                cache_path.unlink()
+                self._remove_cache_file(cache_path)
                 logger.debug("Removed cache file: %s", cache_path.name)
             except OSError as e:
                 logger.warning("Failed to remove cache file %s: %s", cache_path.name, e)
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Evict stale and least recently used cache entries.
+
+        Entries written by other cache format versions are always removed.
+        Remaining entries are removed oldest access first until the total size
+        is within max_size_bytes. Other files in the cache directory (e.g.
+        column mappings) are left alone.
+
+        Args:
+            keep: Cache file that must not be evicted (e.g. the entry that
+                was just written), even if it alone exceeds the limit.
+
+        Returns:
+            Number of cache files removed.
+        """
+        prefix = f"v{CACHE_FORMAT_VERSION}_"
+        entries: list[tuple[float, int, Path]] = []
+        removed = 0
+
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                if not path.name.startswith(prefix):
+                    self._remove_cache_file(path)
+                    removed += 1
+                    continue
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                self._remove_cache_file(path)
+            except OSError as e:
+                logger.warning("Failed to evict cache file %s: %s", path.name, e)
+                continue
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info("Evicted %d cache file(s), %d bytes remain", removed, total)
+        return removed
+
+    @staticmethod
+    def _touch(cache_path: Path) -> None:
+        """Record an access by bumping the cache file's modification time."""
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
@@ -0,0 +1,187 @@
+"""Column-projected access to cached Parquet data.
+
+Trade exports often carry 300+ feature columns while a session maps about ten
+and filters on a handful more. ``ColumnStore`` wraps a cached Parquet file so
+only the mapped columns are read when the file is loaded; every other column
+stays on disk until a tab asks for it and is then read once and attached to
+the frames that need it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import warnings
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.core.models import ColumnMapping
+
+logger = logging.getLogger(__name__)
+
+# Unmapped columns that are still read up front: the trigger price used for the
+# change_X_min columns and the entry price candidates of the chart viewer
+AUXILIARY_COLUMNS = (
+    "trigger_price_unadjusted",
+    "entry_price",
+    "price",
+    "trigger_price",
+    "fill_price",
+    "avg_price",
+    "open",
+)
+
+
+def mapped_columns(mapping: ColumnMapping) -> list[str]:
+    """Source columns referenced by a column mapping.
+
+    Args:
+        mapping: Column mapping configuration.
+
+    Returns:
+        Column names of every mapped field that is set.
+    """
+    columns = []
+    for mapping_field in dataclasses.fields(mapping):
+        value = getattr(mapping, mapping_field.name)
+        if isinstance(value, str) and value:
+            columns.append(value)
+    return columns
+
+
+class ColumnStore:
+    """Reads columns of a cached Parquet file on demand.
+
+    Frames built from the store must keep the file's row positions as their
+    index labels (a fresh load has a RangeIndex, and filtering or sorting keeps
+    the labels), so columns read later can be lined up with their rows.
+
+    Attributes:
+        path: Path to the Parquet file.
+        columns: All column names in file order.
+        num_rows: Number of rows in the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Read the schema of a Parquet file without loading any data.
+
+        Args:
+            path: Path to the Parquet file.
+        """
+        self.path = path
+        self._schema = pq.read_schema(path)
+        self.columns: list[str] = list(self._schema.names)
+        self._column_set = set(self.columns)
+        self.num_rows: int = pq.read_metadata(path).num_rows
+
+    def __contains__(self, column: object) -> bool:
+        return column in self._column_set
+
+    def eager_columns(self, mapping: ColumnMapping) -> list[str]:
+        """Columns to read up front for a mapping.
+
+        Args:
+            mapping: Column mapping saved for the file.
+
+        Returns:
+            Mapped and auxiliary columns present in the file, in file order.
+        """
+        wanted = set(mapped_columns(mapping)) | set(AUXILIARY_COLUMNS)
+        return [column for column in self.columns if column in wanted]
+
+    def read(self, columns: Iterable[str] | None = None) -> pd.DataFrame:
+        """Read columns from the file.
+
+        Args:
+            columns: Columns to read; all columns if None.
+
+        Returns:
+            DataFrame with a RangeIndex over all rows.
+        """
+        if columns is not None:
+            columns = [column for column in columns if column in self._column_set]
+        df: pd.DataFrame = pq.read_table(self.path, columns=columns).to_pandas()
+        return df
+
+    def schema_frame(self, loaded: pd.DataFrame) -> pd.DataFrame:
+        """Zero-row frame with every column available alongside ``loaded``.
+
+        Columns still on disk get the dtype their Parquet type maps to, so
+        callers can pick columns with ``select_dtypes`` as they would on a
+        fully loaded frame. Columns only in ``loaded`` (e.g. derived ones)
+        are appended after the file's columns.
+
+        Args:
+            loaded: Frame built from this store.
+
+        Returns:
+            Empty DataFrame whose columns and dtypes describe the full dataset.
+        """
+        frame: pd.DataFrame = self._schema.empty_table().to_pandas()
+        head = loaded.iloc[:0]
+        for column in head.columns:
+            frame[column] = head[column].array
+        return frame
+
+    def fill(self, frames: Iterable[pd.DataFrame], columns: Iterable[str]) -> list[str]:
+        """Attach columns from the file to frames that lack them, in place.
+
+        Each column is read once and shared across frames; rows are picked by
+        the frames' index labels.
+
+        Args:
+            frames: Frames built from this store.
+            columns: Columns the caller needs; unknown names are ignored.
+
+        Returns:
+            Names of the columns that were read from the file.
+
+        Raises:
+            ValueError: If a frame's index does not hold row positions of the file.
+        """
+        frames = list(frames)
+        wanted = [column for column in dict.fromkeys(columns) if column in self._column_set]
+        pending = [
+            (frame, [column for column in wanted if column not in frame.columns])
+            for frame in frames
+        ]
+        pending = [(frame, missing) for frame, missing in pending if missing]
+        if not pending:
+            return []
+
+        positions = [self._row_positions(frame.index) for frame, _ in pending]
+        to_read = list(dict.fromkeys(column for _, missing in pending for column in missing))
+        values = self.read(to_read)
+
+        # Frames are updated in place so every holder sees the new columns;
+        # inserting many columns fragments the frame, which pandas warns about
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+            for (frame, missing), rows in zip(pending, positions, strict=True):
+                for column in missing:
+                    column_values = values[column].to_numpy()
+                    frame[column] = column_values if rows is None else column_values[rows]
+
+        logger.info("Read %d column(s) on demand from %s", len(to_read), self.path.name)
+        return to_read
+
+    def _row_positions(self, index: pd.Index) -> np.ndarray | None:
+        """File row positions for a frame index, or None for all rows in order.
+
+        Raises:
+            ValueError: If the index labels are not row positions of the file.
+        """
+        if isinstance(index, pd.RangeIndex) and index.equals(pd.RangeIndex(self.num_rows)):
+            return None
+        if len(index) == 0:
+            return np.empty(0, dtype=np.intp)
+        if not pd.api.types.is_integer_dtype(index.dtype):
+            raise ValueError("Frame index does not hold file row positions")
+        rows = index.to_numpy(dtype=np.intp)
+        if rows.min() < 0 or rows.max() >= self.num_rows:
+            raise ValueError("Frame index does not hold file row positions")
+        return rows
@@ -6,15 +6,133 @@ and is designed to be extended for Kelly-based calculations in Story 3.5.
 """
 
 import logging
+from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 
+from src.core.date_utils import resolve_dates
 from src.core.exceptions import EquityCalculationError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DrawdownEpisodes:
+    """Every drawdown episode of an equity curve, one array entry per episode.
+
+    An episode is a maximal run of consecutive points where equity is below its
+    running peak.
+
+    Attributes:
+        peak_index: Index where the peak the episode is measured from was first
+            established.
+        start: First underwater index.
+        trough: Index of the deepest dollar drawdown within the episode.
+        recovery: First index at or above the peak again, -1 if not recovered.
+        depth: Deepest drawdown in dollars (positive).
+        depth_pct: Deepest drawdown as a percentage of the peak (positive), NaN
+            where the peak is zero or negative.
+        num_points: Length of the equity curve the episodes were extracted from.
+    """
+
+    peak_index: np.ndarray
+    start: np.ndarray
+    trough: np.ndarray
+    recovery: np.ndarray
+    depth: np.ndarray
+    depth_pct: np.ndarray
+    num_points: int
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def recovered(self) -> np.ndarray:
+        """Boolean mask of episodes that recovered to their peak."""
+        return self.recovery >= 0
+
+    @property
+    def length(self) -> np.ndarray:
+        """Consecutive underwater points in each episode."""
+        end = np.where(self.recovered, self.recovery, self.num_points)
+        return end - self.start
+
+    @property
+    def duration(self) -> np.ndarray:
+        """Points from the peak to recovery (to the last point if unrecovered)."""
+        end = np.where(self.recovered, self.recovery, self.num_points)
+        return end - self.peak_index
+
+
+def extract_drawdown_episodes(
+    equity: np.ndarray | pd.Series,
+    peak: np.ndarray | pd.Series | None = None,
+) -> DrawdownEpisodes:
+    """Extract all drawdown episodes from an equity curve in one vectorized pass.
+
+    Underwater runs are found by run-length encoding the ``equity < peak`` mask,
+    peak indices by ``searchsorted`` on the non-decreasing peak, and troughs and
+    depths with per-run reductions.
+
+    Args:
+        equity: Equity values in chronological order.
+        peak: Running peak for each point. Defaults to the running maximum of
+            ``equity``; pass it explicitly when the peak includes starting capital.
+
+    Returns:
+        DrawdownEpisodes describing every episode, in chronological order.
+    """
+    equity = np.asarray(equity, dtype=float)
+    peak = np.fmax.accumulate(equity) if peak is None else np.asarray(peak, dtype=float)
+    num_points = len(equity)
+
+    underwater = equity < peak
+    padded = np.concatenate(([False], underwater, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    start = edges[0::2]
+    end = edges[1::2]
+
+    if len(start) == 0:
+        empty = np.array([], dtype=np.int64)
+        return DrawdownEpisodes(
+            peak_index=empty,
+            start=empty,
+            trough=empty,
+            recovery=empty,
+            depth=np.array([], dtype=float),
+            depth_pct=np.array([], dtype=float),
+            num_points=num_points,
+        )
+
+    recovery = np.where(end < num_points, end, -1)
+    peak_index = np.minimum(np.searchsorted(peak, peak[start], side="left"), start)
+
+    # Per-episode trough: order underwater points by (episode, drawdown, index)
+    # so the first entry of each episode is its earliest deepest point
+    drawdown = equity - peak
+    points = np.flatnonzero(underwater)
+    lengths = end - start
+    episode_of_point = np.repeat(np.arange(len(start)), lengths)
+    order = np.lexsort((points, drawdown[points], episode_of_point))
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    trough = points[order[offsets]]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown_pct = np.where(peak > 0, -drawdown / peak * 100.0, np.nan)
+    depth_pct = np.fmax.reduceat(drawdown_pct[points], offsets)
+
+    return DrawdownEpisodes(
+        peak_index=peak_index,
+        start=start,
+        trough=trough,
+        recovery=recovery,
+        depth=-drawdown[trough],
+        depth_pct=depth_pct,
+        num_points=num_points,
+    )
+
+
 class EquityCalculator:
     """Calculate equity curves for flat stake and Kelly position sizing.
 
@@ -56,8 +174,8 @@ class EquityCalculator:
             # (string dates like DD/MM/YYYY don't sort correctly as strings)
             if date_col is not None and date_col in df.columns:
                 df = df.copy()
-                df["_sort_date"] = pd.to_datetime(df[date_col], dayfirst=True, errors="coerce")
-                df = df.sort_values("_sort_date").reset_index(drop=True)
+                df["_sort_date"] = resolve_dates(df, date_col)
+                df = df.sort_values("_sort_date", kind="stable").reset_index(drop=True)
                 df = df.drop(columns=["_sort_date"])
 
             gains: np.ndarray = df[gain_col].to_numpy(dtype=float)
@@ -145,25 +263,18 @@ class EquityCalculator:
         if peak_at_max_dd <= 0:
             max_dd_pct_value = None
 
-        # Calculate drawdown duration (from when drawdown started to recovery)
-        # Find when the peak that led to max drawdown was established
-        # This is the first index where peak equals peak_at_max_dd
-        dd_start_idx = 0
-        for i in range(max_dd_pct_idx + 1):
-            if peak[i] == peak_at_max_dd:
-                dd_start_idx = i
-                break
+        # Calculate drawdown duration (from when the peak was established to
+        # recovery) for the episode containing the max percentage drawdown
+        episodes = extract_drawdown_episodes(equity, peak)
+        episode = int(np.searchsorted(episodes.start, max_dd_pct_idx, side="right")) - 1
+        if episode < 0 or episodes.length[episode] <= max_dd_pct_idx - episodes.start[episode]:
+            # Degenerate zero-peak curve: fall back to the deepest dollar episode
+            episode = int(np.searchsorted(episodes.start, max_dd_dollar_idx, side="right")) - 1
 
-        # Find recovery point (when equity returns to or exceeds the peak)
         dd_duration: int | str | None
-        recovered = False
-        for i in range(dd_start_idx + 1, len(equity)):
-            if equity[i] >= peak_at_max_dd:
-                dd_duration = i - dd_start_idx
-                recovered = True
-                break
-
-        if not recovered:
+        if episodes.recovered[episode]:
+            dd_duration = int(episodes.duration[episode])
+        else:
             dd_duration = "Not recovered"
 
         logger.debug(
@@ -260,8 +371,8 @@ class EquityCalculator:
             # (string dates like DD/MM/YYYY don't sort correctly as strings)
             if date_col is not None and date_col in df.columns:
                 df = df.copy()
-                df["_sort_date"] = pd.to_datetime(df[date_col], dayfirst=True, errors="coerce")
-                df = df.sort_values("_sort_date").reset_index(drop=True)
+                df["_sort_date"] = resolve_dates(df, date_col)
+                df = df.sort_values("_sort_date", kind="stable").reset_index(drop=True)
                 df = df.drop(columns=["_sort_date"])
 
             gains: np.ndarray = df[gain_col].to_numpy(dtype=float)
@@ -270,54 +381,14 @@ class EquityCalculator:
             # Calculate effective Kelly: kelly_pct * (kelly_fraction / 100)
             effective_kelly = kelly_pct * (kelly_fraction / 100.0)
 
-            # Preallocate arrays
-            pnl = np.zeros(n_trades)
-            equity = np.zeros(n_trades)
-            peak = np.zeros(n_trades)
-            drawdown = np.zeros(n_trades)
-            position_size = np.zeros(n_trades)
-
-            # Initialize
-            current_equity = start_capital
-            current_peak = start_capital
-            blown = False
-
-            for i in range(n_trades):
-                if blown:
-                    # Account blown - set remaining trades to 0
-                    pnl[i] = 0.0
-                    equity[i] = 0.0
-                    peak[i] = current_peak
-                    drawdown[i] = -current_peak
-                    position_size[i] = 0.0
-                    continue
-
-                # Calculate position size based on current equity and Kelly
-                pos_size = current_equity * (effective_kelly / 100.0)
-                position_size[i] = pos_size
-
-                # Calculate trade PnL
-                trade_pnl = pos_size * (gains[i] / 100.0)
-                pnl[i] = trade_pnl
-
-                # Update equity
-                new_equity = current_equity + trade_pnl
-                equity[i] = new_equity
-
-                # Check for blown account
-                if new_equity <= 0:
-                    logger.warning(
-                        "Account blown at trade %d, equity=%.2f", i + 1, new_equity
-                    )
-                    equity[i] = 0.0
-                    blown = True
-
-                # Update peak and drawdown
-                current_equity = equity[i]
-                if current_equity > current_peak:
-                    current_peak = current_equity
-                peak[i] = current_peak
-                drawdown[i] = current_equity - current_peak
+            paths = self.calculate_kelly_paths(
+                gains, start_capital, kelly_fraction, kelly_pct
+            )
+            pnl = paths["pnl"]
+            equity = paths["equity"]
+            peak = paths["peak"]
+            drawdown = paths["drawdown"]
+            position_size = paths["position_size"]
 
             result = pd.DataFrame({
                 "trade_num": np.arange(1, n_trades + 1),
@@ -344,6 +415,95 @@ class EquityCalculator:
         except Exception as e:
             raise EquityCalculationError(f"Failed to calculate Kelly equity curve: {e}") from e
 
+    def calculate_kelly_paths(
+        self,
+        gains: np.ndarray,
+        start_capital: float,
+        kelly_fraction: float,
+        kelly_pct: float | np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """Calculate compounded Kelly equity paths without a per-trade loop.
+
+        Equity follows ``start_capital * cumprod(1 + k * g)`` and is truncated at
+        the first non-positive value: that trade's equity is set to 0 and every
+        later trade has zero position size and PnL (the account is blown).
+
+        Args:
+            gains: Gain percentages (e.g., 5.0 = 5%), either a 1-D array of
+                trades or a 2-D (scenarios x trades) matrix evaluated row-wise.
+            start_capital: Starting capital in dollars
+            kelly_fraction: Kelly fraction as percentage (e.g., 25 = 25% of Kelly)
+            kelly_pct: Base Kelly percentage. For a 2-D matrix this may be an
+                array with one value per scenario row.
+
+        Returns:
+            Dict of arrays shaped like ``gains`` with keys: pnl, equity, peak,
+            drawdown, position_size
+
+        Raises:
+            EquityCalculationError: If gains is not 1-D or 2-D, or kelly_pct does
+                not match the number of scenario rows
+        """
+        gains = np.asarray(gains, dtype=float)
+        if gains.ndim not in (1, 2):
+            raise EquityCalculationError(
+                f"Gains must be a 1-D or 2-D array, got {gains.ndim} dimensions"
+            )
+
+        # Position size as a fraction of current equity
+        stake = np.asarray(kelly_pct, dtype=float) * (kelly_fraction / 100.0) / 100.0
+        if stake.ndim > 0:
+            if gains.ndim != 2 or stake.shape != (gains.shape[0],):
+                raise EquityCalculationError(
+                    f"kelly_pct must be a scalar or have one value per scenario row, "
+                    f"got shape {stake.shape} for gains of shape {gains.shape}"
+                )
+            stake = stake[:, np.newaxis]
+
+        if gains.shape[-1] == 0:
+            return {
+                key: np.zeros(gains.shape)
+                for key in ("pnl", "equity", "peak", "drawdown", "position_size")
+            }
+
+        # Long compounding runs can overflow to inf (as the float loop did)
+        with np.errstate(over="ignore", invalid="ignore"):
+            unbounded = start_capital * np.cumprod(1.0 + stake * (gains / 100.0), axis=-1)
+
+            # The account is blown from the first non-positive equity onwards
+            blown = np.logical_or.accumulate(unbounded <= 0, axis=-1)
+            equity = np.where(blown, 0.0, unbounded)
+
+            # Equity before each trade; trades after the blow-up are not taken
+            prior_equity = np.empty_like(equity)
+            prior_equity[..., 0] = start_capital
+            prior_equity[..., 1:] = equity[..., :-1]
+            taken = np.ones_like(blown)
+            taken[..., 1:] = ~blown[..., :-1]
+
+            position_size = np.where(taken, prior_equity * stake, 0.0)
+            pnl = np.where(taken, position_size * (gains / 100.0), 0.0)
+
+            # Running peak starts at start_capital; fmax skips NaN equity like the
+            # sequential comparison did
+            peak = np.fmax(np.fmax.accumulate(equity, axis=-1), start_capital)
+            drawdown = equity - peak
+
+        if blown.size > 0 and blown[..., -1].any():
+            logger.warning(
+                "Account blown in %d of %d Kelly path(s)",
+                int(np.count_nonzero(blown[..., -1])),
+                1 if gains.ndim == 1 else gains.shape[0],
+            )
+
+        return {
+            "pnl": pnl,
+            "equity": equity,
+            "peak": peak,
+            "drawdown": drawdown,
+            "position_size": position_size,
+        }
+
     def calculate_kelly_metrics(
         self,
         df: pd.DataFrame,
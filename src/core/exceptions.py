@@ -17,6 +17,14 @@ class FileLoadError(LumenError):
     """
 
 
+class LoadCancelledError(FileLoadError):
+    """Raised when a file load is cancelled before it completes.
+
+    This exception is raised by the chunked readers when their cancel
+    event is set between blocks or rows.
+    """
+
+
 class ColumnMappingError(LumenError):
     """Raised when column mapping is invalid.
 
@@ -47,3 +55,11 @@ class EquityCalculationError(LumenError):
     This exception is raised when equity curve calculation encounters
     invalid data, missing columns, or other calculation errors.
     """
+
+
+class FilterExpressionError(LumenError):
+    """Raised when a filter expression cannot be parsed or evaluated.
+
+    This exception is raised for syntax errors, unknown columns and
+    comparisons between incompatible column types.
+    """
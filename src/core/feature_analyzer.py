@@ -18,6 +18,8 @@ import pandas as pd
 from numpy.typing import NDArray
 from scipy import stats
 
+from src.core.date_utils import resolve_dates
+
 
 class RangeClassification(Enum):
     """Classification of a feature range relative to baseline."""
@@ -854,7 +856,7 @@ class FeatureAnalyzer:
             Consistency score from 0 to 1, or None if insufficient data.
         """
         try:
-            dates = pd.to_datetime(df[date_col], dayfirst=True, format="mixed", errors="coerce")
+            dates = resolve_dates(df, date_col)
             years = dates.dt.year.unique()
 
             if len(years) < 2:
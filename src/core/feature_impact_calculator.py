@@ -71,7 +71,7 @@ class FeatureImpactCalculator:
     # Default columns to exclude from analysis
     DEFAULT_EXCLUDED_COLS = {
         "date", "time", "ticker", "symbol", "gain_pct", "gain", "return",
-        "trigger_number", "trade_id", "id", "index",
+        "trigger_number", "_trigger_group", "trade_id", "id", "index",
     }
 
     def calculate_all_features(
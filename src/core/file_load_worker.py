@@ -1,47 +1,94 @@
 """Background worker thread for file loading operations."""
 
+import logging
+import threading
 from pathlib import Path
 
+import pandas as pd
+import pyarrow as pa
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from src.core.cache_manager import CacheManager
-from src.core.exceptions import FileLoadError
-from src.core.file_loader import FileLoader
+from src.core.column_mapper import ColumnMapper
+from src.core.column_store import ColumnStore
+from src.core.exceptions import FileLoadError, LoadCancelledError
+from src.core.file_loader import FileLoader, mapping_column_types
+from src.core.models import ColumnMapping
+
+logger = logging.getLogger(__name__)
 
 
 class FileLoadWorker(QThread):
     """Worker thread for loading files in the background.
 
+    CSV files are streamed block by block into the Parquet cache and then read
+    from it; other formats are loaded with FileLoader (row by row for .xlsx).
+    Both paths report real progress and can be stopped with cancel(). When a
+    column mapping was saved for the file, its columns are read with explicit
+    types instead of inferred ones, and a load served from the Parquet cache
+    only reads the mapped columns; ``column_store`` then gives access to the
+    remaining columns on demand.
+
     Signals:
         progress: Emitted with progress percentage (0-100).
         finished: Emitted with the loaded DataFrame on success.
         error: Emitted with error message string on failure.
         cache_hit: Emitted with True if loaded from cache, False otherwise.
+        cancelled: Emitted when the load was stopped by cancel().
     """
 
     progress = pyqtSignal(int)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     cache_hit = pyqtSignal(bool)
+    cancelled = pyqtSignal()
 
-    def __init__(self, path: Path, sheet: str | None = None) -> None:
+    # Share of the progress bar used by the streaming/reading phase
+    _READ_START = 10
+    _READ_SPAN = 75
+
+    def __init__(
+        self,
+        path: Path,
+        sheet: str | None = None,
+        lazy_columns: bool = True,
+        cache_dir: Path | None = None,
+    ) -> None:
         """Initialize the worker.
 
         Args:
             path: Path to the file to load.
             sheet: Sheet name for Excel files (optional).
+            lazy_columns: Read only the mapped columns from the Parquet cache
+                when a saved mapping matches the file.
+            cache_dir: Directory of the Parquet cache and saved mappings.
+                Defaults to CacheManager's.
         """
         super().__init__()
         self.path = path
         self.sheet = sheet
-        self._loader = FileLoader()
-        self._cache_manager = CacheManager()
+        self.lazy_columns = lazy_columns
+        # Set when the loaded DataFrame holds only part of the file's columns
+        self.column_store: ColumnStore | None = None
+        # Fallback when CSV streaming fails; pyarrow applies the mapping's column types
+        self._loader = FileLoader(csv_engine="pyarrow")
+        self._cache_manager = CacheManager() if cache_dir is None else CacheManager(cache_dir)
+        self._column_mapper = ColumnMapper(cache_dir)
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation; the load stops at the next block or row batch."""
+        self._cancel_event.set()
 
     def run(self) -> None:
         """Execute the file loading operation."""
         try:
+            saved_mapping = self._column_mapper.load_mapping(self.path, self.sheet)
+
             # Check cache first
-            cached_df = self._cache_manager.get_cached(self.path, self.sheet)
+            cached_df = self._cache_manager.get_cached(
+                self.path, self.sheet, columns=self._projected_columns(saved_mapping)
+            )
             if cached_df is not None:
                 self.progress.emit(100)
                 self.cache_hit.emit(True)
@@ -50,15 +97,100 @@ class FileLoadWorker(QThread):
 
             # Cache miss - load from source
             self.cache_hit.emit(False)
-            self.progress.emit(10)
-            df = self._loader.load(self.path, self.sheet)
-            self.progress.emit(100)
+            self.progress.emit(self._READ_START)
+
+            column_types = mapping_column_types(saved_mapping) if saved_mapping else None
 
-            # Save to cache after successful load
-            self._cache_manager.save_to_cache(df, self.path, self.sheet)
+            df = None
+            if self.path.suffix.lower() == ".csv" and self.sheet is None:
+                df = self._load_csv_streaming(saved_mapping, column_types)
 
+            if df is None:
+                df = self._loader.load(
+                    self.path,
+                    self.sheet,
+                    progress_callback=self._on_stream_progress,
+                    cancel_event=self._cancel_event,
+                    column_types=column_types,
+                )
+                self.progress.emit(90)
+                # Save to cache after successful load
+                self._cache_manager.save_to_cache(df, self.path, self.sheet)
+
+            self.progress.emit(100)
             self.finished.emit(df)
+        except LoadCancelledError:
+            logger.info("Loading %s cancelled", self.path.name)
+            self.cancelled.emit()
         except FileLoadError as e:
             self.error.emit(str(e))
         except Exception as e:
             self.error.emit(f"Unexpected error: {e}")
+
+    def _load_csv_streaming(
+        self,
+        mapping: ColumnMapping | None,
+        column_types: dict[str, pa.DataType] | None,
+    ) -> pd.DataFrame | None:
+        """Stream a CSV into the cache and read it back.
+
+        Args:
+            mapping: Column mapping saved for the file, if any.
+            column_types: Explicit Arrow types for known columns.
+
+        Returns:
+            Loaded DataFrame, or None if streaming failed and the caller should
+            fall back to FileLoader.
+
+        Raises:
+            LoadCancelledError: If the load was cancelled.
+        """
+        try:
+            cache_path = self._cache_manager.stream_csv_to_cache(
+                self.path,
+                progress_callback=self._on_stream_progress,
+                cancel_event=self._cancel_event,
+                column_types=column_types,
+            )
+        except LoadCancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Streaming %s failed, using standard load: %s", self.path.name, e)
+            return None
+
+        df = pd.read_parquet(cache_path, columns=self._projected_columns(mapping))
+        logger.info("Loaded %d rows from %s", len(df), self.path.name)
+        return df
+
+    def _projected_columns(self, mapping: ColumnMapping | None) -> list[str] | None:
+        """Pick the columns to read from the Parquet cache.
+
+        Opens ``column_store`` when the load can be limited to the mapped
+        columns, i.e. lazy loading is on, the file is cached and the saved
+        mapping is valid for it.
+
+        Args:
+            mapping: Column mapping saved for the file, if any.
+
+        Returns:
+            Columns to read up front, or None to read every column.
+        """
+        self.column_store = None
+        if not self.lazy_columns or mapping is None:
+            return None
+        store = self._cache_manager.open_column_store(self.path, self.sheet)
+        if store is None or mapping.validate(store.columns):
+            return None
+        self.column_store = store
+        columns = store.eager_columns(mapping)
+        logger.info(
+            "Reading %d of %d columns of %s up front",
+            len(columns),
+            len(store.columns),
+            self.path.name,
+        )
+        return columns
+
+    def _on_stream_progress(self, pct: int) -> None:
+        """Map reader progress (0-100) onto the 10-85% range of the bar."""
+        self.progress.emit(self._READ_START + int(pct * self._READ_SPAN / 100))
@@ -1,20 +1,120 @@
 """File loading functionality for Excel, CSV, and Parquet files."""
 
 import logging
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
-from src.core.exceptions import FileLoadError
+from src.core.exceptions import FileLoadError, LoadCancelledError
+from src.core.models import ColumnMapping
+from src.core.time_utils import time_to_minutes
 
 logger = logging.getLogger(__name__)
 
+# Backends for reading CSV files
+CSV_ENGINES = ("pandas", "pyarrow")
+
+
+def probe_csv_schema(csv_path: Path, read_opts: pa_csv.ReadOptions) -> pa.Schema | None:
+    """Infer a CSV schema with pyarrow from the first block of the file.
+
+    Args:
+        csv_path: Path to the CSV file.
+        read_opts: Read options; ``block_size`` sets the sample size.
+
+    Returns:
+        Schema inferred from the first block, or None for a header-only file.
+    """
+    with open(csv_path, "rb") as source:
+        reader = pa_csv.open_csv(source, read_options=read_opts)
+        try:
+            reader.read_next_batch()
+        except StopIteration:
+            return None
+        return reader.schema
+
+
+def csv_type_overrides(schema: pa.Schema | None) -> dict[str, pa.DataType]:
+    """Adjust pyarrow's inferred CSV types to match ``pd.read_csv``.
+
+    Columns that are empty in the sample are read as float64 instead of null,
+    and date/time columns are kept as strings rather than parsed.
+
+    Args:
+        schema: Schema inferred from a sample of the file (may be None).
+
+    Returns:
+        Column type overrides for ``pyarrow.csv.ConvertOptions``.
+    """
+    overrides: dict[str, pa.DataType] = {}
+    for field in schema or []:
+        if pa.types.is_null(field.type):
+            overrides[field.name] = pa.float64()
+        elif pa.types.is_temporal(field.type):
+            overrides[field.name] = pa.string()
+    return overrides
+
+
+def mapping_column_types(mapping: ColumnMapping) -> dict[str, pa.DataType]:
+    """Explicit Arrow types for the numeric columns of a saved column mapping.
+
+    The gain, MAE, MFE and price-after columns are always read as float64, so
+    a column that happens to hold only whole numbers in the sampled block is
+    not parsed as int64 and then rejected when a decimal shows up later.
+    Other columns keep inferred types so they match ``pd.read_csv``.
+
+    Args:
+        mapping: Column mapping saved for the file.
+
+    Returns:
+        Column name to Arrow type.
+    """
+    numeric_columns = [
+        mapping.gain_pct,
+        mapping.mae_pct,
+        mapping.mfe_pct,
+        mapping.price_10_min_after,
+        mapping.price_20_min_after,
+        mapping.price_30_min_after,
+        mapping.price_60_min_after,
+        mapping.price_90_min_after,
+        mapping.price_120_min_after,
+        mapping.price_150_min_after,
+        mapping.price_180_min_after,
+        mapping.price_240_min_after,
+    ]
+    return {column: pa.float64() for column in numeric_columns if column}
+
 
 class FileLoader:
     """Load Excel, CSV, and Parquet files into DataFrames."""
 
     SUPPORTED_EXTENSIONS = {".xlsx", ".xls", ".csv", ".parquet"}
 
+    # Rows read between progress updates / cancellation checks for xlsx files
+    XLSX_PROGRESS_ROWS = 5000
+
+    def __init__(self, csv_engine: str = "pandas") -> None:
+        """Initialize FileLoader.
+
+        Args:
+            csv_engine: CSV backend, one of CSV_ENGINES. "pyarrow" parses with
+                multiple threads and converts to NumPy-backed pandas columns.
+
+        Raises:
+            ValueError: If csv_engine is not supported.
+        """
+        if csv_engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Unsupported CSV engine: {csv_engine}. Supported: {', '.join(CSV_ENGINES)}"
+            )
+        self.csv_engine = csv_engine
+
     def get_sheet_names(self, path: Path) -> list[str]:
         """Get sheet names from an Excel file.
 
@@ -42,12 +142,25 @@ class FileLoader:
             logger.error("Failed to read Excel file: %s", e)
             raise FileLoadError("Unable to read file. The file may be corrupted.") from None
 
-    def load(self, path: Path, sheet: str | None = None) -> pd.DataFrame:
+    def load(
+        self,
+        path: Path,
+        sheet: str | None = None,
+        progress_callback: Callable[[int], None] | None = None,
+        cancel_event: threading.Event | None = None,
+        column_types: dict[str, pa.DataType] | None = None,
+    ) -> pd.DataFrame:
         """Load a file into a DataFrame.
 
         Args:
             path: Path to the file to load.
             sheet: Sheet name for Excel files. If None, uses the first sheet.
+            progress_callback: Called with the percentage (0-100) of rows read.
+                Only reported for .xlsx files, which are read row by row.
+            cancel_event: Checked while reading .xlsx rows; when set the load
+                stops with LoadCancelledError.
+            column_types: Explicit Arrow types for CSV columns (see
+                mapping_column_types). Used by the pyarrow engine.
 
         Returns:
             DataFrame containing the file data.
@@ -66,15 +179,14 @@ class FileLoader:
         try:
             df: pd.DataFrame
             if suffix == ".csv":
-                df = pd.read_csv(path)
+                if self.csv_engine == "pyarrow":
+                    df = self._read_csv_pyarrow(path, column_types)
+                else:
+                    df = pd.read_csv(path)
             elif suffix == ".parquet":
                 df = pd.read_parquet(path)
             elif suffix == ".xlsx":
-                # Use first sheet (index 0) if no sheet specified
-                sheet_to_load = sheet if sheet is not None else 0
-                result = pd.read_excel(path, sheet_name=sheet_to_load, engine="openpyxl")
-                assert isinstance(result, pd.DataFrame)
-                df = result
+                df = self._read_xlsx(path, sheet, progress_callback, cancel_event)
             elif suffix == ".xls":
                 # Use first sheet (index 0) if no sheet specified
                 sheet_to_load = sheet if sheet is not None else 0
@@ -99,6 +211,110 @@ class FileLoader:
             logger.error("Failed to load file: %s", e)
             raise FileLoadError("Unable to read file. The file may be corrupted.") from None
 
+    def _read_csv_pyarrow(
+        self, path: Path, column_types: dict[str, pa.DataType] | None
+    ) -> pd.DataFrame:
+        """Read a CSV with pyarrow's multi-threaded parser.
+
+        Types are inferred from the first block with the same adjustments as
+        the streaming cache (see csv_type_overrides), then explicit
+        ``column_types`` are applied on top. If a later block does not match
+        the inferred types, the file is re-read with the pandas parser.
+
+        Args:
+            path: Path to the CSV file.
+            column_types: Explicit Arrow types for known columns.
+
+        Returns:
+            DataFrame with NumPy-backed columns, as ``pd.read_csv`` returns.
+        """
+        read_opts = pa_csv.ReadOptions(use_threads=True)
+        overrides = csv_type_overrides(probe_csv_schema(path, read_opts))
+        overrides.update(column_types or {})
+        convert_opts = pa_csv.ConvertOptions(column_types=overrides, strings_can_be_null=True)
+
+        try:
+            table = pa_csv.read_csv(path, read_options=read_opts, convert_options=convert_opts)
+        except pa.ArrowInvalid as e:
+            logger.warning("pyarrow could not parse %s, using pandas: %s", path.name, e)
+            return pd.read_csv(path)
+
+        # split_blocks avoids consolidating columns into 2-D blocks, so numeric
+        # columns without nulls convert without a copy
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def _read_xlsx(
+        self,
+        path: Path,
+        sheet: str | None,
+        progress_callback: Callable[[int], None] | None,
+        cancel_event: threading.Event | None,
+    ) -> pd.DataFrame:
+        """Read an .xlsx sheet row by row with openpyxl's read-only mode.
+
+        Cells are converted and parsed the same way ``pd.read_excel`` does, but
+        rows are streamed so progress can be reported and the load cancelled.
+
+        Args:
+            path: Path to the Excel file.
+            sheet: Sheet name. If None, uses the first sheet.
+            progress_callback: Called with the percentage of rows read.
+            cancel_event: Checked every XLSX_PROGRESS_ROWS rows.
+
+        Returns:
+            DataFrame with the sheet contents, header taken from the first row.
+
+        Raises:
+            LoadCancelledError: If cancel_event was set.
+        """
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+        workbook = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            worksheet = workbook[sheet] if sheet is not None else workbook.worksheets[0]
+            # Row count from the sheet's dimension record, if present
+            expected_rows = worksheet.max_row or 0
+            worksheet.reset_dimensions()
+
+            data: list[list[object]] = []
+            last_row_with_data = -1
+            for row_number, row in enumerate(worksheet.rows):
+                converted: list[object] = []
+                for cell in row:
+                    value = cell.value
+                    if value is None:
+                        converted.append("")
+                    elif cell.data_type == TYPE_ERROR:
+                        converted.append(np.nan)
+                    elif cell.data_type == TYPE_NUMERIC and int(value) == value:
+                        converted.append(int(value))
+                    else:
+                        converted.append(value)
+                while converted and converted[-1] == "":
+                    converted.pop()
+                if converted:
+                    last_row_with_data = row_number
+                data.append(converted)
+
+                if row_number % self.XLSX_PROGRESS_ROWS == 0 and row_number > 0:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise LoadCancelledError(f"Loading {path.name} was cancelled")
+                    if progress_callback is not None and expected_rows > 0:
+                        progress_callback(min(99, row_number * 100 // expected_rows))
+        finally:
+            workbook.close()
+
+        data = data[: last_row_with_data + 1]
+        if progress_callback is not None:
+            progress_callback(100)
+        if not data:
+            return pd.DataFrame()
+
+        width = max(len(row) for row in data)
+        data = [row + [""] * (width - len(row)) for row in data]
+        return pd.io.parsers.TextParser(data, header=0, skip_blank_lines=False).read()
+
     def _precompute_columns(
         self, df: pd.DataFrame, column_mapping: dict[str, str | None]
     ) -> pd.DataFrame:
@@ -121,23 +337,14 @@ class FileLoader:
         return result
 
     def _parse_time_to_minutes(self, time_series: pd.Series) -> pd.Series:
-        """Convert time strings to minutes since midnight.
+        """Convert time values to whole minutes since midnight.
 
         Args:
-            time_series: Series of time strings (HH:MM:SS or HH:MM).
+            time_series: Series of time values in any format accepted by
+                time_to_minutes().
 
         Returns:
-            Series of integer minutes.
+            Series of float minutes with seconds truncated, NaN where the
+            time is missing or cannot be parsed.
         """
-
-        def parse_single(t: object) -> int | None:
-            if pd.isna(t):
-                return None
-            if isinstance(t, str):
-                parts = t.split(":")
-                hours = int(parts[0])
-                minutes = int(parts[1]) if len(parts) > 1 else 0
-                return hours * 60 + minutes
-            return None
-
-        return time_series.apply(parse_single)
+        return np.floor(time_to_minutes(time_series))
@@ -1,100 +1,375 @@
-"""Filter engine for bounds-based DataFrame filtering."""
+"""Filter engine for bounds-based DataFrame filtering.
+
+Each FilterCriteria compiles to a NumPy boolean mask over the column's
+array. Masks are memoized per engine by (column, operator, bounds) in a
+bounded LRU, so toggling one filter chip or stepping one threshold in a
+sweep costs a single column comparison and the rest is a bitwise AND of
+cached masks. A column's masks are dropped when the frame's array for
+that column changes.
+
+An engine created with ``range_index=True`` also keeps a sorted index
+(argsort permutation plus sorted values) for each numeric column it
+filters, built on first use. A criterion then resolves to at most two
+contiguous slices of the permutation via ``np.searchsorted``. When the
+most selective criterion keeps few rows, the other criteria are checked
+on its selection only instead of over whole columns, which is what the
+narrow windows of parameter sweeps need.
+"""
 
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import time as dt_time
 
 import numpy as np
 import pandas as pd
 
+from .date_utils import resolve_dates
 from .models import FilterCriteria
+from .time_utils import time_bound_to_minutes, time_to_minutes
+
+__all__ = ["FilterEngine", "time_to_minutes"]
 
 logger = logging.getLogger(__name__)
 
+# Per-criterion masks kept by each FilterEngine
+MASK_CACHE_SIZE = 64
+
+# Largest fraction of rows for which a range-index selection beats masks
+RANGE_SELECTION_MAX_FRACTION = 0.1
+
+_MaskKey = tuple[str, str, float | None, float | None]
+
+
+@dataclass
+class _SortedColumn:
+    """Range index over one numeric column.
+
+    Attributes:
+        order: Row positions sorting the column ascending, NaN last.
+        values: Column values in ``order``.
+        num_valid: Number of non-NaN values (the NaN rows are ``order[num_valid:]``).
+    """
+
+    order: np.ndarray
+    values: np.ndarray
+    num_valid: int
+
+    @classmethod
+    def build(cls, values: np.ndarray) -> "_SortedColumn":
+        """Sort a column once."""
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+        if sorted_values.dtype.kind == "f":
+            num_valid = int(np.searchsorted(np.isnan(sorted_values), True))
+        else:
+            num_valid = len(sorted_values)
+        return cls(order=order, values=sorted_values, num_valid=num_valid)
+
+    def _spans(self, criteria: FilterCriteria) -> list[tuple[int, int]]:
+        """Start/stop positions in ``order`` of the rows passing the criterion."""
+        valid = self.values[: self.num_valid]
+        if criteria.min_val is None:
+            lo = 0
+        else:
+            lo = int(np.searchsorted(valid, criteria.min_val, "left"))
+        if criteria.max_val is None:
+            hi = self.num_valid
+        else:
+            hi = max(lo, int(np.searchsorted(valid, criteria.max_val, "right")))
+
+        total = len(self.order)
+        if criteria.operator == "between":
+            return [(lo, hi)]
+        elif criteria.operator == "not_between":
+            return [(0, lo), (hi, self.num_valid)]
+        elif criteria.operator == "between_blanks":
+            return [(lo, hi), (self.num_valid, total)]
+        else:  # not_between_blanks
+            return [(0, lo), (hi, total)]
+
+    def count(self, criteria: FilterCriteria) -> int:
+        """Number of rows passing the criterion, in O(log n)."""
+        return sum(stop - start for start, stop in self._spans(criteria))
+
+    def select(self, criteria: FilterCriteria) -> np.ndarray:
+        """Row positions passing the criterion, in value order."""
+        parts = [self.order[start:stop] for start, stop in self._spans(criteria)]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+@dataclass
+class _ColumnEntry:
+    """Array a column's cached masks were computed from.
+
+    Attributes:
+        token: Identity of the frame's storage for the column.
+        source: The storage itself, held so its address cannot be reused.
+        values: Numeric array compared against bounds, or None when the
+            column is not numeric and masks come from FilterCriteria.apply.
+        index: Range index over ``values``, built on first use.
+    """
+
+    token: tuple[object, ...]
+    source: object
+    values: np.ndarray | None
+    index: _SortedColumn | None = None
+
+
+def _column_entry(series: pd.Series) -> _ColumnEntry:
+    """Resolve a column to its storage token and comparable values."""
+    token: tuple[object, ...]
+    if isinstance(series.dtype, np.dtype):
+        # View of the frame's block, stable across lookups
+        source = series.to_numpy()
+        token = (
+            source.__array_interface__["data"][0],
+            source.shape,
+            source.strides,
+            source.dtype.str,
+        )
+        values = source if source.dtype.kind in "biuf" else None
+    else:
+        source = series.array
+        token = (id(source), len(source))
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = None
+    return _ColumnEntry(token=token, source=source, values=values)
+
 
-def time_to_minutes(series: pd.Series) -> pd.Series:
-    """Convert a time series to minutes since midnight.
+def criteria_mask(criteria: FilterCriteria, values: np.ndarray) -> np.ndarray:
+    """Evaluate a filter criterion over a numeric column array.
 
-    Handles multiple time formats:
-    - HH:MM:SS strings (e.g., "09:30:00")
-    - HH:MM strings (e.g., "09:30")
-    - Integer HHMMSS (e.g., 93000)
-    - Excel serial time (float 0-1)
-    - datetime.time objects
+    Matches FilterCriteria.apply: NaN never satisfies a bound, and the
+    ``*_blanks`` operators decide whether NaN rows pass.
 
     Args:
-        series: Pandas Series containing time values in any supported format.
+        criteria: Filter criterion to evaluate.
+        values: Numeric column values.
 
     Returns:
-        Pandas Series of float values representing minutes since midnight.
-        NaN values in input are preserved as NaN in output.
+        Boolean array, True where the row passes.
     """
-    if series.empty:
-        return pd.Series([], dtype=float)
+    is_null: np.ndarray = (
+        np.isnan(values) if values.dtype.kind == "f" else np.zeros(len(values), dtype=bool)
+    )
+
+    in_range: np.ndarray
+    with np.errstate(invalid="ignore"):
+        if criteria.min_val is not None and criteria.max_val is not None:
+            in_range = (values >= criteria.min_val) & (values <= criteria.max_val)
+        elif criteria.min_val is not None:
+            in_range = values >= criteria.min_val
+        else:
+            in_range = values <= criteria.max_val
 
-    result = pd.Series(index=series.index, dtype=float)
+    passes: np.ndarray
+    if criteria.operator == "between":
+        passes = in_range
+    elif criteria.operator == "not_between":
+        passes = ~in_range & ~is_null
+    elif criteria.operator == "between_blanks":
+        passes = in_range | is_null
+    else:  # not_between_blanks
+        passes = (~in_range & ~is_null) | is_null
+    return passes
 
-    # Get first non-null value to determine format
-    first_val = series.dropna().iloc[0] if series.notna().any() else None
 
-    if first_val is None:
-        return result
+class FilterEngine:
+    """Apply bounds-based filters to DataFrames."""
 
-    # Strategy 1: datetime.time objects
-    if isinstance(first_val, dt_time):
-        result = series.apply(
-            lambda x: x.hour * 60 + x.minute + x.second / 60 if pd.notna(x) else np.nan
+    def __init__(self, cache_size: int = MASK_CACHE_SIZE, range_index: bool = False) -> None:
+        """Initialize the engine.
+
+        Args:
+            cache_size: Maximum number of per-criterion masks to keep.
+            range_index: Build a sorted index for each filtered numeric column
+                and use it when a criterion selects few rows.
+        """
+        self._cache_size = cache_size
+        self._range_index = range_index
+        self._columns: dict[str, _ColumnEntry] = {}
+        self._masks: OrderedDict[_MaskKey, np.ndarray] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Drop all cached column arrays and masks."""
+        self._columns.clear()
+        self._masks.clear()
+
+    def _column(self, df: pd.DataFrame, column: str) -> _ColumnEntry:
+        """Return the cache entry for a column, replacing it if the storage changed."""
+        entry = _column_entry(df[column])
+        cached = self._columns.get(column)
+        if cached is not None and cached.token == entry.token:
+            return cached
+        # New frame or replaced column: its masks are stale
+        self._masks = OrderedDict(
+            (key, mask) for key, mask in self._masks.items() if key[0] != column
         )
+        self._columns[column] = entry
+        return entry
 
-    # Strategy 2: Excel serial time (float between 0 and 1)
-    elif pd.api.types.is_float_dtype(series):
-        col_values = series.dropna()
-        if len(col_values) > 0 and col_values.between(0, 1).all():
-            result = series * 24 * 60  # Convert fraction of day to minutes
+    def _sorted_column(self, df: pd.DataFrame, column: str) -> _SortedColumn | None:
+        """Return the range index for a column, or None if it cannot have one."""
+        entry = self._column(df, column)
+        if entry.values is None or entry.values.dtype.kind not in "iuf":
+            return None
+        if entry.index is None:
+            entry.index = _SortedColumn.build(entry.values)
+        return entry.index
+
+    def criteria_rows(self, df: pd.DataFrame, criteria: FilterCriteria) -> np.ndarray:
+        """Return the positions of rows passing one criterion via the range index.
+
+        Args:
+            df: Source DataFrame.
+            criteria: Filter criterion on a numeric column.
+
+        Returns:
+            Row positions in ascending column-value order (not row order).
+        """
+        index = self._sorted_column(df, criteria.column)
+        if index is None:
+            return np.flatnonzero(self.criteria_mask(df, criteria))
+        return index.select(criteria)
+
+    def column_token(self, df: pd.DataFrame, column: str) -> tuple[object, ...]:
+        """Return an identity for a column's storage in a frame.
+
+        The token changes when the column is replaced, so callers can tell
+        whether results computed from the column are still valid.
+
+        Args:
+            df: Source DataFrame.
+            column: Column name.
+
+        Returns:
+            Hashable token.
+        """
+        return self._column(df, column).token
+
+    def column_values(self, df: pd.DataFrame, column: str) -> np.ndarray:
+        """Return a column as a NumPy array, from the cache if possible.
+
+        Args:
+            df: Source DataFrame.
+            column: Column name.
+
+        Returns:
+            Numeric array (NaN for missing values) for numeric columns,
+            otherwise the column's values as an array. Treat it as read-only.
+        """
+        entry = self._column(df, column)
+        if entry.values is not None:
+            return entry.values
+        return np.asarray(entry.source)
+
+    def criteria_mask_at(
+        self, df: pd.DataFrame, criteria: FilterCriteria, rows: np.ndarray
+    ) -> np.ndarray:
+        """Evaluate one criterion on selected rows only.
+
+        Args:
+            df: Source DataFrame.
+            criteria: Filter criterion to evaluate.
+            rows: Row positions to check.
+
+        Returns:
+            Boolean array aligned with ``rows``.
+        """
+        values = self._column(df, criteria.column).values
+        if values is not None:
+            return criteria_mask(criteria, values[rows])
+        mask: np.ndarray = self.criteria_mask(df, criteria)[rows]
+        return mask
+
+    def criteria_mask(self, df: pd.DataFrame, criteria: FilterCriteria) -> np.ndarray:
+        """Return the boolean mask of one criterion, from the cache if possible.
+
+        Args:
+            df: Source DataFrame.
+            criteria: Filter criterion to evaluate.
+
+        Returns:
+            Boolean array over the rows of ``df``. Treat it as read-only; it
+            is shared with the cache.
+        """
+        entry = self._column(df, criteria.column)
+        key = (criteria.column, criteria.operator, criteria.min_val, criteria.max_val)
+        mask = self._masks.get(key)
+        if mask is not None:
+            self._masks.move_to_end(key)
+            return mask
+
+        if entry.values is not None:
+            mask = criteria_mask(criteria, entry.values)
         else:
-            logger.warning(
-                "Float column values outside 0-1 range, cannot interpret as Excel serial time. "
-                "First value: %s",
-                first_val
-            )
-            # Return NaN result (already initialized as NaN)
-
-    # Strategy 3: Integer HHMMSS format
-    elif pd.api.types.is_integer_dtype(series):
-        def int_to_minutes(val):
-            if pd.isna(val):
-                return np.nan
-            val_str = str(int(val)).zfill(6)
-            hours = int(val_str[:2])
-            mins = int(val_str[2:4])
-            secs = int(val_str[4:6])
-            return hours * 60 + mins + secs / 60
-        result = series.apply(int_to_minutes)
-
-    # Strategy 4: String formats
-    else:
-        def parse_time_string(val):
-            if pd.isna(val) or val == "":
-                return np.nan
-            val_str = str(val).strip()
-            if ":" in val_str:
-                parts = val_str.split(":")
-                hours = int(parts[0])
-                mins = int(parts[1])
-                secs = int(parts[2]) if len(parts) > 2 else 0
-                return hours * 60 + mins + secs / 60
-            # Try integer format
-            val_str = val_str.zfill(6)
-            hours = int(val_str[:2])
-            mins = int(val_str[2:4])
-            secs = int(val_str[4:6])
-            return hours * 60 + mins + secs / 60
-        result = series.apply(parse_time_string)
-
-    return result
+            mask = criteria.apply(df).to_numpy(dtype=bool, na_value=False)
 
+        self._masks[key] = mask
+        while len(self._masks) > self._cache_size:
+            self._masks.popitem(last=False)
+        return mask
 
-class FilterEngine:
-    """Apply bounds-based filters to DataFrames."""
+    def filter_mask(self, df: pd.DataFrame, filters: list[FilterCriteria]) -> np.ndarray:
+        """Combine filters with AND logic into one boolean mask.
+
+        Args:
+            df: Source DataFrame.
+            filters: Filter criteria to apply.
+
+        Returns:
+            Boolean array over the rows of ``df`` (a new array).
+        """
+        mask = np.ones(len(df), dtype=bool)
+        for criteria in filters:
+            mask &= self.criteria_mask(df, criteria)
+        return mask
+
+    def filter_rows(self, df: pd.DataFrame, filters: list[FilterCriteria]) -> np.ndarray:
+        """Return the positions of rows passing all filters.
+
+        Args:
+            df: Source DataFrame.
+            filters: Filter criteria to apply.
+
+        Returns:
+            Ascending row positions, usable with ``df.take``.
+        """
+        if self._range_index and filters:
+            rows = self._select_rows(df, filters)
+            if rows is not None:
+                return rows
+        return np.flatnonzero(self.filter_mask(df, filters))
+
+    def _select_rows(self, df: pd.DataFrame, filters: list[FilterCriteria]) -> np.ndarray | None:
+        """Intersect filters starting from the smallest range-index selection.
+
+        Returns:
+            Ascending row positions, or None when no criterion is selective
+            enough for the selection path to beat whole-column masks.
+        """
+        best: FilterCriteria | None = None
+        best_count = int(len(df) * RANGE_SELECTION_MAX_FRACTION)
+        for criteria in filters:
+            index = self._sorted_column(df, criteria.column)
+            if index is None:
+                continue
+            count = index.count(criteria)
+            if count <= best_count:
+                best, best_count = criteria, count
+        if best is None:
+            return None
+
+        rows = self.criteria_rows(df, best)
+        for criteria in filters:
+            if criteria is best or len(rows) == 0:
+                continue
+            # Check only the rows still selected
+            rows = rows[self.criteria_mask_at(df, criteria, rows)]
+        return np.sort(rows)
 
     def apply_filters(
         self,
@@ -113,14 +388,12 @@ class FilterEngine:
         if not filters:
             return df.copy()
 
-        mask = pd.Series(True, index=df.index)
-        for criteria in filters:
-            mask &= criteria.apply(df)
+        rows = self.filter_rows(df, filters)
 
         logger.debug(
-            "Filter applied: %d rows match out of %d", mask.sum(), len(df)
+            "Filter applied: %d rows match out of %d", len(rows), len(df)
         )
-        return df[mask].copy()
+        return df.take(rows)
 
     def apply_date_range(
         self,
@@ -149,7 +422,7 @@ class FilterEngine:
             logger.warning("Date column '%s' not found in DataFrame", date_col)
             return df.copy()
 
-        col = pd.to_datetime(df[date_col], dayfirst=True, format="mixed", errors="coerce")
+        col = resolve_dates(df, date_col)
         mask = pd.Series(True, index=df.index)
 
         if start is not None:
@@ -164,16 +437,23 @@ class FilterEngine:
     def apply_time_range(
         df: pd.DataFrame,
         time_col: str,
-        start_time: str | None,
-        end_time: str | None,
+        start_time: str | dt_time | None,
+        end_time: str | dt_time | None,
+        minutes_col: str | None = None,
     ) -> pd.DataFrame:
         """Filter DataFrame by time-of-day range.
 
+        Times are compared as minutes since midnight, so the filter is a
+        numeric range mask. Pass ``minutes_col`` to use minutes computed once
+        at mapping time instead of parsing ``time_col``.
+
         Args:
             df: DataFrame to filter.
             time_col: Column containing time values.
             start_time: Start time in HH:MM:SS format, or None for no lower bound.
             end_time: End time in HH:MM:SS format, or None for no upper bound.
+            minutes_col: Column holding time_to_minutes() of ``time_col``, used
+                when present.
 
         Returns:
             Filtered DataFrame.
@@ -181,133 +461,34 @@ class FilterEngine:
         if start_time is None and end_time is None:
             return df.copy()
 
-        if time_col not in df.columns:
-            logger.warning("Time column '%s' not found, skipping time filter", time_col)
-            return df.copy()
-
-        # Get raw time values for diagnostic
-        raw_values = df[time_col].head(5).tolist()
-        first_val = df[time_col].iloc[0] if len(df) > 0 else None
-        logger.info(
-            "Time filter: column '%s', dtype=%s, sample values: %s, first_val type: %s",
-            time_col, df[time_col].dtype, raw_values, type(first_val).__name__
-        )
-
-        # Try multiple parsing strategies
-        time_series = None
-
-        # Strategy 1: Check if column already contains datetime.time objects
-        if first_val is not None and isinstance(first_val, dt_time):
-            # Already time objects - use directly
-            time_series = df[time_col]
-            logger.info("Time filter: column already contains time objects")
-
-        # Strategy 2: Check if column contains datetime objects (extract time)
-        elif first_val is not None and hasattr(first_val, 'time') and callable(first_val.time):
-            # datetime objects - extract time component
-            time_series = df[time_col].apply(lambda x: x.time() if pd.notna(x) else None)
-            logger.info("Time filter: extracted time from datetime objects")
-
-        # Strategy 3: Check if it's a pandas datetime dtype
-        elif pd.api.types.is_datetime64_any_dtype(df[time_col]):
-            time_series = pd.to_datetime(df[time_col]).dt.time
-            logger.info("Time filter: extracted time from datetime64 column")
-
-        # Strategy 4: Check if it's Excel serial time (float between 0 and 1)
-        elif pd.api.types.is_float_dtype(df[time_col]):
-            col_values = df[time_col].dropna()
-            if len(col_values) > 0 and col_values.between(0, 1).all():
-                # Excel serial time: fraction of 24 hours
-                # Convert to timedelta, then extract time (handle NaN values)
-                total_seconds = df[time_col].fillna(0) * 24 * 60 * 60
-                hours = (total_seconds // 3600).astype(int) % 24
-                minutes = ((total_seconds % 3600) // 60).astype(int)
-                seconds = (total_seconds % 60).astype(int)
-                time_strings = (
-                    hours.astype(str) + ":" + minutes.astype(str) + ":" + seconds.astype(str)
-                )
-                # Set NaN positions back to NaT
-                parsed_times = pd.to_datetime(time_strings, format="%H:%M:%S", errors="coerce")
-                time_series = parsed_times.dt.time
-                time_series = time_series.where(df[time_col].notna(), None)
-                logger.info("Time filter: converted from Excel serial time (float 0-1)")
-            else:
-                logger.warning(
-                    "Time filter: float column '%s' values not in 0-1 range for Excel time. "
-                    "Sample: %s",
-                    time_col, raw_values
-                )
+        if minutes_col is not None and minutes_col in df.columns:
+            minutes = df[minutes_col]
+        elif time_col in df.columns:
+            if df.empty:
                 return df.copy()
-
+            minutes = time_to_minutes(df[time_col])
         else:
-            # Strategy 4: Parse string formats
-            try:
-                # Try HH:MM:SS format first
-                parsed = pd.to_datetime(df[time_col], format="%H:%M:%S", errors="coerce")
-                if parsed.notna().sum() > 0:
-                    time_series = parsed.dt.time
-                    logger.info("Time filter: parsed using HH:MM:SS format")
-                else:
-                    # Try HH:MM format (no seconds)
-                    parsed = pd.to_datetime(df[time_col], format="%H:%M", errors="coerce")
-                    if parsed.notna().sum() > 0:
-                        time_series = parsed.dt.time
-                        logger.info("Time filter: parsed using HH:MM format")
-                    else:
-                        # Try mixed format as last resort
-                        parsed = pd.to_datetime(df[time_col], format="mixed", errors="coerce")
-                        if parsed.notna().sum() > 0:
-                            time_series = parsed.dt.time
-                            logger.info("Time filter: parsed using mixed format")
-                        else:
-                            logger.warning(
-                                "Time filter: could not parse any values from '%s'. "
-                                "Sample: %s",
-                                time_col, raw_values
-                            )
-                            return df.copy()
-            except Exception as e:
-                logger.warning("Time filter: failed to parse column '%s': %s", time_col, e)
-                return df.copy()
-
-        if time_series is None:
-            logger.warning("Time filter: could not parse column '%s'", time_col)
+            logger.warning("Time column '%s' not found, skipping time filter", time_col)
             return df.copy()
 
-        # Check how many values parsed successfully
-        valid_count = time_series.notna().sum()
-        logger.info(
-            "Time filter: %d of %d values parsed successfully",
-            valid_count, len(df)
-        )
-
-        if valid_count == 0:
+        valid_count = int(minutes.notna().sum())
+        if valid_count == 0 and not df.empty:
             logger.warning(
                 "Time filter: 0 values parsed from column '%s'. "
                 "Sample values: %s. Check time format.",
-                time_col, raw_values
+                time_col, df[time_col].head(5).tolist() if time_col in df.columns else [],
             )
             return df.copy()
 
         mask = pd.Series(True, index=df.index)
-
         if start_time is not None:
-            # Handle both string and datetime.time inputs
-            if isinstance(start_time, dt_time):
-                start = start_time
-            else:
-                start = dt_time.fromisoformat(start_time)
-            mask &= time_series >= start
-
+            mask &= minutes >= time_bound_to_minutes(start_time)
         if end_time is not None:
-            # Handle both string and datetime.time inputs
-            end = end_time if isinstance(end_time, dt_time) else dt_time.fromisoformat(end_time)
-            mask &= time_series <= end
+            mask &= minutes <= time_bound_to_minutes(end_time)
 
-        result_count = mask.sum()
         logger.debug(
             "Time filter: %d of %d rows match range %s to %s",
-            result_count, len(df), start_time, end_time
+            mask.sum(), len(df), start_time, end_time
         )
 
         return df[mask].copy()
@@ -0,0 +1,634 @@
+"""Filter expression language.
+
+Expressions combine conditions that a stack of FilterCriteria chips
+cannot express, for example::
+
+    gain_pct > 0 and (mfe_pct >= 2 * mae_pct or ticker in ('AAPL', 'MSFT'))
+    not (volume between 1000 and 5000) and time_of_day <= 10:30
+
+Supported syntax:
+
+- ``and``, ``or``, ``not`` and parentheses
+- comparisons ``< <= > >= = == !=`` between columns, numbers and strings
+- ``+ - * /`` arithmetic on numeric operands
+- ``x between a and b``, ``x in (...)``, ``x not in (...)``
+- ``x is null``, ``x is not null``
+- ``time_of_day``, the mapped time column as minutes since midnight,
+  compared against ``HH:MM`` or ``HH:MM:SS`` literals
+- backquoted column names for names that are not identifiers:
+  ```gain %` > 1``
+
+Keywords are case-insensitive. Like FilterCriteria, a comparison never
+passes a row where either side is missing.
+
+An expression is parsed into an AST once and constant-folded. Each
+evaluation orders the operands of ``and``/``or`` by the pass rate measured
+on a sample of rows, then evaluates them with NumPy over the filter
+engine's cached column arrays. An ``and`` checks each further operand only
+on the rows still passing, and an ``or`` only on the rows not yet passing,
+so the most selective conditions shrink the work for the rest.
+"""
+
+import logging
+import operator
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import FilterExpressionError
+from .filter_engine import FilterEngine
+from .time_utils import TIME_MINUTES_COLUMN, time_bound_to_minutes, time_to_minutes
+
+logger = logging.getLogger(__name__)
+
+# Name of the pseudo-column holding the time of day in minutes
+TIME_OF_DAY = "time_of_day"
+
+# Rows sampled to estimate the pass rate of each and/or operand
+SELECTIVITY_SAMPLE_SIZE = 1024
+
+_KEYWORDS = {"and", "or", "not", "in", "is", "null", "between", "true", "false"}
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<time>\d{1,2}:\d{2}(?::\d{2})?)
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<string>'[^']*'|"[^"]*")
+    | (?P<quoted>`[^`]+`)
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<op><=|>=|==|!=|<>|[<>=+\-*/(),])
+    """,
+    re.VERBOSE,
+)
+
+_COMPARISONS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Comparison with its operands swapped
+_FLIPPED = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+
+_ARITHMETIC = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
+
+# ---------------------------------------------------------------------------
+# AST
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Literal:
+    """Constant number, string or boolean."""
+
+    value: float | str | bool
+
+
+@dataclass(frozen=True)
+class Column:
+    """Column of the filtered frame (or ``time_of_day``)."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class Arithmetic:
+    """Binary arithmetic on two operands."""
+
+    op: str
+    left: "Node"
+    right: "Node"
+
+
+@dataclass(frozen=True)
+class Compare:
+    """Comparison of two operands."""
+
+    op: str
+    left: "Node"
+    right: "Node"
+
+
+@dataclass(frozen=True)
+class InList:
+    """Membership of an operand in a list of constants."""
+
+    operand: "Node"
+    values: tuple[float | str | bool, ...]
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class IsNull:
+    """Missing-value test."""
+
+    operand: "Node"
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class And:
+    """Conjunction of predicates."""
+
+    terms: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    """Disjunction of predicates."""
+
+    terms: tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    """Negation of a predicate."""
+
+    term: "Node"
+
+
+Node = Literal | Column | Arithmetic | Compare | InList | IsNull | And | Or | Not
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split an expression into (kind, text) tokens."""
+    tokens: list[tuple[str, str]] = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if match is None:
+            raise FilterExpressionError(
+                f"Unexpected character {text[position]!r} at position {position}"
+            )
+        kind = match.lastgroup or ""
+        value = match.group()
+        position = match.end()
+        if kind == "space":
+            continue
+        if kind == "name" and value.lower() in _KEYWORDS:
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value))
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing the AST."""
+
+    def __init__(self, text: str) -> None:
+        self._tokens = _tokenize(text)
+        self._position = 0
+
+    def parse(self) -> Node:
+        if not self._tokens:
+            raise FilterExpressionError("Expression is empty")
+        node = self._or()
+        if self._position < len(self._tokens):
+            raise FilterExpressionError(f"Unexpected {self._tokens[self._position][1]!r}")
+        return node
+
+    def _peek(self) -> tuple[str, str] | None:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _accept(self, *values: str) -> str | None:
+        token = self._peek()
+        if token is not None and token[0] in ("keyword", "op") and token[1] in values:
+            self._position += 1
+            return token[1]
+        return None
+
+    def _expect(self, value: str) -> None:
+        if self._accept(value) is None:
+            token = self._peek()
+            found = "end of expression" if token is None else repr(token[1])
+            raise FilterExpressionError(f"Expected {value!r}, found {found}")
+
+    def _or(self) -> Node:
+        terms = [self._and()]
+        while self._accept("or"):
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else Or(tuple(terms))
+
+    def _and(self) -> Node:
+        terms = [self._not()]
+        while self._accept("and"):
+            terms.append(self._not())
+        return terms[0] if len(terms) == 1 else And(tuple(terms))
+
+    def _not(self) -> Node:
+        if self._accept("not"):
+            return Not(self._not())
+        return self._predicate()
+
+    def _predicate(self) -> Node:
+        left = self._sum()
+
+        op = self._accept("<", "<=", ">", ">=", "=", "==", "!=", "<>")
+        if op is not None:
+            op = {"=": "==", "<>": "!="}.get(op, op)
+            return Compare(op, left, self._sum())
+
+        if self._accept("between"):
+            low = self._sum()
+            self._expect("and")
+            high = self._sum()
+            return And((Compare(">=", left, low), Compare("<=", left, high)))
+
+        if self._accept("not"):
+            self._expect("in")
+            return InList(left, self._list(), negated=True)
+        if self._accept("in"):
+            return InList(left, self._list())
+
+        if self._accept("is"):
+            negated = self._accept("not") is not None
+            self._expect("null")
+            return IsNull(left, negated=negated)
+
+        # Bare operand: a boolean column or constant
+        return left
+
+    def _list(self) -> tuple[float | str | bool, ...]:
+        self._expect("(")
+        values = [self._constant()]
+        while self._accept(","):
+            values.append(self._constant())
+        self._expect(")")
+        return tuple(values)
+
+    def _constant(self) -> float | str | bool:
+        node = _fold(self._sum())
+        if not isinstance(node, Literal):
+            raise FilterExpressionError("'in' lists may only contain constants")
+        return node.value
+
+    def _sum(self) -> Node:
+        node = self._product()
+        while (op := self._accept("+", "-")) is not None:
+            node = Arithmetic(op, node, self._product())
+        return node
+
+    def _product(self) -> Node:
+        node = self._unary()
+        while (op := self._accept("*", "/")) is not None:
+            node = Arithmetic(op, node, self._unary())
+        return node
+
+    def _unary(self) -> Node:
+        if self._accept("-"):
+            return Arithmetic("-", Literal(0.0), self._unary())
+        if self._accept("+"):
+            return self._unary()
+        return self._atom()
+
+    def _atom(self) -> Node:
+        if self._accept("("):
+            node = self._or()
+            self._expect(")")
+            return node
+
+        token = self._peek()
+        if token is None:
+            raise FilterExpressionError("Unexpected end of expression")
+        kind, value = token
+        self._position += 1
+
+        if kind == "number":
+            return Literal(float(value))
+        if kind == "time":
+            if value.index(":") == 1:
+                value = "0" + value
+            try:
+                return Literal(time_bound_to_minutes(value))
+            except ValueError as e:
+                raise FilterExpressionError(f"Invalid time {value!r}") from e
+        if kind == "string":
+            return Literal(value[1:-1])
+        if kind == "quoted":
+            return Column(value[1:-1])
+        if kind == "name":
+            return Column(value)
+        if kind == "keyword" and value in ("true", "false"):
+            return Literal(value == "true")
+        raise FilterExpressionError(f"Unexpected {value!r}")
+
+
+# ---------------------------------------------------------------------------
+# Constant folding
+# ---------------------------------------------------------------------------
+
+
+def _fold(node: Node) -> Node:
+    """Evaluate constant subexpressions and simplify boolean structure."""
+    if isinstance(node, Arithmetic):
+        left, right = _fold(node.left), _fold(node.right)
+        if isinstance(left, Literal) and isinstance(right, Literal):
+            try:
+                return Literal(_ARITHMETIC[node.op](left.value, right.value))
+            except (TypeError, ZeroDivisionError) as e:
+                raise FilterExpressionError(f"Cannot evaluate {node.op!r}: {e}") from e
+        return Arithmetic(node.op, left, right)
+
+    if isinstance(node, Compare):
+        left, right = _fold(node.left), _fold(node.right)
+        if isinstance(left, Literal) and isinstance(right, Literal):
+            try:
+                return Literal(bool(_COMPARISONS[node.op](left.value, right.value)))
+            except TypeError as e:
+                raise FilterExpressionError(
+                    f"Cannot compare {left.value!r} with {right.value!r}"
+                ) from e
+        if isinstance(left, Literal):
+            # Keep the column on the left
+            return Compare(_FLIPPED[node.op], right, left)
+        return Compare(node.op, left, right)
+
+    if isinstance(node, InList):
+        operand = _fold(node.operand)
+        if isinstance(operand, Literal):
+            return Literal((operand.value in node.values) != node.negated)
+        return InList(operand, node.values, node.negated)
+
+    if isinstance(node, IsNull):
+        operand = _fold(node.operand)
+        if isinstance(operand, Literal):
+            return Literal(node.negated)
+        return IsNull(operand, node.negated)
+
+    if isinstance(node, Not):
+        term = _fold(node.term)
+        if isinstance(term, Literal):
+            return Literal(not term.value)
+        if isinstance(term, Not):
+            return term.term
+        return Not(term)
+
+    if isinstance(node, (And, Or)):
+        # Constant that decides the result, and constant that can be dropped
+        absorbing = isinstance(node, Or)
+        terms = []
+        for term in map(_fold, node.terms):
+            # Flatten nested terms of the same kind
+            for part in term.terms if type(term) is type(node) else (term,):
+                if isinstance(part, Literal):
+                    if bool(part.value) == absorbing:
+                        return Literal(absorbing)
+                    continue
+                terms.append(part)
+        if not terms:
+            return Literal(not absorbing)
+        if len(terms) == 1:
+            return terms[0]
+        return type(node)(tuple(terms))
+
+    return node
+
+
+def _columns(node: Node) -> set[str]:
+    """Names of the columns an expression reads."""
+    if isinstance(node, Column):
+        return {node.name}
+    if isinstance(node, (Arithmetic, Compare)):
+        return _columns(node.left) | _columns(node.right)
+    if isinstance(node, (InList, IsNull)):
+        return _columns(node.operand)
+    if isinstance(node, Not):
+        return _columns(node.term)
+    if isinstance(node, (And, Or)):
+        return set().union(*(_columns(term) for term in node.terms))
+    return set()
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+class _Evaluator:
+    """Evaluate a folded AST over one frame."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        engine: FilterEngine,
+        time_col: str | None,
+    ) -> None:
+        self._df = df
+        self._engine = engine
+        self._time_col = time_col
+        self._arrays: dict[str, np.ndarray] = {}
+
+    def _column(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is not None:
+            return array
+
+        if name in self._df.columns:
+            array = self._engine.column_values(self._df, name)
+        elif name == TIME_OF_DAY:
+            if TIME_MINUTES_COLUMN in self._df.columns:
+                array = self._engine.column_values(self._df, TIME_MINUTES_COLUMN)
+            elif self._time_col is not None and self._time_col in self._df.columns:
+                minutes = time_to_minutes(self._df[self._time_col])
+                array = minutes.to_numpy(dtype=float, na_value=np.nan)
+            else:
+                raise FilterExpressionError("time_of_day needs a mapped time column")
+        else:
+            raise FilterExpressionError(f"Unknown column {name!r}")
+
+        self._arrays[name] = array
+        return array
+
+    def value(self, node: Node, rows: np.ndarray | None) -> np.ndarray | float | str | bool:
+        """Values of an operand on the given rows (all rows for None)."""
+        if isinstance(node, Literal):
+            return node.value
+        if isinstance(node, Column):
+            array = self._column(node.name)
+            return array if rows is None else array[rows]
+        if isinstance(node, Arithmetic):
+            left = self.value(node.left, rows)
+            right = self.value(node.right, rows)
+            try:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    result: np.ndarray | float | str | bool = _ARITHMETIC[node.op](left, right)
+            except TypeError as e:
+                raise FilterExpressionError(f"Cannot apply {node.op!r}: {e}") from e
+            return result
+        raise FilterExpressionError("Expected a value, found a condition")
+
+    def mask(self, node: Node, rows: np.ndarray | None) -> np.ndarray:
+        """Boolean result of a predicate on the given rows (all rows for None)."""
+        # Every caller negates masks with ``~``, so they must never be ints
+        return np.asarray(self._mask(node, rows), dtype=bool)
+
+    def _mask(self, node: Node, rows: np.ndarray | None) -> np.ndarray:
+        num_rows = len(self._df) if rows is None else len(rows)
+
+        if isinstance(node, Literal):
+            return np.full(num_rows, bool(node.value))
+
+        if isinstance(node, Column):
+            values = self._column(node.name)
+            if values.dtype.kind != "b":
+                raise FilterExpressionError(f"Column {node.name!r} is not a condition")
+            # Copy: the whole column is the engine's cached array
+            return values.copy() if rows is None else values[rows]
+
+        if isinstance(node, Compare):
+            left = self.value(node.left, rows)
+            right = self.value(node.right, rows)
+            try:
+                with np.errstate(invalid="ignore"):
+                    result = np.asarray(_COMPARISONS[node.op](left, right), dtype=bool)
+            except TypeError as e:
+                raise FilterExpressionError(f"Cannot compare with {node.op!r}: {e}") from e
+            # Missing values never pass a comparison
+            passes: np.ndarray = result & ~_isnull(left) & ~_isnull(right)
+            return passes
+
+        if isinstance(node, InList):
+            operand = self.value(node.operand, rows)
+            found: np.ndarray = pd.Series(operand, copy=False).isin(node.values).to_numpy()
+            if node.negated:
+                found = ~found & ~_isnull(operand)
+            return found
+
+        if isinstance(node, IsNull):
+            is_null = _isnull(self.value(node.operand, rows))
+            return ~is_null if node.negated else is_null
+
+        if isinstance(node, Not):
+            return ~self.mask(node.term, rows)
+
+        if isinstance(node, And):
+            return self._combine(node.terms, rows, num_rows, passing=False)
+
+        if isinstance(node, Or):
+            return self._combine(node.terms, rows, num_rows, passing=True)
+
+        raise FilterExpressionError("Expected a condition, found a value")
+
+    def _combine(
+        self, terms: tuple[Node, ...], rows: np.ndarray | None, num_rows: int, passing: bool
+    ) -> np.ndarray:
+        """Evaluate and/or terms, each only on the rows still undecided.
+
+        For ``and`` (passing=False) a row is decided once a term fails; for
+        ``or`` (passing=True) once a term passes.
+        """
+        result = np.full(num_rows, passing)
+        undecided = None  # positions within ``rows``; None means all of them
+        for term in terms:
+            if undecided is None:
+                decided = self.mask(term, rows) == passing
+                undecided = np.flatnonzero(~decided)
+            else:
+                subset = undecided if rows is None else rows[undecided]
+                decided = self.mask(term, subset) == passing
+                undecided = undecided[~decided]
+            if len(undecided) == 0:
+                return result
+        result[undecided] = not passing
+        return result
+
+    def order(self, node: Node, sample: np.ndarray) -> Node:
+        """Reorder and/or terms by their pass rate on a sample of rows.
+
+        ``and`` puts the terms that fail most rows first; ``or`` puts the
+        terms that pass most rows first.
+        """
+        if isinstance(node, Not):
+            return Not(self.order(node.term, sample))
+        if not isinstance(node, (And, Or)):
+            return node
+
+        terms = [self.order(term, sample) for term in node.terms]
+        rates = [float(self.mask(term, sample).mean()) for term in terms]
+        descending = isinstance(node, Or)
+        ranked = sorted(zip(rates, range(len(terms)), strict=True), reverse=descending)
+        return type(node)(tuple(terms[index] for _, index in ranked))
+
+
+def _isnull(values: np.ndarray | float | str | bool) -> np.ndarray:
+    """Missing-value mask of an operand (a 0-d array for a constant)."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biu":
+        return np.zeros(len(values), dtype=bool)
+    return np.asarray(pd.isna(values), dtype=bool)
+
+
+class FilterExpression:
+    """Parsed and constant-folded filter expression.
+
+    Attributes:
+        text: Source text of the expression.
+        columns: Names of the columns the expression reads.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Parse an expression.
+
+        Args:
+            text: Expression source.
+
+        Raises:
+            FilterExpressionError: If the expression is not valid.
+        """
+        self.text = text
+        self._root = _fold(_Parser(text).parse())
+        self.columns = sorted(_columns(self._root))
+
+    def __repr__(self) -> str:
+        return f"FilterExpression({self.text!r})"
+
+    def mask(
+        self,
+        df: pd.DataFrame,
+        engine: FilterEngine | None = None,
+        time_col: str | None = None,
+    ) -> np.ndarray:
+        """Evaluate the expression over a frame.
+
+        Args:
+            df: Trade data.
+            engine: FilterEngine whose cached column arrays to use.
+            time_col: Mapped time column, read by ``time_of_day`` when the
+                frame has no ``time_minutes`` column.
+
+        Returns:
+            Boolean array over the rows of ``df``.
+
+        Raises:
+            FilterExpressionError: If a column is missing or the types of a
+                comparison do not match.
+        """
+        evaluator = _Evaluator(df, engine if engine is not None else FilterEngine(), time_col)
+        root = self._root
+        if isinstance(root, (And, Or, Not)) and len(df) > 0:
+            num_samples = min(len(df), SELECTIVITY_SAMPLE_SIZE)
+            sample = np.unique(np.linspace(0, len(df) - 1, num_samples).astype(np.intp))
+            root = evaluator.order(root, sample)
+
+        mask = evaluator.mask(root, None)
+        logger.debug(
+            "Filter expression %r: %d rows match out of %d", self.text, mask.sum(), len(df)
+        )
+        return mask
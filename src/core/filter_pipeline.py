@@ -0,0 +1,432 @@
+"""Incremental filter chain for the Feature Explorer.
+
+The explorer's chain (column filters, filter expression, date range,
+time range, first trigger) used to be recomputed from the full baseline on every change.
+FilterPipeline keeps each stage's selection vector together with a
+per-row count of failed stages, so a change only touches the rows it can
+affect:
+
+- tightening a bound re-checks only the rows that passed that stage,
+- loosening a bound re-checks only the rows that stage excluded,
+- adding or removing a stage adjusts the fail count of the rows it fails,
+- the first trigger is recomputed only for the ticker-date groups that
+  contain a row whose visibility changed.
+
+Rows pass the chain where their fail count is zero.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .date_utils import DATE_NS_COLUMN, NAT_ORDINAL, resolve_dates
+from .filter_engine import FilterEngine
+from .filter_expression import FilterExpression
+from .first_trigger import TRIGGER_GROUP_COLUMN, TriggerGroups
+from .models import FilterCriteria
+from .time_utils import TIME_MINUTES_COLUMN, time_bound_to_minutes, time_to_minutes
+
+logger = logging.getLogger(__name__)
+
+_Bounds = tuple[float | None, float | None]
+
+# Evaluates a stage on row positions (or all rows for None)
+_Evaluator = Callable[[np.ndarray | None], np.ndarray]
+
+
+@dataclass(eq=False)
+class _Stage:
+    """One filter stage and the rows it currently passes.
+
+    Attributes:
+        family: (kind, column, operator, storage token). Stages of the same
+            family differ only in their bounds, so one can be refined into
+            another.
+        bounds: (lower, upper) bound; None for an open side.
+        mask: Boolean array over baseline rows, True where the row passes.
+    """
+
+    family: tuple[object, ...]
+    bounds: _Bounds
+    mask: np.ndarray
+
+
+@dataclass
+class _StageSpec:
+    """A requested stage, evaluated only on the rows that need checking."""
+
+    family: tuple[object, ...]
+    bounds: _Bounds
+    evaluate: _Evaluator
+
+
+def _narrows(operator: str, old: _Bounds, new: _Bounds) -> bool:
+    """Return True if the new bounds pass a subset of the rows the old ones pass."""
+    old_lo = -np.inf if old[0] is None else old[0]
+    old_hi = np.inf if old[1] is None else old[1]
+    new_lo = -np.inf if new[0] is None else new[0]
+    new_hi = np.inf if new[1] is None else new[1]
+    if operator.startswith("not_between"):
+        # Rows outside the range pass, so a wider range passes fewer rows
+        return new_lo <= old_lo and new_hi >= old_hi
+    return new_lo >= old_lo and new_hi <= old_hi
+
+
+def _range_mask(values: np.ndarray, valid: np.ndarray, bounds: _Bounds) -> np.ndarray:
+    """Inclusive range check that never passes missing values."""
+    mask = valid.copy()
+    with np.errstate(invalid="ignore"):
+        if bounds[0] is not None:
+            mask &= values >= bounds[0]
+        if bounds[1] is not None:
+            mask &= values <= bounds[1]
+    return mask
+
+
+class FilterPipeline:
+    """Maintain the filtered view of one baseline incrementally.
+
+    The pipeline is tied to a baseline frame; passing a different frame (or
+    one whose length changed) starts over. Stage results are also tied to
+    the storage of the columns they read, so a replaced column is
+    re-evaluated rather than refined.
+    """
+
+    def __init__(self, engine: FilterEngine | None = None) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            engine: FilterEngine evaluating column filters; its mask cache is
+                shared with other users of the engine.
+        """
+        self._engine = engine if engine is not None else FilterEngine()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the baseline and every stage."""
+        self._baseline: pd.DataFrame | None = None
+        self._stages: list[_Stage] = []
+        self._fail_count = np.zeros(0, dtype=np.uint16)
+        self._values: dict[tuple[str, str], tuple[tuple[object, ...], np.ndarray, np.ndarray]] = {}
+        self._groups: TriggerGroups | None = None
+        self._groups_key: tuple[object, ...] | None = None
+        self._first_pos: np.ndarray | None = None
+
+    @property
+    def filtered_count(self) -> int:
+        """Number of baseline rows passing every stage (before first trigger)."""
+        return int(np.count_nonzero(self._fail_count == 0))
+
+    def update(
+        self,
+        baseline: pd.DataFrame,
+        filters: list[FilterCriteria],
+        date_col: str | None = None,
+        date_start: str | None = None,
+        date_end: str | None = None,
+        time_col: str | None = None,
+        time_start: str | None = None,
+        time_end: str | None = None,
+        minutes_col: str | None = None,
+        first_trigger_cols: tuple[str, str, str] | None = None,
+        expression: FilterExpression | None = None,
+        expression_time_col: str | None = None,
+    ) -> np.ndarray:
+        """Bring the view up to date with the current filter state.
+
+        Args:
+            baseline: Baseline trade data.
+            filters: Column filters, combined with AND logic.
+            date_col: Mapped date column, or None for no date filter.
+            date_start: Start date ISO string (inclusive), or None.
+            date_end: End date ISO string (inclusive), or None.
+            time_col: Mapped time column, or None for no time filter.
+            time_start: Start time in HH:MM:SS format, or None.
+            time_end: End time in HH:MM:SS format, or None.
+            minutes_col: Column holding time_to_minutes() of ``time_col``,
+                used when present.
+            first_trigger_cols: (ticker, date, time) columns to keep only the
+                first passing row per ticker-date, or None to keep all rows.
+            expression: Filter expression ANDed with the other stages, or None.
+            expression_time_col: Mapped time column read by ``time_of_day``
+                in the expression.
+
+        Returns:
+            Baseline row positions of the view: ascending, or in first-trigger
+            order (ticker, date, time) when first trigger is applied.
+        """
+        num_rows = len(baseline)
+        if baseline is not self._baseline or num_rows != len(self._fail_count):
+            self.reset()
+            self._baseline = baseline
+            self._fail_count = np.zeros(num_rows, dtype=np.uint16)
+
+        specs = [self._column_spec(baseline, criteria) for criteria in filters]
+        if expression is not None:
+            specs.append(self._expression_spec(baseline, expression, expression_time_col))
+        date_spec = self._date_spec(baseline, date_col, date_start, date_end)
+        if date_spec is not None:
+            specs.append(date_spec)
+        time_spec = self._time_spec(baseline, time_col, time_start, time_end, minutes_col)
+        if time_spec is not None:
+            specs.append(time_spec)
+
+        try:
+            changed = self._apply_specs(specs)
+        except Exception:
+            # Stages may be half-updated; start over on the next call
+            self.reset()
+            raise
+        visible = self._fail_count == 0
+
+        if first_trigger_cols is None:
+            self._first_pos = None
+            return np.flatnonzero(visible)
+        return self._first_trigger_rows(baseline, first_trigger_cols, visible, changed)
+
+    def _apply_specs(self, specs: list[_StageSpec]) -> np.ndarray:
+        """Match requested stages to current ones and update the fail counts.
+
+        Returns:
+            Row positions whose fail count changed (may repeat).
+        """
+        remaining = list(self._stages)
+        stages: list[_Stage] = []
+        changed: list[np.ndarray] = []
+        checked = 0
+
+        for spec in specs:
+            stage = next(
+                (s for s in remaining if s.family == spec.family and s.bounds == spec.bounds),
+                None,
+            )
+            if stage is None:
+                stage = next((s for s in remaining if s.family == spec.family), None)
+            if stage is not None:
+                remaining.remove(stage)
+
+            if stage is None:
+                mask = spec.evaluate(None)
+                failing = np.flatnonzero(~mask)
+                self._fail_count[failing] += 1
+                changed.append(failing)
+                checked += len(mask)
+                stage = _Stage(family=spec.family, bounds=spec.bounds, mask=mask)
+            elif stage.bounds != spec.bounds:
+                operator = str(spec.family[2])
+                if _narrows(operator, stage.bounds, spec.bounds):
+                    rows = np.flatnonzero(stage.mask)
+                    dropped = rows[~spec.evaluate(rows)]
+                    gained = rows[:0]
+                elif _narrows(operator, spec.bounds, stage.bounds):
+                    rows = np.flatnonzero(~stage.mask)
+                    gained = rows[spec.evaluate(rows)]
+                    dropped = rows[:0]
+                else:
+                    # One bound tightened, the other loosened
+                    new_mask = spec.evaluate(None)
+                    rows = new_mask
+                    dropped = np.flatnonzero(stage.mask & ~new_mask)
+                    gained = np.flatnonzero(new_mask & ~stage.mask)
+                checked += len(rows)
+
+                mask = stage.mask.copy()
+                mask[dropped] = False
+                mask[gained] = True
+                self._fail_count[dropped] += 1
+                self._fail_count[gained] -= 1
+                changed.extend((dropped, gained))
+                stage = _Stage(family=spec.family, bounds=spec.bounds, mask=mask)
+            stages.append(stage)
+
+        for stage in remaining:
+            failing = np.flatnonzero(~stage.mask)
+            self._fail_count[failing] -= 1
+            changed.append(failing)
+
+        self._stages = stages
+        logger.debug(
+            "Filter pipeline: %d stages, %d rows checked, %d rows pass",
+            len(stages), checked, self.filtered_count,
+        )
+        return np.concatenate(changed) if changed else np.zeros(0, dtype=np.intp)
+
+    def _column_spec(self, df: pd.DataFrame, criteria: FilterCriteria) -> _StageSpec:
+        """Stage for one column filter, evaluated by the filter engine."""
+        engine = self._engine
+
+        def evaluate(rows: np.ndarray | None) -> np.ndarray:
+            if rows is None:
+                return engine.criteria_mask(df, criteria)
+            return engine.criteria_mask_at(df, criteria, rows)
+
+        token = engine.column_token(df, criteria.column)
+        return _StageSpec(
+            family=("column", criteria.column, criteria.operator, token),
+            bounds=(criteria.min_val, criteria.max_val),
+            evaluate=evaluate,
+        )
+
+    def _expression_spec(
+        self, df: pd.DataFrame, expression: FilterExpression, time_col: str | None
+    ) -> _StageSpec:
+        """Stage for a filter expression; re-evaluated whenever its text changes."""
+        engine = self._engine
+
+        def evaluate(rows: np.ndarray | None) -> np.ndarray:
+            mask = expression.mask(df, engine, time_col)
+            return mask if rows is None else mask[rows]
+
+        read = [*expression.columns, TIME_MINUTES_COLUMN]
+        if time_col is not None:
+            read.append(time_col)
+        tokens = tuple(
+            engine.column_token(df, column) for column in read if column in df.columns
+        )
+        # An expression has no bounds to refine, so it is reused only when unchanged
+        return _StageSpec(
+            family=("expression", expression.text, time_col, tokens),
+            bounds=(None, None),
+            evaluate=evaluate,
+        )
+
+    def _date_spec(
+        self, df: pd.DataFrame, date_col: str | None, start: str | None, end: str | None
+    ) -> _StageSpec | None:
+        """Stage for the date range, or None when it is inactive."""
+        if date_col is None or (start is None and end is None):
+            return None
+        if date_col not in df.columns:
+            logger.warning("Date column '%s' not found in DataFrame", date_col)
+            return None
+
+        def parse() -> np.ndarray:
+            dates = resolve_dates(df, date_col)
+            return dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+        source = DATE_NS_COLUMN if DATE_NS_COLUMN in df.columns else date_col
+        token, values, valid = self._cached_values(df, "date", source, parse)
+        bounds = (
+            None if start is None else pd.Timestamp(start).value,
+            None if end is None else pd.Timestamp(end).value,
+        )
+        return self._range_spec(("date", date_col, "between", token), bounds, values, valid)
+
+    def _time_spec(
+        self,
+        df: pd.DataFrame,
+        time_col: str | None,
+        start: str | None,
+        end: str | None,
+        minutes_col: str | None,
+    ) -> _StageSpec | None:
+        """Stage for the time-of-day range, or None when it is inactive."""
+        if time_col is None or (start is None and end is None):
+            return None
+
+        if minutes_col is not None and minutes_col in df.columns:
+            source = minutes_col
+        elif time_col in df.columns:
+            source = time_col
+        else:
+            logger.warning("Time column '%s' not found, skipping time filter", time_col)
+            return None
+
+        def parse() -> np.ndarray:
+            minutes = df[source] if source == minutes_col else time_to_minutes(df[time_col])
+            return minutes.to_numpy(dtype=float, na_value=np.nan)
+
+        token, values, valid = self._cached_values(df, "time", source, parse)
+        if len(df) > 0 and not valid.any():
+            logger.warning(
+                "Time filter: 0 values parsed from column '%s'. Check time format.", time_col
+            )
+            return None
+
+        bounds = (
+            None if start is None else time_bound_to_minutes(start),
+            None if end is None else time_bound_to_minutes(end),
+        )
+        return self._range_spec(("time", time_col, "between", token), bounds, values, valid)
+
+    def _cached_values(
+        self,
+        df: pd.DataFrame,
+        kind: str,
+        column: str,
+        parse: Callable[[], np.ndarray],
+    ) -> tuple[tuple[object, ...], np.ndarray, np.ndarray]:
+        """Parse a date or time column once per storage of that column.
+
+        Returns:
+            Tuple of (storage token, values, boolean array of non-missing values).
+        """
+        token = self._engine.column_token(df, column)
+        cached = self._values.get((kind, column))
+        if cached is not None and cached[0] == token:
+            return cached
+
+        values = parse()
+        valid = ~np.isnan(values) if values.dtype.kind == "f" else values != NAT_ORDINAL
+        entry = (token, values, valid)
+        self._values[(kind, column)] = entry
+        return entry
+
+    @staticmethod
+    def _range_spec(
+        family: tuple[object, ...], bounds: _Bounds, values: np.ndarray, valid: np.ndarray
+    ) -> _StageSpec:
+        """Stage for an inclusive range over a parsed date or time array."""
+
+        def evaluate(rows: np.ndarray | None) -> np.ndarray:
+            if rows is None:
+                return _range_mask(values, valid, bounds)
+            return _range_mask(values[rows], valid[rows], bounds)
+
+        return _StageSpec(family=family, bounds=bounds, evaluate=evaluate)
+
+    def _first_trigger_rows(
+        self,
+        df: pd.DataFrame,
+        columns: tuple[str, str, str],
+        visible: np.ndarray,
+        changed: np.ndarray,
+    ) -> np.ndarray:
+        """First visible row per ticker-date, updating only changed groups."""
+        stored = [c for c in (TRIGGER_GROUP_COLUMN, "trigger_number") if c in df.columns]
+        key_columns = [*columns, *stored]
+        key = tuple(key_columns) + tuple(
+            self._engine.column_token(df, column) for column in key_columns
+        )
+        if self._groups is None or self._groups_key != key:
+            self._groups = None
+            if TRIGGER_GROUP_COLUMN in df.columns and "trigger_number" in df.columns:
+                # Keys stored at mapping time: rebuild the order without sorting
+                self._groups = TriggerGroups.from_keys(
+                    df[TRIGGER_GROUP_COLUMN].to_numpy(dtype=np.int64),
+                    df["trigger_number"].to_numpy(dtype=np.int64) - 1,
+                )
+            if self._groups is None:
+                self._groups = TriggerGroups.build(df, *columns)
+            self._groups_key = key
+            self._first_pos = None
+
+        groups = self._groups
+        num_rows = len(df)
+        if self._first_pos is None:
+            self._first_pos = np.full(groups.num_groups, num_rows, dtype=np.int64)
+            found, positions = groups.first_positions(visible)
+            self._first_pos[found] = positions
+        elif len(changed) > 0:
+            dirty = np.unique(groups.group_ids[changed])
+            found, positions = groups.first_positions(visible, dirty)
+            self._first_pos[dirty] = num_rows
+            self._first_pos[found] = positions
+            logger.debug("First trigger: %d of %d groups updated", len(dirty), groups.num_groups)
+
+        first_pos = self._first_pos
+        rows: np.ndarray = groups.order[first_pos[first_pos < num_rows]]
+        return rows
@@ -76,6 +76,7 @@ class FilterPresetManager:
                 time_range=preset.time_range,
                 first_trigger_only=preset.first_trigger_only,
                 created=datetime.now().isoformat(timespec="seconds"),
+                expression=preset.expression,
             )
 
         data = {
@@ -102,6 +103,7 @@ class FilterPresetManager:
                     "all_times": preset.time_range[2],
                 },
                 "first_trigger_only": preset.first_trigger_only,
+                "expression": preset.expression,
             },
         }
 
@@ -165,6 +167,7 @@ class FilterPresetManager:
             ),
             first_trigger_only=filters.get("first_trigger_only", True),
             created=data.get("created"),
+            expression=filters.get("expression"),
         )
 
         logger.info(f"Loaded filter preset '{name}' from {path}")
@@ -1,21 +1,275 @@
-"""First trigger algorithm implementation."""
+"""First trigger algorithm implementation.
+
+Rows are ranked within their ticker-date group by time (nulls first, ties
+in row order). ``assign_trigger_numbers`` stores the rank as
+``trigger_number`` and a dense group id as ``_trigger_group`` at mapping
+time, so later first-trigger selections on any subset of the baseline are
+a "lowest rank per group among the passing rows" reduction over two
+integer arrays instead of a sort of the whole frame.
+"""
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Derived column holding the dense ticker-date group id of each row; ids
+# are numbered in (ticker, date) sort order
+TRIGGER_GROUP_COLUMN = "_trigger_group"
+
+
+def first_in_group(group_ids: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Mark the lowest-ranked row of each group.
+
+    Args:
+        group_ids: Non-negative group id of each row.
+        ranks: Rank of each row, unique within its group.
+
+    Returns:
+        Boolean array, True for the first row of each group present.
+    """
+    if len(group_ids) == 0:
+        return np.zeros(0, dtype=bool)
+    min_rank = np.full(int(group_ids.max()) + 1, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(min_rank, group_ids, ranks)
+    return ranks == min_rank[group_ids]
+
+
+def _concat_ranges(begins: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate the integer ranges [begin, end) without a Python loop."""
+    lengths = ends - begins
+    offsets = np.repeat(begins - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(int(lengths.sum()))
+
+
+@dataclass
+class TriggerGroups:
+    """Ticker-date groups of a frame in first-trigger sort order.
+
+    Rows are ordered by ticker, date and time (nulls first, ties in row
+    order), which is the order FirstTriggerEngine sorts by. Each ticker-date
+    group is a contiguous run of that order, so the first trigger of a group
+    among any subset of rows is the subset's earliest position in the run.
+
+    Attributes:
+        order: Row positions in sort order.
+        sorted_groups: Group id at each sort position; groups are numbered
+            in sort order.
+        group_ids: Group id of each row, by row position.
+        starts: Sort position where each group begins, plus a final
+            ``len(order)``.
+    """
+
+    order: np.ndarray
+    sorted_groups: np.ndarray
+    group_ids: np.ndarray
+    starts: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        df: pd.DataFrame,
+        ticker_col: str,
+        date_col: str,
+        time_col: str,
+    ) -> TriggerGroups:
+        """Sort the key columns of a frame once and number its groups.
+
+        Args:
+            df: Trade data.
+            ticker_col: Column name for ticker/symbol.
+            date_col: Column name for trade date.
+            time_col: Column name for trade time.
+
+        Returns:
+            TriggerGroups over the rows of ``df``.
+        """
+        keys = df[[ticker_col, date_col, time_col]].reset_index(drop=True)
+        order = keys.sort_values(
+            by=[ticker_col, date_col, time_col],
+            na_position="first",
+            kind="stable",
+        ).index.to_numpy()
+
+        num_rows = len(order)
+        new_group = np.ones(num_rows, dtype=bool)
+        if num_rows > 1:
+            # Factorized codes compare missing values as equal, like drop_duplicates
+            ticker_codes = pd.factorize(keys[ticker_col].to_numpy()[order])[0]
+            date_codes = pd.factorize(keys[date_col].to_numpy()[order])[0]
+            new_group[1:] = (ticker_codes[1:] != ticker_codes[:-1]) | (
+                date_codes[1:] != date_codes[:-1]
+            )
+
+        sorted_groups = np.cumsum(new_group) - 1
+        group_ids = np.empty(num_rows, dtype=np.int64)
+        group_ids[order] = sorted_groups
+        starts = np.append(np.flatnonzero(new_group), num_rows)
+        return cls(
+            order=order,
+            sorted_groups=sorted_groups,
+            group_ids=group_ids,
+            starts=starts,
+        )
+
+    @classmethod
+    def from_keys(cls, group_ids: np.ndarray, ranks: np.ndarray) -> TriggerGroups | None:
+        """Rebuild the groups from stored group ids and in-group ranks.
+
+        Args:
+            group_ids: Group id of each row, numbered in sort order.
+            ranks: Zero-based rank of each row within its group.
+
+        Returns:
+            TriggerGroups, or None if the keys do not rank every group of
+            the frame completely (e.g. the frame is a subset of the rows
+            they were computed on).
+        """
+        num_rows = len(group_ids)
+        if num_rows == 0 or group_ids.min() < 0 or ranks.min() < 0:
+            return None
+        counts = np.bincount(group_ids)
+        if (ranks >= counts[group_ids]).any():
+            return None
+
+        starts = np.concatenate(([0], np.cumsum(counts)))
+        sort_positions = starts[group_ids] + ranks
+        order = np.full(num_rows, -1, dtype=np.int64)
+        order[sort_positions] = np.arange(num_rows)
+        if (order < 0).any():
+            # Two rows share a rank
+            return None
+        return cls(
+            order=order,
+            sorted_groups=np.repeat(np.arange(len(counts)), counts),
+            group_ids=group_ids,
+            starts=starts,
+        )
+
+    @property
+    def ranks(self) -> np.ndarray:
+        """Zero-based rank of each row within its group, by row position."""
+        ranks = np.empty(len(self.order), dtype=np.int64)
+        ranks[self.order] = np.arange(len(self.order)) - self.starts[self.sorted_groups]
+        return ranks
+
+    @property
+    def num_groups(self) -> int:
+        """Number of ticker-date groups."""
+        return len(self.starts) - 1
+
+    def first_positions(
+        self, mask: np.ndarray, groups: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the first passing row of each group.
+
+        Args:
+            mask: Boolean array over row positions.
+            groups: Ascending group ids to check; all groups if None.
+
+        Returns:
+            Tuple of (group ids that have a passing row, sort position of
+            that group's first passing row), both ascending.
+        """
+        if groups is None:
+            positions = np.flatnonzero(mask[self.order])
+        else:
+            candidates = _concat_ranges(self.starts[groups], self.starts[groups + 1])
+            positions = candidates[mask[self.order[candidates]]]
+        found = self.sorted_groups[positions]
+        first = np.ones(len(positions), dtype=bool)
+        first[1:] = found[1:] != found[:-1]
+        return found[first], positions[first]
+
+    def first_rows(self, mask: np.ndarray) -> np.ndarray:
+        """Row positions of each group's first passing row, in sort order.
+
+        Args:
+            mask: Boolean array over row positions.
+
+        Returns:
+            Row positions, one per group with a passing row.
+        """
+        return self.order[self.first_positions(mask)[1]]
+
 
 class FirstTriggerEngine:
     """First trigger algorithm implementation.
 
     Identifies the first signal per ticker-date combination from trade data.
-    Uses vectorized pandas operations for performance on large datasets.
+    Only the ticker, date and time columns are sorted; the rows themselves
+    are selected by position, so wide frames are never reshuffled.
     """
 
+    def trigger_keys(
+        self,
+        df: pd.DataFrame,
+        ticker_col: str,
+        date_col: str,
+        time_col: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ticker-date group id and in-group rank of each row.
+
+        Uses the ``_trigger_group`` and ``trigger_number`` columns when the
+        frame has them (the baseline and any subset of it), otherwise sorts
+        the key columns.
+
+        Args:
+            df: Trade data.
+            ticker_col: Column name for ticker/symbol.
+            date_col: Column name for trade date.
+            time_col: Column name for trade time.
+
+        Returns:
+            Tuple of (group ids, ranks) aligned with the rows of ``df``.
+        """
+        if TRIGGER_GROUP_COLUMN in df.columns and "trigger_number" in df.columns:
+            return (
+                df[TRIGGER_GROUP_COLUMN].to_numpy(dtype=np.int64),
+                df["trigger_number"].to_numpy(dtype=np.int64),
+            )
+        groups = TriggerGroups.build(df, ticker_col, date_col, time_col)
+        return groups.group_ids, groups.ranks
+
+    def first_trigger_mask(
+        self,
+        df: pd.DataFrame,
+        ticker_col: str,
+        date_col: str,
+        time_col: str,
+    ) -> np.ndarray:
+        """Mark the first row per ticker-date combination.
+
+        Args:
+            df: Trade data, possibly already filtered.
+            ticker_col: Column name for ticker/symbol.
+            date_col: Column name for trade date.
+            time_col: Column name for trade time.
+
+        Returns:
+            Boolean array over the rows of ``df``.
+        """
+        group_ids, ranks = self.trigger_keys(df, ticker_col, date_col, time_col)
+        return first_in_group(group_ids, ranks)
+
+    def _first_rows(
+        self,
+        df: pd.DataFrame,
+        ticker_col: str,
+        date_col: str,
+        time_col: str,
+    ) -> np.ndarray:
+        """Positions of the first row per ticker-date, in ticker/date/time order."""
+        group_ids, ranks = self.trigger_keys(df, ticker_col, date_col, time_col)
+        rows = np.flatnonzero(first_in_group(group_ids, ranks))
+        # One row per group, and group ids follow the sort order
+        return rows[np.argsort(group_ids[rows], kind="stable")]
+
     def apply(
         self,
         df: pd.DataFrame,
@@ -27,8 +281,8 @@ class FirstTriggerEngine:
 
         Algorithm:
         1. Group by ticker + date
-        2. Sort by time within groups (nulls first)
-        3. Keep first row per group
+        2. Rank by time within groups (nulls first)
+        3. Keep the lowest-ranked row per group
 
         Args:
             df: Input DataFrame with trade data.
@@ -37,24 +291,15 @@ class FirstTriggerEngine:
             time_col: Column name for trade time.
 
         Returns:
-            DataFrame with one row per ticker-date (first trigger only).
+            DataFrame with one row per ticker-date (first trigger only), in
+            ticker/date/time order with a fresh index.
         """
         if len(df) == 0:
             logger.debug("Empty DataFrame, returning empty result")
             return df.copy()
 
-        # Sort by ticker, date, time (nulls first within each group)
-        # Reset index to ensure deterministic drop_duplicates behavior
-        sorted_df = df.sort_values(
-            by=[ticker_col, date_col, time_col],
-            na_position="first",
-        ).reset_index(drop=True)
-
-        # Keep first row per ticker-date combination
-        result = sorted_df.drop_duplicates(
-            subset=[ticker_col, date_col],
-            keep="first",
-        )
+        rows = self._first_rows(df, ticker_col, date_col, time_col)
+        result = df.take(rows).reset_index(drop=True)
 
         logger.info(
             "First trigger applied: %d baseline rows from %d total",
@@ -74,7 +319,10 @@ class FirstTriggerEngine:
         """Apply first trigger to already-filtered data.
 
         Same algorithm as apply(), but intended for use on pre-filtered data
-        to identify first triggers within filtered results.
+        to identify first triggers within filtered results. Rows keep their
+        index labels so they can be matched back to the baseline rows. On a
+        subset of the mapped baseline the precomputed group ids and trigger
+        numbers are reused, so no column is sorted.
 
         Args:
             df: Input DataFrame (already filtered).
@@ -89,19 +337,7 @@ class FirstTriggerEngine:
             logger.debug("Empty DataFrame, returning empty result")
             return df.copy()
 
-        # Sort by ticker, date, time (nulls first within each group)
-        # Reset index to ensure deterministic drop_duplicates behavior
-        # regardless of original index ordering from prior filtering
-        sorted_df = df.sort_values(
-            by=[ticker_col, date_col, time_col],
-            na_position="first",
-        ).reset_index(drop=True)
-
-        # Keep first row per ticker-date combination
-        result = sorted_df.drop_duplicates(
-            subset=[ticker_col, date_col],
-            keep="first",
-        )
+        result = df.take(self._first_rows(df, ticker_col, date_col, time_col))
 
         logger.debug(
             "First trigger on filtered: %d first triggers from %d filtered rows",
@@ -109,7 +345,7 @@ class FirstTriggerEngine:
             len(df),
         )
 
-        return result.copy()
+        return result
 
     def assign_trigger_numbers(
         self,
@@ -121,8 +357,8 @@ class FirstTriggerEngine:
         """Assign trigger_number to each row based on chronological order per ticker-date.
 
         Algorithm:
-        1. Sort by ticker, date, time
-        2. Group by ticker + date
+        1. Sort the ticker, date and time columns
+        2. Number the ticker-date groups in that order
         3. Assign rank within each group (1 = first, 2 = second, etc.)
 
         Args:
@@ -132,30 +368,22 @@ class FirstTriggerEngine:
             time_col: Column name for trade time.
 
         Returns:
-            DataFrame with new 'trigger_number' column added.
+            DataFrame copy with new 'trigger_number' and '_trigger_group'
+            columns added, rows in their original order.
         """
+        result = df.copy()
         if len(df) == 0:
-            result = df.copy()
             result["trigger_number"] = pd.Series(dtype=int)
+            result[TRIGGER_GROUP_COLUMN] = pd.Series(dtype=int)
             return result
 
-        # Sort by ticker, date, time
-        sorted_df = df.sort_values(
-            by=[ticker_col, date_col, time_col],
-            na_position="first",
-        ).copy()
-
-        # Assign rank within each ticker-date group
-        sorted_df["trigger_number"] = sorted_df.groupby(
-            [ticker_col, date_col]
-        ).cumcount() + 1
-
-        # Restore original order
-        result = sorted_df.loc[df.index]
+        groups = TriggerGroups.build(df, ticker_col, date_col, time_col)
+        result["trigger_number"] = groups.ranks + 1
+        result[TRIGGER_GROUP_COLUMN] = groups.group_ids
 
         logger.info(
             "Trigger numbers assigned: max trigger_number=%d across %d rows",
-            result["trigger_number"].max() if len(result) > 0 else 0,
+            result["trigger_number"].max(),
             len(result),
         )
 
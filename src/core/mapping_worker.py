@@ -9,14 +9,18 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 
 import pandas as pd
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from src.core.filter_engine import time_to_minutes
-from src.core.first_trigger import FirstTriggerEngine
+from src.core.cache_manager import DERIVED_COLUMNS, CacheManager
+from src.core.date_utils import DATE_NS_COLUMN, parse_dates
+from src.core.first_trigger import TRIGGER_GROUP_COLUMN, FirstTriggerEngine, TriggerGroups
 from src.core.metrics import MetricsCalculator
 from src.core.models import AdjustmentParams, ColumnMapping, TradingMetrics
+from src.core.time_utils import TIME_MINUTES_COLUMN, time_to_minutes
+from src.core.trade_matrix import TradeMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +77,7 @@ class MappingResult:
         kelly_equity: Kelly equity curve DataFrame, or None.
         total_rows: Total number of rows in baseline_df.
         baseline_rows: Number of first-trigger rows.
+        trade_matrix: Columnar numeric view of baseline_df, or None.
     """
 
     baseline_df: pd.DataFrame
@@ -82,6 +87,7 @@ class MappingResult:
     kelly_equity: pd.DataFrame | None
     total_rows: int
     baseline_rows: int
+    trade_matrix: TradeMatrix | None = None
 
 
 class MappingWorker(QThread):
@@ -90,12 +96,19 @@ class MappingWorker(QThread):
     Performs the heavy computation that previously ran on the main thread
     inside ``DataInputTab._on_mapping_continue()``:
 
-    1. ``assign_trigger_numbers()``
+    1. ``assign_trigger_numbers()`` (trigger numbers and ticker-date group
+       ids) and ``parse_dates()`` on the date column
     2. Filter to first triggers
     3. ``MetricsCalculator.calculate()``
     4. ``calculate_adjusted_gains()``
     5. ``compute_time_change_columns()``
     6. ``time_to_minutes()``
+    7. ``TradeMatrix.from_frame()``
+
+    When the source file is known, the columns added by steps 1 and 4-6 are
+    cached as a sidecar keyed on the file contents, mapping and adjustment
+    parameters. Reopening the same file with the same settings restores them
+    instead of recomputing.
 
     Signals:
         progress: Emitted with progress percentage (0-100).
@@ -114,6 +127,9 @@ class MappingWorker(QThread):
         adjustment_params: AdjustmentParams,
         flat_stake: float,
         start_capital: float,
+        source_path: Path | None = None,
+        sheet: str | None = None,
+        cache_manager: CacheManager | None = None,
     ) -> None:
         """Initialize the worker.
 
@@ -123,6 +139,11 @@ class MappingWorker(QThread):
             adjustment_params: Stop loss / efficiency parameters.
             flat_stake: Flat stake dollar amount for equity curve.
             start_capital: Starting capital for Kelly equity curve.
+            source_path: File ``df`` was loaded from. Enables the derived-column
+                cache when given.
+            sheet: Sheet name for Excel files.
+            cache_manager: Cache to use for derived columns. Defaults to a
+                CacheManager on the standard cache directory.
         """
         super().__init__()
         self._df = df
@@ -130,21 +151,68 @@ class MappingWorker(QThread):
         self._adjustment_params = adjustment_params
         self._flat_stake = flat_stake
         self._start_capital = start_capital
+        self._source_path = source_path
+        self._sheet = sheet
+        self._cache_manager = cache_manager
+
+    def _load_derived(self) -> pd.DataFrame | None:
+        """Return cached derived columns for the source file, if any."""
+        if self._source_path is None:
+            return None
+        if self._cache_manager is None:
+            self._cache_manager = CacheManager()
+        return self._cache_manager.get_derived(
+            self._source_path,
+            self._sheet,
+            self._mapping,
+            self._adjustment_params,
+            num_rows=len(self._df),
+        )
+
+    def _save_derived(self, baseline_df: pd.DataFrame) -> None:
+        """Store the derived columns of baseline_df for the source file."""
+        if self._source_path is None or self._cache_manager is None:
+            return
+        self._cache_manager.save_derived(
+            baseline_df,
+            self._source_path,
+            self._sheet,
+            self._mapping,
+            self._adjustment_params,
+        )
 
     def run(self) -> None:
         """Execute the post-mapping computation."""
         try:
             mapping = self._mapping
+            derived = self._load_derived()
             self.progress.emit(5)
 
             # 1. Assign trigger numbers (heaviest step for wide DataFrames)
-            engine = FirstTriggerEngine()
-            baseline_df = engine.assign_trigger_numbers(
-                self._df,
-                ticker_col=mapping.ticker,
-                date_col=mapping.date,
-                time_col=mapping.time,
-            )
+            if derived is not None:
+                baseline_df = self._df.copy()
+                baseline_df["trigger_number"] = derived["trigger_number"].to_numpy()
+                if TRIGGER_GROUP_COLUMN in derived.columns:
+                    baseline_df[TRIGGER_GROUP_COLUMN] = derived[TRIGGER_GROUP_COLUMN].to_numpy()
+                else:
+                    baseline_df[TRIGGER_GROUP_COLUMN] = TriggerGroups.build(
+                        baseline_df, mapping.ticker, mapping.date, mapping.time
+                    ).group_ids
+            else:
+                engine = FirstTriggerEngine()
+                baseline_df = engine.assign_trigger_numbers(
+                    self._df,
+                    ticker_col=mapping.ticker,
+                    date_col=mapping.date,
+                    time_col=mapping.time,
+                )
+
+            # Parse the date column once for every date consumer
+            if mapping.date and mapping.date in baseline_df.columns:
+                if derived is not None and DATE_NS_COLUMN in derived.columns:
+                    baseline_df[DATE_NS_COLUMN] = derived[DATE_NS_COLUMN].to_numpy()
+                else:
+                    baseline_df[DATE_NS_COLUMN] = parse_dates(baseline_df[mapping.date])
             self.progress.emit(40)
 
             # 2. Filter to first triggers for metrics
@@ -174,21 +242,36 @@ class MappingWorker(QThread):
             )
             self.progress.emit(70)
 
-            # 4. Add adjusted_gain_pct column
-            if mapping.mae_pct is not None:
-                adjusted_gains = self._adjustment_params.calculate_adjusted_gains(
-                    baseline_df, mapping.gain_pct, mapping.mae_pct
-                )
-                baseline_df["adjusted_gain_pct"] = adjusted_gains
-            self.progress.emit(80)
-
-            # 5. Compute time change columns
-            baseline_df = compute_time_change_columns(baseline_df, mapping)
-            self.progress.emit(88)
-
-            # 6. Add time_minutes column
-            if mapping.time and mapping.time in baseline_df.columns:
-                baseline_df["time_minutes"] = time_to_minutes(baseline_df[mapping.time])
+            if derived is not None:
+                # 4-6. Restore cached derived columns
+                restored = set(DERIVED_COLUMNS) - {
+                    "trigger_number", TRIGGER_GROUP_COLUMN, DATE_NS_COLUMN
+                }
+                for column in derived.columns:
+                    if column in restored:
+                        baseline_df[column] = derived[column].to_numpy()
+                self.progress.emit(92)
+            else:
+                # 4. Add adjusted_gain_pct column
+                if mapping.mae_pct is not None:
+                    adjusted_gains = self._adjustment_params.calculate_adjusted_gains(
+                        baseline_df, mapping.gain_pct, mapping.mae_pct
+                    )
+                    baseline_df["adjusted_gain_pct"] = adjusted_gains
+                self.progress.emit(80)
+
+                # 5. Compute time change columns
+                baseline_df = compute_time_change_columns(baseline_df, mapping)
+                self.progress.emit(88)
+
+                # 6. Add time_minutes column
+                if mapping.time and mapping.time in baseline_df.columns:
+                    baseline_df[TIME_MINUTES_COLUMN] = time_to_minutes(baseline_df[mapping.time])
+                self._save_derived(baseline_df)
+                self.progress.emit(92)
+
+            # 7. Build the shared numeric matrix once for all calculators
+            trade_matrix = TradeMatrix.from_frame(baseline_df, mapping)
             self.progress.emit(95)
 
             result = MappingResult(
@@ -199,6 +282,7 @@ class MappingWorker(QThread):
                 kelly_equity=kelly_equity,
                 total_rows=total_rows,
                 baseline_rows=baseline_rows,
+                trade_matrix=trade_matrix,
             )
             self.progress.emit(100)
             self.finished.emit(result)
@@ -6,8 +6,10 @@ from typing import cast
 
 import pandas as pd
 
+from src.core.date_utils import resolve_dates
 from src.core.equity import EquityCalculator
 from src.core.models import AdjustmentParams, ColumnMapping, OffsetScenario, StopScenario, TradingMetrics
+from src.core.trade_matrix import TradeMatrix
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +95,7 @@ class MetricsCalculator:
         # (string dates like DD/MM/YYYY don't sort correctly as strings)
         if date_col and date_col in df.columns:
             df = df.copy()
-            df["_sort_date"] = pd.to_datetime(df[date_col], dayfirst=True, errors="coerce")
+            df["_sort_date"] = resolve_dates(df, date_col)
             if time_col and time_col in df.columns:
                 df = df.sort_values(["_sort_date", time_col]).reset_index(drop=True)
                 logger.debug("Sorted DataFrame by %s, %s", date_col, time_col)
@@ -484,6 +486,7 @@ class MetricsCalculator:
         stop_levels: list[int] | None = None,
         start_capital: float | None = None,
         fractional_kelly_pct: float = 25.0,
+        matrix: TradeMatrix | None = None,
     ) -> list[StopScenario]:
         """Calculate metrics at each stop loss level.
 
@@ -496,19 +499,35 @@ class MetricsCalculator:
             stop_levels: List of stop percentages to simulate. Defaults to [10,20,30,40,50,60,70,80,90,100].
             start_capital: Starting capital for Kelly calculations.
             fractional_kelly_pct: Fractional Kelly percentage.
+            matrix: Optional TradeMatrix for the rows of ``df``; when given, the
+                scenarios are computed from its arrays without touching ``df``.
 
         Returns:
             List of StopScenario dataclasses, one per stop level.
         """
-        from src.core.statistics import STOP_LOSS_LEVELS, _calculate_stop_level_row
+        from src.core.statistics import (
+            STOP_LOSS_LEVELS,
+            calculate_stop_scenario_grid,
+            calculate_stop_scenario_grid_from_matrix,
+        )
 
         if stop_levels is None:
             stop_levels = list(STOP_LOSS_LEVELS)
 
-        scenarios = []
+        if matrix is not None:
+            rows = calculate_stop_scenario_grid_from_matrix(
+                matrix,
+                adjustment_params,
+                stop_levels,
+                start_capital=start_capital,
+                fractional_kelly_pct=fractional_kelly_pct,
+            )
+            return self._stop_scenarios_from_rows(stop_levels, rows, len(matrix))
+
         gain_col = mapping.gain_pct
         mae_col = mapping.mae_pct
         date_col = mapping.date if hasattr(mapping, 'date') else None
+        time_col = mapping.time if hasattr(mapping, 'time') else None
 
         # Compute adjusted gains using same method as calculate()
         if mae_col and mae_col in df.columns:
@@ -516,23 +535,31 @@ class MetricsCalculator:
         else:
             adjusted_gains = df[gain_col].astype(float) if len(df) > 0 else pd.Series(dtype=float)
 
-        for stop_level in stop_levels:
-            # Use existing _calculate_stop_level_row from statistics.py
-            # This ensures formula consistency
-            row = _calculate_stop_level_row(
-                df=df,
-                adjusted_gains=adjusted_gains,
-                mae_col=mae_col,
-                stop_level=stop_level,
-                efficiency=adjustment_params.efficiency,
-                start_capital=start_capital,
-                fractional_kelly_pct=fractional_kelly_pct,
-                date_col=date_col,
-            )
+        # Use the statistics scenario grid so formulas match the Statistics tab,
+        # evaluating every stop level in a single pass
+        rows = calculate_stop_scenario_grid(
+            df=df,
+            adjusted_gains=adjusted_gains,
+            mae_col=mae_col,
+            stop_levels=stop_levels,
+            efficiency=adjustment_params.efficiency,
+            start_capital=start_capital,
+            fractional_kelly_pct=fractional_kelly_pct,
+            date_col=date_col,
+            time_col=time_col,
+        )
 
-            scenario = StopScenario(
+        return self._stop_scenarios_from_rows(stop_levels, rows, len(df))
+
+    @staticmethod
+    def _stop_scenarios_from_rows(
+        stop_levels: list[int], rows: list[dict], num_trades: int
+    ) -> list[StopScenario]:
+        """Convert stop grid rows to StopScenario dataclasses."""
+        return [
+            StopScenario(
                 stop_pct=stop_level,
-                num_trades=len(df),
+                num_trades=num_trades,
                 win_pct=row.get("Win %", 0.0),
                 ev_pct=row.get("EV %"),
                 avg_gain_pct=row.get("Avg Gain %"),
@@ -544,9 +571,8 @@ class MetricsCalculator:
                 max_dd_pct=row.get("Max DD %"),
                 kelly_pnl=row.get("Total Kelly $"),
             )
-            scenarios.append(scenario)
-
-        return scenarios
+            for stop_level, row in zip(stop_levels, rows, strict=True)
+        ]
 
     def calculate_offset_scenarios(
         self,
@@ -556,6 +582,7 @@ class MetricsCalculator:
         offsets: list[float] | None = None,
         start_capital: float | None = None,
         fractional_kelly_pct: float = 25.0,
+        matrix: TradeMatrix | None = None,
     ) -> list["OffsetScenario"]:
         """Calculate metrics at each entry price offset.
 
@@ -566,44 +593,64 @@ class MetricsCalculator:
             offsets: List of offset percentages. Defaults to [-20,-10,0,10,20,30,40].
             start_capital: Starting capital for Kelly calculations.
             fractional_kelly_pct: Fractional Kelly percentage.
+            matrix: Optional TradeMatrix for the rows of ``df``; when given, the
+                scenarios are computed from its arrays without touching ``df``.
 
         Returns:
             List of OffsetScenario dataclasses, one per offset level.
         """
-        from src.core.statistics import OFFSET_LEVELS, _calculate_offset_level_row
+        from src.core.statistics import (
+            OFFSET_LEVELS,
+            calculate_offset_scenario_grid,
+            calculate_offset_scenario_grid_from_matrix,
+        )
 
         if offsets is None:
             offsets = list(OFFSET_LEVELS)
 
-        scenarios = []
-        gain_col = mapping.gain_pct
-        mae_col = mapping.mae_pct
-        mfe_col = mapping.mfe_pct
-        date_col = mapping.date if hasattr(mapping, 'date') else None
-
-        for offset in offsets:
-            row = _calculate_offset_level_row(
-                df=df,
-                gain_col=gain_col,
-                mae_col=mae_col,
-                mfe_col=mfe_col,
-                offset=offset,
-                adjustment_params=adjustment_params,
+        if matrix is not None:
+            rows = calculate_offset_scenario_grid_from_matrix(
+                matrix,
+                adjustment_params,
+                offsets,
                 start_capital=start_capital,
                 fractional_kelly_pct=fractional_kelly_pct,
-                date_col=date_col,
             )
+            return self._offset_scenarios_from_rows(offsets, rows)
+
+        date_col = mapping.date if hasattr(mapping, 'date') else None
+        time_col = mapping.time if hasattr(mapping, 'time') else None
+
+        rows = calculate_offset_scenario_grid(
+            df=df,
+            gain_col=mapping.gain_pct,
+            mae_col=mapping.mae_pct,
+            mfe_col=mapping.mfe_pct,
+            offsets=offsets,
+            adjustment_params=adjustment_params,
+            start_capital=start_capital,
+            fractional_kelly_pct=fractional_kelly_pct,
+            date_col=date_col,
+            time_col=time_col,
+        )
+
+        return self._offset_scenarios_from_rows(offsets, rows)
 
-            scenario = OffsetScenario(
+    @staticmethod
+    def _offset_scenarios_from_rows(
+        offsets: list[float], rows: list[dict]
+    ) -> list[OffsetScenario]:
+        """Convert offset grid rows to OffsetScenario dataclasses."""
+        return [
+            OffsetScenario(
                 offset_pct=offset,
                 num_trades=row.get("# of Trades", 0),
                 win_pct=row.get("Win %", 0.0),
                 total_return_pct=row.get("Total Gain %"),
                 eg_pct=row.get("EG %"),
             )
-            scenarios.append(scenario)
-
-        return scenarios
+            for offset, row in zip(offsets, rows, strict=True)
+        ]
 
 
 def calculate_suggested_bins(data: list[float], method: str = "freedman_diaconis") -> int:
@@ -468,6 +468,7 @@ class FilterPreset:
         time_range: Tuple of (start_time, end_time, all_times).
         first_trigger_only: State of first trigger toggle.
         created: ISO timestamp when preset was created.
+        expression: Filter expression text (see filter_expression), or None.
     """
 
     name: str
@@ -476,6 +477,7 @@ class FilterPreset:
     time_range: tuple[str | None, str | None, bool]
     first_trigger_only: bool
     created: str | None = None
+    expression: str | None = None
 
 
 @dataclass
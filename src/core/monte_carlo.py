@@ -3,17 +3,68 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import multiprocessing
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
+from scipy import stats
 
 if TYPE_CHECKING:
+    import pandas as pd
     from numpy.typing import NDArray
 
+    from src.core.models import ColumnMapping
+
 logger = logging.getLogger(__name__)
 
+# Approximate number of (n_sims x n_trades) 8-byte working arrays alive at once
+# while a batch is evaluated: indices, sampled gains, equity, running max,
+# drawdown and the boolean/int masks used for streaks and durations.
+_WORKING_ARRAYS_PER_CELL = 8
+
+# Upper bound on simulations per batch so progress updates and cancellation
+# stay responsive even when the memory budget would allow larger batches.
+_MAX_BATCH_SIMS = 1000
+
+# Below this many simulated trades (n_sims x n_trades) worker start-up costs more
+# than it saves, so the engine stays in-process even when num_workers > 1.
+_MIN_PARALLEL_CELLS = 20_000_000
+
+SIMULATION_TYPES = ("resample", "reshuffle", "moving_block", "stationary_block", "date_grouped")
+BLOCK_SIMULATION_TYPES = ("moving_block", "stationary_block")
+
+# Percentile bands for charting
+EQUITY_PERCENTILES = (5, 25, 50, 75, 95)
+
+# "auto" percentile method keeps every equity curve for exact percentiles only
+# while the full (n_sims x n_trades) matrix stays below this size.
+_EXACT_PERCENTILE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Streaming percentile sketch: histogram bins per trade index, number of pilot
+# paths used to fix the bin ranges, and the margin added on each side of the
+# pilot range (as a fraction of that range).
+_SKETCH_BINS = 512
+_SKETCH_PILOT_SIMS = 1000
+_SKETCH_RANGE_MARGIN = 0.25
+
+# Statistics that convergence mode can monitor; all are fractions in [0, 1]
+CONVERGENCE_STATISTICS = (
+    "median_max_dd",
+    "p95_max_dd",
+    "risk_of_ruin",
+    "probability_of_profit",
+)
+
+# Convergence mode: number of batch-means groups, confidence level of their
+# interval, and minimum simulations before convergence is checked at all.
+_CONVERGENCE_GROUPS = 20
+_CONVERGENCE_CONFIDENCE = 0.95
+_CONVERGENCE_MIN_SIMS = 500
+
 
 class PositionSizingMode(str, Enum):
     """Position sizing mode for Monte Carlo simulation."""
@@ -32,22 +83,52 @@ class MonteCarloConfig:
         initial_capital: Starting capital for equity calculations.
         ruin_threshold_pct: Percentage loss that defines ruin (e.g., 50 = lose half).
         var_confidence_pct: Confidence level for VaR calculation (e.g., 5 = 5th percentile).
-        simulation_type: Either "resample" (with replacement) or "reshuffle" (permutation).
+        simulation_type: "resample" (with replacement), "reshuffle" (permutation),
+            "moving_block" or "stationary_block" (block bootstrap preserving serial
+            correlation), or "date_grouped" (resample whole trading days).
         position_sizing_mode: Either "flat_stake", "compounded_kelly", or "compounded_custom".
         flat_stake: Fixed dollar amount per trade (used when mode is flat_stake).
         fractional_kelly_pct: Fractional Kelly percentage (used when mode is compounded_kelly).
         custom_position_pct: Custom position size percentage (used when mode is compounded_custom).
+        seed: Optional seed for the random generator. Runs with the same seed are
+            reproducible; None draws fresh entropy.
+        memory_budget_mb: Working memory budget for a single simulation batch. The
+            engine sizes its batches so the per-batch arrays stay within this budget.
+        num_workers: Number of worker processes. 1 runs in-process; larger values
+            split the batches across a process pool. Results for a given seed are
+            identical for any worker count.
+        equity_percentile_method: How the equity percentile bands are built.
+            "exact" keeps every equity curve; "histogram" streams the curves into a
+            fixed-bin histogram per trade index (memory O(n_trades)); "auto" uses
+            exact unless the full curve matrix would exceed 1 GiB.
+        convergence_tolerance: Enables convergence mode when set. Simulations run
+            in batches until the 95% confidence half-width of every target statistic
+            is at most this value (absolute, e.g. 0.005 = 0.5 percentage points), or
+            num_simulations is reached. None always runs num_simulations.
+        convergence_targets: Statistics monitored in convergence mode, a subset of
+            CONVERGENCE_STATISTICS.
+        block_length: Block length (mean length for stationary_block) in trades.
+            None selects it automatically from the gains' autocorrelation.
     """
 
     num_simulations: int = 5000
     initial_capital: float = 100000.0
     ruin_threshold_pct: float = 50.0
     var_confidence_pct: float = 5.0
-    simulation_type: Literal["resample", "reshuffle"] = "resample"
+    simulation_type: Literal[
+        "resample", "reshuffle", "moving_block", "stationary_block", "date_grouped"
+    ] = "resample"
     position_sizing_mode: PositionSizingMode = PositionSizingMode.COMPOUNDED_KELLY
     flat_stake: float = 10000.0
     fractional_kelly_pct: float = 25.0
     custom_position_pct: float = 10.0
+    seed: int | None = None
+    memory_budget_mb: float = 256.0
+    num_workers: int = 1
+    equity_percentile_method: Literal["auto", "exact", "histogram"] = "auto"
+    convergence_tolerance: float | None = None
+    convergence_targets: tuple[str, ...] = CONVERGENCE_STATISTICS
+    block_length: int | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
@@ -59,14 +140,30 @@ class MonteCarloConfig:
             raise ValueError("ruin_threshold_pct must be between 0 and 100")
         if not 0 < self.var_confidence_pct < 100:
             raise ValueError("var_confidence_pct must be between 0 and 100")
-        if self.simulation_type not in ("resample", "reshuffle"):
-            raise ValueError("simulation_type must be 'resample' or 'reshuffle'")
+        if self.simulation_type not in SIMULATION_TYPES:
+            raise ValueError(f"simulation_type must be one of {SIMULATION_TYPES}")
         if self.flat_stake <= 0:
             raise ValueError("flat_stake must be positive")
         if not 0 < self.fractional_kelly_pct <= 100:
             raise ValueError("fractional_kelly_pct must be between 0 and 100")
         if not 0 < self.custom_position_pct <= 100:
             raise ValueError("custom_position_pct must be between 0 and 100")
+        if self.memory_budget_mb <= 0:
+            raise ValueError("memory_budget_mb must be positive")
+        if self.num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if self.equity_percentile_method not in ("auto", "exact", "histogram"):
+            raise ValueError("equity_percentile_method must be 'auto', 'exact' or 'histogram'")
+        if self.convergence_tolerance is not None and not 0 < self.convergence_tolerance < 1:
+            raise ValueError("convergence_tolerance must be between 0 and 1")
+        if not self.convergence_targets or not set(self.convergence_targets) <= set(
+            CONVERGENCE_STATISTICS
+        ):
+            raise ValueError(
+                f"convergence_targets must be a non-empty subset of {CONVERGENCE_STATISTICS}"
+            )
+        if self.block_length is not None and self.block_length < 1:
+            raise ValueError("block_length must be at least 1")
 
 
 @dataclass
@@ -140,6 +237,301 @@ class MonteCarloResults:
     # Shape: (num_trades, 5) for 5th, 25th, 50th, 75th, 95th percentiles
     equity_percentiles: NDArray[np.float64]
 
+    # Resolution of equity_percentiles relative to the median band: 0.0 when
+    # computed exactly, otherwise the widest histogram bin / median equity
+    equity_percentiles_error: float = 0.0
+
+    # Simulations actually used (fewer than configured after early stopping)
+    num_simulations_run: int | None = None
+
+    # Convergence mode: whether every target met the tolerance (None when the
+    # mode is off) and the achieved 95% confidence half-width per target
+    converged: bool | None = None
+    convergence_precision: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _PathMetrics:
+    """Per-simulation metrics, one entry per simulated path."""
+
+    max_dd: NDArray[np.float64]
+    final_equity: NDArray[np.float64]
+    min_equity: NDArray[np.float64]
+    cagr: NDArray[np.float64]
+    sharpe: NDArray[np.float64]
+    sortino: NDArray[np.float64]
+    calmar: NDArray[np.float64]
+    win_streak: NDArray[np.int64]
+    loss_streak: NDArray[np.int64]
+    recovery_factor: NDArray[np.float64]
+    profit_factor: NDArray[np.float64]
+    avg_dd_duration: NDArray[np.float64]
+    max_dd_duration: NDArray[np.int64]
+
+    @classmethod
+    def zeros(cls, n_sims: int) -> _PathMetrics:
+        """Allocate zero-filled metric arrays for n_sims paths."""
+        int_fields = ("win_streak", "loss_streak", "max_dd_duration")
+        arrays: dict[str, NDArray[Any]] = {
+            f.name: np.zeros(n_sims, dtype=np.int64 if f.name in int_fields else np.float64)
+            for f in fields(cls)
+        }
+        return cls(**arrays)
+
+    def assign(self, start: int, batch: _PathMetrics) -> None:
+        """Copy a batch's metrics into this container starting at path index start."""
+        stop = start + len(batch.max_dd)
+        for f in fields(self):
+            getattr(self, f.name)[start:stop] = getattr(batch, f.name)
+
+    def head(self, n_sims: int) -> _PathMetrics:
+        """Metrics of the first n_sims paths."""
+        return _PathMetrics(**{f.name: getattr(self, f.name)[:n_sims] for f in fields(self)})
+
+
+def _max_drawdown_batch(equity_curves: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Maximum drawdown (as a decimal) of each row of an equity matrix."""
+    running_max = np.maximum.accumulate(equity_curves, axis=1)
+    drawdown = (running_max - equity_curves) / running_max
+    max_dd: NDArray[np.float64] = drawdown.max(axis=1)
+    return max_dd
+
+
+def _max_run_length(mask: NDArray[np.bool_]) -> NDArray[np.int64]:
+    """Length of the longest run of True values in each row of a boolean matrix.
+
+    Each position's run length is its distance from the most recent False
+    position in the row, found with a running maximum over False indices.
+    """
+    n_rows, n_cols = mask.shape
+    if n_cols == 0:
+        return np.zeros(n_rows, dtype=np.int64)
+    positions = np.arange(n_cols, dtype=np.int64)
+    last_break = np.maximum.accumulate(np.where(mask, -1, positions), axis=1)
+    run_lengths: NDArray[np.int64] = (positions - last_break).max(axis=1)
+    return run_lengths
+
+
+def _drawdown_duration_batch(
+    equity_curves: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """Average and maximum drawdown duration (in trades) of each equity row.
+
+    A drawdown period is a run of trades spent below the running maximum.
+    """
+    running_max = np.maximum.accumulate(equity_curves, axis=1)
+    in_drawdown = equity_curves < running_max
+
+    n_periods = in_drawdown[:, 0].astype(np.int64) + (
+        in_drawdown[:, 1:] & ~in_drawdown[:, :-1]
+    ).sum(axis=1)
+    total_duration = in_drawdown.sum(axis=1)
+    avg_duration = np.divide(
+        total_duration,
+        n_periods,
+        out=np.zeros(len(equity_curves), dtype=np.float64),
+        where=n_periods > 0,
+    )
+    return avg_duration, _max_run_length(in_drawdown)
+
+
+def _moving_block_indices(
+    rng: np.random.Generator, batch_size: int, n_trades: int, block_length: int
+) -> NDArray[np.int64]:
+    """Trade indices for the moving block bootstrap.
+
+    Each row is built from consecutive blocks of block_length trades whose
+    start positions are drawn uniformly from all complete blocks.
+    """
+    n_blocks = -(-n_trades // block_length)
+    starts = rng.integers(0, n_trades - block_length + 1, size=(batch_size, n_blocks))
+    positions = np.arange(n_trades)
+    return starts[:, positions // block_length] + positions % block_length
+
+
+def _stationary_block_indices(
+    rng: np.random.Generator, batch_size: int, n_trades: int, block_length: int
+) -> NDArray[np.int64]:
+    """Trade indices for the stationary bootstrap (Politis & Romano, 1994).
+
+    Blocks have geometrically distributed lengths with mean block_length and
+    wrap around the end of the series. A new block starts at each position
+    with probability 1 / block_length; other positions continue the block.
+    """
+    positions = np.arange(n_trades)
+    new_block = rng.random((batch_size, n_trades)) < 1.0 / block_length
+    new_block[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    start_index = rng.integers(0, n_trades, size=(batch_size, n_trades))
+    return (np.take_along_axis(start_index, block_start, axis=1) + positions - block_start) % (
+        n_trades
+    )
+
+
+def _day_group_indices(
+    rng: np.random.Generator, batch_size: int, trade_days: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    """Trade indices that resample whole trading days with replacement.
+
+    Days are drawn until each row holds at least n_trades trades, and the
+    last drawn day is truncated so every path has the original length.
+    """
+    n_trades = len(trade_days)
+    order = np.argsort(trade_days, kind="stable")
+    _, day_starts, day_sizes = np.unique(
+        trade_days[order], return_index=True, return_counts=True
+    )
+    n_days = len(day_sizes)
+
+    # Draw enough days for the expected trade count, topping up short rows
+    drawn = rng.integers(0, n_days, size=(batch_size, n_days + 1))
+    cumulative = np.cumsum(day_sizes[drawn], axis=1)
+    while cumulative[:, -1].min() < n_trades:
+        extra = rng.integers(0, n_days, size=(batch_size, n_days + 1))
+        drawn = np.concatenate([drawn, extra], axis=1)
+        cumulative = np.cumsum(day_sizes[drawn], axis=1)
+
+    # Locate the drawn day covering each output position with one searchsorted
+    # over all rows, offset so the per-row cumulative sizes are globally sorted
+    n_draws = drawn.shape[1]
+    row_offsets = np.arange(batch_size) * int(cumulative[:, -1].max())
+    positions = np.arange(n_trades)
+    slots = np.searchsorted(
+        (cumulative + row_offsets[:, np.newaxis]).ravel(),
+        (positions + row_offsets[:, np.newaxis]).ravel(),
+        side="right",
+    ).reshape(batch_size, n_trades) - (np.arange(batch_size) * n_draws)[:, np.newaxis]
+
+    days = np.take_along_axis(drawn, slots, axis=1)
+    day_offset = positions - (np.take_along_axis(cumulative, slots, axis=1) - day_sizes[days])
+    return order[day_starts[days] + day_offset]
+
+
+def _auto_block_length(
+    gains: NDArray[np.float64], simulation_type: str
+) -> int:
+    """Select a block length from the gains' autocorrelation.
+
+    Implements the automatic block-length rule of Politis & White (2004) with
+    the correction of Patton, Politis & White (2009). Uncorrelated gains give
+    a block length of 1, i.e. the i.i.d. bootstrap.
+
+    Args:
+        gains: Array of trade returns in chronological order.
+        simulation_type: "moving_block" or "stationary_block".
+
+    Returns:
+        Block length in trades.
+    """
+    n = len(gains)
+    centered = gains - gains.mean()
+    variance = float(np.dot(centered, centered)) / n
+    if variance == 0:
+        return 1
+
+    k_n = max(5, int(np.ceil(np.sqrt(np.log10(n)))))
+    max_lag = min(n - 1, int(np.ceil(np.sqrt(n))) + k_n)
+    autocov = np.array(
+        [np.dot(centered[: n - k], centered[k:]) / n for k in range(max_lag + 1)]
+    )
+    autocorr = np.abs(autocov / variance)
+
+    # Smallest lag after which k_n consecutive autocorrelations are insignificant
+    threshold = 2 * np.sqrt(np.log10(n) / n)
+    m_hat = max_lag
+    for m in range(1, max_lag - k_n + 1):
+        if np.all(autocorr[m + 1 : m + 1 + k_n] < threshold):
+            m_hat = m
+            break
+    big_m = min(2 * m_hat, max_lag)
+
+    # Flat-top lag window
+    lags = np.arange(1, big_m + 1)
+    t = lags / big_m
+    window = np.where(t <= 0.5, 1.0, 2 * (1 - t))
+    g = 2 * np.sum(window * lags * autocov[1 : big_m + 1])
+    g0 = autocov[0] + 2 * np.sum(window * autocov[1 : big_m + 1])
+    d = (2.0 if simulation_type == "stationary_block" else 4.0 / 3.0) * g0**2
+    if d <= 0 or g == 0:
+        return 1
+
+    block_length = (2 * g**2 / d) ** (1 / 3) * n ** (1 / 3)
+    max_block = int(np.ceil(min(3 * np.sqrt(n), n / 3)))
+    return int(np.clip(np.round(block_length), 1, max_block))
+
+
+class _EquityPercentileSketch:
+    """Streaming percentile bands from a fixed-bin histogram per trade index.
+
+    Bin ranges are fixed from a pilot sample of equity curves, widened by
+    _SKETCH_RANGE_MARGIN on each side. Values outside the range are clamped
+    into the edge bins, so only the extreme tails are affected. Memory is
+    O(n_trades * n_bins) however many simulations are added.
+    """
+
+    def __init__(self, pilot_curves: NDArray[np.float64], n_bins: int = _SKETCH_BINS) -> None:
+        """Initialize bin ranges from pilot equity curves.
+
+        Args:
+            pilot_curves: Equity curves of shape (n_pilot, n_trades).
+            n_bins: Number of histogram bins per trade index.
+        """
+        low = pilot_curves.min(axis=0)
+        high = pilot_curves.max(axis=0)
+        # Columns where every pilot path agrees still need a positive bin width
+        span = np.where(high > low, high - low, np.maximum(np.abs(high), 1.0) * 1e-6)
+        self._low = low - span * _SKETCH_RANGE_MARGIN
+        self._width = span * (1 + 2 * _SKETCH_RANGE_MARGIN) / n_bins
+        self._n_bins = n_bins
+        n_trades = pilot_curves.shape[1]
+        self._offsets = np.arange(n_trades, dtype=np.int64) * n_bins
+        self._counts = np.zeros((n_trades, n_bins), dtype=np.int64)
+
+    def update(self, equity_curves: NDArray[np.float64]) -> None:
+        """Add a batch of equity curves of shape (batch_size, n_trades)."""
+        bins = ((equity_curves - self._low) / self._width).astype(np.int64)
+        np.clip(bins, 0, self._n_bins - 1, out=bins)
+        bins += self._offsets
+        self._counts += np.bincount(bins.ravel(), minlength=self._counts.size).reshape(
+            self._counts.shape
+        )
+
+    def percentiles(self, percentiles: tuple[float, ...]) -> NDArray[np.float64]:
+        """Estimate percentiles per trade index, interpolating within bins.
+
+        Args:
+            percentiles: Percentiles to estimate (0-100).
+
+        Returns:
+            Array of shape (n_trades, len(percentiles)).
+        """
+        cumulative = np.cumsum(self._counts, axis=1)
+        total = cumulative[:, -1]
+        rows = np.arange(len(cumulative))
+        result = np.empty((len(cumulative), len(percentiles)), dtype=np.float64)
+        for j, pct in enumerate(percentiles):
+            target = total * pct / 100.0
+            bin_idx = np.minimum(
+                (cumulative < target[:, np.newaxis]).sum(axis=1), self._n_bins - 1
+            )
+            before = np.where(bin_idx > 0, cumulative[rows, np.maximum(bin_idx - 1, 0)], 0)
+            in_bin = self._counts[rows, bin_idx]
+            fraction = np.divide(
+                target - before,
+                in_bin,
+                out=np.full(len(cumulative), 0.5),
+                where=in_bin > 0,
+            )
+            result[:, j] = self._low + (bin_idx + fraction) * self._width
+        return result
+
+    def relative_error(self, median: NDArray[np.float64]) -> float:
+        """Widest bin relative to the median band across all trade indices."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = self._width / np.abs(median)
+        finite = relative[np.isfinite(relative)]
+        return float(finite.max()) if len(finite) > 0 else 0.0
+
 
 class MonteCarloEngine:
     """Engine for running Monte Carlo simulations on trade data.
@@ -161,6 +553,7 @@ class MonteCarloEngine:
         """
         self.config = config
         self._cancelled = False
+        self._rng = np.random.default_rng(config.seed)
 
     def cancel(self) -> None:
         """Request cancellation of the running simulation."""
@@ -176,7 +569,7 @@ class MonteCarloEngine:
         Returns:
             Resampled gains array.
         """
-        return np.random.choice(gains, size=num_trades, replace=True)
+        return self._rng.choice(gains, size=num_trades, replace=True)
 
     def _reshuffle(self, gains: NDArray[np.float64]) -> NDArray[np.float64]:
         """Reshuffle gains using Fisher-Yates permutation.
@@ -187,13 +580,88 @@ class MonteCarloEngine:
         Returns:
             Permuted gains array (all original values, different order).
         """
-        return np.random.permutation(gains)
+        return self._rng.permutation(gains)
+
+    def _sample_batch(
+        self,
+        gains: NDArray[np.float64],
+        batch_size: int,
+        rng: np.random.Generator | None = None,
+        *,
+        block_length: int | None = None,
+        trade_days: NDArray[np.int64] | None = None,
+    ) -> NDArray[np.float64]:
+        """Draw a batch of simulated trade sequences.
+
+        Args:
+            gains: Array of trade returns.
+            batch_size: Number of simulations in the batch.
+            rng: Random generator to draw from. Defaults to the engine's generator.
+            block_length: Block length for the block bootstrap modes. Defaults to
+                config.block_length or the automatically selected length.
+            trade_days: Day identifier of each trade (required for date_grouped).
+
+        Returns:
+            Array of shape (batch_size, len(gains)), one simulation per row.
+
+        Raises:
+            ValueError: If simulation_type is date_grouped and trade_days is missing.
+        """
+        rng = self._rng if rng is None else rng
+        n_trades = len(gains)
+        simulation_type = self.config.simulation_type
+        if simulation_type == "reshuffle":
+            return rng.permuted(np.tile(gains, (batch_size, 1)), axis=1)
+
+        if simulation_type == "resample":
+            indices = rng.integers(0, n_trades, size=(batch_size, n_trades))
+        elif simulation_type in BLOCK_SIMULATION_TYPES:
+            if block_length is None:
+                block_length = self._resolve_block_length(gains)
+            if simulation_type == "moving_block":
+                indices = _moving_block_indices(rng, batch_size, n_trades, block_length)
+            else:
+                indices = _stationary_block_indices(rng, batch_size, n_trades, block_length)
+        else:
+            if trade_days is None or len(trade_days) != n_trades:
+                raise ValueError("date_grouped simulation requires a trade day for every trade")
+            indices = _day_group_indices(rng, batch_size, trade_days)
+        return gains[indices]
+
+    def _resolve_block_length(self, gains: NDArray[np.float64]) -> int:
+        """Configured block length, or one selected from the gains if unset.
+
+        Args:
+            gains: Array of trade returns in chronological order.
+
+        Returns:
+            Block length in trades.
+        """
+        if self.config.block_length is not None:
+            return min(self.config.block_length, len(gains))
+        return _auto_block_length(gains, self.config.simulation_type)
+
+    def _batch_size(self, n_sims: int, n_trades: int) -> int:
+        """Number of simulations evaluated together within the memory budget.
+
+        Args:
+            n_sims: Total number of simulations.
+            n_trades: Number of trades per simulation.
+
+        Returns:
+            Batch size between 1 and min(n_sims, _MAX_BATCH_SIMS).
+        """
+        budget_bytes = self.config.memory_budget_mb * 1024 * 1024
+        bytes_per_sim = n_trades * 8 * _WORKING_ARRAYS_PER_CELL
+        return int(max(1, min(n_sims, _MAX_BATCH_SIMS, budget_bytes // bytes_per_sim)))
 
     def _simulate_equity_curve(
         self, sampled_gains: NDArray[np.float64], initial_capital: float
     ) -> NDArray[np.float64]:
         """Calculate cumulative equity curve from sampled gains.
 
+        Works on a single sequence or on a batch with one simulation per row.
+
         Args:
             sampled_gains: Array of trade returns (decimal format, e.g., 0.05 for 5%).
             initial_capital: Starting capital.
@@ -205,19 +673,19 @@ class MonteCarloEngine:
             # Flat stake: fixed dollar amount per trade (additive)
             # PnL per trade = flat_stake * gain_decimal
             pnl_per_trade = self.config.flat_stake * sampled_gains
-            return initial_capital + np.cumsum(pnl_per_trade)
+            return initial_capital + np.cumsum(pnl_per_trade, axis=-1)
         elif self.config.position_sizing_mode == PositionSizingMode.COMPOUNDED_CUSTOM:
             # Compounded Custom: position size = custom_position_pct% of current equity
             # Each trade: equity *= (1 + custom_pct * gain)
             custom_fraction = self.config.custom_position_pct / 100.0
             multipliers = 1 + (custom_fraction * sampled_gains)
-            return initial_capital * np.cumprod(multipliers)
+            return initial_capital * np.cumprod(multipliers, axis=-1)
         else:
             # Compounded Kelly: position size = fractional_kelly_pct% of current equity
             # Each trade: equity *= (1 + fractional_kelly * gain)
             fractional_kelly = self.config.fractional_kelly_pct / 100.0
             multipliers = 1 + (fractional_kelly * sampled_gains)
-            return initial_capital * np.cumprod(multipliers)
+            return initial_capital * np.cumprod(multipliers, axis=-1)
 
     def _calculate_max_drawdown(self, equity_curve: NDArray[np.float64]) -> float:
         """Calculate maximum drawdown from equity curve.
@@ -228,15 +696,11 @@ class MonteCarloEngine:
         Returns:
             Maximum drawdown as a decimal (e.g., 0.25 for 25% drawdown).
         """
-        running_max = np.maximum.accumulate(equity_curve)
-        drawdown = (running_max - equity_curve) / running_max
-        return float(np.max(drawdown))
+        return float(_max_drawdown_batch(equity_curve[np.newaxis, :])[0])
 
     def _calculate_max_streak(self, gains: NDArray[np.float64], win: bool) -> int:
         """Calculate maximum consecutive winning or losing streak.
 
-        Uses run-length encoding pattern for efficiency.
-
         Args:
             gains: Array of trade returns.
             win: If True, count winning streaks; if False, count losing streaks.
@@ -248,21 +712,7 @@ class MonteCarloEngine:
             return 0
 
         is_win = gains > 0 if win else gains < 0
-        if not np.any(is_win):
-            return 0
-
-        # Run-length encoding
-        changes = np.diff(is_win.astype(int))
-        run_starts = np.where(changes != 0)[0] + 1
-        run_starts = np.concatenate([[0], run_starts, [len(is_win)]])
-
-        max_streak = 0
-        for i in range(len(run_starts) - 1):
-            start, end = run_starts[i], run_starts[i + 1]
-            if is_win[start]:
-                max_streak = max(max_streak, end - start)
-
-        return max_streak
+        return int(_max_run_length(is_win[np.newaxis, :])[0])
 
     def _calculate_drawdown_duration(
         self, equity_curve: NDArray[np.float64]
@@ -277,50 +727,286 @@ class MonteCarloEngine:
         Returns:
             Tuple of (average_duration, max_duration) in trades.
         """
-        running_max = np.maximum.accumulate(equity_curve)
-        in_drawdown = equity_curve < running_max
+        avg_durations, max_durations = _drawdown_duration_batch(equity_curve[np.newaxis, :])
+        return float(avg_durations[0]), int(max_durations[0])
+
+    def _calculate_batch_metrics(
+        self, sampled: NDArray[np.float64], initial_capital: float
+    ) -> tuple[NDArray[np.float64], _PathMetrics]:
+        """Calculate every per-simulation metric for a batch of simulations.
+
+        All metrics are computed with axis-wise array operations over the
+        (batch_size, n_trades) matrix, one simulation per row.
+
+        Args:
+            sampled: Simulated trade returns, shape (batch_size, n_trades).
+            initial_capital: Starting capital.
+
+        Returns:
+            Tuple of (equity curves of shape (batch_size, n_trades), metrics with
+            one entry per simulation).
+        """
+        n_trades = sampled.shape[1]
+        # Each trade = 1 trading day, 252 days/year
+        years = n_trades / 252.0
+
+        # Category 1: Max Drawdown
+        equity_curves = self._simulate_equity_curve(sampled, initial_capital)
+        max_dd = _max_drawdown_batch(equity_curves)
 
-        if not np.any(in_drawdown):
-            return 0.0, 0
+        # Category 2: Final Equity
+        final_equity = equity_curves[:, -1]
+        min_equity = equity_curves.min(axis=1)
 
-        # Find drawdown periods using run-length encoding
-        changes = np.diff(in_drawdown.astype(int))
-        starts = np.where(changes == 1)[0] + 1
-        ends = np.where(changes == -1)[0] + 1
+        # Category 3: CAGR (negative final equity has no real root -> NaN)
+        with np.errstate(invalid="ignore"):
+            if years > 0:
+                cagr = (final_equity / initial_capital) ** (1 / years) - 1
+            else:
+                cagr = np.zeros(len(sampled))
+
+        # Category 4: Risk-Adjusted Metrics
+        mean_return = sampled.mean(axis=1)
+        std_return = sampled.std(axis=1)
+
+        is_loss = sampled < 0
+        is_win = sampled > 0
+        n_losses = is_loss.sum(axis=1)
+        losses = np.where(is_loss, sampled, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            downside_mean = losses.sum(axis=1) / n_losses
+            downside_std = np.sqrt(
+                np.where(is_loss, (sampled - downside_mean[:, np.newaxis]) ** 2, 0.0).sum(
+                    axis=1
+                )
+                / n_losses
+            )
+
+            # Sharpe Ratio (annualized)
+            sharpe = np.where(std_return > 0, mean_return / std_return * np.sqrt(252), 0.0)
+
+            # Sortino Ratio (annualized)
+            sortino = np.where(
+                downside_std > 0,
+                mean_return / downside_std * np.sqrt(252),
+                np.where(mean_return <= 0, 0.0, np.inf),
+            )
+
+            # Calmar Ratio
+            calmar = np.where(
+                max_dd > 0, cagr / max_dd, np.where(cagr > 0, np.inf, 0.0)
+            )
+
+        # Category 6: Streaks
+        win_streak = _max_run_length(is_win)
+        loss_streak = _max_run_length(is_loss)
+
+        # Category 7: Recovery Factor
+        net_profit = final_equity - initial_capital
+        max_dd_value = max_dd * initial_capital
+        with np.errstate(invalid="ignore", divide="ignore"):
+            recovery_factor = np.where(
+                max_dd_value > 0,
+                net_profit / max_dd_value,
+                np.where(net_profit > 0, np.inf, 0.0),
+            )
+
+        # Category 8: Profit Factor
+        sum_winners = np.where(is_win, sampled, 0.0).sum(axis=1)
+        sum_losers = np.abs(losses.sum(axis=1))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            profit_factor = np.where(
+                sum_losers > 0,
+                sum_winners / sum_losers,
+                np.where(sum_winners > 0, np.inf, 0.0),
+            )
+
+        # Category 9: Drawdown Duration
+        avg_dd_duration, max_dd_duration = _drawdown_duration_batch(equity_curves)
+
+        return equity_curves, _PathMetrics(
+            max_dd=max_dd,
+            final_equity=final_equity,
+            min_equity=min_equity,
+            cagr=cagr,
+            sharpe=sharpe,
+            sortino=sortino,
+            calmar=calmar,
+            win_streak=win_streak,
+            loss_streak=loss_streak,
+            recovery_factor=recovery_factor,
+            profit_factor=profit_factor,
+            avg_dd_duration=avg_dd_duration,
+            max_dd_duration=max_dd_duration,
+        )
 
-        # Handle edge cases
-        if in_drawdown[0]:
-            starts = np.concatenate([[0], starts])
-        if in_drawdown[-1]:
-            ends = np.concatenate([ends, [len(in_drawdown)]])
+    def _worker_count(self, n_sims: int, n_trades: int, n_batches: int) -> int:
+        """Number of worker processes to use for a run.
 
-        if len(starts) == 0 or len(ends) == 0:
-            return 0.0, 0
+        Args:
+            n_sims: Total number of simulations.
+            n_trades: Number of trades per simulation.
+            n_batches: Number of batches the run is split into.
 
-        durations = ends[: len(starts)] - starts[: len(ends)]
-        return float(np.mean(durations)), int(np.max(durations))
+        Returns:
+            1 for in-process execution, otherwise the process pool size.
+        """
+        if n_sims * n_trades < _MIN_PARALLEL_CELLS:
+            return 1
+        return max(1, min(self.config.num_workers, n_batches))
+
+    def _use_percentile_sketch(self, n_sims: int, n_trades: int) -> bool:
+        """Whether equity percentiles should come from the streaming sketch.
+
+        Args:
+            n_sims: Total number of simulations.
+            n_trades: Number of trades per simulation.
+
+        Returns:
+            True for the histogram sketch, False to keep every equity curve.
+        """
+        method = self.config.equity_percentile_method
+        if method == "auto":
+            return n_sims * n_trades * 8 > _EXACT_PERCENTILE_MAX_BYTES
+        return method == "histogram"
+
+    def _iter_batches(
+        self,
+        gains: NDArray[np.float64],
+        batch_bounds: list[tuple[int, int]],
+        batch_seeds: list[np.random.SeedSequence],
+        num_workers: int,
+        block_length: int | None,
+        trade_days: NDArray[np.int64] | None,
+    ) -> Iterator[tuple[int, NDArray[np.float64], _PathMetrics]]:
+        """Evaluate batches and yield them as they complete.
+
+        Cancellation is checked between batches. With more than one worker,
+        batches run in a process pool with at most two batches queued per
+        worker, so a cancel only waits for the batches already in flight.
+
+        Args:
+            gains: Array of trade returns.
+            batch_bounds: (start, stop) simulation index range of each batch.
+            batch_seeds: Child seed sequence of each batch.
+            num_workers: Number of worker processes.
+            block_length: Block length for the block bootstrap modes.
+            trade_days: Day identifier of each trade for date_grouped mode.
+
+        Yields:
+            Tuples of (batch index, equity curves, path metrics), in completion order.
+        """
+        if num_workers == 1:
+            batches = zip(batch_bounds, batch_seeds, strict=True)
+            for index, ((start, stop), seed) in enumerate(batches):
+                if self._cancelled:
+                    return
+                yield index, *_simulate_batch(
+                    self.config, gains, seed, stop - start, block_length, trade_days
+                )
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        queued = enumerate(zip(batch_bounds, batch_seeds, strict=True))
+        pending: dict[Future[tuple[NDArray[np.float64], _PathMetrics]], int] = {}
+
+        def submit_next() -> None:
+            item = next(queued, None)
+            if item is not None:
+                index, ((start, stop), seed) = item
+                future = executor.submit(
+                    _simulate_batch,
+                    self.config,
+                    gains,
+                    seed,
+                    stop - start,
+                    block_length,
+                    trade_days,
+                )
+                pending[future] = index
+
+        try:
+            for _ in range(2 * num_workers):
+                submit_next()
+            while pending and not self._cancelled:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    yield index, *future.result()
+                    if not self._cancelled:
+                        submit_next()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _convergence_precision(self, paths: _PathMetrics) -> dict[str, float]:
+        """Confidence half-width of each convergence target via batch means.
+
+        The paths are split into _CONVERGENCE_GROUPS contiguous groups; each
+        target statistic is computed per group and the half-width is the
+        Student-t interval of the group means.
+
+        Args:
+            paths: Metrics of the simulations completed so far.
+
+        Returns:
+            Mapping of target statistic name to its confidence half-width.
+        """
+        initial_capital = self.config.initial_capital
+        ruin_threshold = initial_capital * (1 - self.config.ruin_threshold_pct / 100)
+        n_groups = _CONVERGENCE_GROUPS
+        group_size = len(paths.max_dd) // n_groups
+        used = group_size * n_groups
+
+        max_dd = paths.max_dd[:used].reshape(n_groups, group_size)
+        per_group = {
+            "median_max_dd": np.percentile(max_dd, 50, axis=1),
+            "p95_max_dd": np.percentile(max_dd, 95, axis=1),
+            "risk_of_ruin": (
+                paths.min_equity[:used].reshape(n_groups, group_size) < ruin_threshold
+            ).mean(axis=1),
+            "probability_of_profit": (
+                paths.final_equity[:used].reshape(n_groups, group_size) > initial_capital
+            ).mean(axis=1),
+        }
+        t_crit = stats.t.ppf(0.5 + _CONVERGENCE_CONFIDENCE / 2, n_groups - 1)
+        return {
+            name: float(t_crit * np.std(per_group[name], ddof=1) / np.sqrt(n_groups))
+            for name in self.config.convergence_targets
+        }
 
     def run(
         self,
         gains: NDArray[np.float64],
         progress_callback: Callable[[int, int], None] | None = None,
+        trade_days: NDArray[np.int64] | None = None,
     ) -> MonteCarloResults:
         """Run Monte Carlo simulation.
 
+        Simulations are evaluated in batches sized to ``config.memory_budget_mb``;
+        progress is reported and cancellation checked once per batch. In
+        convergence mode the run stops at the first batch boundary where every
+        target statistic is within ``config.convergence_tolerance``.
+
         Args:
             gains: Array of trade returns as decimals (e.g., 0.05 for 5% gain).
             progress_callback: Optional callback for progress updates (completed, total).
+            trade_days: Day identifier of each trade, aligned with gains. Required
+                for date_grouped simulation (see extract_trade_days_from_app_state).
 
         Returns:
             MonteCarloResults containing all calculated metrics.
 
         Raises:
-            ValueError: If gains array is empty or has fewer than 10 trades.
+            ValueError: If gains array is empty or has fewer than 10 trades, or
+                trade_days is missing or misaligned for date_grouped simulation.
         """
         import time
 
         start_time = time.perf_counter()
         self._cancelled = False
+        self._rng = np.random.default_rng(self.config.seed)
 
         # Validate input
         if len(gains) == 0:
@@ -329,123 +1015,118 @@ class MonteCarloEngine:
             raise ValueError("Insufficient data: need at least 10 trades for Monte Carlo")
 
         gains = np.asarray(gains, dtype=np.float64)
+        if self.config.simulation_type == "date_grouped":
+            if trade_days is None or len(trade_days) != len(gains):
+                raise ValueError("date_grouped simulation requires a trade day for every trade")
+            trade_days = np.asarray(trade_days, dtype=np.int64)
+        block_length = (
+            self._resolve_block_length(gains)
+            if self.config.simulation_type in BLOCK_SIMULATION_TYPES
+            else None
+        )
         n_sims = self.config.num_simulations
         n_trades = len(gains)
         initial_capital = self.config.initial_capital
+        tolerance = self.config.convergence_tolerance
 
         # Pre-allocate result arrays
-        max_dd_arr = np.zeros(n_sims, dtype=np.float64)
-        final_equity_arr = np.zeros(n_sims, dtype=np.float64)
-        min_equity_arr = np.zeros(n_sims, dtype=np.float64)
-        cagr_arr = np.zeros(n_sims, dtype=np.float64)
-        sharpe_arr = np.zeros(n_sims, dtype=np.float64)
-        sortino_arr = np.zeros(n_sims, dtype=np.float64)
-        calmar_arr = np.zeros(n_sims, dtype=np.float64)
-        win_streak_arr = np.zeros(n_sims, dtype=np.int64)
-        loss_streak_arr = np.zeros(n_sims, dtype=np.int64)
-        recovery_factor_arr = np.zeros(n_sims, dtype=np.float64)
-        profit_factor_arr = np.zeros(n_sims, dtype=np.float64)
-        avg_dd_duration_arr = np.zeros(n_sims, dtype=np.float64)
-        max_dd_duration_arr = np.zeros(n_sims, dtype=np.int64)
-
-        # For equity percentiles chart (collect all equity curves)
-        all_equity_curves = np.zeros((n_sims, n_trades), dtype=np.float64)
-
-        # Calculate years for CAGR (each trade = 1 trading day, 252 days/year)
-        years = n_trades / 252.0
-
-        # Run simulations
-        for i in range(n_sims):
-            if self._cancelled:
-                logger.info("Monte Carlo simulation cancelled at iteration %d", i)
-                break
-
-            # Sample trades
-            if self.config.simulation_type == "resample":
-                sampled = self._resample(gains, n_trades)
-            else:
-                sampled = self._reshuffle(gains)
-
-            # Calculate equity curve
-            equity_curve = self._simulate_equity_curve(sampled, initial_capital)
-            all_equity_curves[i] = equity_curve
-
-            # Category 1: Max Drawdown
-            max_dd_arr[i] = self._calculate_max_drawdown(equity_curve)
-
-            # Category 2: Final Equity
-            final_equity = equity_curve[-1]
-            final_equity_arr[i] = final_equity
-            min_equity_arr[i] = np.min(equity_curve)
-
-            # Category 3: CAGR
-            if years > 0:
-                cagr_arr[i] = (final_equity / initial_capital) ** (1 / years) - 1
-            else:
-                cagr_arr[i] = 0.0
-
-            # Category 4: Risk-Adjusted Metrics
-            mean_return = np.mean(sampled)
-            std_return = np.std(sampled)
-            downside_returns = sampled[sampled < 0]
-            downside_std = np.std(downside_returns) if len(downside_returns) > 0 else np.nan
-
-            # Sharpe Ratio (annualized)
-            if std_return > 0:
-                sharpe_arr[i] = mean_return / std_return * np.sqrt(252)
-            else:
-                sharpe_arr[i] = 0.0
-
-            # Sortino Ratio (annualized)
-            if downside_std > 0 and not np.isnan(downside_std):
-                sortino_arr[i] = mean_return / downside_std * np.sqrt(252)
-            else:
-                sortino_arr[i] = 0.0 if mean_return <= 0 else np.inf
-
-            # Calmar Ratio
-            if max_dd_arr[i] > 0:
-                calmar_arr[i] = cagr_arr[i] / max_dd_arr[i]
-            else:
-                calmar_arr[i] = np.inf if cagr_arr[i] > 0 else 0.0
-
-            # Category 6: Streaks
-            win_streak_arr[i] = self._calculate_max_streak(sampled, win=True)
-            loss_streak_arr[i] = self._calculate_max_streak(sampled, win=False)
-
-            # Category 7: Recovery Factor
-            net_profit = final_equity - initial_capital
-            max_dd_value = max_dd_arr[i] * initial_capital
-            if max_dd_value > 0:
-                recovery_factor_arr[i] = net_profit / max_dd_value
-            else:
-                recovery_factor_arr[i] = np.inf if net_profit > 0 else 0.0
-
-            # Category 8: Profit Factor
-            winners = sampled[sampled > 0]
-            losers = sampled[sampled < 0]
-            sum_winners = np.sum(winners) if len(winners) > 0 else 0.0
-            sum_losers = np.abs(np.sum(losers)) if len(losers) > 0 else 0.0
-            if sum_losers > 0:
-                profit_factor_arr[i] = sum_winners / sum_losers
-            else:
-                profit_factor_arr[i] = np.inf if sum_winners > 0 else 0.0
-
-            # Category 9: Drawdown Duration
-            avg_dd_dur, max_dd_dur = self._calculate_drawdown_duration(equity_curve)
-            avg_dd_duration_arr[i] = avg_dd_dur
-            max_dd_duration_arr[i] = max_dd_dur
+        paths = _PathMetrics.zeros(n_sims)
+
+        batch_size = self._batch_size(n_sims, n_trades)
+        batch_bounds = [
+            (start, min(start + batch_size, n_sims)) for start in range(0, n_sims, batch_size)
+        ]
+        # One child seed stream per batch: the batch layout depends only on the
+        # config, so a given seed reproduces the same results for any worker count.
+        seed_sequence = np.random.SeedSequence(self.config.seed)
+        batch_seeds = seed_sequence.spawn(len(batch_bounds))
+
+        # For equity percentiles chart: either every equity curve or a streaming
+        # sketch whose bin ranges come from a pilot drawn on its own seed stream
+        all_equity_curves: NDArray[np.float64] | None = None
+        sketch: _EquityPercentileSketch | None = None
+        if self._use_percentile_sketch(n_sims, n_trades):
+            pilot_rng = np.random.default_rng(seed_sequence.spawn(1)[0])
+            pilot_size = min(n_sims, _SKETCH_PILOT_SIMS, batch_size)
+            pilot_sample = self._sample_batch(
+                gains,
+                pilot_size,
+                pilot_rng,
+                block_length=block_length,
+                trade_days=trade_days,
+            )
+            pilot_curves = self._simulate_equity_curve(pilot_sample, initial_capital)
+            sketch = _EquityPercentileSketch(pilot_curves)
+        else:
+            all_equity_curves = np.zeros((n_sims, n_trades), dtype=np.float64)
 
-            # Progress callback every 100 simulations
-            if progress_callback and (i + 1) % 100 == 0:
-                progress_callback(i + 1, n_sims)
+        num_workers = self._worker_count(n_sims, n_trades, len(batch_bounds))
+        logger.debug(
+            "Monte Carlo batch size: %d simulations, %d worker(s), block length %s",
+            batch_size,
+            num_workers,
+            block_length,
+        )
 
-        # Final progress callback
-        if progress_callback and not self._cancelled:
-            progress_callback(n_sims, n_sims)
+        # Run simulations batch by batch. Batches may complete out of order, so
+        # equity curves and convergence checks only consume the leading run of
+        # completed batches; early stopping then never depends on worker timing.
+        completed = 0
+        n_prefix_batches = 0
+        unconsumed_curves: dict[int, NDArray[np.float64]] = {}
+        converged: bool | None = None if tolerance is None else False
+        precision: dict[str, float] = {}
+        for index, equity_curves, batch in self._iter_batches(
+            gains, batch_bounds, batch_seeds, num_workers, block_length, trade_days
+        ):
+            start, stop = batch_bounds[index]
+            paths.assign(start, batch)
+            unconsumed_curves[index] = equity_curves
+
+            completed += stop - start
+            if progress_callback:
+                progress_callback(completed, n_sims)
+
+            prefix_before = n_prefix_batches
+            while n_prefix_batches in unconsumed_curves:
+                curves = unconsumed_curves.pop(n_prefix_batches)
+                prefix_start, prefix_stop = batch_bounds[n_prefix_batches]
+                if sketch is not None:
+                    sketch.update(curves)
+                else:
+                    assert all_equity_curves is not None
+                    all_equity_curves[prefix_start:prefix_stop] = curves
+                n_prefix_batches += 1
+
+            prefix_sims = batch_bounds[n_prefix_batches - 1][1] if n_prefix_batches else 0
+            if (
+                tolerance is not None
+                and n_prefix_batches > prefix_before
+                and prefix_sims >= _CONVERGENCE_MIN_SIMS
+            ):
+                precision = self._convergence_precision(paths.head(prefix_sims))
+                if all(width <= tolerance for width in precision.values()):
+                    converged = True
+                    break
+
+        if self._cancelled:
+            logger.info("Monte Carlo simulation cancelled after %d simulations", completed)
+
+        n_used = n_sims
+        if converged:
+            n_used = batch_bounds[n_prefix_batches - 1][1]
+            paths = paths.head(n_used)
+            if all_equity_curves is not None:
+                all_equity_curves = all_equity_curves[:n_used]
+            logger.info(
+                "Monte Carlo converged after %d of %d simulations", n_used, n_sims
+            )
+        elif tolerance is not None and not self._cancelled:
+            precision = self._convergence_precision(paths)
 
         # Category 5: Risk of Ruin
         ruin_threshold = initial_capital * (1 - self.config.ruin_threshold_pct / 100)
-        risk_of_ruin = float(np.mean(min_equity_arr < ruin_threshold))
+        risk_of_ruin = float(np.mean(paths.min_equity < ruin_threshold))
 
         # Category 10: VaR and CVaR
         var_pct = self.config.var_confidence_pct
@@ -454,80 +1135,127 @@ class MonteCarloEngine:
         cvar_mask = all_returns <= var
         cvar = float(np.mean(all_returns[cvar_mask])) if np.any(cvar_mask) else var
 
-        # Calculate equity percentiles for charting
-        equity_percentiles = np.percentile(
-            all_equity_curves, [5, 25, 50, 75, 95], axis=0
-        ).T  # Shape: (n_trades, 5)
+        # Calculate equity percentiles for charting, shape: (n_trades, 5)
+        if sketch is not None:
+            equity_percentiles = sketch.percentiles(EQUITY_PERCENTILES)
+            equity_percentiles_error = sketch.relative_error(
+                equity_percentiles[:, EQUITY_PERCENTILES.index(50)]
+            )
+        else:
+            assert all_equity_curves is not None
+            equity_percentiles = np.percentile(
+                all_equity_curves, EQUITY_PERCENTILES, axis=0
+            ).T
+            equity_percentiles_error = 0.0
 
         elapsed = time.perf_counter() - start_time
-        logger.info("Monte Carlo completed in %.2fs (%d simulations)", elapsed, n_sims)
+        logger.info("Monte Carlo completed in %.2fs (%d simulations)", elapsed, n_used)
 
         return MonteCarloResults(
             config=self.config,
             num_trades=n_trades,
             # Category 1
-            median_max_dd=float(np.percentile(max_dd_arr, 50)),
-            p95_max_dd=float(np.percentile(max_dd_arr, 95)),
-            p99_max_dd=float(np.percentile(max_dd_arr, 99)),
-            max_dd_distribution=max_dd_arr,
+            median_max_dd=float(np.percentile(paths.max_dd, 50)),
+            p95_max_dd=float(np.percentile(paths.max_dd, 95)),
+            p99_max_dd=float(np.percentile(paths.max_dd, 99)),
+            max_dd_distribution=paths.max_dd,
             # Category 2
-            mean_final_equity=float(np.mean(final_equity_arr)),
-            std_final_equity=float(np.std(final_equity_arr)),
-            p5_final_equity=float(np.percentile(final_equity_arr, 5)),
-            p95_final_equity=float(np.percentile(final_equity_arr, 95)),
-            probability_of_profit=float(np.mean(final_equity_arr > initial_capital)),
-            final_equity_distribution=final_equity_arr,
+            mean_final_equity=float(np.mean(paths.final_equity)),
+            std_final_equity=float(np.std(paths.final_equity)),
+            p5_final_equity=float(np.percentile(paths.final_equity, 5)),
+            p95_final_equity=float(np.percentile(paths.final_equity, 95)),
+            probability_of_profit=float(np.mean(paths.final_equity > initial_capital)),
+            final_equity_distribution=paths.final_equity,
             # Category 3
-            mean_cagr=float(np.mean(cagr_arr)),
-            median_cagr=float(np.median(cagr_arr)),
-            cagr_distribution=cagr_arr,
+            mean_cagr=float(np.mean(paths.cagr)),
+            median_cagr=float(np.median(paths.cagr)),
+            cagr_distribution=paths.cagr,
             # Category 4
-            mean_sharpe=float(np.mean(sharpe_arr[np.isfinite(sharpe_arr)])),
-            mean_sortino=float(np.mean(sortino_arr[np.isfinite(sortino_arr)])),
-            mean_calmar=float(np.mean(calmar_arr[np.isfinite(calmar_arr)])),
-            sharpe_distribution=sharpe_arr,
-            sortino_distribution=sortino_arr,
-            calmar_distribution=calmar_arr,
+            mean_sharpe=float(np.mean(paths.sharpe[np.isfinite(paths.sharpe)])),
+            mean_sortino=float(np.mean(paths.sortino[np.isfinite(paths.sortino)])),
+            mean_calmar=float(np.mean(paths.calmar[np.isfinite(paths.calmar)])),
+            sharpe_distribution=paths.sharpe,
+            sortino_distribution=paths.sortino,
+            calmar_distribution=paths.calmar,
             # Category 5
             risk_of_ruin=risk_of_ruin,
             # Category 6
-            mean_max_win_streak=float(np.mean(win_streak_arr)),
-            max_max_win_streak=int(np.max(win_streak_arr)),
-            mean_max_loss_streak=float(np.mean(loss_streak_arr)),
-            max_max_loss_streak=int(np.max(loss_streak_arr)),
-            win_streak_distribution=win_streak_arr,
-            loss_streak_distribution=loss_streak_arr,
+            mean_max_win_streak=float(np.mean(paths.win_streak)),
+            max_max_win_streak=int(np.max(paths.win_streak)),
+            mean_max_loss_streak=float(np.mean(paths.loss_streak)),
+            max_max_loss_streak=int(np.max(paths.loss_streak)),
+            win_streak_distribution=paths.win_streak,
+            loss_streak_distribution=paths.loss_streak,
             # Category 7
             mean_recovery_factor=float(
-                np.mean(recovery_factor_arr[np.isfinite(recovery_factor_arr)])
+                np.mean(paths.recovery_factor[np.isfinite(paths.recovery_factor)])
             ),
-            recovery_factor_distribution=recovery_factor_arr,
+            recovery_factor_distribution=paths.recovery_factor,
             # Category 8
             mean_profit_factor=float(
-                np.mean(profit_factor_arr[np.isfinite(profit_factor_arr)])
+                np.mean(paths.profit_factor[np.isfinite(paths.profit_factor)])
             ),
-            profit_factor_distribution=profit_factor_arr,
+            profit_factor_distribution=paths.profit_factor,
             # Category 9
-            mean_avg_dd_duration=float(np.mean(avg_dd_duration_arr)),
-            mean_max_dd_duration=float(np.mean(max_dd_duration_arr)),
-            max_dd_duration_distribution=max_dd_duration_arr,
+            mean_avg_dd_duration=float(np.mean(paths.avg_dd_duration)),
+            mean_max_dd_duration=float(np.mean(paths.max_dd_duration)),
+            max_dd_duration_distribution=paths.max_dd_duration,
             # Category 10
             var=var,
             cvar=cvar,
             # Chart data
             equity_percentiles=equity_percentiles,
+            equity_percentiles_error=equity_percentiles_error,
+            num_simulations_run=min(completed, n_used),
+            converged=converged,
+            convergence_precision=precision,
         )
 
 
-def extract_gains_from_app_state(
-    baseline_df: "pd.DataFrame | None",
-    column_mapping: "ColumnMapping | None",
-    first_trigger_enabled: bool = False,
-) -> NDArray[np.float64]:
-    """Extract adjusted gains array from baseline DataFrame for Monte Carlo simulation.
+def _simulate_batch(
+    config: MonteCarloConfig,
+    gains: NDArray[np.float64],
+    seed: np.random.SeedSequence,
+    batch_size: int,
+    block_length: int | None = None,
+    trade_days: NDArray[np.int64] | None = None,
+) -> tuple[NDArray[np.float64], _PathMetrics]:
+    """Simulate one batch from its own seed stream.
 
-    Uses adjusted_gain_pct column which has stop-loss capped gains.
-    Falls back to gain_pct if adjusted_gain_pct is not available.
+    Module-level so it can be pickled into worker processes.
+
+    Args:
+        config: Simulation configuration.
+        gains: Array of trade returns.
+        seed: Child seed sequence for this batch.
+        batch_size: Number of simulations in the batch.
+        block_length: Block length for the block bootstrap modes.
+        trade_days: Day identifier of each trade for date_grouped mode.
+
+    Returns:
+        Tuple of (equity curves, per-path metrics) for the batch.
+    """
+    engine = MonteCarloEngine(config)
+    sampled = engine._sample_batch(
+        gains,
+        batch_size,
+        np.random.default_rng(seed),
+        block_length=block_length,
+        trade_days=trade_days,
+    )
+    return engine._calculate_batch_metrics(sampled, config.initial_capital)
+
+
+def _select_trade_rows(
+    baseline_df: pd.DataFrame | None,
+    column_mapping: ColumnMapping | None,
+    first_trigger_enabled: bool,
+) -> tuple[pd.DataFrame, str, NDArray[np.intp]]:
+    """Select the trades used for Monte Carlo and the gain column to use.
+
+    Trades are used in chronological order (date, then entry time), so the
+    block and date-grouped modes resample runs of trades as they happened
+    rather than in file order.
 
     Args:
         baseline_df: The baseline DataFrame containing adjusted_gain_pct column.
@@ -535,17 +1263,13 @@ def extract_gains_from_app_state(
         first_trigger_enabled: Whether to filter to first triggers only.
 
     Returns:
-        NumPy array of trade returns (as decimals, e.g., 0.05 for 5% gain).
+        Tuple of (selected rows, gain column name, positions of the selected
+        rows in chronological order).
 
     Raises:
         ValueError: If DataFrame is empty, missing required columns, or has
             fewer than 10 trades after filtering.
     """
-    import pandas as pd
-
-    # Local import to avoid circular dependency
-    from src.core.column_mapper import ColumnMapping  # noqa: F811
-
     if baseline_df is None or baseline_df.empty:
         raise ValueError("No data available: baseline DataFrame is empty")
 
@@ -587,9 +1311,69 @@ def extract_gains_from_app_state(
             f"Insufficient data for Monte Carlo: need at least 10 trades, got {len(df)}"
         )
 
+    return df, gain_col, _chronological_order(df, column_mapping)
+
+
+def _chronological_order(
+    df: pd.DataFrame, column_mapping: ColumnMapping
+) -> NDArray[np.intp]:
+    """Row positions sorted by date, then entry time.
+
+    Rows with unparseable dates (or all rows, without a date column) keep
+    their file order after the dated ones; same-day trades without a time
+    keep their file order within the day.
+    """
+    from src.core.date_utils import resolve_dates
+    from src.core.time_utils import TIME_MINUTES_COLUMN, time_to_minutes
+
+    date_col = getattr(column_mapping, "date", None)
+    if not date_col or date_col not in df.columns:
+        return np.arange(len(df))
+
+    dates = resolve_dates(df, date_col)
+    date_key = dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    date_key = np.where(dates.isna().to_numpy(), np.iinfo(np.int64).max, date_key)
+
+    time_col = getattr(column_mapping, "time", None)
+    if TIME_MINUTES_COLUMN in df.columns:
+        minutes = df[TIME_MINUTES_COLUMN].to_numpy(dtype=np.float64, na_value=np.nan)
+    elif time_col and time_col in df.columns:
+        minutes = time_to_minutes(df[time_col]).to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        minutes = np.zeros(len(df))
+
+    # np.lexsort is stable and sorts by the last key first
+    return np.lexsort((np.nan_to_num(minutes, nan=0.0), date_key))
+
+
+def extract_gains_from_app_state(
+    baseline_df: pd.DataFrame | None,
+    column_mapping: ColumnMapping | None,
+    first_trigger_enabled: bool = False,
+) -> NDArray[np.float64]:
+    """Extract adjusted gains array from baseline DataFrame for Monte Carlo simulation.
+
+    Uses adjusted_gain_pct column which has stop-loss capped gains.
+    Falls back to gain_pct if adjusted_gain_pct is not available. Gains are
+    in chronological order.
+
+    Args:
+        baseline_df: The baseline DataFrame containing adjusted_gain_pct column.
+        column_mapping: Column mapping with gain_pct field.
+        first_trigger_enabled: Whether to filter to first triggers only.
+
+    Returns:
+        NumPy array of trade returns (as decimals, e.g., 0.05 for 5% gain).
+
+    Raises:
+        ValueError: If DataFrame is empty, missing required columns, or has
+            fewer than 10 trades after filtering.
+    """
+    df, gain_col, order = _select_trade_rows(baseline_df, column_mapping, first_trigger_enabled)
+
     # Extract gains as numpy array - NO conversion needed
     # adjusted_gain_pct is already in decimal format with capped losses
-    gains = df[gain_col].to_numpy(dtype=np.float64)
+    gains = df[gain_col].to_numpy(dtype=np.float64)[order]
 
     logger.debug(
         "Extracted %d gains for Monte Carlo: min=%.4f, max=%.4f",
@@ -599,3 +1383,38 @@ def extract_gains_from_app_state(
     )
 
     return gains
+
+
+def extract_trade_days_from_app_state(
+    baseline_df: pd.DataFrame | None,
+    column_mapping: ColumnMapping | None,
+    first_trigger_enabled: bool = False,
+) -> NDArray[np.int64]:
+    """Extract a trading-day identifier for each trade used in Monte Carlo.
+
+    Selects the same rows, in the same order, as extract_gains_from_app_state.
+    Identifiers are day ordinals, so trades on the same calendar day share one.
+
+    Args:
+        baseline_df: The baseline DataFrame.
+        column_mapping: Column mapping with date field.
+        first_trigger_enabled: Whether to filter to first triggers only.
+
+    Returns:
+        NumPy array of day identifiers aligned with the extracted gains.
+
+    Raises:
+        ValueError: If the trades cannot be selected or the date column is missing.
+    """
+    from src.core.date_utils import day_ordinals, resolve_dates
+
+    df, _, order = _select_trade_rows(baseline_df, column_mapping, first_trigger_enabled)
+
+    date_col = getattr(column_mapping, "date", None)
+    if date_col is None or date_col not in df.columns:
+        raise ValueError(f"Date column '{date_col}' not found in DataFrame")
+
+    # Unparseable dates become one shared group rather than failing the run
+    ordinals = day_ordinals(resolve_dates(df, date_col))[order]
+    _, day_ids = np.unique(ordinals, return_inverse=True)
+    return day_ids.astype(np.int64)
@@ -218,7 +218,8 @@ class ThresholdAnalysisEngine:
         # Generate 11 threshold values: 5 below, current, 5 above
         thresholds = [current_value + (i - 5) * step_size for i in range(11)]
 
-        filter_engine = FilterEngine()
+        # Narrow threshold steps resolve through the range index
+        filter_engine = FilterEngine(range_index=True)
         calculator = MetricsCalculator()
         rows: list[ThresholdRow] = []
         current_index = 5  # Middle row is current
@@ -444,6 +445,9 @@ class ParameterSensitivityEngine:
         self._column_mapping = column_mapping
         self._active_filters = active_filters
         self._cancelled = False
+        # Shared across grid points so repeated criteria reuse cached masks,
+        # and the narrow sweep windows resolve through the range index
+        self._filter_engine = FilterEngine(range_index=True)
 
     def cancel(self) -> None:
         """Request cancellation of running analysis."""
@@ -513,8 +517,7 @@ class ParameterSensitivityEngine:
         Returns:
             Dict mapping metric name to value.
         """
-        filter_engine = FilterEngine()
-        filtered_df = filter_engine.apply_filters(self._baseline_df, filters)
+        filtered_df = self._filter_engine.apply_filters(self._baseline_df, filters)
 
         if len(filtered_df) == 0:
             # No trades pass filters - return zeros
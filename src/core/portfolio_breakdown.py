@@ -5,6 +5,9 @@ import logging
 import numpy as np
 import pandas as pd
 
+from src.core.date_utils import parse_dates
+from src.core.equity import extract_drawdown_episodes
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,7 +49,7 @@ class PortfolioBreakdownCalculator:
             return {}
 
         df = equity_df.copy()
-        df["_year"] = pd.to_datetime(df["date"], dayfirst=True, format="mixed", errors="coerce").dt.year
+        df["_year"] = parse_dates(df["date"]).dt.year
 
         results: dict[int, dict[str, float]] = {}
 
@@ -137,7 +140,7 @@ class PortfolioBreakdownCalculator:
             return {}
 
         df = equity_df.copy()
-        df["_date"] = pd.to_datetime(df["date"], dayfirst=True, format="mixed", errors="coerce")
+        df["_date"] = parse_dates(df["date"])
         df["_year"] = df["_date"].dt.year
         df["_month"] = df["_date"].dt.month
 
@@ -178,7 +181,7 @@ class PortfolioBreakdownCalculator:
         if equity_df.empty:
             return []
 
-        years = pd.to_datetime(equity_df["date"], dayfirst=True, format="mixed", errors="coerce").dt.year.unique()
+        years = parse_dates(equity_df["date"]).dt.year.unique()
         return sorted(int(y) for y in years)
 
     def _calculate_dd_duration(
@@ -193,14 +196,7 @@ class PortfolioBreakdownCalculator:
         Returns:
             Longest streak where equity < peak (in trading days/trades).
         """
-        max_streak = 0
-        current_streak = 0
-
-        for e, p in zip(equity, peak):
-            if e < p:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 0
+        episodes = extract_drawdown_episodes(np.asarray(equity), np.asarray(peak))
+        max_streak = int(episodes.length.max()) if len(episodes) > 0 else 0
 
         return max_streak
@@ -4,6 +4,7 @@ import logging
 
 import pandas as pd
 
+from src.core.date_utils import parse_dates
 from src.core.portfolio_models import PositionSizeType, StrategyConfig
 
 logger = logging.getLogger(__name__)
@@ -70,11 +71,10 @@ class PortfolioCalculator:
         Returns:
             Series of parsed datetime values.
         """
-        # First try: let pandas infer the format for each element
-        try:
-            return pd.to_datetime(date_series, format='mixed', dayfirst=True)
-        except Exception:
-            pass
+        # First try: one format detected from a sample, element-wise for the rest
+        parsed = parse_dates(date_series)
+        if parsed.notna().sum() == date_series.notna().sum():
+            return parsed
 
         # Second try: day-first parsing (European format)
         try:
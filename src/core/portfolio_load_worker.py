@@ -0,0 +1,198 @@
+"""Background worker thread for loading saved portfolio strategy files."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import pandas as pd
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.core.cache_manager import CacheManager
+from src.core.file_loader import FileLoader
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on loader processes; each one holds a full parsed workbook
+MAX_LOAD_WORKERS = 8
+
+
+def _load_strategy_file(path: str, sheet: str | None, cache_dir: str) -> pd.DataFrame:
+    """Load a strategy file through the Parquet cache.
+
+    Runs in a worker process, so it opens its own CacheManager on the shared
+    cache directory.
+
+    Args:
+        path: Path to the strategy file.
+        sheet: Sheet name for Excel files; the first sheet if None.
+        cache_dir: Cache directory of the CacheManager.
+
+    Returns:
+        DataFrame with the file contents.
+
+    Raises:
+        FileLoadError: If the file cannot be loaded.
+    """
+    file_path = Path(path)
+    cache_manager = CacheManager(cache_dir=Path(cache_dir))
+    df = cache_manager.get_cached(file_path, sheet)
+    if df is None:
+        df = FileLoader().load(file_path, sheet)
+        cache_manager.save_to_cache(df, file_path, sheet)
+    return df
+
+
+class PortfolioLoadWorker(QThread):
+    """Worker thread that loads strategy files concurrently.
+
+    Each distinct (file, sheet) pair is loaded once, through the same Parquet
+    cache as the Data Input tab. Cache hits are read in the worker thread;
+    only cache misses are parsed in a process pool, because Excel parsing is
+    CPU-bound and holds the GIL. With at most one miss the pool is skipped.
+    Strategies are reported as their files arrive, so the portfolio can
+    render progressively.
+
+    Signals:
+        strategy_started: Emitted with a strategy name when its file is queued for loading.
+        strategy_loaded: Emitted with (strategy name, DataFrame).
+        strategy_failed: Emitted with (strategy name, error message).
+        progress: Emitted with (files done, total files).
+        finished: Emitted once every file has been loaded or has failed.
+    """
+
+    strategy_started = pyqtSignal(str)
+    strategy_loaded = pyqtSignal(str, object)
+    strategy_failed = pyqtSignal(str, str)
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+
+    def __init__(
+        self,
+        strategies: list[tuple[str, str, str | None]],
+        cache_dir: Path | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            strategies: (name, file path, sheet name) of each strategy to load.
+            cache_dir: Cache directory. Defaults to CacheManager's.
+            max_workers: Maximum number of loader processes. Defaults to the
+                CPU count, capped at MAX_LOAD_WORKERS.
+        """
+        super().__init__()
+        # Absolute, so loader processes resolve it as the caller did
+        self._cache_dir = (cache_dir or CacheManager().cache_dir).absolute()
+        self._max_workers = max_workers or min(os.cpu_count() or 1, MAX_LOAD_WORKERS)
+        self._cancel_event = threading.Event()
+        # Strategies sharing a file and sheet are served by a single load
+        self._jobs: dict[tuple[str, str | None], list[str]] = {}
+        for name, path, sheet in strategies:
+            self._jobs.setdefault((path, sheet), []).append(name)
+
+    def cancel(self) -> None:
+        """Stop loading; files already being parsed are discarded."""
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        """Load every strategy file."""
+        jobs = list(self._jobs.items())
+        total = len(jobs)
+        self.progress.emit(0, total)
+
+        # Cached files are millisecond Parquet reads; no process needed
+        cache_manager = CacheManager(cache_dir=self._cache_dir)
+        misses: list[tuple[tuple[str, str | None], list[str]]] = []
+        done = 0
+        for (path, sheet), names in jobs:
+            if self._cancel_event.is_set():
+                return
+            self._emit_started(names)
+            try:
+                df = cache_manager.get_cached(Path(path), sheet)
+            except OSError:
+                df = None
+            if df is None:
+                misses.append(((path, sheet), names))
+                continue
+            self._emit_loaded(names, df)
+            done += 1
+            self.progress.emit(done, total)
+
+        num_workers = min(self._max_workers, len(misses))
+        if num_workers <= 1:
+            for (path, sheet), names in misses:
+                if self._cancel_event.is_set():
+                    return
+                try:
+                    df = _load_strategy_file(path, sheet, str(self._cache_dir))
+                except Exception as e:
+                    self._emit_failed(names, e)
+                else:
+                    self._emit_loaded(names, df)
+                done += 1
+                self.progress.emit(done, total)
+        else:
+            self._run_pool(misses, num_workers, done, total)
+
+        if not self._cancel_event.is_set():
+            self.finished.emit()
+
+    def _run_pool(
+        self,
+        jobs: list[tuple[tuple[str, str | None], list[str]]],
+        num_workers: int,
+        done_count: int,
+        total: int,
+    ) -> None:
+        """Load files in a process pool, reporting them in completion order.
+
+        Args:
+            jobs: ((file path, sheet), strategy names) of each file to parse.
+            num_workers: Number of worker processes.
+            done_count: Files already loaded from the cache.
+            total: Total number of files, for progress.
+        """
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        pending: dict[Future[pd.DataFrame], list[str]] = {}
+        try:
+            for (path, sheet), names in jobs:
+                future = executor.submit(_load_strategy_file, path, sheet, str(self._cache_dir))
+                pending[future] = names
+
+            while pending and not self._cancel_event.is_set():
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    names = pending.pop(future)
+                    try:
+                        df = future.result()
+                    except Exception as e:
+                        self._emit_failed(names, e)
+                    else:
+                        self._emit_loaded(names, df)
+                    done_count += 1
+                    self.progress.emit(done_count, total)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _emit_started(self, names: list[str]) -> None:
+        for name in names:
+            self.strategy_started.emit(name)
+
+    def _emit_loaded(self, names: list[str], df: pd.DataFrame) -> None:
+        for index, name in enumerate(names):
+            # Strategies sharing a file get their own frame
+            self.strategy_loaded.emit(name, df if index == 0 else df.copy())
+            logger.info("Loaded strategy '%s' (%d rows)", name, len(df))
+
+    def _emit_failed(self, names: list[str], error: Exception) -> None:
+        for name in names:
+            logger.warning("Could not load file for %s: %s", name, error)
+            self.strategy_failed.emit(name, str(error))
@@ -13,6 +13,9 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from src.core.date_utils import parse_dates
+from src.core.equity import extract_drawdown_episodes
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,7 +125,7 @@ class PortfolioMetricsCalculator:
         ending_value = equity_curve["equity"].iloc[-1]
 
         # Calculate years from date range
-        dates = pd.to_datetime(equity_curve["date"], dayfirst=True, format="mixed", errors="coerce")
+        dates = parse_dates(equity_curve["date"])
         days = (dates.max() - dates.min()).days
         if days == 0:
             return None
@@ -168,7 +171,7 @@ class PortfolioMetricsCalculator:
             Series of daily returns (as decimals) indexed by date.
         """
         df = equity_curve.copy()
-        df["_date"] = pd.to_datetime(df["date"], dayfirst=True, format="mixed", errors="coerce").dt.normalize()
+        df["_date"] = parse_dates(df["date"]).dt.normalize()
 
         # Take end-of-day equity (last trade of each day)
         daily_equity = df.groupby("_date")["equity"].last()
@@ -299,24 +302,10 @@ class PortfolioMetricsCalculator:
         equities = equity_curve["equity"].astype(float)
         peaks = equity_curve["peak"].astype(float)
 
-        # Underwater when equity < peak
-        underwater = equities < peaks
-        time_underwater_pct = float(underwater.sum() / len(underwater) * 100)
-
-        # Calculate drawdown periods (consecutive underwater days)
-        periods = []
-        current_period = 0
-        for uw in underwater:
-            if uw:
-                current_period += 1
-            else:
-                if current_period > 0:
-                    periods.append(current_period)
-                current_period = 0
-        if current_period > 0:
-            periods.append(current_period)
-
-        max_duration = max(periods) if periods else 0
+        # Underwater when equity < peak; each episode is one consecutive run
+        episodes = extract_drawdown_episodes(equities, peaks)
+        time_underwater_pct = float(episodes.length.sum() / len(equities) * 100)
+        max_duration = int(episodes.length.max()) if len(episodes) > 0 else 0
 
         return max_duration, time_underwater_pct
 
@@ -445,7 +434,7 @@ class PortfolioMetricsCalculator:
             return None
 
         df = equity_curve.copy()
-        df["date"] = pd.to_datetime(df["date"], dayfirst=True, format="mixed", errors="coerce")
+        df["date"] = parse_dates(df["date"])
 
         # Sort by date and trade_num to ensure "first" aggregation gets chronologically first trade
         # trade_num is needed when multiple trades occur on the same date
@@ -685,7 +674,7 @@ class PortfolioMetricsCalculator:
             Series of drawdown percentages (negative values) indexed by date.
         """
         df = equity_curve.copy()
-        df["_date"] = pd.to_datetime(df["date"], dayfirst=True, format="mixed", errors="coerce").dt.normalize()
+        df["_date"] = parse_dates(df["date"]).dt.normalize()
 
         # Take end-of-day equity
         daily_equity = df.groupby("_date")["equity"].last()
@@ -985,8 +974,8 @@ class PortfolioMetricsCalculator:
         if len(baseline_df) == 0 or len(combined_df) == 0:
             return None
 
-        baseline_df["date"] = pd.to_datetime(baseline_df["date"], dayfirst=True, format="mixed", errors="coerce")
-        combined_df["date"] = pd.to_datetime(combined_df["date"], dayfirst=True, format="mixed", errors="coerce")
+        baseline_df["date"] = parse_dates(baseline_df["date"])
+        combined_df["date"] = parse_dates(combined_df["date"])
 
         # Merge on date and ticker
         merged = baseline_df.merge(
@@ -3,6 +3,10 @@
 Writes state files to ~/.lumen/state/ so the MCP server can read
 the current GUI state (loaded file, filters, metrics) and sync
 DataFrames without manual user intervention.
+
+The baseline DataFrame is written once per load as an Arrow IPC file and
+the filtered view is published as the baseline rows it selects, so a filter
+change only writes a row-position file (see src.core.state_files).
 """
 
 from __future__ import annotations
@@ -10,14 +14,20 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import uuid
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from PyQt6.QtCore import QObject, QTimer
 
+from src.core.cache_manager import INTERNAL_COLUMNS
+from src.core.state_files import frame_to_table, selection_digest, write_rows, write_table
+
 if TYPE_CHECKING:
     from src.core.app_state import AppState
 
@@ -25,6 +35,19 @@ logger = logging.getLogger(__name__)
 
 STATE_DIR = Path.home() / ".lumen" / "state"
 
+# Data files are versioned by name so a file the MCP server has memory-mapped
+# is never overwritten; files of earlier versions are removed once unused
+_DATA_FILE_PATTERNS = ("baseline_*.arrow", "filtered_*.arrow")
+# Files written by earlier releases
+_LEGACY_FILES = ("baseline_data.parquet", "filtered_data.parquet")
+
+
+def _public_table(df: pd.DataFrame) -> pa.Table:
+    """Arrow table of a frame without its internal bookkeeping columns."""
+    table = frame_to_table(df)
+    internal = [column for column in INTERNAL_COLUMNS if column in table.column_names]
+    return table.drop_columns(internal) if internal else table
+
 
 class StateExporter(QObject):
     """Debounced exporter that writes GUI state to filesystem.
@@ -33,9 +56,14 @@ class StateExporter(QObject):
     debounce period. Files are written atomically via tmp + rename.
 
     State files written to ~/.lumen/state/:
-        gui_state.json  — metadata, filters, adjustment params, metrics summary
-        baseline_data.parquet — baseline DataFrame
-        filtered_data.parquet — filtered DataFrame
+        gui_state.json  — metadata, filters, adjustment params, metrics summary,
+            and the names of the current data files
+        baseline_<version>.arrow — baseline DataFrame, rewritten only when the
+            baseline changes
+        filtered_rows_<version>.arrow — baseline row positions of the
+            filtered view, when it is a row subset of the baseline; rewritten
+            only when the selection or filters change
+        filtered_<version>.arrow — filtered DataFrame otherwise
     """
 
     _DEBOUNCE_MS = 500
@@ -49,6 +77,15 @@ class StateExporter(QObject):
         """
         super().__init__(parent)
         self._app_state = app_state
+        # Current baseline file; rewritten when the baseline is reloaded
+        self._baseline_file: str | None = None
+        self._baseline_signature: tuple[Any, ...] | None = None
+        self._baseline_dirty = True
+        # Last published filtered view; a selection is only rewritten when
+        # its rows or filters change
+        self._filtered: dict[str, Any] = {"kind": None, "file": None, "rows": 0}
+        self._selection_key: tuple[str, str, str, str | None] | None = None
+        self._selection_version = 0
 
         self._timer = QTimer(self)
         self._timer.setSingleShot(True)
@@ -60,10 +97,10 @@ class StateExporter(QObject):
     def _connect_signals(self) -> None:
         """Connect to AppState signals that should trigger an export."""
         s = self._app_state
-        s.data_loaded.connect(self._schedule)
+        s.data_loaded.connect(self._schedule_baseline)
         s.filtered_data_updated.connect(self._schedule)
         s.metrics_updated.connect(self._schedule)
-        s.adjustment_params_changed.connect(self._schedule)
+        s.adjustment_params_changed.connect(self._schedule_baseline)
         s.filters_changed.connect(self._schedule)
         s.first_trigger_toggled.connect(self._schedule)
 
@@ -71,29 +108,203 @@ class StateExporter(QObject):
         """Restart the debounce timer."""
         self._timer.start()
 
+    def _schedule_baseline(self, *_args: object) -> None:
+        """Restart the debounce timer and rewrite the baseline on export."""
+        self._baseline_dirty = True
+        self._timer.start()
+
     def _export(self) -> None:
-        """Write all state files atomically."""
+        """Write all state files atomically.
+
+        Data files are written before gui_state.json, so the JSON never
+        names a file that does not exist yet.
+        """
         state = self._app_state
         if state.baseline_df is None:
             return
 
         try:
             STATE_DIR.mkdir(parents=True, exist_ok=True)
-            self._write_json(state)
-            self._write_parquet(state.baseline_df, STATE_DIR / "baseline_data.parquet")
-            if state.filtered_df is not None:
-                self._write_parquet(state.filtered_df, STATE_DIR / "filtered_data.parquet")
-            else:
-                # Remove stale filtered file when no filters are active
-                filtered_path = STATE_DIR / "filtered_data.parquet"
-                if filtered_path.exists():
-                    filtered_path.unlink()
+            baseline_file = self._export_baseline(state.baseline_df)
+            filtered = self._export_filtered(
+                state.baseline_df,
+                state.filtered_df,
+                baseline_file,
+                self._filter_definitions(state),
+                state.filter_expression or None,
+            )
+            self._write_json(state, baseline_file, filtered)
+            self._remove_stale_files(keep={baseline_file, filtered.get("file")})
             logger.debug("State exported to %s", STATE_DIR)
         except Exception:
             logger.exception("Failed to export GUI state")
 
-    def _write_json(self, state: AppState) -> None:
-        """Write gui_state.json atomically."""
+    def _export_baseline(self, baseline_df: pd.DataFrame) -> str:
+        """Write the baseline file if the baseline changed since the last export.
+
+        Columns left on disk by a column-projected load are read first, so
+        the exported baseline always has the file's full width.
+
+        Args:
+            baseline_df: Current baseline DataFrame.
+
+        Returns:
+            Name of the current baseline file.
+        """
+        self._app_state.ensure_columns(self._app_state.column_schema(baseline_df).columns)
+        # Columns added in place (e.g. read on demand) also need a rewrite
+        signature = (id(baseline_df), baseline_df.shape, tuple(baseline_df.columns))
+        if (
+            self._baseline_file is not None
+            and not self._baseline_dirty
+            and signature == self._baseline_signature
+            and (STATE_DIR / self._baseline_file).exists()
+        ):
+            return self._baseline_file
+
+        name = f"baseline_{uuid.uuid4().hex[:12]}.arrow"
+        write_table(_public_table(baseline_df), STATE_DIR / name)
+        self._baseline_file = name
+        self._baseline_signature = signature
+        self._baseline_dirty = False
+        logger.debug("Baseline exported to %s", name)
+        return name
+
+    def _export_filtered(
+        self,
+        baseline_df: pd.DataFrame,
+        filtered_df: pd.DataFrame | None,
+        baseline_file: str,
+        filters: list[dict[str, Any]],
+        expression: str | None = None,
+    ) -> dict[str, Any]:
+        """Publish the filtered view as a selection of baseline rows.
+
+        The selection file holds the baseline row positions plus, in its
+        metadata, the baseline file, selection version, filter definitions
+        and filter expression. It is only rewritten when the rows, filters
+        or expression change, so the cost scales with the selection rather
+        than the frame width.
+        A filtered view that is not a row subset of the baseline is written
+        as a full frame.
+
+        Args:
+            baseline_df: Current baseline DataFrame.
+            filtered_df: Current filtered DataFrame, if any.
+            baseline_file: Name of the current baseline file.
+            filters: Filter definitions as written to gui_state.json.
+            expression: Filter expression text, or None.
+
+        Returns:
+            Description of the filtered view for gui_state.json: its kind
+            ("rows", "frame" or None), file name, row count and, for
+            selections, version and baseline file.
+        """
+        if filtered_df is None:
+            self._selection_key = None
+            self._filtered = {"kind": None, "file": None, "rows": 0}
+            return self._filtered
+
+        filters_json = json.dumps(filters, default=str)
+        rows = self._baseline_rows(baseline_df, filtered_df)
+        if rows is None:
+            self._selection_key = None
+            name = f"filtered_{uuid.uuid4().hex[:12]}.arrow"
+            write_table(_public_table(filtered_df), STATE_DIR / name)
+            self._filtered = {"kind": "frame", "file": name, "rows": len(filtered_df)}
+            return self._filtered
+
+        key = (baseline_file, selection_digest(rows), filters_json, expression)
+        if key == self._selection_key and (STATE_DIR / self._filtered["file"]).exists():
+            return self._filtered
+
+        self._selection_version += 1
+        version = self._selection_version
+        name = f"filtered_rows_{uuid.uuid4().hex[:12]}.arrow"
+        write_rows(
+            rows,
+            STATE_DIR / name,
+            metadata={
+                "baseline_file": baseline_file,
+                "version": str(version),
+                "filters": filters_json,
+                "filter_expression": expression or "",
+            },
+        )
+        self._selection_key = key
+        self._filtered = {
+            "kind": "rows",
+            "file": name,
+            "rows": len(rows),
+            "version": version,
+            "baseline_file": baseline_file,
+        }
+        return self._filtered
+
+    @staticmethod
+    def _baseline_rows(
+        baseline_df: pd.DataFrame, filtered_df: pd.DataFrame
+    ) -> np.ndarray | None:
+        """Baseline row positions of the filtered rows, matched by index label.
+
+        Args:
+            baseline_df: Current baseline DataFrame.
+            filtered_df: Current filtered DataFrame.
+
+        Returns:
+            Row positions in filtered order, or None if the filtered view is
+            not a row subset of the baseline with the same columns.
+        """
+        if set(filtered_df.columns) != set(baseline_df.columns):
+            return None
+        if not baseline_df.index.is_unique:
+            return None
+        rows = baseline_df.index.get_indexer(filtered_df.index)
+        if (rows < 0).any():
+            return None
+        return rows
+
+    @staticmethod
+    def _remove_stale_files(keep: set[str | None]) -> None:
+        """Remove data files of earlier versions.
+
+        Files the MCP server still has mapped cannot be removed on some
+        platforms; they are retried on the next export.
+
+        Args:
+            keep: Names of the current data files.
+        """
+        stale = [p for pattern in _DATA_FILE_PATTERNS for p in STATE_DIR.glob(pattern)]
+        stale += [STATE_DIR / name for name in _LEGACY_FILES]
+        for path in stale:
+            if path.name in keep or not path.exists():
+                continue
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+    @staticmethod
+    def _filter_definitions(state: AppState) -> list[dict[str, Any]]:
+        """Active filters as JSON-ready dicts."""
+        return [
+            {
+                "column": f.column,
+                "operator": f.operator,
+                "min_val": f.min_val,
+                "max_val": f.max_val,
+            }
+            for f in state.filters
+        ]
+
+    def _write_json(
+        self, state: AppState, baseline_file: str, filtered: dict[str, Any]
+    ) -> None:
+        """Write gui_state.json atomically.
+
+        Args:
+            state: Application state to describe.
+            baseline_file: Name of the current baseline file.
+            filtered: Description of the filtered view from _export_filtered.
+        """
         mapping_dict: dict[str, Any] | None = None
         if state.column_mapping is not None:
             mapping_dict = {
@@ -105,16 +316,7 @@ class StateExporter(QObject):
                 "mfe_pct": state.column_mapping.mfe_pct,
             }
 
-        filters_list: list[dict[str, Any]] = []
-        for f in state.filters:
-            filters_list.append(
-                {
-                    "column": f.column,
-                    "operator": f.operator,
-                    "min_val": f.min_val,
-                    "max_val": f.max_val,
-                }
-            )
+        filters_list = self._filter_definitions(state)
 
         def _metrics_summary(m: Any) -> dict[str, Any] | None:
             if m is None:
@@ -129,6 +331,7 @@ class StateExporter(QObject):
             "source_sheet": state.source_sheet,
             "column_mapping": mapping_dict,
             "filters": filters_list,
+            "filter_expression": state.filter_expression or None,
             "adjustment_params": {
                 "stop_loss": state.adjustment_params.stop_loss,
                 "efficiency": state.adjustment_params.efficiency,
@@ -149,6 +352,8 @@ class StateExporter(QObject):
             "filtered_rows": len(state.filtered_df) if state.filtered_df is not None else 0,
             "baseline_metrics": _metrics_summary(state.baseline_metrics),
             "filtered_metrics": _metrics_summary(state.filtered_metrics),
+            "baseline_file": baseline_file,
+            "filtered": filtered,
             "exported_at": datetime.now(UTC).isoformat(),
         }
 
@@ -157,23 +362,12 @@ class StateExporter(QObject):
         tmp.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
         tmp.replace(target)
 
-    @staticmethod
-    def _write_parquet(df: pd.DataFrame, target: Path) -> None:
-        """Write a DataFrame to parquet atomically."""
-        tmp = target.with_suffix(".parquet.tmp")
-        # Convert object columns to strings to avoid pyarrow type errors
-        # (mixed types or complex objects cause conversion failures)
-        df_clean = df.copy()
-        for col in df_clean.select_dtypes(include=["object"]).columns:
-            df_clean[col] = df_clean[col].astype(str)
-        df_clean.to_parquet(tmp, index=False)
-        tmp.replace(target)
-
     def cleanup(self) -> None:
         """Remove all state files (called on application close)."""
         self._timer.stop()
-        for name in ("gui_state.json", "baseline_data.parquet", "filtered_data.parquet"):
-            p = STATE_DIR / name
+        paths = [STATE_DIR / "gui_state.json", *(STATE_DIR / name for name in _LEGACY_FILES)]
+        paths += [p for pattern in _DATA_FILE_PATTERNS for p in STATE_DIR.glob(pattern)]
+        for p in paths:
             if p.exists():
                 try:
                     p.unlink()
@@ -0,0 +1,161 @@
+"""Arrow IPC files shared between the GUI and the MCP server.
+
+The GUI writes the baseline DataFrame once per load as an uncompressed Arrow
+IPC (Feather v2) file and publishes the filtered view as the baseline row
+positions it selects (a selection file, which also records the baseline it
+indexes, its version and the filters that produced it). The MCP server
+memory-maps the baseline, so columns without nulls are used zero-copy, and
+rebuilds the filtered view with a take.
+
+This module has no Qt dependency so the MCP server can import it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+# Name of the row-position column in a selection file
+ROWS_COLUMN = "row"
+
+
+def frame_to_table(df: pd.DataFrame) -> pa.Table:
+    """Convert a DataFrame to an Arrow table without copying the frame.
+
+    NumPy-backed numeric columns are converted from their arrays, so NaN stays
+    a value rather than becoming null and the MCP side can read them
+    zero-copy. Object columns that Arrow cannot type (mixed or complex
+    values) are stored as strings.
+
+    Args:
+        df: DataFrame to convert. The index is not stored.
+
+    Returns:
+        Arrow table with one column per DataFrame column.
+    """
+    arrays = []
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+            arrays.append(pa.array(series.to_numpy()))
+            continue
+        try:
+            arrays.append(pa.array(series, from_pandas=True))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            arrays.append(pa.array(series.astype(str)))
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def write_table(table: pa.Table, target: Path) -> None:
+    """Write an Arrow table as an uncompressed IPC file, atomically.
+
+    Args:
+        table: Table to write.
+        target: Destination path.
+    """
+    tmp = target.with_name(target.name + ".tmp")
+    # Uncompressed so readers can memory-map the buffers
+    feather.write_feather(table, tmp, compression="uncompressed")
+    tmp.replace(target)
+
+
+def write_rows(
+    rows: np.ndarray, target: Path, metadata: dict[str, str] | None = None
+) -> None:
+    """Write baseline row positions as a single-column IPC file.
+
+    Args:
+        rows: Row positions into the baseline, in view order.
+        target: Destination path.
+        metadata: Key/value pairs stored in the file's schema metadata.
+    """
+    dtype = np.int32 if len(rows) == 0 or rows.max() <= np.iinfo(np.int32).max else np.int64
+    table = pa.table({ROWS_COLUMN: rows.astype(dtype, copy=False)})
+    if metadata:
+        table = table.replace_schema_metadata(metadata)
+    write_table(table, target)
+
+
+def selection_digest(rows: np.ndarray) -> str:
+    """Fingerprint a selection so unchanged selections are not rewritten.
+
+    Args:
+        rows: Row positions, in view order.
+
+    Returns:
+        Hex digest of the positions.
+    """
+    data = np.ascontiguousarray(rows, dtype=np.int64)
+    return hashlib.blake2b(data.tobytes(), digest_size=16).hexdigest()
+
+
+def read_table(path: Path) -> pa.Table:
+    """Memory-map an IPC file written by write_table.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Arrow table backed by the mapped file.
+    """
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def read_frame(path: Path) -> pd.DataFrame:
+    """Memory-map an IPC file as a DataFrame.
+
+    Numeric columns without nulls share the mapped buffers instead of being
+    copied.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        DataFrame with a RangeIndex.
+    """
+    return read_table(path).to_pandas(split_blocks=True)
+
+
+def read_metadata(path: Path) -> dict[str, str]:
+    """Read the schema metadata of an IPC file without reading its data.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Metadata keys and values decoded as UTF-8.
+    """
+    with pa.memory_map(str(path), "r") as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    return {key.decode(): value.decode() for key, value in metadata.items()}
+
+
+def read_rows(path: Path) -> np.ndarray:
+    """Read baseline row positions written by write_rows.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Row positions in view order.
+    """
+    return read_table(path).column(ROWS_COLUMN).to_numpy()
+
+
+def take_rows(df: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+    """Build a view of a baseline DataFrame from row positions.
+
+    Args:
+        df: Baseline DataFrame with a RangeIndex.
+        rows: Row positions, in view order.
+
+    Returns:
+        New DataFrame with the selected rows and a fresh RangeIndex.
+    """
+    return df.take(rows).reset_index(drop=True)
@@ -1,11 +1,15 @@
 """Statistics calculations for trade analysis tables."""
 
 import logging
+import warnings
+from collections.abc import Sequence
 
+import numpy as np
 import pandas as pd
 
 from src.core.equity import EquityCalculator
 from src.core.models import AdjustmentParams, ColumnMapping
+from src.core.trade_matrix import TradeMatrix, chronological_order
 
 logger = logging.getLogger(__name__)
 
@@ -325,6 +329,12 @@ STOP_LOSS_LEVELS = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
 # Offset levels (fixed) for offset table
 OFFSET_LEVELS = [-20, -10, 0, 10, 20, 30, 40]
 
+# Fine-grained offset sweep: -30% to +50% in 0.5% steps
+OFFSET_SWEEP_LEVELS = [step / 2 for step in range(-60, 101)]
+
+# Upper bound on (levels x trades) cells materialized at once by scenario grids
+_SCENARIO_GRID_MAX_CELLS = 4_000_000
+
 
 def calculate_stop_loss_table(
     df: pd.DataFrame,
@@ -332,6 +342,7 @@ def calculate_stop_loss_table(
     adjustment_params: AdjustmentParams,
     start_capital: float | None = None,
     fractional_kelly_pct: float = 25.0,
+    matrix: TradeMatrix | None = None,
 ) -> pd.DataFrame:
     """Simulate stop loss levels and calculate metrics.
 
@@ -342,6 +353,8 @@ def calculate_stop_loss_table(
         start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
             If None, Kelly PnL and Max DD columns will be None.
         fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
+        matrix: Optional TradeMatrix for the rows of ``df``; when given, the
+            DataFrame is not touched.
 
     Returns:
         DataFrame with rows for each stop level and performance metrics.
@@ -350,10 +363,20 @@ def calculate_stop_loss_table(
                  Half Kelly (Stop Adj), Quarter Kelly (Stop Adj),
                  Max DD %, Total Kelly $
     """
-    rows = []
+    if matrix is not None:
+        rows = calculate_stop_scenario_grid_from_matrix(
+            matrix,
+            adjustment_params,
+            STOP_LOSS_LEVELS,
+            start_capital=start_capital,
+            fractional_kelly_pct=fractional_kelly_pct,
+        )
+        return pd.DataFrame(rows)
+
     gain_col = mapping.gain_pct
     mae_col = mapping.mae_pct
     date_col = mapping.date if hasattr(mapping, 'date') else None
+    time_col = mapping.time if hasattr(mapping, 'time') else None
 
     # Compute adjusted gains fresh using the same method as MetricsCalculator
     # This ensures consistency between Statistics and baseline metrics
@@ -372,18 +395,17 @@ def calculate_stop_loss_table(
         adjusted_gains.mean() if len(adjusted_gains) > 0 else 0,
     )
 
-    for stop_level in STOP_LOSS_LEVELS:
-        row = _calculate_stop_level_row(
-            df,
-            adjusted_gains,
-            mae_col,
-            stop_level,
-            adjustment_params.efficiency,
-            start_capital=start_capital,
-            fractional_kelly_pct=fractional_kelly_pct,
-            date_col=date_col,
-        )
-        rows.append(row)
+    rows = calculate_stop_scenario_grid(
+        df,
+        adjusted_gains,
+        mae_col,
+        STOP_LOSS_LEVELS,
+        adjustment_params.efficiency,
+        start_capital=start_capital,
+        fractional_kelly_pct=fractional_kelly_pct,
+        date_col=date_col,
+        time_col=time_col,
+    )
 
     # Log the 100% stop row for comparison with baseline
     row_100 = rows[-1]  # Last row should be 100% stop
@@ -406,6 +428,7 @@ def _calculate_stop_level_row(
     start_capital: float | None = None,
     fractional_kelly_pct: float = 25.0,
     date_col: str | None = None,
+    time_col: str | None = None,
 ) -> dict:
     """Calculate metrics for a single stop loss level.
 
@@ -418,160 +441,315 @@ def _calculate_stop_level_row(
         start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
         fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
         date_col: Optional date column name for equity curve.
+        time_col: Optional entry time column name; orders same-day trades.
 
     Returns:
         Dictionary with metrics for this stop level.
     """
-    total_trades = len(df)
+    grid = calculate_stop_scenario_grid(
+        df,
+        adjusted_gains,
+        mae_col,
+        [stop_level],
+        efficiency,
+        start_capital=start_capital,
+        fractional_kelly_pct=fractional_kelly_pct,
+        date_col=date_col,
+        time_col=time_col,
+    )
+    return grid[0]
 
-    # Handle empty data
-    if total_trades == 0:
-        return {
-            "Stop %": stop_level,
-            "Win %": 0.0,
-            "EV %": None,
-            "Avg Gain %": None,
-            "Median Gain %": None,
-            "Profit Ratio": None,
-            "Edge %": None,
-            "EG %": None,
-            "Max Loss %": 0.0,
-            "Full Kelly (Stop Adj)": None,
-            "Half Kelly (Stop Adj)": None,
-            "Quarter Kelly (Stop Adj)": None,
-            "Max DD %": None,
-            "Total Kelly $": None,
-        }
 
-    # Identify trades that would be stopped at this stop level
-    # mae_col is in percentage format (e.g., 27 = 27%)
-    # Use > (not >=) to match AdjustmentParams: mae <= stop_loss means NOT stopped
-    stopped_mask = df[mae_col] > stop_level
-    stopped_count = stopped_mask.sum()
+def _chronological_order(
+    df: pd.DataFrame, date_col: str | None, time_col: str | None = None
+) -> np.ndarray | None:
+    """Return row positions sorting trades by date and time, or None to keep row order.
 
-    # Start with the adjusted gains (decimal format, e.g., 0.15 = 15%)
-    adjusted_returns = adjusted_gains.copy()
+    Uses the same key as TradeMatrix.order, so the DataFrame and matrix paths
+    produce identical Kelly curves.
+    """
+    if date_col is None or date_col not in df.columns:
+        return None
+    return chronological_order(df, date_col, time_col)
 
-    # For stopped trades at THIS stop level, replace with simulated stop loss return
-    # The stop loss return = -stop_level% with efficiency slippage subtracted
-    # This matches how calculate_adjusted_gains works: gain - efficiency
-    # So a stopped trade at 20% stop with 5% slippage = -20% - 5% = -25%
-    # In decimal: -0.25
-    stop_loss_return = -(stop_level + efficiency) / 100.0
-    adjusted_returns[stopped_mask] = stop_loss_return
 
-    # Calculate metrics from adjusted returns (in decimal format)
-    winners = adjusted_returns > 0
-    losers = adjusted_returns < 0
+def _level_chunks(num_levels: int, num_trades: int) -> list[slice]:
+    """Split scenario levels into chunks whose matrices fit the cell budget."""
+    chunk = max(1, _SCENARIO_GRID_MAX_CELLS // max(num_trades, 1))
+    return [slice(i, min(i + chunk, num_levels)) for i in range(0, num_levels, chunk)]
 
-    win_count = winners.sum()
-    loss_count = losers.sum()
 
-    # Win %
-    win_pct = (win_count / total_trades) * 100
+def _kelly_grid_metrics(
+    returns_pct: np.ndarray,
+    kelly_pcts: np.ndarray,
+    start_capital: float,
+    fractional_kelly_pct: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Kelly PnL and Max DD % for every scenario row of a returns matrix.
 
-    # Max Loss % (stopped out / total × 100)
-    max_loss_pct = (stopped_count / total_trades) * 100
+    Mirrors EquityCalculator.calculate_kelly_metrics (absolute Kelly for
+    negative values, Max DD % as defined by calculate_drawdown_metrics) but
+    evaluates all rows in one call.
 
-    # Avg Gain % and Median Gain % (from adjusted returns converted to percentage)
-    adjusted_returns_pct = adjusted_returns * 100
-    avg_gain_pct = adjusted_returns_pct.mean()
-    median_gain_pct = adjusted_returns_pct.median()
+    Args:
+        returns_pct: (scenarios x trades) returns in percentage format,
+            in chronological order.
+        kelly_pcts: Full Kelly percentage for each scenario row.
+        start_capital: Starting capital in dollars.
+        fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
 
-    # EV % (expected value = average return, same as Avg Gain %)
-    ev_pct = avg_gain_pct
+    Returns:
+        Tuple of (kelly_pnl, max_dd_pct, max_dd_defined) arrays; max_dd_defined
+        is False where the curve has no drawdown or the peak is not positive.
+    """
+    paths = EquityCalculator().calculate_kelly_paths(
+        returns_pct, start_capital, fractional_kelly_pct, np.abs(kelly_pcts)
+    )
+    equity = paths["equity"]
+    peak = paths["peak"]
+    drawdown = paths["drawdown"]
 
-    # Calculate avg_win and avg_loss for profit ratio
-    avg_win = adjusted_returns[winners].mean() if win_count > 0 else 0.0
-    avg_loss = adjusted_returns[losers].mean() if loss_count > 0 else 0.0  # Negative
+    kelly_pnl = equity[:, -1] - start_capital
 
-    # Profit Ratio: avg_win / abs(avg_loss)
-    profit_ratio = avg_win / abs(avg_loss) if avg_loss != 0 else None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown_pct = np.where(peak > 0, (drawdown / peak) * -100.0, 0.0)
+    rows = np.arange(len(kelly_pcts))
+    worst = np.argmax(drawdown_pct, axis=1)
+    max_dd_pct = drawdown_pct[rows, worst]
+    defined = ~np.all(drawdown >= 0, axis=1) & (peak[rows, worst] > 0)
+
+    return kelly_pnl, max_dd_pct, defined
+
+
+def calculate_stop_scenario_grid(
+    df: pd.DataFrame,
+    adjusted_gains: pd.Series,
+    mae_col: str,
+    stop_levels: Sequence[float],
+    efficiency: float,
+    start_capital: float | None = None,
+    fractional_kelly_pct: float = 25.0,
+    date_col: str | None = None,
+    time_col: str | None = None,
+) -> list[dict]:
+    """Calculate stop loss metrics for every level of a stop grid at once.
+
+    Trades are sorted chronologically once; a (levels x trades) returns matrix
+    is then built by broadcasting the MAE array against the stop levels, and
+    all metrics including the Kelly curve are reduced along the trade axis.
+    Levels are processed in chunks so fine-grained grids over large datasets
+    stay within a bounded amount of memory.
 
-    # Diagnostic logging for 100% stop level (comparing with baseline)
-    if stop_level == 100:
-        logger.info(
-            "STATISTICS DIAGNOSTIC: 100%% stop level details - "
-            "stopped_count=%d, win_count=%d, loss_count=%d, "
-            "avg_win=%.6f, avg_loss=%.6f, profit_ratio=%.4f",
-            stopped_count,
-            win_count,
-            loss_count,
-            avg_win,
-            avg_loss,
-            profit_ratio or 0,
+    Args:
+        df: Trade data DataFrame.
+        adjusted_gains: Pre-computed adjusted gains (decimal format, from AdjustmentParams).
+        mae_col: Column name for MAE percentage (percentage points).
+        stop_levels: Stop loss levels to simulate (e.g., 20 for 20%), any granularity.
+        efficiency: Efficiency/slippage percentage (e.g., 5 for 5% slippage).
+        start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
+            If None, Max DD % and Total Kelly $ are None.
+        fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
+        date_col: Optional date column name for chronological Kelly curves.
+        time_col: Optional entry time column name; orders same-day trades.
+
+    Returns:
+        List of row dicts, one per stop level, with the stop loss table columns.
+
+    Raises:
+        ValueError: If any stop level is not positive.
+    """
+    if len(df) == 0:
+        return _stop_scenario_rows(
+            np.array([]), np.array([]), stop_levels, efficiency, start_capital, fractional_kelly_pct
         )
 
-    # Edge %: (profit_ratio + 1) × win_rate - 1 (as percentage)
-    # win_rate is a decimal (0-1)
-    win_rate = win_count / total_trades
-    if profit_ratio is not None:
-        edge_decimal = (profit_ratio + 1) * win_rate - 1
-        edge_pct = edge_decimal * 100
-    else:
-        edge_decimal = None
-        edge_pct = None
+    # Sort once so every scenario's Kelly curve is chronological
+    gains = adjusted_gains.to_numpy(dtype=float)
+    mae = df[mae_col].to_numpy(dtype=float)
+    order = _chronological_order(df, date_col, time_col)
+    if order is not None:
+        gains = gains[order]
+        mae = mae[order]
 
-    # EG %: Geometric growth formula at full Kelly stake
-    eg_pct = calculate_expected_growth(win_rate, profit_ratio)
+    return _stop_scenario_rows(
+        gains, mae, stop_levels, efficiency, start_capital, fractional_kelly_pct
+    )
 
-    # Full Kelly (Stop Adj): edge / profit_ratio / (stop_level/100) * 100
-    # edge_decimal is in decimal form (0.13 = 13%), result should be percentage
-    if profit_ratio is not None and profit_ratio > 0 and edge_decimal is not None:
-        stop_decimal = stop_level / 100.0
-        full_kelly = (edge_decimal / profit_ratio / stop_decimal) * 100  # Convert to percentage
-        half_kelly = full_kelly / 2
-        quarter_kelly = full_kelly / 4
-    else:
-        full_kelly = None
-        half_kelly = None
-        quarter_kelly = None
-
-    # Calculate Kelly metrics (Max DD % and Total Kelly $)
-    max_dd_pct = None
-    kelly_pnl = None
-
-    if start_capital is not None and full_kelly is not None and total_trades > 0:
-        try:
-            # Create temporary DataFrame with adjusted returns for this stop level
-            kelly_df = df.copy()
-            # EquityCalculator expects gains in percentage format (e.g., 15 for 15%)
-            kelly_df["_stop_adj_gains_pct"] = adjusted_returns * 100
-
-            equity_calculator = EquityCalculator()
-            kelly_result = equity_calculator.calculate_kelly_metrics(
-                kelly_df,
-                "_stop_adj_gains_pct",
-                start_capital,
-                fractional_kelly_pct,
-                full_kelly,  # Use the stop-adjusted full Kelly for this level
-                date_col=date_col,
-            )
-            kelly_pnl = kelly_result.get("pnl")
-            max_dd_pct = kelly_result.get("max_dd_pct")
-        except Exception as e:
-            logger.warning(
-                "Failed to calculate Kelly metrics for stop level %d: %s",
-                stop_level,
-                str(e),
+
+def calculate_stop_scenario_grid_from_matrix(
+    matrix: TradeMatrix,
+    adjustment_params: AdjustmentParams,
+    stop_levels: Sequence[float],
+    start_capital: float | None = None,
+    fractional_kelly_pct: float = 25.0,
+) -> list[dict]:
+    """Calculate the stop loss grid straight from a TradeMatrix.
+
+    Same results as calculate_stop_scenario_grid, but reads the pre-built
+    numeric arrays and chronological order instead of the DataFrame.
+
+    Args:
+        matrix: Trade matrix for the rows to analyse.
+        adjustment_params: Adjustment parameters (stop_loss, efficiency).
+        stop_levels: Stop loss levels to simulate (e.g., 20 for 20%).
+        start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
+        fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
+
+    Returns:
+        List of row dicts, one per stop level, with the stop loss table columns.
+    """
+    order = matrix.order
+    return _stop_scenario_rows(
+        matrix.adjusted_gains(adjustment_params)[order],
+        matrix.mae[order],
+        stop_levels,
+        adjustment_params.efficiency,
+        start_capital,
+        fractional_kelly_pct,
+    )
+
+
+def _stop_scenario_rows(
+    gains: np.ndarray,
+    mae: np.ndarray,
+    stop_levels: Sequence[float],
+    efficiency: float,
+    start_capital: float | None,
+    fractional_kelly_pct: float,
+) -> list[dict]:
+    """Stop loss grid rows from chronologically ordered adjusted gains and MAE."""
+    levels = np.asarray(stop_levels, dtype=float)
+    if np.any(levels <= 0):
+        raise ValueError(f"Stop levels must be positive, got {list(stop_levels)}")
+
+    total_trades = len(gains)
+
+    # Handle empty data
+    if total_trades == 0:
+        return [
+            {
+                "Stop %": stop_level,
+                "Win %": 0.0,
+                "EV %": None,
+                "Avg Gain %": None,
+                "Median Gain %": None,
+                "Profit Ratio": None,
+                "Edge %": None,
+                "EG %": None,
+                "Max Loss %": 0.0,
+                "Full Kelly (Stop Adj)": None,
+                "Half Kelly (Stop Adj)": None,
+                "Quarter Kelly (Stop Adj)": None,
+                "Max DD %": None,
+                "Total Kelly $": None,
+            }
+            for stop_level in stop_levels
+        ]
+
+    # Use > (not >=) to match AdjustmentParams: mae <= stop_loss means NOT stopped
+    # A stopped trade at 20% stop with 5% slippage returns -20% - 5% = -25%
+    stop_loss_returns = -(levels + efficiency) / 100.0
+    has_nan = bool(np.isnan(gains).any())
+    stop_levels = list(stop_levels)
+
+    rows: list[dict] = []
+    for chunk in _level_chunks(len(levels), total_trades):
+        stopped = mae[np.newaxis, :] > levels[chunk, np.newaxis]
+        returns = np.where(stopped, stop_loss_returns[chunk, np.newaxis], gains[np.newaxis, :])
+        returns_pct = returns * 100
+        winners = returns > 0
+        losers = returns < 0
+
+        stopped_count = stopped.sum(axis=1)
+        win_count = winners.sum(axis=1)
+        loss_count = losers.sum(axis=1)
+        win_sum = np.where(winners, returns, 0.0).sum(axis=1)
+        loss_sum = np.where(losers, returns, 0.0).sum(axis=1)
+        with warnings.catch_warnings():
+            # All-NaN rows legitimately produce NaN means and medians
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if has_nan:
+                avg_gain_pct = np.nanmean(returns_pct, axis=1)
+                median_gain_pct = np.nanmedian(returns_pct, axis=1)
+            else:
+                avg_gain_pct = returns_pct.mean(axis=1)
+                median_gain_pct = np.median(returns_pct, axis=1)
+
+        chunk_rows = []
+        full_kellys = np.full(len(stopped_count), np.nan)
+        for i, stop_level in enumerate(stop_levels[chunk]):
+            # Profit Ratio: avg_win / abs(avg_loss)
+            avg_win = win_sum[i] / win_count[i] if win_count[i] > 0 else 0.0
+            avg_loss = loss_sum[i] / loss_count[i] if loss_count[i] > 0 else 0.0  # Negative
+            profit_ratio = float(avg_win / abs(avg_loss)) if avg_loss != 0 else None
+
+            # Edge %: (profit_ratio + 1) × win_rate - 1 (as percentage)
+            win_rate = float(win_count[i] / total_trades)
+            if profit_ratio is not None:
+                edge_decimal = (profit_ratio + 1) * win_rate - 1
+                edge_pct = edge_decimal * 100
+            else:
+                edge_decimal = None
+                edge_pct = None
+
+            # EG %: Geometric growth formula at full Kelly stake
+            eg_pct = calculate_expected_growth(win_rate, profit_ratio)
+
+            # Full Kelly (Stop Adj): edge / profit_ratio / (stop_level/100) * 100
+            if profit_ratio is not None and profit_ratio > 0 and edge_decimal is not None:
+                full_kelly = (edge_decimal / profit_ratio / (stop_level / 100.0)) * 100
+                half_kelly = full_kelly / 2
+                quarter_kelly = full_kelly / 4
+                full_kellys[i] = full_kelly
+            else:
+                full_kelly = None
+                half_kelly = None
+                quarter_kelly = None
+
+            if stop_level == 100:
+                logger.info(
+                    "STATISTICS DIAGNOSTIC: 100%% stop level details - "
+                    "stopped_count=%d, win_count=%d, loss_count=%d, "
+                    "avg_win=%.6f, avg_loss=%.6f, profit_ratio=%.4f",
+                    stopped_count[i],
+                    win_count[i],
+                    loss_count[i],
+                    avg_win,
+                    avg_loss,
+                    profit_ratio or 0,
+                )
+
+            chunk_rows.append({
+                "Stop %": stop_level,
+                "Win %": win_rate * 100,
+                "EV %": float(avg_gain_pct[i]),
+                "Avg Gain %": float(avg_gain_pct[i]),
+                "Median Gain %": float(median_gain_pct[i]),
+                "Profit Ratio": profit_ratio,
+                "Edge %": edge_pct,
+                "EG %": eg_pct,
+                "Max Loss %": float(stopped_count[i] / total_trades * 100),
+                "Full Kelly (Stop Adj)": full_kelly,
+                "Half Kelly (Stop Adj)": half_kelly,
+                "Quarter Kelly (Stop Adj)": quarter_kelly,
+                "Max DD %": None,
+                "Total Kelly $": None,
+            })
+
+        # Kelly metrics (Max DD % and Total Kelly $) for levels with a Kelly stake
+        valid = ~np.isnan(full_kellys)
+        if start_capital is not None and valid.any():
+            kelly_pnl, max_dd_pct, max_dd_defined = _kelly_grid_metrics(
+                returns_pct[valid], full_kellys[valid], start_capital, fractional_kelly_pct
             )
+            for j, i in enumerate(np.flatnonzero(valid).tolist()):
+                chunk_rows[i]["Total Kelly $"] = float(kelly_pnl[j])
+                if max_dd_defined[j]:
+                    chunk_rows[i]["Max DD %"] = float(max_dd_pct[j])
 
-    return {
-        "Stop %": stop_level,
-        "Win %": win_pct,
-        "EV %": ev_pct,
-        "Avg Gain %": avg_gain_pct,
-        "Median Gain %": median_gain_pct,
-        "Profit Ratio": profit_ratio,
-        "Edge %": edge_pct,
-        "EG %": eg_pct,
-        "Max Loss %": max_loss_pct,
-        "Full Kelly (Stop Adj)": full_kelly,
-        "Half Kelly (Stop Adj)": half_kelly,
-        "Quarter Kelly (Stop Adj)": quarter_kelly,
-        "Max DD %": max_dd_pct,
-        "Total Kelly $": kelly_pnl,
-    }
+        rows.extend(chunk_rows)
+
+    return rows
 
 
 def calculate_offset_table(
@@ -580,6 +758,8 @@ def calculate_offset_table(
     adjustment_params: AdjustmentParams,
     start_capital: float | None = None,
     fractional_kelly_pct: float = 25.0,
+    offsets: Sequence[float] | None = None,
+    matrix: TradeMatrix | None = None,
 ) -> pd.DataFrame:
     """Simulate entry offsets with recalculated MAE/MFE and returns.
 
@@ -594,25 +774,42 @@ def calculate_offset_table(
         start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
             If None, Kelly PnL and Max DD columns will be None.
         fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
+        offsets: Offset levels to simulate. Defaults to OFFSET_LEVELS; pass
+            OFFSET_SWEEP_LEVELS for the fine-grained sweep.
+        matrix: Optional TradeMatrix for the rows of ``df``; when given, the
+            DataFrame is not touched.
 
     Returns:
         DataFrame with rows for each offset level and performance metrics.
         Includes Max DD % and Total Kelly $ columns.
     """
-    rows = []
-    gain_col = mapping.gain_pct
-    mae_col = mapping.mae_pct
-    mfe_col = mapping.mfe_pct
-    date_col = mapping.date if hasattr(mapping, 'date') else None
+    levels = OFFSET_LEVELS if offsets is None else offsets
 
-    for offset in OFFSET_LEVELS:
-        row = _calculate_offset_level_row(
-            df, gain_col, mae_col, mfe_col, offset, adjustment_params,
+    if matrix is not None:
+        rows = calculate_offset_scenario_grid_from_matrix(
+            matrix,
+            adjustment_params,
+            levels,
             start_capital=start_capital,
             fractional_kelly_pct=fractional_kelly_pct,
-            date_col=date_col,
         )
-        rows.append(row)
+        return pd.DataFrame(rows)
+
+    date_col = mapping.date if hasattr(mapping, 'date') else None
+    time_col = mapping.time if hasattr(mapping, 'time') else None
+
+    rows = calculate_offset_scenario_grid(
+        df,
+        mapping.gain_pct,
+        mapping.mae_pct,
+        mapping.mfe_pct,
+        levels,
+        adjustment_params,
+        start_capital=start_capital,
+        fractional_kelly_pct=fractional_kelly_pct,
+        date_col=date_col,
+        time_col=time_col,
+    )
 
     return pd.DataFrame(rows)
 
@@ -627,6 +824,7 @@ def _calculate_offset_level_row(
     start_capital: float | None = None,
     fractional_kelly_pct: float = 25.0,
     date_col: str | None = None,
+    time_col: str | None = None,
 ) -> dict:
     """Calculate metrics for a single offset level.
 
@@ -641,189 +839,254 @@ def _calculate_offset_level_row(
             If None, Kelly PnL and Max DD columns will be None.
         fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
         date_col: Optional date column name for equity curve.
+        time_col: Optional entry time column name; orders same-day trades.
 
     Returns:
         Dictionary with metrics for this offset level.
     """
-    stop_loss = adjustment_params.stop_loss
-    efficiency = adjustment_params.efficiency
-
-    # Filter qualifying trades based on offset
-    if offset < 0:
-        # Negative offset: price dropped before entry
-        # Include if mfe_pct >= abs(offset) (price dropped enough to reach lower entry)
-        qualifying_mask = df[mfe_col] >= abs(offset)
-    elif offset > 0:
-        # Positive offset: price rose before entry
-        # Include if mae_pct >= offset (price rose enough to reach higher entry)
-        qualifying_mask = df[mae_col] >= offset
-    else:
-        # 0% offset: all trades qualify
-        qualifying_mask = pd.Series([True] * len(df), index=df.index)
-
-    qualifying_df = df[qualifying_mask].copy()
-    num_trades = len(qualifying_df)
-
-    # Handle empty qualifying trades
-    if num_trades == 0:
-        return {
-            "Offset %": offset,
-            "# of Trades": 0,
-            "Win %": 0.0,
-            "Avg. Gain %": None,
-            "Median Gain %": None,
-            "EV %": None,
-            "Profit Ratio": None,
-            "Edge %": None,
-            "EG %": None,
-            "Max Loss %": 0.0,
-            "Total Gain %": 0.0,
-            "Max DD %": None,
-            "Total Kelly $": None,
-        }
-
-    # Recalculate MAE/MFE from new entry point
-    original_entry = 1.0
-    new_entry = original_entry * (1 + offset / 100)
-
-    # Derive price levels from original percentages
-    # For SHORT trades:
-    # mae_pct = how much price rose (bad for short) -> highest_price = 1.0 * (1 + mae_pct/100)
-    # mfe_pct = how much price dropped (good for short) -> lowest_price = 1.0 * (1 - mfe_pct/100)
-    highest_price = original_entry * (1 + qualifying_df[mae_col] / 100)
-    lowest_price = original_entry * (1 - qualifying_df[mfe_col] / 100)
-
-    # Recalculate from new entry
-    # For SHORT: MAE is how much higher price went above entry (bad)
-    new_mae_pct = (highest_price - new_entry) / new_entry * 100
-
-    # Calculate adjusted returns from the offset entry point
-    # Use ORIGINAL gains (not pre-adjusted) to derive exit price
-    # This ensures we apply adjustments consistently from this entry point
-    original_gains = qualifying_df[gain_col].astype(float)
-
-    # exit_price = 1.0 * (1 - original_gain) for SHORT
-    exit_price = original_entry * (1 - original_gains)
-
-    # new_return = (new_entry - exit_price) / new_entry for SHORT
-    # This is the raw return from the offset entry point
-    raw_returns = (new_entry - exit_price) / new_entry
-
-    # Convert to percentage for adjustment calculation (matching AdjustmentParams format)
-    raw_returns_pct = raw_returns * 100
-
-    # Apply stop-loss: if new_mae > stop_loss, trade is stopped
-    # (matching AdjustmentParams: mae <= stop_loss means NOT stopped)
-    stopped_mask = new_mae_pct > stop_loss
-    stopped_count = stopped_mask.sum()
+    grid = calculate_offset_scenario_grid(
+        df,
+        gain_col,
+        mae_col,
+        mfe_col,
+        [offset],
+        adjustment_params,
+        start_capital=start_capital,
+        fractional_kelly_pct=fractional_kelly_pct,
+        date_col=date_col,
+        time_col=time_col,
+    )
+    return grid[0]
 
-    # Stopped trades get -stop_loss return (in percentage)
-    raw_returns_pct[stopped_mask] = -stop_loss
 
-    # Clip any losses to not exceed stop_loss (matching AdjustmentParams)
-    # This ensures consistency even if MAE data is inconsistent
-    raw_returns_pct = raw_returns_pct.clip(lower=-stop_loss)
+def calculate_offset_scenario_grid(
+    df: pd.DataFrame,
+    gain_col: str,
+    mae_col: str,
+    mfe_col: str,
+    offsets: Sequence[float],
+    adjustment_params: AdjustmentParams,
+    start_capital: float | None = None,
+    fractional_kelly_pct: float = 25.0,
+    date_col: str | None = None,
+    time_col: str | None = None,
+) -> list[dict]:
+    """Calculate entry offset metrics for every level of an offset grid at once.
 
-    # Apply efficiency deduction (slippage) to all trades
-    adjusted_returns_pct = raw_returns_pct - efficiency
+    Only the gain, MAE and MFE columns are read. Trades are sorted
+    chronologically once, then qualification masks, re-based MAE and adjusted
+    returns are built as (offsets x trades) broadcast matrices. Trades that do
+    not qualify for an offset are excluded from its statistics and enter its
+    Kelly curve as flat (zero-return) steps, which leaves the final equity and
+    Max DD % of the qualifying trades unchanged.
 
-    # Convert back to decimal for metric calculations
-    adjusted_returns = adjusted_returns_pct / 100
+    Args:
+        df: Trade data DataFrame.
+        gain_col: Column name for gain percentage (decimal).
+        mae_col: Column name for MAE percentage (percentage points).
+        mfe_col: Column name for MFE percentage (percentage points).
+        offsets: Offset levels to simulate (e.g., -10 for -10%), any granularity.
+        adjustment_params: Adjustment parameters (stop_loss, efficiency).
+        start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
+            If None, Max DD % and Total Kelly $ are None.
+        fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
+        date_col: Optional date column name for chronological Kelly curves.
+        time_col: Optional entry time column name; orders same-day trades.
 
-    # Calculate metrics
-    winners_mask = adjusted_returns > 0
-    losers_mask = adjusted_returns < 0
+    Returns:
+        List of row dicts, one per offset, with the offset table columns.
 
-    win_count = winners_mask.sum()
-    loss_count = losers_mask.sum()
+    Raises:
+        ValueError: If any offset is -100% or lower (no valid entry price).
+    """
+    gains = df[gain_col].to_numpy(dtype=float)
+    mae = df[mae_col].to_numpy(dtype=float)
+    mfe = df[mfe_col].to_numpy(dtype=float)
+    order = _chronological_order(df, date_col, time_col)
+    if order is not None:
+        gains = gains[order]
+        mae = mae[order]
+        mfe = mfe[order]
+
+    return _offset_scenario_rows(
+        gains, mae, mfe, offsets, adjustment_params, start_capital, fractional_kelly_pct
+    )
 
-    # Win %
-    win_pct = (win_count / num_trades) * 100 if num_trades > 0 else 0.0
 
-    # Max Loss % (stopped out / qualifying × 100)
-    max_loss_pct = (stopped_count / num_trades) * 100 if num_trades > 0 else 0.0
+def calculate_offset_scenario_grid_from_matrix(
+    matrix: TradeMatrix,
+    adjustment_params: AdjustmentParams,
+    offsets: Sequence[float],
+    start_capital: float | None = None,
+    fractional_kelly_pct: float = 25.0,
+) -> list[dict]:
+    """Calculate the entry offset grid straight from a TradeMatrix.
 
-    # Avg. Gain % and Median Gain %
-    avg_gain_pct = adjusted_returns_pct.mean()
-    median_gain_pct = adjusted_returns_pct.median()
+    Same results as calculate_offset_scenario_grid, but reads the pre-built
+    numeric arrays and chronological order instead of the DataFrame.
 
-    # EV % (expected value = avg return, same as Avg. Gain %)
-    ev_pct = avg_gain_pct
+    Args:
+        matrix: Trade matrix for the rows to analyse.
+        adjustment_params: Adjustment parameters (stop_loss, efficiency).
+        offsets: Offset levels to simulate (e.g., -10 for -10%).
+        start_capital: Starting capital for Kelly calculations (e.g., 100000.0).
+        fractional_kelly_pct: Fractional Kelly percentage (e.g., 25 = 25%).
 
-    # Total Gain %
-    total_gain_pct = adjusted_returns_pct.sum()
+    Returns:
+        List of row dicts, one per offset, with the offset table columns.
+    """
+    order = matrix.order
+    return _offset_scenario_rows(
+        matrix.gain[order],
+        matrix.mae[order],
+        matrix.mfe[order],
+        offsets,
+        adjustment_params,
+        start_capital,
+        fractional_kelly_pct,
+    )
 
-    # Calculate avg_win and avg_loss for profit ratio
-    avg_win = adjusted_returns[winners_mask].mean() if win_count > 0 else 0.0
-    avg_loss = adjusted_returns[losers_mask].mean() if loss_count > 0 else 0.0  # Negative
 
-    # Profit Ratio: avg_win / abs(avg_loss)
-    profit_ratio = avg_win / abs(avg_loss) if avg_loss != 0 else None
+def _offset_scenario_rows(
+    gains: np.ndarray,
+    mae: np.ndarray,
+    mfe: np.ndarray,
+    offsets: Sequence[float],
+    adjustment_params: AdjustmentParams,
+    start_capital: float | None,
+    fractional_kelly_pct: float,
+) -> list[dict]:
+    """Entry offset grid rows from chronologically ordered gain, MAE and MFE."""
+    levels = np.asarray(offsets, dtype=float)
+    if np.any(levels <= -100):
+        raise ValueError(f"Offsets must be greater than -100, got {list(offsets)}")
+
+    offsets = list(offsets)
+    stop_loss = adjustment_params.stop_loss
+    efficiency = adjustment_params.efficiency
 
-    # Edge %: (profit_ratio + 1) × win_rate - 1 (as percentage)
-    win_rate = win_count / num_trades if num_trades > 0 else 0.0
-    if profit_ratio is not None:
-        edge_decimal = (profit_ratio + 1) * win_rate - 1
-        edge_pct = edge_decimal * 100
-    else:
-        edge_decimal = None
-        edge_pct = None
+    # Derive price levels from original percentages (original entry = 1.0)
+    # For SHORT trades:
+    # mae_pct = how much price rose (bad for short) -> highest_price = 1.0 * (1 + mae_pct/100)
+    # exit_price = 1.0 * (1 - original_gain)
+    highest_price = 1.0 + mae / 100
+    exit_price = 1.0 - gains
 
-    # EG %: Geometric growth formula at full Kelly stake
-    eg_pct = calculate_expected_growth(win_rate, profit_ratio)
+    rows: list[dict] = []
+    for chunk in _level_chunks(len(levels), len(gains)):
+        offset_col = levels[chunk, np.newaxis]
 
-    # Calculate Kelly % (stop-adjusted) for this offset level
-    # Kelly = edge / profit_ratio / (stop_loss/100) * 100
-    if profit_ratio is not None and profit_ratio > 0 and edge_decimal is not None:
-        stop_decimal = stop_loss / 100.0
-        full_kelly = (edge_decimal / profit_ratio / stop_decimal) * 100
-    else:
-        full_kelly = None
-
-    # Calculate Kelly metrics (Max DD % and Total Kelly $)
-    max_dd_pct = None
-    kelly_pnl = None
-
-    if start_capital is not None and full_kelly is not None and num_trades > 0:
-        try:
-            # Create temporary DataFrame with adjusted returns for this offset level
-            kelly_df = qualifying_df.copy()
-            # EquityCalculator expects gains in percentage format (e.g., 15 for 15%)
-            kelly_df["_offset_adj_gains_pct"] = adjusted_returns_pct.values
-
-            equity_calculator = EquityCalculator()
-            kelly_result = equity_calculator.calculate_kelly_metrics(
-                kelly_df,
-                "_offset_adj_gains_pct",
-                start_capital,
-                fractional_kelly_pct,
-                full_kelly,  # Use the stop-adjusted full Kelly for this level
-                date_col=date_col,
-            )
-            kelly_pnl = kelly_result.get("pnl")
-            max_dd_pct = kelly_result.get("max_dd_pct")
-        except Exception as e:
-            logger.warning(
-                "Failed to calculate Kelly metrics for offset level %d: %s",
-                offset,
-                str(e),
+        # Negative offset: price dropped enough to reach the lower entry (mfe >= |offset|)
+        # Positive offset: price rose enough to reach the higher entry (mae >= offset)
+        # 0% offset: all trades qualify
+        qualifying = np.where(
+            offset_col < 0,
+            mfe[np.newaxis, :] >= np.abs(offset_col),
+            np.where(offset_col > 0, mae[np.newaxis, :] >= offset_col, True),
+        )
+        num_trades = qualifying.sum(axis=1)
+
+        # Recalculate MAE and the raw return from the new entry point
+        new_entry = 1.0 + offset_col / 100
+        new_mae_pct = (highest_price[np.newaxis, :] - new_entry) / new_entry * 100
+        raw_returns_pct = (new_entry - exit_price[np.newaxis, :]) / new_entry * 100
+
+        # Stopped trades get -stop_loss; clip remaining losses to the stop
+        # (matching AdjustmentParams: mae <= stop_loss means NOT stopped)
+        stopped = qualifying & (new_mae_pct > stop_loss)
+        raw_returns_pct = np.maximum(np.where(stopped, -stop_loss, raw_returns_pct), -stop_loss)
+
+        # Apply efficiency deduction; non-qualifying trades drop out as NaN
+        adjusted_returns_pct = np.where(qualifying, raw_returns_pct - efficiency, np.nan)
+        adjusted_returns = adjusted_returns_pct / 100
+        winners = adjusted_returns > 0
+        losers = adjusted_returns < 0
+
+        stopped_count = stopped.sum(axis=1)
+        win_count = winners.sum(axis=1)
+        loss_count = losers.sum(axis=1)
+        win_sum = np.where(winners, adjusted_returns, 0.0).sum(axis=1)
+        loss_sum = np.where(losers, adjusted_returns, 0.0).sum(axis=1)
+        total_gain_pct = np.nansum(adjusted_returns_pct, axis=1)
+        with warnings.catch_warnings():
+            # Offsets without qualifying trades produce NaN means and medians
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            avg_gain_pct = np.nanmean(adjusted_returns_pct, axis=1)
+            median_gain_pct = np.nanmedian(adjusted_returns_pct, axis=1)
+
+        chunk_rows = []
+        full_kellys = np.full(len(num_trades), np.nan)
+        for i, offset in enumerate(offsets[chunk]):
+            if num_trades[i] == 0:
+                chunk_rows.append({
+                    "Offset %": offset,
+                    "# of Trades": 0,
+                    "Win %": 0.0,
+                    "Avg. Gain %": None,
+                    "Median Gain %": None,
+                    "EV %": None,
+                    "Profit Ratio": None,
+                    "Edge %": None,
+                    "EG %": None,
+                    "Max Loss %": 0.0,
+                    "Total Gain %": 0.0,
+                    "Max DD %": None,
+                    "Total Kelly $": None,
+                })
+                continue
+
+            # Profit Ratio: avg_win / abs(avg_loss)
+            avg_win = win_sum[i] / win_count[i] if win_count[i] > 0 else 0.0
+            avg_loss = loss_sum[i] / loss_count[i] if loss_count[i] > 0 else 0.0  # Negative
+            profit_ratio = float(avg_win / abs(avg_loss)) if avg_loss != 0 else None
+
+            # Edge %: (profit_ratio + 1) × win_rate - 1 (as percentage)
+            win_rate = float(win_count[i] / num_trades[i])
+            if profit_ratio is not None:
+                edge_decimal = (profit_ratio + 1) * win_rate - 1
+                edge_pct = edge_decimal * 100
+            else:
+                edge_decimal = None
+                edge_pct = None
+
+            # EG %: Geometric growth formula at full Kelly stake
+            eg_pct = calculate_expected_growth(win_rate, profit_ratio)
+
+            # Kelly % (stop-adjusted): edge / profit_ratio / (stop_loss/100) * 100
+            if profit_ratio is not None and profit_ratio > 0 and edge_decimal is not None:
+                full_kellys[i] = (edge_decimal / profit_ratio / (stop_loss / 100.0)) * 100
+
+            chunk_rows.append({
+                "Offset %": offset,
+                "# of Trades": int(num_trades[i]),
+                "Win %": win_rate * 100,
+                "Avg. Gain %": float(avg_gain_pct[i]),
+                "Median Gain %": float(median_gain_pct[i]),
+                "EV %": float(avg_gain_pct[i]),
+                "Profit Ratio": profit_ratio,
+                "Edge %": edge_pct,
+                "EG %": eg_pct,
+                "Max Loss %": float(stopped_count[i] / num_trades[i] * 100),
+                "Total Gain %": float(total_gain_pct[i]),
+                "Max DD %": None,
+                "Total Kelly $": None,
+            })
+
+        # Kelly metrics (Max DD % and Total Kelly $) for offsets with a Kelly stake
+        valid = ~np.isnan(full_kellys)
+        if start_capital is not None and valid.any():
+            kelly_returns_pct = np.where(qualifying[valid], adjusted_returns_pct[valid], 0.0)
+            kelly_pnl, max_dd_pct, max_dd_defined = _kelly_grid_metrics(
+                kelly_returns_pct, full_kellys[valid], start_capital, fractional_kelly_pct
             )
+            for j, i in enumerate(np.flatnonzero(valid).tolist()):
+                chunk_rows[i]["Total Kelly $"] = float(kelly_pnl[j])
+                if max_dd_defined[j]:
+                    chunk_rows[i]["Max DD %"] = float(max_dd_pct[j])
 
-    return {
-        "Offset %": offset,
-        "# of Trades": num_trades,
-        "Win %": win_pct,
-        "Avg. Gain %": avg_gain_pct,
-        "Median Gain %": median_gain_pct,
-        "EV %": ev_pct,
-        "Profit Ratio": profit_ratio,
-        "Edge %": edge_pct,
-        "EG %": eg_pct,
-        "Max Loss %": max_loss_pct,
-        "Total Gain %": total_gain_pct,
-        "Max DD %": max_dd_pct,
-        "Total Kelly $": kelly_pnl,
-    }
+        rows.extend(chunk_rows)
+
+    return rows
 
 
 # Partial profit target levels (fixed)
@@ -0,0 +1,154 @@
+"""Vectorized time-of-day normalization.
+
+Every supported time representation is converted to float minutes since
+midnight in whole-column operations, so the result can be computed once at
+mapping time (stored as the ``time_minutes`` column) and time-of-day filters
+become plain numeric range masks.
+"""
+
+import logging
+from datetime import datetime
+from datetime import time as dt_time
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Derived column holding time_to_minutes() of the mapped time column
+TIME_MINUTES_COLUMN = "time_minutes"
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def time_to_minutes(series: pd.Series) -> pd.Series:
+    """Convert a time series to minutes since midnight.
+
+    Handles multiple time formats:
+    - HH:MM:SS strings (e.g., "09:30:00")
+    - HH:MM strings (e.g., "09:30")
+    - HHMMSS digit strings (e.g., "093000")
+    - Integer HHMMSS (e.g., 93000), including integer columns read as float
+      because of missing values
+    - Excel serial time (float 0-1), rounded to whole seconds
+    - datetime.time objects
+    - datetime values (datetime64 columns or datetime objects), time of day only
+    - timedelta values since midnight
+
+    Args:
+        series: Pandas Series containing time values in any supported format.
+
+    Returns:
+        Pandas Series of float values representing minutes since midnight.
+        NaN values in input, and values that cannot be parsed, are NaN in
+        the output.
+    """
+    if series.empty:
+        return pd.Series([], dtype=float)
+
+    valid = series.dropna()
+    if valid.empty:
+        return pd.Series(np.nan, index=series.index, dtype=float)
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return _datetime_to_minutes(series)
+
+    if pd.api.types.is_timedelta64_dtype(series):
+        return (series.dt.total_seconds() / 60).astype(float)
+
+    if pd.api.types.is_bool_dtype(series):
+        return pd.Series(np.nan, index=series.index, dtype=float)
+
+    if pd.api.types.is_integer_dtype(series):
+        return _hhmmss_to_minutes(series.astype(float))
+
+    if pd.api.types.is_float_dtype(series):
+        if valid.between(0, 1).all():
+            # Fraction of a day; Excel stores whole seconds
+            seconds = (series * _SECONDS_PER_DAY).round()
+            return (seconds / 60).astype(float)
+        if (valid == np.floor(valid)).all():
+            return _hhmmss_to_minutes(series.astype(float))
+        logger.warning(
+            "Float column values outside 0-1 range, cannot interpret as Excel serial time. "
+            "First value: %s",
+            valid.iloc[0],
+        )
+        return pd.Series(np.nan, index=series.index, dtype=float)
+
+    first_val = valid.iloc[0]
+    if isinstance(first_val, datetime):
+        return _datetime_to_minutes(pd.to_datetime(series, errors="coerce"))
+
+    # Strings and datetime.time objects (whose str() is HH:MM:SS[.ffffff])
+    return _strings_to_minutes(series)
+
+
+def time_bound_to_minutes(value: str | dt_time) -> float:
+    """Convert a time-of-day bound to minutes since midnight.
+
+    Args:
+        value: ISO time string (e.g., "09:30:00") or datetime.time.
+
+    Returns:
+        Minutes since midnight.
+
+    Raises:
+        ValueError: If the string is not an ISO time.
+    """
+    if not isinstance(value, dt_time):
+        value = dt_time.fromisoformat(value)
+    return value.hour * 60 + value.minute + (value.second + value.microsecond / 1e6) / 60
+
+
+def _datetime_to_minutes(series: pd.Series) -> pd.Series:
+    """Time of day of datetime64 values, in minutes."""
+    dt = series.dt
+    minutes = dt.hour * 60 + dt.minute + (dt.second + dt.microsecond / 1e6) / 60
+    return minutes.astype(float)
+
+
+def _hhmmss_to_minutes(values: pd.Series) -> pd.Series:
+    """Minutes from HHMMSS numbers held as floats (NaN for missing)."""
+    hours = values // 10000
+    mins = (values // 100) % 100
+    secs = values % 100
+    return hours * 60 + mins + secs / 60
+
+
+def _strings_to_minutes(series: pd.Series) -> pd.Series:
+    """Minutes from "HH:MM[:SS]" or "HHMMSS" text, parsed column-wise.
+
+    Text neither pattern matches (e.g. "2024-01-02 09:30:00" or "9:30 AM")
+    is parsed with ``pd.to_datetime(format="mixed")``. Missing values, empty
+    strings and text that no parser understands come out as NaN.
+    """
+    text = series.astype(str).str.strip()
+    has_colon = text.str.contains(":", regex=False)
+
+    parts = text.str.split(":", n=2, expand=True)
+    hours = pd.to_numeric(parts[0], errors="coerce")
+    if parts.shape[1] > 1:
+        mins = pd.to_numeric(parts[1], errors="coerce")
+    else:
+        mins = pd.Series(np.nan, index=series.index)
+    if parts.shape[1] > 2:
+        secs = pd.to_numeric(parts[2], errors="coerce").where(parts[2].notna(), 0.0)
+    else:
+        secs = pd.Series(0.0, index=series.index)
+    colon_minutes = hours * 60 + mins + secs / 60
+
+    digits = text.str.zfill(6)
+    digit_minutes = (
+        pd.to_numeric(digits.str.slice(0, 2), errors="coerce") * 60
+        + pd.to_numeric(digits.str.slice(2, 4), errors="coerce")
+        + pd.to_numeric(digits.str.slice(4, 6), errors="coerce") / 60
+    ).where(text.str.isdigit())
+
+    minutes = colon_minutes.where(has_colon, digit_minutes).astype(float)
+
+    unparsed = minutes.isna() & series.notna() & (text != "")
+    if unparsed.any():
+        parsed = pd.to_datetime(text[unparsed], format="mixed", errors="coerce")
+        minutes[unparsed] = _datetime_to_minutes(parsed)
+    return minutes.rename(series.name)
@@ -0,0 +1,295 @@
+"""Columnar numeric view of mapped trade data shared across calculators.
+
+The baseline DataFrame is wide (300+ columns) and large (1M+ rows), so copying
+it, casting columns with ``astype(float)`` or re-parsing dates inside every
+calculator dominates refresh time. ``TradeMatrix`` is built once after mapping
+and holds contiguous float64 arrays for the mapped numeric columns, a
+pre-parsed int64 date/time key and a chronological sort permutation. Other
+numeric columns are materialized lazily on first use.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from src.core.date_utils import resolve_dates
+from src.core.models import AdjustmentParams, ColumnMapping
+from src.core.time_utils import TIME_MINUTES_COLUMN, time_to_minutes
+
+logger = logging.getLogger(__name__)
+
+# Intervals of the change_X_min columns computed after mapping
+CHANGE_INTERVALS = (10, 20, 30, 60, 90, 120, 150, 180, 240)
+
+# int64 value pandas uses for NaT
+_NAT_KEY = np.iinfo(np.int64).min
+
+_NANOS_PER_MINUTE = 60 * 1_000_000_000
+
+
+def _time_of_day(df: pd.DataFrame, time_col: str | None) -> np.ndarray:
+    """Entry time as minutes since midnight, NaN if unknown.
+
+    Reuses the ``time_minutes`` column when the mapping step added it.
+    """
+    if TIME_MINUTES_COLUMN in df.columns:
+        return _numeric(df[TIME_MINUTES_COLUMN])
+    if time_col and time_col in df.columns and len(df) > 0:
+        return _numeric(time_to_minutes(df[time_col]))
+    return np.full(len(df), np.nan)
+
+
+def _date_time_key(
+    df: pd.DataFrame, date_col: str | None, time_minutes: np.ndarray
+) -> np.ndarray:
+    """Trade date plus time of day as int64 nanoseconds, NaT where the date is unparseable."""
+    if date_col and date_col in df.columns and len(df) > 0:
+        dates = resolve_dates(df, date_col)
+        date_key = dates.to_numpy(dtype="datetime64[ns]").view(np.int64).copy()
+    else:
+        date_key = np.full(len(df), _NAT_KEY, dtype=np.int64)
+
+    has_date = date_key != _NAT_KEY
+    has_time = has_date & np.isfinite(time_minutes)
+    date_key[has_time] += np.round(time_minutes[has_time] * _NANOS_PER_MINUTE).astype(np.int64)
+    return date_key
+
+
+def _sort_order(date_key: np.ndarray) -> np.ndarray:
+    """Stable permutation sorting date keys, with unparseable dates last."""
+    sort_key = np.where(date_key != _NAT_KEY, date_key, np.iinfo(np.int64).max)
+    order: np.ndarray = np.argsort(sort_key, kind="stable")
+    return order
+
+
+def chronological_order(
+    df: pd.DataFrame, date_col: str | None, time_col: str | None = None
+) -> np.ndarray:
+    """Row positions sorting trades by date and entry time.
+
+    Same order as ``TradeMatrix.from_frame(df, mapping).order``, for callers
+    that work on the DataFrame directly.
+
+    Args:
+        df: Trade data.
+        date_col: Date column name.
+        time_col: Entry time column name; ``time_minutes`` is used if present.
+
+    Returns:
+        Stable permutation of ``range(len(df))``; unparseable dates sort last
+        and ties keep file order.
+    """
+    return _sort_order(_date_time_key(df, date_col, _time_of_day(df, time_col)))
+
+
+def _numeric(series: pd.Series) -> np.ndarray:
+    """Convert a column to a contiguous float64 array, NaN where not numeric."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return np.ascontiguousarray(series.to_numpy(dtype=float, na_value=np.nan))
+    return np.ascontiguousarray(
+        pd.to_numeric(series, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    )
+
+
+@dataclass
+class TradeMatrix:
+    """Contiguous numeric arrays for the mapped trade columns.
+
+    Rows are in the same order as the source DataFrame, and ``index`` holds its
+    labels so filtered frames can be mapped back with :meth:`select`.
+
+    Attributes:
+        index: Row labels of the source DataFrame.
+        gain: Gain (decimal format, e.g., 0.05 = 5%).
+        mae: MAE percentage (percentage points).
+        mfe: MFE percentage (percentage points).
+        date_key: Trade date plus time of day as int64 nanoseconds since the
+            epoch; ``np.iinfo(np.int64).min`` (NaT) where the date is unparseable.
+        time_minutes: Entry time as minutes since midnight, NaN if unknown.
+        order: Stable permutation sorting rows chronologically by ``date_key``,
+            with unparseable dates last.
+        changes: change_X_min arrays keyed by interval in minutes.
+    """
+
+    index: pd.Index
+    gain: np.ndarray
+    mae: np.ndarray
+    mfe: np.ndarray
+    date_key: np.ndarray
+    time_minutes: np.ndarray
+    order: np.ndarray
+    changes: dict[int, np.ndarray] = field(default_factory=dict)
+    _source: pd.DataFrame | None = field(default=None, repr=False)
+    _parent: TradeMatrix | None = field(default=None, repr=False)
+    _positions: np.ndarray | None = field(default=None, repr=False)
+    _features: dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, mapping: ColumnMapping) -> TradeMatrix:
+        """Build the matrix from a mapped DataFrame.
+
+        Dates are parsed once (day-first, mixed formats) and combined with the
+        entry time. ``time_minutes`` and ``change_X_min`` columns are reused when
+        the mapping step already added them.
+
+        Args:
+            df: Mapped trade data (typically the baseline DataFrame).
+            mapping: Column mapping configuration.
+
+        Returns:
+            TradeMatrix over all rows of ``df``.
+        """
+        num_rows = len(df)
+
+        def column(name: str | None) -> np.ndarray:
+            if name and name in df.columns:
+                return _numeric(df[name])
+            return np.full(num_rows, np.nan)
+
+        time_minutes = _time_of_day(df, mapping.time)
+        date_key = _date_time_key(df, mapping.date, time_minutes)
+        # Unparseable dates sort last, ties keep file order
+        order = _sort_order(date_key)
+
+        changes = {
+            interval: column(f"change_{interval}_min")
+            for interval in CHANGE_INTERVALS
+            if f"change_{interval}_min" in df.columns
+        }
+
+        matrix = cls(
+            index=df.index,
+            gain=column(mapping.gain_pct),
+            mae=column(mapping.mae_pct),
+            mfe=column(mapping.mfe_pct),
+            date_key=date_key,
+            time_minutes=time_minutes,
+            order=order,
+            changes=changes,
+            _source=df,
+        )
+        logger.debug(
+            "Built TradeMatrix: %d rows, %d change columns", num_rows, len(changes)
+        )
+        return matrix
+
+    def __len__(self) -> int:
+        return len(self.gain)
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Date/time keys as ``datetime64[ns]`` (NaT where unparseable)."""
+        return self.date_key.view("datetime64[ns]")
+
+    def adjusted_gains(self, adjustment_params: AdjustmentParams) -> np.ndarray:
+        """Stop loss and efficiency adjusted gains (decimal format).
+
+        Matches :meth:`AdjustmentParams.calculate_adjusted_gains`.
+
+        Args:
+            adjustment_params: Stop loss / efficiency parameters.
+
+        Returns:
+            Adjusted gains in row order.
+        """
+        stop_loss = adjustment_params.stop_loss
+        stop_adjusted = np.where(self.mae <= stop_loss, self.gain * 100, -stop_loss)
+        # np.maximum keeps NaN gains as NaN, like Series.clip
+        stop_adjusted = np.maximum(stop_adjusted, -stop_loss)
+        return (stop_adjusted - adjustment_params.efficiency) / 100
+
+    def feature(self, column: str) -> np.ndarray:
+        """Numeric values of any source column, materialized on first use.
+
+        Args:
+            column: Column name in the source DataFrame.
+
+        Returns:
+            float64 array in row order, NaN where values are not numeric.
+
+        Raises:
+            KeyError: If the column is not in the source DataFrame.
+        """
+        values = self._features.get(column)
+        if values is None:
+            if self._parent is not None:
+                values = self._parent.feature(column)[self._positions]
+            elif self._source is not None and column in self._source.columns:
+                values = _numeric(self._source[column])
+            else:
+                raise KeyError(column)
+            self._features[column] = values
+        return values
+
+    def feature_block(self, columns: list[str]) -> np.ndarray:
+        """Materialize several feature columns as one (rows x columns) block.
+
+        Args:
+            columns: Column names in the source DataFrame.
+
+        Returns:
+            Fortran-ordered float64 array so each column is contiguous.
+        """
+        block = np.empty((len(self), len(columns)), dtype=float, order="F")
+        for i, column in enumerate(columns):
+            block[:, i] = self.feature(column)
+        return block
+
+    def take(self, positions: np.ndarray) -> TradeMatrix:
+        """Return the rows at the given positions as a new matrix.
+
+        Args:
+            positions: Integer row positions, in the desired row order.
+
+        Returns:
+            TradeMatrix over the selected rows; features still load lazily.
+        """
+        positions = np.asarray(positions, dtype=np.intp)
+        date_key = self.date_key[positions]
+        sort_key = np.where(date_key != _NAT_KEY, date_key, np.iinfo(np.int64).max)
+        return TradeMatrix(
+            index=self.index[positions],
+            gain=self.gain[positions],
+            mae=self.mae[positions],
+            mfe=self.mfe[positions],
+            date_key=date_key,
+            time_minutes=self.time_minutes[positions],
+            order=np.argsort(sort_key, kind="stable"),
+            changes={interval: values[positions] for interval, values in self.changes.items()},
+            _parent=self,
+            _positions=positions,
+        )
+
+    def select(self, labels: pd.Index, gains: pd.Series | None = None) -> TradeMatrix:
+        """Return the rows with the given index labels, e.g. a filtered frame.
+
+        Args:
+            labels: Index labels of the rows to keep (``filtered_df.index``).
+            gains: Mapped gain column of the labelled rows. When given, the
+                selected rows must hold the same gains, which catches frames
+                whose labels were reset rather than kept from the source.
+
+        Returns:
+            TradeMatrix whose rows line up with ``labels``.
+
+        Raises:
+            KeyError: If the matrix index is not unique, a label is missing or
+                the gains do not match.
+        """
+        if labels.equals(self.index):
+            matrix = self
+        elif not self.index.is_unique:
+            raise KeyError("TradeMatrix index is not unique")
+        else:
+            positions = self.index.get_indexer(labels)
+            if np.any(positions < 0):
+                raise KeyError("Labels not found in TradeMatrix")
+            matrix = self.take(positions)
+
+        if gains is not None and not np.array_equal(matrix.gain, _numeric(gains), equal_nan=True):
+            raise KeyError("Rows do not match the TradeMatrix rows with the same labels")
+        return matrix
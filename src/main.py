@@ -1,6 +1,7 @@
 """Lumen - Trading Analytics Application."""
 
 import logging
+import multiprocessing
 import sys
 
 from PyQt6.QtWidgets import QApplication
@@ -54,4 +55,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     sys.exit(main())
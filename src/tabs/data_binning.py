@@ -507,8 +507,8 @@ class DataBinningTab(BackgroundCalculationMixin, QWidget):
         if not isinstance(df, pd.DataFrame):
             return
 
-        # Get numeric columns
-        numeric_cols = df.select_dtypes(
+        # Get numeric columns, including any still on disk (column-projected load)
+        numeric_cols = self._app_state.column_schema(df).select_dtypes(
             include=["int64", "float64", "int32", "float32"]
         ).columns.tolist()
 
@@ -534,6 +534,7 @@ class DataBinningTab(BackgroundCalculationMixin, QWidget):
             column_name: Name of the selected column.
         """
         if column_name:
+            self._app_state.ensure_columns([column_name])
             # Detect if this is a time column
             self._is_time_column = is_time_column(column_name)
             self.column_selected.emit(column_name)
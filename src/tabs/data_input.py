@@ -26,13 +26,15 @@ from PyQt6.QtWidgets import (
 
 from src.core.app_state import AppState
 from src.core.column_mapper import ColumnMapper
+from src.core.column_store import ColumnStore
+from src.core.date_utils import DATE_NS_COLUMN, parse_dates
 from src.core.file_load_worker import FileLoadWorker
 from src.core.file_loader import FileLoader
-from src.core.filter_engine import time_to_minutes
 from src.core.first_trigger import FirstTriggerEngine
 from src.core.mapping_worker import MappingResult, MappingWorker
 from src.core.metrics import MetricsCalculator
 from src.core.models import AdjustmentParams, ColumnMapping, DetectionResult, TradingMetrics
+from src.core.time_utils import TIME_MINUTES_COLUMN, time_to_minutes
 from src.ui.components.metric_card import MetricCard
 from src.ui.components.no_scroll_widgets import NoScrollComboBox, NoScrollDoubleSpinBox
 from src.ui.constants import Colors, Fonts, Spacing
@@ -1117,6 +1119,8 @@ class DataInputTab(QWidget):
         self._worker: FileLoadWorker | None = None
         self._mapping_worker: MappingWorker | None = None
         self._df: pd.DataFrame | None = None
+        # Columns of the loaded file that are still on disk (lazy load)
+        self._column_store: ColumnStore | None = None
         self._file_loader = FileLoader()
         self._column_mapper = ColumnMapper()
         self._column_mapping: ColumnMapping | None = None
@@ -1439,7 +1443,12 @@ class DataInputTab(QWidget):
         self._load_data_btn.setEnabled(True)
 
     def _on_load_data_clicked(self) -> None:
-        """Handle Load Data button click."""
+        """Handle Load Data button click (Cancel while a load is running)."""
+        if self._worker is not None and self._worker.isRunning():
+            self._worker.cancel()
+            self._load_data_btn.setEnabled(False)
+            return
+
         if self._selected_path is None:
             return
 
@@ -1449,9 +1458,9 @@ class DataInputTab(QWidget):
             sheet = self._sheet_selector.currentText()
         self._selected_sheet = sheet
 
-        # Disable UI during loading
+        # Disable UI during loading; Load Data becomes Cancel
         self._select_file_btn.setEnabled(False)
-        self._load_data_btn.setEnabled(False)
+        self._load_data_btn.setText("Cancel")
         self._sheet_selector.setEnabled(False)
 
         # Show progress bar
@@ -1465,6 +1474,7 @@ class DataInputTab(QWidget):
         self._worker.finished.connect(self._on_load_complete)
         self._worker.error.connect(self._on_load_error)
         self._worker.cache_hit.connect(self._on_cache_hit)
+        self._worker.cancelled.connect(self._on_load_cancelled)
         self._worker.start()
 
     def _on_progress(self, value: int) -> None:
@@ -1486,12 +1496,10 @@ class DataInputTab(QWidget):
             df: The loaded DataFrame.
         """
         self._df = df
+        self._column_store = self._worker.column_store if self._worker is not None else None
         self._progress_bar.setVisible(False)
 
-        # Re-enable UI
-        self._select_file_btn.setEnabled(True)
-        self._load_data_btn.setEnabled(True)
-        self._sheet_selector.setEnabled(True)
+        self._restore_load_controls()
 
         # Show success message based on cache status
         filename = self._selected_path.name if self._selected_path else "file"
@@ -1528,13 +1536,33 @@ class DataInputTab(QWidget):
         """
         self._progress_bar.setVisible(False)
 
-        # Re-enable UI
+        self._restore_load_controls()
+
+        self._show_error(error_message)
+
+    def _on_load_cancelled(self) -> None:
+        """Handle a load stopped by the Cancel button."""
+        self._progress_bar.setVisible(False)
+        self._restore_load_controls()
+        self._status_label.setText("Load cancelled")
+        self._status_label.setStyleSheet(
+            f"""
+            QLabel {{
+                color: {Colors.TEXT_SECONDARY};
+                font-family: "{Fonts.UI}";
+                font-size: 14px;
+                padding: 8px 0;
+            }}
+        """
+        )
+
+    def _restore_load_controls(self) -> None:
+        """Re-enable file selection controls after a load ends."""
         self._select_file_btn.setEnabled(True)
+        self._load_data_btn.setText("Load Data")
         self._load_data_btn.setEnabled(True)
         self._sheet_selector.setEnabled(True)
 
-        self._show_error(error_message)
-
     def _show_error(self, message: str) -> None:
         """Display an error message.
 
@@ -1586,6 +1614,8 @@ class DataInputTab(QWidget):
             self._config_panel.setVisible(False)
         else:
             # Show config panel
+            self._load_remaining_columns()
+            df = self._df
             self._config_panel.set_columns(list(df.columns), df, detection_result)
             self._config_panel.setVisible(True)
             self._success_panel.setVisible(False)
@@ -1623,10 +1653,23 @@ class DataInputTab(QWidget):
             all_required_detected=True,
         )
 
+        self._load_remaining_columns()
         self._config_panel.set_columns(list(self._df.columns), self._df, detection_result)
         self._success_panel.setVisible(False)
         self._config_panel.setVisible(True)
 
+    def _load_remaining_columns(self) -> None:
+        """Read every column of a column-projected load.
+
+        The mapping editor lists and previews all columns, so the full file
+        is needed before it is shown.
+        """
+        if self._column_store is None or self._df is None:
+            return
+        logger.info("Loading all %d columns for mapping", len(self._column_store.columns))
+        self._df = self._column_store.read()
+        self._column_store = None
+
     def _on_mapping_continue(self, mapping: ColumnMapping | None = None) -> None:
         """Handle continue after mapping is complete.
 
@@ -1681,6 +1724,8 @@ class DataInputTab(QWidget):
             adjustment_params=adjustment_params,
             flat_stake=flat_stake,
             start_capital=start_capital,
+            source_path=self._selected_path,
+            sheet=self._selected_sheet,
         )
         self._mapping_worker.progress.connect(self._on_progress)
         self._mapping_worker.finished.connect(self._on_mapping_complete)
@@ -1724,7 +1769,9 @@ class DataInputTab(QWidget):
             self._app_state.source_file_path = str(self._selected_path)
             self._app_state.source_sheet = self._selected_sheet or ""
             self._app_state.raw_df = self._df
+            self._app_state.column_store = self._column_store
             self._app_state.baseline_df = baseline_df
+            self._app_state.trade_matrix = result.trade_matrix
             self._app_state.column_mapping = mapping
             self._app_state.baseline_metrics = metrics
             self._app_state.adjustment_params = adjustment_params
@@ -1870,10 +1917,15 @@ class DataInputTab(QWidget):
 
         # Ensure time_minutes column exists for time-based analysis
         has_time_col = mapping.time and mapping.time in baseline_df.columns
-        if has_time_col and "time_minutes" not in baseline_df.columns:
-            baseline_df["time_minutes"] = time_to_minutes(baseline_df[mapping.time])
+        if has_time_col and TIME_MINUTES_COLUMN not in baseline_df.columns:
+            baseline_df[TIME_MINUTES_COLUMN] = time_to_minutes(baseline_df[mapping.time])
             logger.debug("Added time_minutes column derived from '%s'", mapping.time)
 
+        # Ensure the parsed date column exists for date consumers
+        has_date_col = mapping.date and mapping.date in baseline_df.columns
+        if has_date_col and DATE_NS_COLUMN not in baseline_df.columns:
+            baseline_df[DATE_NS_COLUMN] = parse_dates(baseline_df[mapping.date])
+
         # Get flat stake and start capital from AppState or use defaults
         metrics_inputs = self._app_state.metrics_user_inputs
         flat_stake = metrics_inputs.flat_stake if metrics_inputs else 10000.0
@@ -11,6 +11,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
@@ -29,12 +30,14 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.app_state import AppState
-from src.core.exceptions import ExportError
+from src.core.exceptions import ExportError, FilterExpressionError
 from src.core.export_manager import ExportManager
 from src.core.filter_engine import FilterEngine
+from src.core.filter_expression import TIME_OF_DAY, FilterExpression
+from src.core.filter_pipeline import FilterPipeline
 from src.core.filter_preset_manager import FilterPresetManager
-from src.core.first_trigger import FirstTriggerEngine
 from src.core.models import FilterCriteria, TradingMetrics
+from src.core.time_utils import TIME_MINUTES_COLUMN
 from src.ui.components.axis_column_selector import AxisColumnSelector
 from src.ui.components.axis_control_panel import AxisControlPanel
 from src.ui.components.chart_canvas import ChartCanvas
@@ -85,6 +88,8 @@ class FeatureExplorerTab(QWidget):
         self._time_start: str | None = None
         self._time_end: str | None = None
         self._all_times: bool = True
+        # Parsed filter expression, or None
+        self._filter_expression: FilterExpression | None = None
         # Contrast colors state
         self._contrast_colors: bool = False
         # Axis bounds for data filtering (not just zoom)
@@ -95,6 +100,9 @@ class FeatureExplorerTab(QWidget):
         # Guard flag to prevent recursion when chart updates trigger range changes
 
         self._preset_manager = FilterPresetManager()
+        # Long-lived so filter masks over the baseline are reused across changes
+        self._filter_engine = FilterEngine()
+        self._filter_pipeline = FilterPipeline(self._filter_engine)
 
         self._setup_ui()
         self._connect_signals()
@@ -320,6 +328,7 @@ class FeatureExplorerTab(QWidget):
         self._filter_panel.date_range_changed.connect(self._on_date_range_changed)
         self._filter_panel.time_range_changed.connect(self._on_time_range_changed)
         self._filter_panel.single_filter_applied.connect(self._on_single_filter_applied)
+        self._filter_panel.expression_changed.connect(self._on_expression_changed)
 
         # Export button
         self._export_button.clicked.connect(self._on_export_clicked)
@@ -445,6 +454,7 @@ class FeatureExplorerTab(QWidget):
 
         y_column = self._axis_selector.y_column
         x_column = self._axis_selector.x_column
+        self._app_state.ensure_columns(column for column in (x_column, y_column) if column)
 
         if df is None or df.empty:
             # Edge case: zero matches after filter or zero first triggers
@@ -503,11 +513,11 @@ class FeatureExplorerTab(QWidget):
             and self._app_state.baseline_df is not None
         ):
             # Need to compute how many rows matched filters before first trigger
-            engine = FilterEngine()
-            filtered_only = engine.apply_filters(
-                self._app_state.baseline_df, self._app_state.filters
+            pre_first_trigger_count = int(
+                self._filter_engine.filter_mask(
+                    self._app_state.baseline_df, self._app_state.filters
+                ).sum()
             )
-            pre_first_trigger_count = len(filtered_only)
 
         # Check if bounds filtering is active
         bounds_active = (
@@ -593,11 +603,44 @@ class FeatureExplorerTab(QWidget):
     def _on_filters_cleared(self) -> None:
         """Handle filter clear."""
         self._app_state.filters = []
+        self._app_state.filter_expression = ""
+        self._filter_expression = None
         self._app_state.filters_changed.emit(self._app_state.filters)
         self._apply_current_filters()
         self._update_filter_summary()
         logger.info("Filters cleared")
 
+    def _on_expression_changed(self, text: str) -> None:
+        """Handle filter expression edit.
+
+        Args:
+            text: Expression text, or "" to remove the expression.
+        """
+        expression = None
+        if text:
+            try:
+                expression = FilterExpression(text)
+            except FilterExpressionError as e:
+                Toast.display(self, f"Invalid filter expression: {e}", "error")
+                return
+            baseline = self._app_state.baseline_df
+            if baseline is not None:
+                available = self._app_state.column_schema(baseline).columns
+                missing = [
+                    column
+                    for column in expression.columns
+                    if column != TIME_OF_DAY and column not in available
+                ]
+                if missing:
+                    Toast.display(self, f"Unknown column(s): {', '.join(missing)}", "error")
+                    return
+
+        self._filter_expression = expression
+        self._app_state.filter_expression = text
+        self._apply_current_filters()
+        self._update_filter_summary()
+        logger.info("Filter expression: %s", text or "none")
+
     def _on_single_filter_applied(self, criteria: FilterCriteria) -> None:
         """Apply a single filter criterion without clearing others.
 
@@ -683,8 +726,10 @@ class FeatureExplorerTab(QWidget):
 
     def _update_filter_summary(self) -> None:
         """Update filter summary label with active filter count."""
-        # Count column filters
+        # Count column filters (the expression counts as one)
         column_filter_count = len(self._app_state.filters)
+        if self._filter_expression is not None:
+            column_filter_count += 1
 
         # Count date filter as active if not "all dates"
         date_filter_active = not self._all_dates
@@ -726,70 +771,70 @@ class FeatureExplorerTab(QWidget):
         """Apply current filters with first-trigger state.
 
         Recomputes filtered_df based on current filters and first_trigger_enabled.
-        Chain: baseline_df → date_range_filter → column_filters → first_trigger
+        Chain: baseline_df → column_filters → filter_expression → date_range_filter
+        → time_range_filter → first_trigger. The pipeline keeps each stage's
+        selection between calls, so a change only re-checks the rows (and
+        ticker-date groups) it can affect.
         """
-        if self._app_state.baseline_df is None:
+        baseline = self._app_state.baseline_df
+        if baseline is None:
             return
 
-        engine = FilterEngine()
-
-        # Start with baseline data
-        df = self._app_state.baseline_df.copy()
-
-        # Apply date range filter first (if column mapping available)
-        if self._app_state.column_mapping and not self._all_dates:
-            df = engine.apply_date_range(
-                df,
-                date_col=self._app_state.column_mapping.date,
-                start=self._date_start,
-                end=self._date_end,
-                all_dates=self._all_dates,
-            )
-
-        # Apply time range filter
-        if (
-            not self._all_times
-            and self._app_state.column_mapping is not None
-            and self._app_state.column_mapping.time is not None
-        ):
-            df = FilterEngine.apply_time_range(
-                df,
-                self._app_state.column_mapping.time,
-                self._time_start,
-                self._time_end,
-            )
+        # Filter columns may still be on disk after a column-projected load
+        columns = [f.column for f in self._app_state.filters]
+        if self._filter_expression is not None:
+            columns.extend(self._filter_expression.columns)
+        self._app_state.ensure_columns(columns)
 
-        # Apply feature filters if any
-        if self._app_state.filters:
-            df = engine.apply_filters(df, self._app_state.filters)
+        mapping = self._app_state.column_mapping
+        filters = list(self._app_state.filters)
+        date_col = mapping.date if mapping and not self._all_dates else None
+        time_col = mapping.time if mapping and not self._all_times else None
 
-        # Apply first trigger filter: take lowest trigger_number per ticker-date
-        # from the already-filtered data.
+        # Apply first trigger filter: take the first row per ticker-date from
+        # the already-filtered data.
         # This ensures we get the first trigger that PASSES the filters,
         # not just trigger_number == 1 which might have been filtered out.
-        if self._app_state.first_trigger_enabled and "trigger_number" in df.columns:
-            mapping = self._app_state.column_mapping
+        first_trigger_cols = None
+        if self._app_state.first_trigger_enabled and "trigger_number" in baseline.columns:
             if mapping and mapping.ticker and mapping.date and mapping.time:
-                before_count = len(df)
-                first_trigger_engine = FirstTriggerEngine()
-                df = first_trigger_engine.apply_filtered(
-                    df,
-                    ticker_col=mapping.ticker,
-                    date_col=mapping.date,
-                    time_col=mapping.time,
-                )
-                logger.debug(
-                    "First trigger filter applied: %d first triggers from %d filtered rows",
-                    len(df),
-                    before_count,
-                )
+                first_trigger_cols = (mapping.ticker, mapping.date, mapping.time)
             else:
                 # Fallback to simple filter if column mapping incomplete
-                df = df[df["trigger_number"] == 1].copy()
-                logger.debug(
-                    "First trigger filter (fallback): %d rows with trigger_number=1",
-                    len(df),
-                )
+                filters.append(FilterCriteria("trigger_number", "between", 1, 1))
+
+        def update(expression: FilterExpression | None) -> np.ndarray:
+            return self._filter_pipeline.update(
+                baseline,
+                filters,
+                date_col=date_col,
+                date_start=self._date_start,
+                date_end=self._date_end,
+                time_col=time_col,
+                time_start=self._time_start,
+                time_end=self._time_end,
+                minutes_col=TIME_MINUTES_COLUMN,
+                first_trigger_cols=first_trigger_cols,
+                expression=expression,
+                expression_time_col=mapping.time if mapping else None,
+            )
+
+        try:
+            rows = update(self._filter_expression)
+        except FilterExpressionError as e:
+            # Type errors only show up on evaluation; drop the expression
+            Toast.display(self, f"Invalid filter expression: {e}", "error")
+            self._filter_expression = None
+            self._app_state.filter_expression = ""
+            rows = update(None)
+        df = baseline.take(rows)
+
+        if first_trigger_cols is not None:
+            logger.debug(
+                "First trigger filter applied: %d first triggers from %d filtered rows",
+                len(df),
+                self._filter_pipeline.filtered_count,
+            )
 
         self._app_state.filtered_df = df
         self._app_state.filtered_data_updated.emit(df)
@@ -809,9 +854,10 @@ class FeatureExplorerTab(QWidget):
         )
         self._export_button.setEnabled(has_data)
 
-    @staticmethod
-    def _get_numeric_columns(df: pd.DataFrame) -> list[str]:
-        """Get list of numeric columns from DataFrame.
+    def _get_numeric_columns(self, df: pd.DataFrame) -> list[str]:
+        """Get list of numeric columns available for a DataFrame.
+
+        Includes columns that a column-projected load left on disk.
 
         Args:
             df: The DataFrame to analyze.
@@ -821,7 +867,8 @@ class FeatureExplorerTab(QWidget):
         """
         if df is None or df.empty:
             return []
-        return df.select_dtypes(include=["number"]).columns.tolist()
+        schema = self._app_state.column_schema(df)
+        return schema.select_dtypes(include=["number"]).columns.tolist()
 
     @staticmethod
     def _apply_bounds_filter(
@@ -1010,10 +1057,16 @@ class FeatureExplorerTab(QWidget):
         elif not is_excel and path.suffix.lower() != ".csv":
             path = path.with_suffix(".csv")
 
+        # Export every user column, including any still on disk
+        # (column-projected load)
+        filtered_df = self._app_state.filtered_df
+        columns = self._app_state.column_schema(filtered_df).columns
+        self._app_state.ensure_columns(columns)
+
         try:
             exporter = ExportManager()
             export_args = {
-                "df": self._app_state.filtered_df,
+                "df": filtered_df[[c for c in columns if c in filtered_df.columns]],
                 "path": path,
                 "filters": self._app_state.filters,
                 "first_trigger_enabled": self._app_state.first_trigger_enabled,
@@ -625,6 +625,14 @@ class FeatureImpactTab(BackgroundCalculationMixin, QWidget):
         if self._app_state.column_mapping:
             gain_col = self._app_state.column_mapping.gain_pct
 
+        # Read analyzed columns still on disk (column-projected load); the
+        # frames are filled in place, so filtered_df gets them too
+        schema = self._app_state.column_schema(baseline_df)
+        numeric_cols = schema.select_dtypes(include=[np.number]).columns.tolist()
+        self._app_state.ensure_columns(
+            column for column in numeric_cols if column not in self._user_excluded_cols
+        )
+
         # Apply First Trigger Only filtering to baseline data if enabled
         # Note: filtered_df already has first trigger filtering applied by Feature Explorer,
         # so we don't apply it again to avoid double filtering
@@ -677,7 +685,6 @@ class FeatureImpactTab(BackgroundCalculationMixin, QWidget):
         )
 
         # Update exclude panel with available columns
-        numeric_cols = baseline_df.select_dtypes(include=[np.number]).columns.tolist()
         analyzable = [c for c in numeric_cols if c != gain_col]
         if hasattr(self, "_exclude_panel"):
             self._exclude_panel.set_columns(analyzable)
@@ -19,6 +19,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from src.core.cache_manager import INTERNAL_COLUMNS
 from src.ui.components.exclude_column_panel import ExcludeColumnPanel
 from src.ui.components.feature_impact_chart import FeatureImpactChart
 from src.ui.components.range_analysis_table import RangeAnalysisTable
@@ -302,11 +303,19 @@ class FeatureInsightsTab(BackgroundCalculationMixin, QWidget):
         self._run_button.setEnabled(False)
         self._run_button.setText("Analyzing...")
 
+        # Read analyzed columns still on disk (column-projected load)
+        schema = self.app_state.column_schema(self.app_state.filtered_df)
+        self.app_state.ensure_columns(
+            column
+            for column in schema.select_dtypes(include=["number"]).columns
+            if column not in exclude
+        )
+
         # Start worker
         self._worker = AnalysisWorker(
             df=self.app_state.filtered_df.copy(),
             gain_col=mapping.gain_pct,
-            exclude_columns=exclude,
+            exclude_columns=exclude | set(INTERNAL_COLUMNS),
             date_col=mapping.date,
         )
         self._worker.finished.connect(self._on_analysis_complete)
@@ -441,7 +450,8 @@ class FeatureInsightsTab(BackgroundCalculationMixin, QWidget):
         """Populate column exclusion panel."""
         import pandas as pd
 
-        # Get numeric columns only
+        # Get numeric columns only, including any still on disk
+        df = self.app_state.column_schema(df)
         numeric_columns = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
 
         # Load saved exclusions, falling back to defaults
@@ -7,6 +7,7 @@ and shows detailed metric sections organized by category.
 from __future__ import annotations
 
 import logging
+import os
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -26,6 +27,7 @@ from src.core.monte_carlo import (
     MonteCarloEngine,
     MonteCarloResults,
     extract_gains_from_app_state,
+    extract_trade_days_from_app_state,
 )
 from src.ui.components import EmptyState, Toast
 from src.ui.components.hero_metric_card import HeroMetricsPanel
@@ -53,16 +55,23 @@ class MonteCarloWorker(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
-    def __init__(self, engine: MonteCarloEngine, gains: NDArray[np.float64]) -> None:
+    def __init__(
+        self,
+        engine: MonteCarloEngine,
+        gains: NDArray[np.float64],
+        trade_days: NDArray[np.int64] | None = None,
+    ) -> None:
         """Initialize the worker.
 
         Args:
             engine: MonteCarloEngine instance to use.
             gains: Array of trade gains for simulation.
+            trade_days: Optional day identifier per trade (date_grouped mode).
         """
         super().__init__()
         self._engine = engine
         self._gains = gains
+        self._trade_days = trade_days
 
     def run(self) -> None:
         """Execute the Monte Carlo simulation."""
@@ -70,6 +79,7 @@ class MonteCarloWorker(QObject):
             results = self._engine.run(
                 self._gains,
                 progress_callback=lambda c, t: self.progress.emit(c, t),
+                trade_days=self._trade_days,
             )
             self.finished.emit(results)
         except Exception as e:
@@ -334,9 +344,8 @@ class MonteCarloTab(QWidget):
         self._status_label.setText(
             f"Simulation complete ({results.num_trades} trades)"
         )
-        self._sim_count_label.setText(
-            f"{results.config.num_simulations:,} simulations"
-        )
+        num_simulations = results.num_simulations_run or results.config.num_simulations
+        self._sim_count_label.setText(f"{num_simulations:,} simulations")
 
     def _on_run_simulation(self) -> None:
         """Handle run simulation request."""
@@ -348,10 +357,14 @@ class MonteCarloTab(QWidget):
             Toast.display(self, "No data loaded", "error")
             return
 
+        # Use filtered data (respects user's Filter Panel filters)
+        trades_df = self._app_state.filtered_df
+        if trades_df is None:
+            trades_df = self._app_state.baseline_df
+
         try:
-            # Extract gains from filtered data (respects user's Filter Panel filters)
             gains = extract_gains_from_app_state(
-                self._app_state.filtered_df if self._app_state.filtered_df is not None else self._app_state.baseline_df,
+                trades_df,
                 self._app_state.column_mapping,
                 self._app_state.first_trigger_enabled,
             )
@@ -362,6 +375,19 @@ class MonteCarloTab(QWidget):
         # Get configuration from panel (includes position sizing mode)
         config = self._config_panel.get_config()
 
+        # Day-grouped resampling needs the trading day of every trade
+        trade_days = None
+        if config.simulation_type == "date_grouped":
+            try:
+                trade_days = extract_trade_days_from_app_state(
+                    trades_df,
+                    self._app_state.column_mapping,
+                    self._app_state.first_trigger_enabled,
+                )
+            except ValueError as e:
+                Toast.display(self, str(e), "error")
+                return
+
         # Get user inputs for flat stake and initial capital from app state
         metrics_inputs = self._app_state.metrics_user_inputs
         if metrics_inputs:
@@ -397,12 +423,15 @@ class MonteCarloTab(QWidget):
             fractional_kelly_source,
         )
 
+        # Spread large runs across all cores (small runs stay in-process)
+        config.num_workers = os.cpu_count() or 1
+
         # Create engine
         self._engine = MonteCarloEngine(config)
 
         # Create worker and thread
         self._thread = QThread()
-        self._worker = MonteCarloWorker(self._engine, gains)
+        self._worker = MonteCarloWorker(self._engine, gains, trade_days)
         self._worker.moveToThread(self._thread)
 
         # Connect signals
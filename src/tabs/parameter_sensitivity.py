@@ -219,6 +219,17 @@ class ParameterSensitivityTab(QWidget):
             }}
         """)
         filter_section.addWidget(self._filter_combo)
+
+        # The worker varies app_state.filters only, so say when an
+        # expression narrows the Feature Explorer view beyond them
+        self._expression_note = QLabel("")
+        self._expression_note.setWordWrap(True)
+        self._expression_note.setStyleSheet(f"""
+            color: {COLORS["row_current_accent"]};
+            font-size: 11px;
+        """)
+        self._expression_note.setVisible(False)
+        filter_section.addWidget(self._expression_note)
         layout.addLayout(filter_section)
 
         # Bound toggle section
@@ -500,6 +511,7 @@ class ParameterSensitivityTab(QWidget):
         self._app_state.filters_changed.connect(self._populate_filter_dropdown)
         self._app_state.data_loaded.connect(self._populate_filter_dropdown)
         self._app_state.adjustment_params_changed.connect(self._on_params_changed)
+        self._app_state.filtered_data_updated.connect(self._update_expression_note)
 
     def _populate_filter_dropdown(self) -> None:
         """Populate the filter dropdown with current filters."""
@@ -531,6 +543,14 @@ class ParameterSensitivityTab(QWidget):
         self._filter_combo.blockSignals(False)
         
 
+    def _update_expression_note(self) -> None:
+        """Show whether the Feature Explorer filter expression is left out."""
+        expression = self._app_state.filter_expression
+        self._expression_note.setText(
+            f"Filter expression not applied here: {expression}" if expression else ""
+        )
+        self._expression_note.setVisible(bool(expression))
+
     def _on_filter_selected(self, index: int) -> None:
         """Handle filter selection change."""
         filters = self._app_state.filters or []
@@ -654,6 +674,7 @@ class ParameterSensitivityTab(QWidget):
         # Start with baseline_df and apply date/time filters (but NOT feature filters)
         # This allows Parameter Sensitivity to vary feature filter thresholds
         from src.core.filter_engine import FilterEngine
+        from src.core.time_utils import TIME_MINUTES_COLUMN
 
         engine = FilterEngine()
         source_df = self._app_state.baseline_df
@@ -679,6 +700,7 @@ class ParameterSensitivityTab(QWidget):
                 self._app_state.column_mapping.time,
                 self._app_state.time_start,
                 self._app_state.time_end,
+                minutes_col=TIME_MINUTES_COLUMN,
             )
 
         # Start worker - it will apply feature filters with varied thresholds
@@ -1247,6 +1247,7 @@ class PnLStatsTab(BackgroundCalculationMixin, QWidget):
                 adjustment_params=adjustment_params,
                 start_capital=metrics_inputs.starting_capital if metrics_inputs else None,
                 fractional_kelly_pct=fractional_kelly_pct,
+                matrix=self._app_state.trade_matrix_for(filtered_df),
             )
         else:
             self._app_state.stop_scenarios = []
@@ -1263,6 +1264,7 @@ class PnLStatsTab(BackgroundCalculationMixin, QWidget):
                 adjustment_params=adjustment_params,
                 start_capital=metrics_inputs.starting_capital if metrics_inputs else None,
                 fractional_kelly_pct=fractional_kelly_pct,
+                matrix=self._app_state.trade_matrix_for(filtered_df),
             )
         else:
             self._app_state.offset_scenarios = []
@@ -24,6 +24,7 @@ from src.core.app_state import AppState
 from src.core.date_utils import DateFormat, detect_date_format
 from src.core.portfolio_calculator import PortfolioCalculator
 from src.core.portfolio_config_manager import PortfolioConfigManager
+from src.core.portfolio_load_worker import PortfolioLoadWorker
 from src.core.portfolio_models import PortfolioColumnMapping, StrategyConfig
 from src.ui.components.no_scroll_widgets import NoScrollDoubleSpinBox
 from src.ui.components.portfolio_charts import PortfolioChartsWidget
@@ -48,6 +49,7 @@ class PortfolioOverviewTab(QWidget):
         _calculator: Portfolio calculator for equity curve computation.
         _strategy_data: Dictionary mapping strategy names to loaded DataFrames.
         _recalc_timer: Timer for debounced recalculation.
+        _load_worker: Background loader for saved strategies, while it runs.
     """
 
     # Signal emitted when portfolio data changes (for Portfolio Breakdown tab)
@@ -75,6 +77,9 @@ class PortfolioOverviewTab(QWidget):
         self._recalc_timer.setSingleShot(True)
         self._recalc_timer.timeout.connect(self._recalculate)
         self._format_warning_shown = False
+        self._load_worker: PortfolioLoadWorker | None = None
+        # Saved strategies still loading: name at load start -> current name
+        self._loading_names: dict[str, str] = {}
 
         self._setup_ui()
         self._connect_signals()
@@ -154,6 +159,18 @@ class PortfolioOverviewTab(QWidget):
 
         toolbar_layout.addStretch()
 
+        # Progress of the background load of saved strategies
+        self._load_status_label = QLabel()
+        self._load_status_label.setStyleSheet(f"""
+            QLabel {{
+                color: {Colors.TEXT_SECONDARY};
+                font-family: {Fonts.UI};
+                font-size: {FontSizes.BODY}px;
+            }}
+        """)
+        self._load_status_label.setVisible(False)
+        toolbar_layout.addWidget(self._load_status_label)
+
         # Account Start label and spinner
         account_label = QLabel("Account Start:")
         account_label.setStyleSheet(f"""
@@ -193,49 +210,131 @@ class PortfolioOverviewTab(QWidget):
     def _connect_signals(self) -> None:
         """Connect widget signals to handlers."""
         self._add_strategy_btn.clicked.connect(self._on_add_strategy)
-        self._strategy_table.strategy_changed.connect(self._schedule_recalculation)
+        self._strategy_table.strategy_changed.connect(self._on_strategy_changed)
         self._strategy_table.strategy_name_changed.connect(self._on_strategy_name_changed)
         self._account_start_spin.valueChanged.connect(self._schedule_recalculation)
 
     def _load_saved_config(self) -> None:
-        """Load saved strategies on startup."""
+        """Load saved strategies on startup.
+
+        Strategies are added to the table straight away; their files are
+        loaded in the background by PortfolioLoadWorker and the portfolio is
+        recalculated as each one arrives.
+        """
         strategies, account_start = self._config_manager.load()
         self._account_start_spin.setValue(account_start)
 
         valid_strategies = []
         for config in strategies:
-            file_path = Path(config.file_path)
-
             # Skip strategies with missing files
-            if not file_path.exists():
+            if not Path(config.file_path).exists():
                 logger.warning(
                     f"Skipping strategy '{config.name}': file not found at {config.file_path}"
                 )
                 continue
-
-            # Try to reload the data
-            try:
-                if config.file_path.endswith(".csv"):
-                    df = pd.read_csv(config.file_path)
-                else:
-                    sheet = config.sheet_name if config.sheet_name else 0
-                    df = pd.read_excel(config.file_path, sheet_name=sheet)
-
-                self._strategy_data[config.name] = df
-                self._strategy_table.add_strategy(config)
-                valid_strategies.append(config)
-                logger.info(f"Loaded strategy '{config.name}' from {config.file_path}")
-            except Exception as e:
-                logger.warning(f"Could not load file for {config.name}: {e}")
-                # Don't add strategy if file can't be loaded
+            valid_strategies.append(config)
 
         # Update config to remove invalid entries
         if len(valid_strategies) < len(strategies):
             self._config_manager.save(valid_strategies, account_start)
             logger.info(f"Cleaned up config: {len(strategies) - len(valid_strategies)} invalid entries removed")
 
-        if valid_strategies:
-            self._schedule_recalculation()
+        if not valid_strategies:
+            return
+
+        for config in valid_strategies:
+            self._strategy_table.add_strategy(config)
+            self._loading_names[config.name] = config.name
+
+        self._load_worker = PortfolioLoadWorker(
+            [(config.name, config.file_path, config.sheet_name) for config in valid_strategies]
+        )
+        self._load_worker.strategy_started.connect(self._on_strategy_load_started)
+        self._load_worker.strategy_loaded.connect(self._on_strategy_loaded)
+        self._load_worker.strategy_failed.connect(self._on_strategy_load_failed)
+        self._load_worker.progress.connect(self._on_load_progress)
+        self._load_worker.finished.connect(self._on_load_finished)
+        self._load_worker.start()
+
+    def _on_strategy_load_started(self, load_name: str) -> None:
+        """Mark a saved strategy as loading.
+
+        Args:
+            load_name: Strategy name when the load started.
+        """
+        name = self._loading_names.get(load_name)
+        if name is not None:
+            self._strategy_table.set_loading(name, True)
+
+    def _on_strategy_loaded(self, load_name: str, df: pd.DataFrame) -> None:
+        """Store a saved strategy's data and redraw the portfolio.
+
+        Args:
+            load_name: Strategy name when the load started.
+            df: The strategy's trade data.
+        """
+        name = self._loading_names.pop(load_name, None)
+        if name is None:
+            return
+        self._strategy_data[name] = df
+        self._strategy_table.set_loading(name, False)
+        self._schedule_recalculation()
+
+    def _on_strategy_load_failed(self, load_name: str, message: str) -> None:
+        """Drop a saved strategy whose file could not be loaded.
+
+        Args:
+            load_name: Strategy name when the load started.
+            message: Error message.
+        """
+        name = self._loading_names.pop(load_name, None)
+        if name is None:
+            return
+        for row, config in enumerate(self._strategy_table.get_strategies()):
+            if config.name == name:
+                self._strategy_table.remove_strategy(row)
+                break
+        self._config_manager.save(
+            self._strategy_table.get_strategies(), self._account_start_spin.value()
+        )
+
+    def _on_load_progress(self, done: int, total: int) -> None:
+        """Show how many strategy files have been loaded.
+
+        Args:
+            done: Number of files loaded so far.
+            total: Total number of files.
+        """
+        self._load_status_label.setText(f"Loading strategies {done}/{total}")
+        self._load_status_label.setVisible(done < total)
+
+    def _on_load_finished(self) -> None:
+        """Clear the loading state once every saved strategy has loaded."""
+        self._load_status_label.setVisible(False)
+        self._loading_names.clear()
+        if self._load_worker is not None:
+            # finished is the worker's last emit; let run() return before dropping it
+            self._load_worker.wait()
+            self._load_worker = None
+
+    def _on_strategy_changed(self) -> None:
+        """Forget deleted strategies that are still loading, then redraw."""
+        if self._loading_names:
+            names = {config.name for config in self._strategy_table.get_strategies()}
+            self._loading_names = {
+                load_name: name
+                for load_name, name in self._loading_names.items()
+                if name in names
+            }
+        self._schedule_recalculation()
+
+    def cleanup(self) -> None:
+        """Stop loading saved strategies and wait for the loader to exit."""
+        if self._load_worker is not None:
+            self._load_worker.cancel()
+            self._load_worker.wait()
+            self._load_worker = None
+        self._loading_names.clear()
 
     def _on_add_strategy(self) -> None:
         """Handle Add Strategy button click."""
@@ -291,6 +390,11 @@ class PortfolioOverviewTab(QWidget):
         if old_name in self._strategy_data:
             self._strategy_data[new_name] = self._strategy_data.pop(old_name)
             logger.info(f"Renamed strategy data key: '{old_name}' -> '{new_name}'")
+        elif old_name in self._loading_names.values():
+            # Data still loading; store it under the new name when it arrives
+            for load_name, name in self._loading_names.items():
+                if name == old_name:
+                    self._loading_names[load_name] = new_name
         else:
             logger.warning(
                 f"Cannot rename strategy '{old_name}' -> '{new_name}': "
@@ -327,6 +431,9 @@ class PortfolioOverviewTab(QWidget):
 
         for config in strategies:
             df = self._strategy_data.get(config.name)
+            if df is None and config.name in self._loading_names.values():
+                # Saved strategy still loading; drawn once it arrives
+                continue
             if df is None:
                 logger.warning(
                     f"Strategy '{config.name}' has no data in _strategy_data. "
@@ -1265,6 +1265,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
         metrics_inputs = self._app_state.metrics_user_inputs
         return {
             "df": df.copy(),  # Copy to avoid race conditions
+            "matrix": self._app_state.trade_matrix_for(df),
             "mapping": self._app_state.column_mapping,
             "params": self._app_state.adjustment_params,
             "start_capital": metrics_inputs.starting_capital if metrics_inputs else 100000.0,
@@ -1297,6 +1298,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
         cover_pct = calc_params["cover_pct"]
         time_stop_scale_pct = calc_params["time_stop_scale_pct"]
         stop_offset_from_golden = calc_params["stop_offset_from_golden"]
+        matrix = calc_params.get("matrix")
         has_timing = calc_params["has_timing"]
         has_time_interval = calc_params["has_time_interval"]
 
@@ -1346,6 +1348,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
                     params,
                     start_capital=start_capital,
                     fractional_kelly_pct=fractional_kelly_pct,
+                    matrix=matrix,
                 )
             except Exception as e:
                 result["errors"].append(f"Stop Loss table: {e}")
@@ -1357,6 +1360,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
                     params,
                     start_capital=start_capital,
                     fractional_kelly_pct=fractional_kelly_pct,
+                    matrix=matrix,
                 )
             except Exception as e:
                 result["errors"].append(f"Offset table: {e}")
@@ -1520,6 +1524,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
 
         mapping = self._app_state.column_mapping
         params = self._app_state.adjustment_params
+        matrix = self._app_state.trade_matrix_for(df)
 
         # Compute fresh adjusted_gain_pct to ensure Scaling/Cover tables use current efficiency
         # This avoids race conditions with other tabs that also update adjusted_gain_pct
@@ -1561,6 +1566,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
                     params,
                     start_capital=start_capital,
                     fractional_kelly_pct=fractional_kelly_pct,
+                    matrix=matrix,
                 )
                 self._populate_table(self._stop_loss_table, stop_loss_df)
             except Exception as e:
@@ -1576,6 +1582,7 @@ class StatisticsTab(BackgroundCalculationMixin, QWidget):
                     params,
                     start_capital=start_capital,
                     fractional_kelly_pct=fractional_kelly_pct,
+                    matrix=matrix,
                 )
                 self._populate_table(self._offset_table, offset_df)
             except Exception as e:
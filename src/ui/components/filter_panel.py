@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QPushButton,
     QScrollArea,
     QVBoxLayout,
@@ -28,11 +29,14 @@ class FilterPanel(QWidget):
 
     Attributes:
         filters_applied: Signal emitted with list of FilterCriteria when applied.
-        filters_cleared: Signal emitted when all filters are cleared.
+        filters_cleared: Signal emitted when all filters, including the
+            expression, are cleared.
         date_range_changed: Signal emitted when date range changes.
             Args: (start: str | None, end: str | None, all_dates: bool)
         time_range_changed: Signal emitted when time range changes.
             Args: (start: str | None, end: str | None, all_times: bool)
+        expression_changed: Signal emitted with the filter expression text
+            when it is edited ("" when cleared).
     """
 
     filters_applied = pyqtSignal(list)  # list[FilterCriteria]
@@ -43,6 +47,7 @@ class FilterPanel(QWidget):
     single_filter_applied = pyqtSignal(object)  # Emits single FilterCriteria
     preset_save_requested = pyqtSignal()  # Emitted when Save clicked
     preset_load_requested = pyqtSignal(str)  # Emitted with preset name
+    expression_changed = pyqtSignal(str)  # Emitted with expression text
 
     def __init__(
         self,
@@ -67,6 +72,8 @@ class FilterPanel(QWidget):
         self._time_start: str | None = None
         self._time_end: str | None = None
         self._all_times_time: bool = True
+        # Filter expression state
+        self._expression: str = ""
         self._setup_ui()
         self._apply_style()
 
@@ -116,6 +123,15 @@ class FilterPanel(QWidget):
         self._chips_scroll.setWidget(self._chips_frame)
         layout.addWidget(self._chips_scroll)
 
+        # Filter expression (ANDed with the column filters)
+        self._expression_edit = QLineEdit()
+        self._expression_edit.setPlaceholderText(
+            "Expression, e.g. gain_pct > 0 and ticker in ('AAPL', 'MSFT')"
+        )
+        self._expression_edit.setClearButtonEnabled(True)
+        self._expression_edit.editingFinished.connect(self._on_expression_edited)
+        layout.addWidget(self._expression_edit)
+
         # Column filter panel (scrollable inline filter system)
         self._column_filter_panel = ColumnFilterPanel(columns=self._columns)
         self._column_filter_panel.setMinimumHeight(220)
@@ -252,6 +268,19 @@ class FilterPanel(QWidget):
         """
         self._load_combo.setStyleSheet(load_combo_style)
 
+        self._expression_edit.setStyleSheet(f"""
+            QLineEdit {{
+                background-color: {Colors.BG_ELEVATED};
+                color: {Colors.TEXT_PRIMARY};
+                border: 1px solid {Colors.BG_BORDER};
+                border-radius: 4px;
+                padding: 6px 8px;
+            }}
+            QLineEdit:focus {{
+                border-color: {Colors.SIGNAL_CYAN};
+            }}
+        """)
+
         # Add chips scroll area and frame styling - use explicit backgrounds to prevent bleeding
         self._chips_scroll.setStyleSheet(f"""
             QScrollArea {{
@@ -310,6 +339,18 @@ class FilterPanel(QWidget):
         self._all_times_time = all_times
         self.time_range_changed.emit(start, end, all_times)
 
+    def _on_expression_edited(self) -> None:
+        """Emit the filter expression when its text changed."""
+        text = self._expression_edit.text().strip()
+        if text == self._expression:
+            return
+        self._expression = text
+        self.expression_changed.emit(text)
+
+    def get_expression(self) -> str:
+        """Get the current filter expression text ("" for none)."""
+        return self._expression
+
     def _on_single_filter_applied(self, criteria: FilterCriteria) -> None:
         """Handle single filter applied from column row.
 
@@ -353,6 +394,10 @@ class FilterPanel(QWidget):
         self._time_end = None
         self._all_times_time = True
 
+        # Clear filter expression (filters_cleared covers it)
+        self._expression_edit.clear()
+        self._expression = ""
+
         self._active_filters.clear()
         self.filters_cleared.emit()
 
@@ -476,6 +521,7 @@ class FilterPanel(QWidget):
             date_range=self.get_date_range(),
             time_range=self.get_time_range(),
             first_trigger_only=self._first_trigger_toggle.isChecked(),
+            expression=self._expression or None,
         )
 
     def set_full_state(self, preset: FilterPreset) -> list[str]:
@@ -499,4 +545,8 @@ class FilterPanel(QWidget):
         # Set first trigger toggle
         self._first_trigger_toggle.setChecked(preset.first_trigger_only)
 
+        # Set filter expression
+        self._expression_edit.setText(preset.expression or "")
+        self._on_expression_edited()
+
         return skipped
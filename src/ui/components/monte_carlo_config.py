@@ -23,12 +23,21 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from src.core.monte_carlo import MonteCarloConfig, PositionSizingMode
+from src.core.monte_carlo import BLOCK_SIMULATION_TYPES, MonteCarloConfig, PositionSizingMode
+from src.ui.components.no_scroll_widgets import NoScrollComboBox
 from src.ui.constants import Colors, Fonts, Spacing
 
 if TYPE_CHECKING:
     from PyQt6.QtGui import QPaintEvent
 
+# Units drawn when resampling: (label, simulation_type)
+RESAMPLE_UNITS = (
+    ("Single Trades", "resample"),
+    ("Moving Blocks", "moving_block"),
+    ("Stationary Blocks", "stationary_block"),
+    ("Trading Days", "date_grouped"),
+)
+
 
 def _make_qt_property(type_: type, getter: object, setter: object) -> object:
     """Create a Qt property, working around mypy stub issues."""
@@ -494,6 +503,32 @@ class MonteCarloConfigPanel(QFrame):
         type_container.layout().addWidget(self._type_toggle)
         layout.addWidget(type_container)
 
+        # What resampling draws: single trades, blocks of trades or whole days
+        unit_container = self._create_input_group("Resample By")
+        unit_layout = QHBoxLayout()
+        unit_layout.setContentsMargins(0, 0, 0, 0)
+        unit_layout.setSpacing(4)
+
+        self._unit_combo = NoScrollComboBox()
+        for label, sim_type in RESAMPLE_UNITS:
+            self._unit_combo.addItem(label, sim_type)
+        self._unit_combo.setStyleSheet(self._combo_style())
+        unit_layout.addWidget(self._unit_combo)
+
+        # Block length in trades; 0 selects it from the gains' autocorrelation
+        self._block_spin = QSpinBox()
+        self._block_spin.setRange(0, 1000)
+        self._block_spin.setValue(0)
+        self._block_spin.setSpecialValueText("Auto")
+        self._block_spin.setSuffix(" trades")
+        self._block_spin.setToolTip("Block length (mean length for stationary blocks)")
+        self._block_spin.setStyleSheet(self._spinbox_style())
+        self._block_spin.setVisible(False)  # Hidden until a block mode is selected
+        unit_layout.addWidget(self._block_spin)
+
+        unit_container.layout().addLayout(unit_layout)
+        layout.addWidget(unit_container)
+
         # Number of simulations
         sims_container = self._create_input_group("Simulations")
         self._num_sims_spin = QSpinBox()
@@ -642,6 +677,35 @@ class MonteCarloConfigPanel(QFrame):
             }}
         """
 
+    def _combo_style(self) -> str:
+        """Get combo box styling matching the spinboxes.
+
+        Returns:
+            Stylesheet string.
+        """
+        return f"""
+            QComboBox {{
+                background-color: {Colors.BG_SURFACE};
+                color: {Colors.TEXT_PRIMARY};
+                font-family: {Fonts.UI};
+                font-size: 12px;
+                border: 1px solid {Colors.BG_BORDER};
+                border-radius: 4px;
+                padding: 4px 8px;
+                min-width: 130px;
+            }}
+            QComboBox:focus {{
+                border-color: {Colors.SIGNAL_CYAN};
+            }}
+            QComboBox:disabled {{
+                color: {Colors.TEXT_DISABLED};
+            }}
+            QComboBox::drop-down {{
+                border: none;
+                width: 20px;
+            }}
+        """
+
     def _toggle_btn_style(self) -> str:
         """Get consistent toggle button styling.
 
@@ -678,7 +742,9 @@ class MonteCarloConfigPanel(QFrame):
 
     def _connect_signals(self) -> None:
         """Connect internal signals."""
-        self._type_toggle.type_changed.connect(self._emit_config_changed)
+        self._type_toggle.type_changed.connect(self._on_simulation_type_changed)
+        self._unit_combo.currentIndexChanged.connect(self._on_simulation_type_changed)
+        self._block_spin.valueChanged.connect(self._emit_config_changed)
         self._num_sims_spin.valueChanged.connect(self._emit_config_changed)
         self._capital_spin.valueChanged.connect(self._emit_config_changed)
         self._ruin_spin.valueChanged.connect(self._emit_config_changed)
@@ -703,6 +769,21 @@ class MonteCarloConfigPanel(QFrame):
         """Emit config_changed signal with current configuration."""
         self.config_changed.emit(self.get_config())
 
+    def _on_simulation_type_changed(self, _: object = None) -> None:
+        """Enable the resampling unit and block length for the selected type."""
+        resampling = self._type_toggle.simulation_type() == "resample"
+        self._unit_combo.setEnabled(resampling)
+        self._block_spin.setVisible(
+            resampling and self._unit_combo.currentData() in BLOCK_SIMULATION_TYPES
+        )
+        self._emit_config_changed()
+
+    def _simulation_type(self) -> str:
+        """Simulation type selected by the toggle and the resampling unit."""
+        if self._type_toggle.simulation_type() == "reshuffle":
+            return "reshuffle"
+        return str(self._unit_combo.currentData())
+
     def _on_position_mode_changed(self, mode: PositionSizingMode) -> None:
         """Handle position sizing mode change.
 
@@ -730,7 +811,8 @@ class MonteCarloConfigPanel(QFrame):
             initial_capital=self._capital_spin.value(),
             ruin_threshold_pct=self._ruin_spin.value(),
             var_confidence_pct=self._var_spin.value(),
-            simulation_type=self._type_toggle.simulation_type(),
+            simulation_type=self._simulation_type(),
+            block_length=self._block_spin.value() or None,
             position_sizing_mode=self._position_sizing_mode,
             flat_stake=10000.0,  # Will be overwritten from app_state
             fractional_kelly_pct=25.0,  # Will be overwritten from app_state
@@ -752,8 +834,18 @@ class MonteCarloConfigPanel(QFrame):
         self._kelly_btn.blockSignals(True)
         self._custom_btn.blockSignals(True)
         self._custom_pct_spin.blockSignals(True)
+        self._unit_combo.blockSignals(True)
+        self._block_spin.blockSignals(True)
 
-        self._type_toggle.set_simulation_type(config.simulation_type)
+        if config.simulation_type == "reshuffle":
+            self._type_toggle.set_simulation_type("reshuffle")
+        else:
+            self._type_toggle.set_simulation_type("resample")
+            self._unit_combo.setCurrentIndex(self._unit_combo.findData(config.simulation_type))
+        self._block_spin.setValue(config.block_length or 0)
+        resampling = config.simulation_type != "reshuffle"
+        self._unit_combo.setEnabled(resampling)
+        self._block_spin.setVisible(config.simulation_type in BLOCK_SIMULATION_TYPES)
         self._num_sims_spin.setValue(config.num_simulations)
         self._capital_spin.setValue(config.initial_capital)
         self._ruin_spin.setValue(config.ruin_threshold_pct)
@@ -771,6 +863,8 @@ class MonteCarloConfigPanel(QFrame):
         self._kelly_btn.blockSignals(False)
         self._custom_btn.blockSignals(False)
         self._custom_pct_spin.blockSignals(False)
+        self._unit_combo.blockSignals(False)
+        self._block_spin.blockSignals(False)
 
     def set_running(self, running: bool) -> None:
         """Set running state.
@@ -781,6 +875,10 @@ class MonteCarloConfigPanel(QFrame):
         self._run_btn.set_running(running)
         # Disable inputs while running
         self._type_toggle.setEnabled(not running)
+        self._unit_combo.setEnabled(
+            not running and self._type_toggle.simulation_type() == "resample"
+        )
+        self._block_spin.setEnabled(not running)
         self._num_sims_spin.setEnabled(not running)
         self._capital_spin.setEnabled(not running)
         self._ruin_spin.setEnabled(not running)
@@ -119,6 +119,23 @@ class StrategyTableWidget(QTableWidget):
         self.insertRow(row)
         self._populate_row(row, config)
 
+    def set_loading(self, name: str, loading: bool) -> None:
+        """Show or clear the loading state of a strategy's file.
+
+        Args:
+            name: Strategy name.
+            loading: Whether the strategy's file is still loading.
+        """
+        for row, config in enumerate(self._strategies):
+            name_item = self.item(row, self.COL_NAME)
+            if (name_item.text() if name_item else config.name) != name:
+                continue
+            file_item = self.item(row, self.COL_FILE)
+            if file_item:
+                prefix = "Loading… " if loading else ""
+                file_item.setText(f"{prefix}{config.file_path}")
+            return
+
     def _populate_row(self, row: int, config: StrategyConfig) -> None:
         """Populate a table row with strategy data.
 
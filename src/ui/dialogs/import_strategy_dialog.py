@@ -39,7 +39,7 @@ class ImportStrategyDialog(QDialog):
         self.setMinimumSize(500, 500)
         self._preview_df: pd.DataFrame | None = None
         self._file_path: str | None = None
-        self._file_loader = FileLoader()
+        self._file_loader = FileLoader(csv_engine="pyarrow")
         self._selected_sheet: str | None = None
         self._setup_ui()
         self._connect_signals()
@@ -159,7 +159,7 @@ class ImportStrategyDialog(QDialog):
                 # CSV file - hide sheet selector
                 self._sheet_label.setVisible(False)
                 self._sheet_selector.setVisible(False)
-                df = pd.read_csv(file_path)
+                df = self._file_loader.load(Path(file_path))
 
             self._file_label.setText(Path(file_path).name)
             self._name_edit.setText(Path(file_path).stem)
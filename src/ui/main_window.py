@@ -62,6 +62,7 @@ class MainWindow(QMainWindow):
         """Set up dockable widgets for all workflow tabs."""
         # Create Portfolio tabs with signal connection
         portfolio_overview = PortfolioOverviewTab(self._app_state)
+        self._portfolio_overview = portfolio_overview
         portfolio_breakdown = PortfolioBreakdownTab()
 
         # Connect Portfolio Overview signal to Breakdown handler
@@ -258,6 +259,7 @@ class MainWindow(QMainWindow):
         self.menuBar().setStyleSheet(menu_stylesheet)
 
     def closeEvent(self, event: object) -> None:
-        """Clean up state exporter on close."""
+        """Clean up state exporter and background loaders on close."""
+        self._portfolio_overview.cleanup()
         self._state_exporter.cleanup()
         super().closeEvent(event)  # type: ignore[arg-type]
@@ -12,6 +12,13 @@ if TYPE_CHECKING:
     from src.core.models import ColumnMapping, FilterCriteria, TradingMetrics
 
 
+@pytest.fixture
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run in tmp_path so the default .lumen_cache/ is created there."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / ".lumen_cache"
+
+
 @pytest.fixture
 def sample_csv_file(tmp_path: Path) -> Path:
     """Create sample CSV file for testing."""
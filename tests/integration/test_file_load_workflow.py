@@ -112,7 +112,7 @@ class TestFileCacheWorkflow:
             finished_dfs.append(result_df)
 
         # First load - cache miss
-        worker1 = FileLoadWorker(csv_file)
+        worker1 = FileLoadWorker(csv_file, cache_dir=tmp_path / "cache")
         worker1.cache_hit.connect(on_cache_hit)
         worker1.finished.connect(on_finished)
         worker1.run()  # Run synchronously for testing
@@ -126,7 +126,7 @@ class TestFileCacheWorkflow:
         cache_hit_values.clear()
         finished_dfs.clear()
 
-        worker2 = FileLoadWorker(csv_file)
+        worker2 = FileLoadWorker(csv_file, cache_dir=tmp_path / "cache")
         worker2.cache_hit.connect(on_cache_hit)
         worker2.finished.connect(on_finished)
         worker2.run()
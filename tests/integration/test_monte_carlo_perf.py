@@ -204,3 +204,31 @@ class TestMonteCarloPerformance:
 
         # Should complete much faster than running all 50,000 simulations
         assert elapsed < 5.0, f"Cancellation took {elapsed:.2f}s to complete"
+
+    @pytest.mark.slow
+    def test_histogram_percentiles_accuracy_benchmark(self) -> None:
+        """Streaming percentile bands vs exact bands on a benchmark dataset.
+
+        5,000 simulations x 2,000 trades; reports the measured error of the
+        histogram sketch against the exact percentiles.
+        """
+        gains = np.random.default_rng(42).normal(0.005, 0.03, 2000)
+        base = {"num_simulations": 5000, "seed": 1}
+
+        exact = MonteCarloEngine(
+            MonteCarloConfig(**base, equity_percentile_method="exact")
+        ).run(gains)
+        approx = MonteCarloEngine(
+            MonteCarloConfig(**base, equity_percentile_method="histogram")
+        ).run(gains)
+
+        median = exact.equity_percentiles[:, 2:3]
+        relative_error = np.abs(approx.equity_percentiles - exact.equity_percentiles) / median
+        print(
+            f"\nHistogram percentiles: max relative error {relative_error.max():.4%}, "
+            f"mean {relative_error.mean():.4%}, "
+            f"reported resolution {approx.equity_percentiles_error:.4%}"
+        )
+
+        assert relative_error.max() < 0.01
+        assert relative_error.max() <= 2 * approx.equity_percentiles_error
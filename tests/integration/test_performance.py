@@ -289,6 +289,38 @@ class TestFirstTriggerTogglePerformance:
         assert (groups == 1).all()
 
 
+class TestCsvLoadPerformance:
+    """Benchmark of the pyarrow CSV engine against the pandas parser."""
+
+    @pytest.mark.slow
+    def test_pyarrow_engine_not_slower_than_pandas(self, large_dataset_path: Path) -> None:
+        """pyarrow engine loads 100k rows identically and at least as fast."""
+        pandas_loader = FileLoader()
+        arrow_loader = FileLoader(csv_engine="pyarrow")
+
+        # Warm up both readers (imports, thread pool start-up)
+        pandas_loader.load(large_dataset_path)
+        arrow_loader.load(large_dataset_path)
+
+        def best_of(loader: FileLoader, runs: int = 3) -> tuple[float, pd.DataFrame]:
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                df = loader.load(large_dataset_path)
+                timings.append(time.perf_counter() - start)
+            return min(timings), df
+
+        pandas_time, expected = best_of(pandas_loader)
+        arrow_time, result = best_of(arrow_loader)
+
+        pd.testing.assert_frame_equal(result, expected)
+        # Margin for single-core CI runners; multi-core machines see a large speedup
+        assert arrow_time < pandas_time * 1.25, (
+            f"pyarrow load took {arrow_time * 1000:.1f}ms, "
+            f"pandas load took {pandas_time * 1000:.1f}ms"
+        )
+
+
 class TestExportPerformance:
     """Performance tests for export operations."""
 
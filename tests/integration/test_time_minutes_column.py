@@ -8,6 +8,8 @@ from src.core.app_state import AppState
 from src.core.models import ColumnMapping
 from src.tabs.data_input import DataInputTab
 
+pytestmark = pytest.mark.usefixtures("isolated_cache_dir")
+
 
 @pytest.fixture
 def app_state() -> AppState:
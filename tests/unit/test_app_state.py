@@ -75,6 +75,30 @@ class TestAppStateHasData:
         assert state.has_data is True
 
 
+class TestAppStateColumnSchema:
+    """Tests for AppState.column_schema."""
+
+    def test_returns_frame_when_fully_loaded(self) -> None:
+        """Without a column store the frame describes itself."""
+        state = AppState()
+        df = pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]})
+
+        assert state.column_schema(df) is df
+
+    def test_hides_internal_columns(self) -> None:
+        """Internal derived columns are not offered as user columns."""
+        state = AppState()
+        df = pd.DataFrame({"a": [1, 2], "trigger_number": [1, 1], "_trigger_group": [0, 1]})
+
+        schema = state.column_schema(df)
+
+        assert schema.columns.tolist() == ["a", "trigger_number"]
+        assert schema.select_dtypes(include=["number"]).columns.tolist() == [
+            "a",
+            "trigger_number",
+        ]
+
+
 class TestAppStateSignals:
     """Tests for AppState signal emissions."""
 
@@ -1,10 +1,13 @@
 """Unit tests for CacheManager."""
 
+import os
 from time import sleep
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
+from src.core import cache_manager
 from src.core.cache_manager import CacheManager
 
 
@@ -39,8 +42,8 @@ class TestGetCacheKey:
         cm = CacheManager(cache_dir=tmp_path / "cache")
         file1 = tmp_path / "test1.csv"
         file2 = tmp_path / "test2.csv"
-        file1.touch()
-        file2.touch()
+        file1.write_text("a\n1\n")
+        file2.write_text("a\n2\n")
 
         key1 = cm._get_cache_key(file1)
         key2 = cm._get_cache_key(file2)
@@ -71,18 +74,17 @@ class TestIsCacheValid:
         assert cm.is_cache_valid(file_path) is False
 
     def test_is_cache_valid_outdated(self, tmp_path):
-        """Returns False when source is newer than cache."""
+        """Returns False when source content changed after caching."""
         cm = CacheManager(cache_dir=tmp_path / "cache")
         file_path = tmp_path / "test.csv"
 
         # Create cache first
-        file_path.touch()
+        file_path.write_text("a\n1\n")
         df = pd.DataFrame({"a": [1, 2, 3]})
         cm.save_to_cache(df, file_path)
 
-        # Wait and touch source to make it newer
-        sleep(0.1)
-        file_path.touch()
+        # Replace the source content (same size, same second)
+        file_path.write_text("a\n2\n")
 
         assert cm.is_cache_valid(file_path) is False
 
@@ -208,8 +210,8 @@ class TestInvalidate:
         cm = CacheManager(cache_dir=tmp_path / "cache")
         file_path1 = tmp_path / "test1.csv"
         file_path2 = tmp_path / "test2.csv"
-        file_path1.touch()
-        file_path2.touch()
+        file_path1.write_text("a\n1\n")
+        file_path2.write_text("a\n2\n")
 
         df = pd.DataFrame({"a": [1, 2, 3]})
         cm.save_to_cache(df, file_path1)
@@ -256,6 +258,159 @@ class TestInvalidate:
         assert cache_path2.exists()  # Sheet2's cache preserved
 
 
+class TestContentAddressing:
+    """Tests for content-fingerprinted, versioned cache keys."""
+
+    def test_touch_keeps_cache_valid(self, tmp_path):
+        """Touching the source without changing content keeps the cache."""
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("a\n1\n")
+        cm.save_to_cache(pd.DataFrame({"a": [1]}), file_path)
+
+        sleep(0.1)
+        file_path.touch()
+
+        assert cm.is_cache_valid(file_path) is True
+
+    def test_identical_files_share_cache(self, tmp_path):
+        """A moved or copied file reuses the cache of the original."""
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        original = tmp_path / "original.csv"
+        original.write_text("a,b\n1,x\n")
+        cm.save_to_cache(pd.DataFrame({"a": [1], "b": ["x"]}), original)
+
+        copy_dir = tmp_path / "share"
+        copy_dir.mkdir()
+        copy = copy_dir / "renamed.csv"
+        copy.write_bytes(original.read_bytes())
+
+        result = cm.get_cached(copy)
+
+        assert result is not None
+        assert list(result.columns) == ["a", "b"]
+
+    def test_format_version_changes_key(self, tmp_path, monkeypatch):
+        """Caches written by another format version are not served."""
+        from src.core import cache_manager
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("a\n1\n")
+        cm.save_to_cache(pd.DataFrame({"a": [1]}), file_path)
+
+        monkeypatch.setattr(
+            cache_manager, "CACHE_FORMAT_VERSION", cache_manager.CACHE_FORMAT_VERSION + 1
+        )
+
+        assert cm.get_cached(file_path) is None
+
+    def test_sampled_fingerprint_detects_edit_in_large_file(self, tmp_path):
+        """Same-size edits in a sampled region change the fingerprint."""
+        from src.core.cache_manager import file_fingerprint
+
+        file_path = tmp_path / "big.csv"
+        content = bytearray(b"x" * (4 * 1024 * 1024))
+        file_path.write_bytes(bytes(content))
+        before = file_fingerprint(file_path)
+
+        content[-10] = ord("y")
+        file_path.write_bytes(bytes(content))
+
+        assert file_fingerprint(file_path) != before
+        assert file_fingerprint(file_path, full_hash=True) != file_fingerprint(file_path)
+
+    def test_same_size_edit_outside_sampled_blocks_invalidates(self, tmp_path):
+        """An edit the sampled fingerprint misses is caught by the full hash."""
+        from src.core.cache_manager import file_fingerprint
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "big.csv"
+        content = bytearray(b"x" * (4 * 1024 * 1024))
+        file_path.write_bytes(bytes(content))
+        cm.save_to_cache(pd.DataFrame({"a": [1]}), file_path)
+        before = file_fingerprint(file_path)
+
+        # Between the 8th and 9th of 16 sampled blocks
+        content[len(content) // 2 + 64 * 1024] = ord("y")
+        file_path.write_bytes(bytes(content))
+        os.utime(file_path, ns=(0, file_path.stat().st_mtime_ns + 10**9))
+
+        assert file_fingerprint(file_path) == before
+        assert cm.is_cache_valid(file_path) is False
+        assert cm.get_cached(file_path) is None
+
+    def test_moved_file_confirmed_by_full_hash(self, tmp_path):
+        """A file with a new modification time but the same bytes stays cached."""
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "big.csv"
+        file_path.write_bytes(b"x" * (4 * 1024 * 1024))
+        cm.save_to_cache(pd.DataFrame({"a": [1]}), file_path)
+
+        os.utime(file_path, ns=(0, file_path.stat().st_mtime_ns + 10**9))
+
+        with patch(
+            "src.core.cache_manager.file_fingerprint", wraps=cache_manager.file_fingerprint
+        ) as fingerprint:
+            assert cm.get_cached(file_path) is not None
+            assert cm.get_cached(file_path) is not None
+
+        # Only the first lookup after the mtime change hashes the whole file
+        full_hashes = [c for c in fingerprint.call_args_list if c.kwargs.get("full_hash")]
+        assert len(full_hashes) == 1
+
+
+class TestEviction:
+    """Tests for size-bounded LRU eviction."""
+
+    def _cache_file(self, cm, tmp_path, name, rows):
+        file_path = tmp_path / name
+        file_path.write_text(name)
+        cm.save_to_cache(pd.DataFrame({"a": range(rows)}), file_path)
+        return file_path
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Oldest accessed entries are evicted once the limit is exceeded."""
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        first = self._cache_file(cm, tmp_path, "first.csv", 1000)
+        sleep(0.05)
+        second = self._cache_file(cm, tmp_path, "second.csv", 1000)
+        sleep(0.05)
+
+        # Reading the first entry makes the second the least recently used
+        assert cm.get_cached(first) is not None
+        sleep(0.05)
+        entry_size = cm._get_cache_path(first).stat().st_size
+        cm.max_size_bytes = entry_size * 2 + entry_size // 2
+        third = self._cache_file(cm, tmp_path, "third.csv", 1000)
+
+        assert cm.is_cache_valid(first)
+        assert not cm.is_cache_valid(second)
+        assert cm.is_cache_valid(third)
+
+    def test_keeps_new_entry_larger_than_limit(self, tmp_path):
+        """The entry just written survives even if it exceeds the limit."""
+        cm = CacheManager(cache_dir=tmp_path / "cache", max_size_bytes=1)
+        file_path = self._cache_file(cm, tmp_path, "data.csv", 100)
+
+        assert cm.is_cache_valid(file_path)
+
+    def test_removes_other_versions_and_ignores_other_files(self, tmp_path):
+        """Stale-version Parquet files are removed, non-Parquet files kept."""
+        cache_dir = tmp_path / "cache"
+        cm = CacheManager(cache_dir=cache_dir)
+        stale = cache_dir / "0123456789abcdef0123456789abcdef.parquet"
+        stale.write_bytes(b"old")
+        mappings = cache_dir / "abc_mappings.json"
+        mappings.write_text("{}")
+
+        removed = cm.evict()
+
+        assert removed == 1
+        assert not stale.exists()
+        assert mappings.exists()
+
+
 class TestCacheManagerInit:
     """Tests for CacheManager initialization."""
 
@@ -475,6 +630,51 @@ class TestStreamCsvToCache:
         assert len(cached) == 500
 
 
+class TestStreamCsvTypes:
+    """Tests for column type handling and cancellation while streaming."""
+
+    def test_late_text_in_empty_column_falls_back_to_string(self, tmp_path):
+        """A column empty in block 1 and textual later is read as text."""
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        csv_path = tmp_path / "sparse.csv"
+        lines = ["id,note"] + [f"{i}," for i in range(200)] + [f"{i},late" for i in range(200, 300)]
+        csv_path.write_text("\n".join(lines))
+
+        cm.stream_csv_to_cache(csv_path, block_size=256)
+        cached = cm.get_cached(csv_path)
+
+        assert cached["note"].dropna().unique().tolist() == ["late"]
+
+    def test_dates_and_times_stay_strings(self, tmp_path):
+        """ISO dates and times are not converted, matching pd.read_csv."""
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("date,time,gain\n2024-01-02,09:30:00,0.5\n2024-01-03,10:00:00,-1\n")
+
+        cm.stream_csv_to_cache(csv_path)
+        cached = cm.get_cached(csv_path)
+
+        pd.testing.assert_frame_equal(cached, pd.read_csv(csv_path))
+
+    def test_cancel_stops_stream(self, tmp_path):
+        """A set cancel event raises and leaves no cache or partial file."""
+        import threading
+
+        from src.core.exceptions import LoadCancelledError
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        csv_path = tmp_path / "data.csv"
+        pd.DataFrame({"a": range(500)}).to_csv(csv_path, index=False)
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(LoadCancelledError):
+            cm.stream_csv_to_cache(csv_path, block_size=256, cancel_event=cancel)
+
+        assert not cm.is_cache_valid(csv_path)
+        assert list((tmp_path / "cache").glob("*.partial")) == []
+
+
 class TestStreamCsvNullColumnProbe:
     """Tests for null-typed column detection in streaming CSV."""
 
@@ -564,3 +764,84 @@ class TestCleanupPartial:
 
         # Should not raise
         cm._cleanup_partial(partial)
+
+
+class TestDerivedCache:
+    """Tests for the post-mapping derived-column sidecar."""
+
+    @pytest.fixture
+    def mapping(self):
+        from src.core.models import ColumnMapping
+
+        return ColumnMapping(
+            ticker="ticker", date="date", time="time",
+            gain_pct="gain_pct", mae_pct="mae_pct", mfe_pct="mfe_pct",
+        )
+
+    @pytest.fixture
+    def baseline(self):
+        return pd.DataFrame({
+            "ticker": ["A", "B", "A"],
+            "gain_pct": [0.1, -0.2, 0.05],
+            "trigger_number": [1, 1, 2],
+            "adjusted_gain_pct": [0.05, -0.25, 0.0],
+            "time_minutes": [570.0, 575.5, 600.0],
+        })
+
+    def test_round_trip_stores_only_derived_columns(self, tmp_path, mapping, baseline):
+        from src.core.models import AdjustmentParams
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("data")
+        params = AdjustmentParams(stop_loss=20, efficiency=5)
+
+        cm.save_derived(baseline, file_path, None, mapping, params)
+        derived = cm.get_derived(file_path, None, mapping, params, num_rows=3)
+
+        assert derived is not None
+        assert list(derived.columns) == ["trigger_number", "adjusted_gain_pct", "time_minutes"]
+        assert derived["trigger_number"].tolist() == [1, 1, 2]
+
+    def test_keyed_on_mapping_and_params(self, tmp_path, mapping, baseline):
+        from dataclasses import replace
+
+        from src.core.models import AdjustmentParams
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("data")
+        params = AdjustmentParams(stop_loss=20, efficiency=5)
+        cm.save_derived(baseline, file_path, None, mapping, params)
+
+        other_params = AdjustmentParams(stop_loss=30, efficiency=5)
+        other_mapping = replace(mapping, time="entry_time")
+
+        assert cm.get_derived(file_path, None, mapping, other_params, num_rows=3) is None
+        assert cm.get_derived(file_path, None, other_mapping, params, num_rows=3) is None
+        assert cm.get_derived(file_path, "Sheet1", mapping, params, num_rows=3) is None
+
+    def test_row_count_mismatch_ignored(self, tmp_path, mapping, baseline):
+        from src.core.models import AdjustmentParams
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("data")
+        params = AdjustmentParams()
+        cm.save_derived(baseline, file_path, None, mapping, params)
+
+        assert cm.get_derived(file_path, None, mapping, params, num_rows=4) is None
+
+    def test_raw_cache_and_sidecar_coexist(self, tmp_path, mapping, baseline):
+        from src.core.models import AdjustmentParams
+
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("data")
+        params = AdjustmentParams()
+
+        cm.save_to_cache(baseline, file_path)
+        cm.save_derived(baseline, file_path, None, mapping, params)
+
+        assert cm.get_cached(file_path) is not None
+        assert cm.get_derived(file_path, None, mapping, params, num_rows=3) is not None
@@ -0,0 +1,133 @@
+"""Unit tests for ColumnStore column-projected loading."""
+
+import pandas as pd
+import pytest
+
+from src.core.cache_manager import CacheManager
+from src.core.column_store import ColumnStore, mapped_columns
+from src.core.models import ColumnMapping
+
+
+@pytest.fixture
+def mapping():
+    return ColumnMapping(
+        ticker="ticker", date="date", time="time",
+        gain_pct="gain_pct", mae_pct="mae_pct", mfe_pct="mfe_pct",
+    )
+
+
+@pytest.fixture
+def wide_df():
+    return pd.DataFrame({
+        "ticker": ["A", "B", "A", "C"],
+        "date": ["2024-01-02"] * 4,
+        "time": ["09:30", "09:31", "09:45", "10:00"],
+        "gain_pct": [0.1, -0.2, 0.05, 0.3],
+        "mae_pct": [1.0, 2.0, 0.5, 1.5],
+        "mfe_pct": [2.0, 0.5, 1.0, 3.0],
+        "feature_a": [10.0, 20.0, 30.0, 40.0],
+        "feature_b": [1, 2, 3, 4],
+        "label": ["x", "y", "z", "w"],
+    })
+
+
+@pytest.fixture
+def store(tmp_path, wide_df):
+    path = tmp_path / "data.parquet"
+    wide_df.to_parquet(path, index=False)
+    return ColumnStore(path)
+
+
+class TestMappedColumns:
+    """Tests for mapped_columns helper."""
+
+    def test_returns_set_string_fields(self, mapping):
+        mapping.price_10_min_after = "price_10"
+
+        assert mapped_columns(mapping) == [
+            "ticker", "date", "time", "gain_pct", "mae_pct", "mfe_pct", "price_10",
+        ]
+
+
+class TestColumnStore:
+    """Tests for ColumnStore."""
+
+    def test_reads_schema_without_data(self, store, wide_df):
+        assert store.columns == list(wide_df.columns)
+        assert store.num_rows == 4
+        assert "feature_a" in store
+        assert "missing" not in store
+
+    def test_eager_columns_are_mapped_columns_in_file_order(self, store, mapping):
+        assert store.eager_columns(mapping) == [
+            "ticker", "date", "time", "gain_pct", "mae_pct", "mfe_pct",
+        ]
+
+    def test_read_skips_unknown_columns(self, store):
+        df = store.read(["gain_pct", "missing"])
+
+        assert list(df.columns) == ["gain_pct"]
+
+    def test_schema_frame_lists_all_columns_with_dtypes(self, store, mapping):
+        loaded = store.read(store.eager_columns(mapping))
+        loaded["trigger_number"] = 1
+
+        schema = store.schema_frame(loaded)
+
+        assert len(schema) == 0
+        assert "feature_a" in schema.columns
+        assert schema.columns[-1] == "trigger_number"
+        numeric = schema.select_dtypes(include=["number"]).columns
+        assert {"feature_a", "feature_b", "trigger_number"} <= set(numeric)
+        assert "label" not in numeric
+
+    def test_fill_aligns_rows_by_index(self, store, mapping, wide_df):
+        raw = store.read(store.eager_columns(mapping))
+        filtered = raw[raw["gain_pct"] > 0].sort_values("gain_pct")
+
+        read = store.fill([raw, filtered], ["feature_a", "gain_pct"])
+
+        assert read == ["feature_a"]
+        pd.testing.assert_series_equal(raw["feature_a"], wide_df["feature_a"])
+        assert filtered["feature_a"].tolist() == [30.0, 10.0, 40.0]
+
+    def test_fill_skips_frames_that_have_column(self, store, mapping):
+        raw = store.read(store.eager_columns(mapping))
+        store.fill([raw], ["feature_a"])
+
+        assert store.fill([raw], ["feature_a"]) == []
+
+    def test_fill_rejects_index_not_from_file(self, store, mapping):
+        raw = store.read(store.eager_columns(mapping))
+        raw.index = ["a", "b", "c", "d"]
+
+        with pytest.raises(ValueError):
+            store.fill([raw], ["feature_a"])
+
+
+class TestCacheProjection:
+    """Tests for column-projected reads through CacheManager."""
+
+    def test_get_cached_reads_only_requested_columns(self, tmp_path, wide_df):
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("data")
+        cm.save_to_cache(wide_df, file_path)
+
+        df = cm.get_cached(file_path, columns=["ticker", "gain_pct", "missing"])
+
+        assert list(df.columns) == ["ticker", "gain_pct"]
+        assert len(df) == 4
+
+    def test_open_column_store(self, tmp_path, wide_df):
+        cm = CacheManager(cache_dir=tmp_path / "cache")
+        file_path = tmp_path / "test.csv"
+        file_path.write_text("data")
+
+        assert cm.open_column_store(file_path) is None
+
+        cm.save_to_cache(wide_df, file_path)
+        store = cm.open_column_store(file_path)
+
+        assert store is not None
+        assert store.columns == list(wide_df.columns)
@@ -1,6 +1,16 @@
+import numpy as np
 import pytest
 import pandas as pd
-from src.core.date_utils import detect_date_format, DateFormat
+from src.core.date_utils import (
+    DATE_NS_COLUMN,
+    NAT_ORDINAL,
+    DateFormat,
+    day_ordinals,
+    detect_date_format,
+    detect_parse_format,
+    parse_dates,
+    resolve_dates,
+)
 
 
 class TestDetectDateFormat:
@@ -28,3 +38,59 @@ class TestDetectDateFormat:
     def test_handles_null_values(self) -> None:
         dates = pd.Series([None, "2021-02-05", None])
         assert detect_date_format(dates) == DateFormat.ISO
+
+
+def _mixed(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, dayfirst=True, format="mixed", errors="coerce")
+
+
+class TestParseDates:
+    def test_day_first_matches_mixed_parsing(self) -> None:
+        dates = pd.Series(["05/02/2021", "13/03/2021", None, "bad", "25/12/2021"])
+        pd.testing.assert_series_equal(parse_dates(dates), _mixed(dates))
+
+    def test_detects_single_format(self) -> None:
+        assert detect_parse_format(pd.Series(["05/02/2021", "13/03/2021"])) == "%d/%m/%Y"
+        assert detect_parse_format(pd.Series(["2021-02-05", "2021-03-13"])) == "ISO8601"
+
+    def test_values_outside_detected_format_fall_back(self) -> None:
+        # The odd value sits between sampled rows
+        dates = pd.Series(["05/02/2021"] * 401)
+        dates.iloc[1] = "2021-03-13"
+        result = parse_dates(dates)
+        assert result.iloc[0] == pd.Timestamp("2021-02-05")
+        assert result.iloc[1] == pd.Timestamp("2021-03-13")
+
+    def test_datetime_column_returned_unchanged(self) -> None:
+        dates = pd.Series(pd.to_datetime(["2021-02-05", "2021-03-13"]))
+        assert parse_dates(dates) is dates
+
+    def test_all_null_returns_nat(self) -> None:
+        result = parse_dates(pd.Series([None, None], dtype=object))
+        assert result.isna().all()
+        assert pd.api.types.is_datetime64_any_dtype(result)
+
+
+class TestResolveDates:
+    def test_reuses_stored_column(self) -> None:
+        stored = pd.to_datetime(["2021-01-01", "2021-01-02"])
+        df = pd.DataFrame({"date": ["x", "y"], DATE_NS_COLUMN: stored})
+        assert resolve_dates(df, "date").tolist() == stored.tolist()
+
+    def test_parses_when_column_absent(self) -> None:
+        df = pd.DataFrame({"date": ["02/01/2021"]})
+        assert resolve_dates(df, "date").iloc[0] == pd.Timestamp("2021-01-02")
+
+
+class TestDayOrdinals:
+    def test_same_day_shares_ordinal(self) -> None:
+        dates = pd.Series(
+            pd.to_datetime(
+                ["2021-01-01 09:30", "2021-01-01 15:00", "2021-01-02", None], format="mixed"
+            )
+        )
+        ordinals = day_ordinals(dates)
+        assert ordinals[0] == ordinals[1] == 18628
+        assert ordinals[2] == 18629
+        assert ordinals[3] == NAT_ORDINAL
+        assert ordinals.dtype == np.int64
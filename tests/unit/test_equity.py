@@ -1,9 +1,10 @@
 """Unit tests for EquityCalculator."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from src.core.equity import EquityCalculator
+from src.core.equity import EquityCalculator, extract_drawdown_episodes
 from src.core.exceptions import EquityCalculationError
 
 
@@ -504,3 +505,134 @@ class TestMaxDrawdownDollarVsPercent:
         assert max_dd_pct == 60.0
         # Max $ is at point 5: $300
         assert max_dd_dollars == 300.0
+
+
+def _reference_kelly(
+    gains: np.ndarray, start_capital: float, stake: float
+) -> dict[str, np.ndarray]:
+    """Sequential per-trade Kelly curve used to check the vectorized kernel."""
+    n_trades = len(gains)
+    keys = ("pnl", "equity", "peak", "drawdown", "position_size")
+    out = {key: np.zeros(n_trades) for key in keys}
+    current_equity = start_capital
+    current_peak = start_capital
+    blown = False
+    for i in range(n_trades):
+        if blown:
+            out["peak"][i] = current_peak
+            out["drawdown"][i] = -current_peak
+            continue
+        out["position_size"][i] = current_equity * stake
+        out["pnl"][i] = out["position_size"][i] * gains[i] / 100.0
+        current_equity = current_equity + out["pnl"][i]
+        if current_equity <= 0:
+            current_equity = 0.0
+            blown = True
+        out["equity"][i] = current_equity
+        current_peak = max(current_peak, current_equity)
+        out["peak"][i] = current_peak
+        out["drawdown"][i] = current_equity - current_peak
+    return out
+
+
+class TestKellyPaths:
+    """Tests for the vectorized Kelly equity kernel."""
+
+    def test_matches_sequential_reference(self) -> None:
+        """Vectorized paths match a per-trade loop, including blow-ups."""
+        rng = np.random.default_rng(7)
+        calc = EquityCalculator()
+        for _ in range(20):
+            gains = rng.normal(2.0, 40.0, size=200)
+            paths = calc.calculate_kelly_paths(gains, 10000.0, 50.0, 80.0)
+            expected = _reference_kelly(gains, 10000.0, 0.4)
+            for key, values in expected.items():
+                np.testing.assert_allclose(paths[key], values, rtol=1e-9, atol=1e-6)
+
+    def test_blow_up_truncates_path(self) -> None:
+        """Trade that takes equity to zero ends the path."""
+        calc = EquityCalculator()
+        paths = calc.calculate_kelly_paths(
+            np.array([10.0, -200.0, 50.0]), 1000.0, 100.0, 100.0
+        )
+        np.testing.assert_allclose(paths["equity"], [1100.0, 0.0, 0.0])
+        np.testing.assert_allclose(paths["position_size"], [1000.0, 1100.0, 0.0])
+        np.testing.assert_allclose(paths["pnl"], [100.0, -2200.0, 0.0])
+        np.testing.assert_allclose(paths["drawdown"], [0.0, -1100.0, -1100.0])
+
+    def test_matrix_rows_match_single_paths(self) -> None:
+        """2-D gains with per-row Kelly equal row-by-row 1-D calls."""
+        rng = np.random.default_rng(11)
+        gains = rng.normal(1.0, 20.0, size=(5, 300))
+        kelly = np.array([5.0, 10.0, 20.0, 40.0, 80.0])
+        calc = EquityCalculator()
+        matrix = calc.calculate_kelly_paths(gains, 5000.0, 25.0, kelly)
+        for row in range(gains.shape[0]):
+            single = calc.calculate_kelly_paths(gains[row], 5000.0, 25.0, kelly[row])
+            for key, values in single.items():
+                np.testing.assert_array_equal(matrix[key][row], values)
+
+    def test_mismatched_kelly_shape_raises(self) -> None:
+        """Per-row Kelly values must match the number of scenario rows."""
+        calc = EquityCalculator()
+        with pytest.raises(EquityCalculationError):
+            calc.calculate_kelly_paths(np.zeros((3, 4)), 1000.0, 25.0, np.ones(2))
+
+
+class TestDrawdownEpisodes:
+    """Tests for the vectorized drawdown episode extractor."""
+
+    def test_episode_fields(self) -> None:
+        """Each underwater run becomes one episode with peak, trough and recovery."""
+        equity = np.array([100.0, 110.0, 90.0, 95.0, 120.0, 100.0, 80.0, 90.0])
+        episodes = extract_drawdown_episodes(equity)
+
+        assert len(episodes) == 2
+        np.testing.assert_array_equal(episodes.peak_index, [1, 4])
+        np.testing.assert_array_equal(episodes.start, [2, 5])
+        np.testing.assert_array_equal(episodes.trough, [2, 6])
+        np.testing.assert_array_equal(episodes.recovery, [4, -1])
+        np.testing.assert_allclose(episodes.depth, [20.0, 40.0])
+        np.testing.assert_allclose(episodes.depth_pct, [20.0 / 110.0 * 100, 40.0 / 120.0 * 100])
+        np.testing.assert_array_equal(episodes.recovered, [True, False])
+        np.testing.assert_array_equal(episodes.length, [2, 3])
+        np.testing.assert_array_equal(episodes.duration, [3, 4])
+
+    def test_no_drawdown_returns_empty(self) -> None:
+        """Monotonic equity has no episodes."""
+        episodes = extract_drawdown_episodes(np.array([1.0, 2.0, 2.0, 3.0]))
+        assert len(episodes) == 0
+        assert episodes.length.size == 0
+
+    def test_lengths_match_sequential_streaks(self) -> None:
+        """Episode lengths equal the consecutive underwater streaks of a loop."""
+        rng = np.random.default_rng(3)
+        equity = 1000.0 + np.cumsum(rng.normal(0.0, 10.0, size=5000))
+        peak = np.maximum.accumulate(equity)
+
+        streaks = []
+        current = 0
+        for e, p in zip(equity, peak, strict=True):
+            if e < p:
+                current += 1
+            elif current > 0:
+                streaks.append(current)
+                current = 0
+        if current > 0:
+            streaks.append(current)
+
+        episodes = extract_drawdown_episodes(equity, peak)
+        np.testing.assert_array_equal(episodes.length, streaks)
+        for i in range(len(episodes)):
+            segment = slice(episodes.start[i], episodes.start[i] + episodes.length[i])
+            assert episodes.depth[i] == pytest.approx(np.max(peak[segment] - equity[segment]))
+
+    def test_duration_measured_from_first_peak_of_plateau(self) -> None:
+        """Flat stretches at the peak count toward drawdown duration."""
+        df = pd.DataFrame({"gain_pct": [5.0, 0.0, -4.0, 4.0]})
+        calc = EquityCalculator()
+        metrics = calc.calculate_flat_stake_metrics(
+            df, gain_col="gain_pct", stake=1000.0, start_capital=0.0
+        )
+        # Peak of 50 established at trade 1, recovered at trade 4
+        assert metrics["dd_duration"] == 3
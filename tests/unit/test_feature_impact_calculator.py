@@ -134,6 +134,17 @@ class TestFeatureImpactCalculatorMultiFeature:
         assert "ticker" not in feature_names
         assert "date" not in feature_names
 
+    def test_trigger_columns_not_analyzed(self, multi_feature_df: pd.DataFrame):
+        """Trigger numbers and trigger group ids are bookkeeping, not features."""
+        multi_feature_df["trigger_number"] = np.arange(len(multi_feature_df)) % 3 + 1
+        multi_feature_df["_trigger_group"] = np.arange(len(multi_feature_df)) // 3
+        calculator = FeatureImpactCalculator()
+        results = calculator.calculate_all_features(df=multi_feature_df, gain_col="gain_pct")
+
+        feature_names = [r.feature_name for r in results]
+        assert "trigger_number" not in feature_names
+        assert "_trigger_group" not in feature_names
+
     def test_calculate_impact_scores(self, multi_feature_df: pd.DataFrame):
         """Test composite impact score calculation."""
         calculator = FeatureImpactCalculator()
@@ -119,3 +119,35 @@ class TestFeatureImpactTabExpansion:
         assert hasattr(tab, '_on_row_clicked')
         # Expansion widget should exist
         assert hasattr(tab, '_detail_widget') or hasattr(tab, '_expanded_row')
+
+
+class TestFeatureImpactTabColumnProjection:
+    """Tests for analysis after a column-projected load."""
+
+    def test_analyzes_columns_left_on_disk(self, app, tmp_path):
+        """Numeric columns still on disk are read and analyzed."""
+        import numpy as np
+        import pandas as pd
+
+        from src.core.column_store import ColumnStore
+
+        rng = np.random.default_rng(3)
+        full = pd.DataFrame({
+            "ticker": ["AAPL"] * 100,
+            "gain_pct": rng.normal(0, 1, 100),
+            "feature_a": rng.uniform(0, 10, 100),
+        })
+        path = tmp_path / "data.parquet"
+        full.to_parquet(path, index=False)
+
+        app_state = AppState()
+        app_state.column_store = ColumnStore(path)
+        app_state.baseline_df = full[["ticker", "gain_pct"]].copy()
+        app_state.filtered_df = app_state.baseline_df
+        app_state.first_trigger_enabled = False
+        tab = FeatureImpactTab(app_state)
+
+        tab._analyze_features()
+
+        assert [r.feature_name for r in tab._baseline_results] == ["feature_a"]
+        assert "feature_a" in app_state.baseline_df.columns
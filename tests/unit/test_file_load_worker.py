@@ -5,6 +5,7 @@ from time import sleep
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from src.core.file_load_worker import FileLoadWorker
@@ -64,6 +65,28 @@ class TestFileLoadWorkerCsvStreaming:
         assert len(df) == 3
         assert list(df.columns) == ["a", "b"]
 
+    def test_fallback_load_applies_mapping_column_types(self, csv_file, tmp_path):
+        """When streaming fails, FileLoader still reads mapped columns with their types."""
+        worker = FileLoadWorker(csv_file)
+        worker._cache_manager.cache_dir = tmp_path / "cache"
+        worker._cache_manager.cache_dir.mkdir(exist_ok=True)
+
+        finished_results = []
+        worker.finished.connect(finished_results.append)
+
+        with patch.object(
+            worker._cache_manager, "stream_csv_to_cache", side_effect=OSError("disk full")
+        ), patch.object(
+            worker._column_mapper, "load_mapping", return_value=MagicMock()
+        ), patch(
+            "src.core.file_load_worker.mapping_column_types",
+            return_value={"a": pa.float64()},
+        ):
+            worker.run()
+
+        assert len(finished_results) == 1
+        assert finished_results[0]["a"].dtype == "float64"
+
     def test_csv_emits_progress(self, csv_file, tmp_path):
         """CSV streaming path emits progress signals."""
         worker = FileLoadWorker(csv_file)
@@ -184,6 +207,30 @@ class TestFileLoadWorkerErrors:
         assert errors[0]  # non-empty error message
 
 
+class TestFileLoadWorkerCancel:
+    """Tests for cancelling a load."""
+
+    def test_cancel_emits_cancelled(self, csv_file, tmp_path):
+        """A cancelled load emits cancelled instead of finished or error."""
+        worker = FileLoadWorker(csv_file)
+        worker._cache_manager.cache_dir = tmp_path / "cache"
+        worker._cache_manager.cache_dir.mkdir(exist_ok=True)
+
+        cancelled = []
+        finished_results = []
+        errors = []
+        worker.cancelled.connect(lambda: cancelled.append(True))
+        worker.finished.connect(finished_results.append)
+        worker.error.connect(errors.append)
+
+        worker.cancel()
+        worker.run()
+
+        assert cancelled == [True]
+        assert finished_results == []
+        assert errors == []
+
+
 class TestOnStreamProgress:
     """Tests for _on_stream_progress helper."""
 
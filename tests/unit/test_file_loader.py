@@ -102,6 +102,122 @@ class TestFileLoaderLoad:
             loader.load(bad_file)
 
 
+class TestFileLoaderPyarrowEngine:
+    """Tests for the pyarrow CSV engine."""
+
+    def test_matches_pandas_engine(self, tmp_path: Path) -> None:
+        """pyarrow engine returns the same frame as pd.read_csv."""
+        path = tmp_path / "trades.csv"
+        path.write_text(
+            "ticker,date,time,gain_pct,volume,note\n"
+            "AAA,2024-01-02,09:30:00,0.05,100,\n"
+            "BBB,2024-01-03,10:00:00,,200,\n"
+            "CCC,2024-01-04,10:30:00,-0.1,300,\n"
+        )
+
+        expected = pd.read_csv(path)
+        result = FileLoader(csv_engine="pyarrow").load(path)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_explicit_column_types(self, tmp_path: Path) -> None:
+        """Explicit types from the mapping override inference."""
+        import pyarrow as pa
+
+        path = tmp_path / "trades.csv"
+        path.write_text("gain_pct,volume\n1,100\n2,200\n")
+
+        result = FileLoader(csv_engine="pyarrow").load(
+            path, column_types={"gain_pct": pa.float64()}
+        )
+
+        assert result["gain_pct"].dtype == "float64"
+        assert result["volume"].dtype == "int64"
+
+    def test_falls_back_to_pandas_on_late_type_change(self, tmp_path: Path) -> None:
+        """A column whose type changes after the first block still loads."""
+        path = tmp_path / "trades.csv"
+        rows = [f"{i}" for i in range(200_000)] + ["1.5"]
+        path.write_text("value\n" + "\n".join(rows) + "\n")
+
+        result = FileLoader(csv_engine="pyarrow").load(path)
+
+        assert len(result) == 200_001
+        assert result["value"].iloc[-1] == 1.5
+
+    def test_mapping_column_types(self) -> None:
+        """Mapped numeric columns are typed float64; others are left to inference."""
+        import pyarrow as pa
+
+        from src.core.file_loader import mapping_column_types
+        from src.core.models import ColumnMapping
+
+        mapping = ColumnMapping(
+            ticker="ticker", date="date", time="time",
+            gain_pct="gain", mae_pct="mae", mfe_pct="mfe",
+            price_10_min_after="p10",
+        )
+
+        assert mapping_column_types(mapping) == {
+            "gain": pa.float64(), "mae": pa.float64(), "mfe": pa.float64(), "p10": pa.float64(),
+        }
+
+    def test_invalid_engine_raises(self) -> None:
+        """Unknown CSV engines are rejected."""
+        with pytest.raises(ValueError, match="Unsupported CSV engine"):
+            FileLoader(csv_engine="polars")
+
+
+class TestFileLoaderXlsxStreaming:
+    """Tests for the row-streaming .xlsx reader."""
+
+    def test_matches_read_excel(self, tmp_path: Path) -> None:
+        """Streaming reader produces the same frame as pd.read_excel."""
+        import numpy as np
+
+        path = tmp_path / "trades.xlsx"
+        df = pd.DataFrame({
+            "ticker": ["AAA", None, "CCC"],
+            "date": pd.to_datetime(["2024-01-02", "2024-01-03", None]),
+            "gain_pct": [0.05, np.nan, 2.0],
+            "count": [1, 2, 3],
+        })
+        df.to_excel(path, index=False, sheet_name="Trades")
+
+        expected = pd.read_excel(path, sheet_name="Trades", engine="openpyxl")
+        result = FileLoader().load(path, "Trades")
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_reports_row_progress(self, tmp_path: Path, monkeypatch) -> None:
+        """Progress is reported while rows are read and ends at 100."""
+        monkeypatch.setattr(FileLoader, "XLSX_PROGRESS_ROWS", 10)
+        path = tmp_path / "trades.xlsx"
+        pd.DataFrame({"a": range(50)}).to_excel(path, index=False)
+
+        progress: list[int] = []
+        FileLoader().load(path, progress_callback=progress.append)
+
+        assert len(progress) > 1
+        assert progress == sorted(progress)
+        assert progress[-1] == 100
+
+    def test_cancel_raises(self, tmp_path: Path, monkeypatch) -> None:
+        """A set cancel event stops the read with LoadCancelledError."""
+        import threading
+
+        from src.core.exceptions import LoadCancelledError
+
+        monkeypatch.setattr(FileLoader, "XLSX_PROGRESS_ROWS", 10)
+        path = tmp_path / "trades.xlsx"
+        pd.DataFrame({"a": range(50)}).to_excel(path, index=False)
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(LoadCancelledError):
+            FileLoader().load(path, cancel_event=cancel)
+
+
 class TestPrecomputedColumns:
     """Tests for pre-computed columns on load."""
 
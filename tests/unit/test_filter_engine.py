@@ -1,5 +1,6 @@
 """Unit tests for FilterEngine."""
 
+import numpy as np
 import pandas as pd
 
 from src.core.filter_engine import FilterEngine
@@ -366,3 +367,92 @@ class TestApplyTimeRange:
         """Should return original df if time column doesn't exist."""
         result = FilterEngine.apply_time_range(sample_trades, "nonexistent", "09:30:00", "10:00:00")
         assert len(result) == len(sample_trades)
+
+
+class TestFilterEngineMaskCache:
+    """Tests for per-criterion mask caching."""
+
+    def test_unchanged_criteria_reuse_cached_mask(self, sample_trades: pd.DataFrame) -> None:
+        """Re-applying a criterion returns the cached mask."""
+        engine = FilterEngine()
+        criteria = FilterCriteria(column="gain_pct", operator="between", min_val=0, max_val=10)
+
+        first = engine.criteria_mask(sample_trades, criteria)
+        second = engine.criteria_mask(sample_trades, criteria)
+
+        assert second is first
+
+    def test_replaced_column_invalidates_masks(self, sample_trades: pd.DataFrame) -> None:
+        """Assigning a new column array recomputes its masks."""
+        engine = FilterEngine()
+        df = sample_trades.copy()
+        criteria = FilterCriteria(column="gain_pct", operator="between", min_val=0, max_val=10)
+        engine.criteria_mask(df, criteria)
+
+        df["gain_pct"] = df["gain_pct"] + 100
+
+        assert not engine.criteria_mask(df, criteria).any()
+
+    def test_blank_operators_match_criteria_apply(self) -> None:
+        """Compiled masks treat NaN the same way as FilterCriteria.apply."""
+        engine = FilterEngine()
+        df = pd.DataFrame({"value": [1.0, None, 5.0, 20.0]})
+
+        for operator in ("between", "not_between", "between_blanks", "not_between_blanks"):
+            criteria = FilterCriteria(column="value", operator=operator, min_val=0, max_val=10)
+            assert (
+                engine.criteria_mask(df, criteria).tolist() == criteria.apply(df).tolist()
+            )
+
+    def test_filter_rows_returns_positions(self, sample_trades: pd.DataFrame) -> None:
+        """filter_rows gives positions into the source frame."""
+        engine = FilterEngine()
+        filters = [FilterCriteria(column="gain_pct", operator="between", min_val=0, max_val=10)]
+
+        rows = engine.filter_rows(sample_trades, filters)
+
+        pd.testing.assert_frame_equal(
+            sample_trades.take(rows), engine.apply_filters(sample_trades, filters)
+        )
+
+
+class TestFilterEngineRangeIndex:
+    """Tests for range-index filtering."""
+
+    @staticmethod
+    def _frame() -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=500)
+        values[::37] = np.nan
+        return pd.DataFrame({
+            "a": values,
+            "b": rng.integers(0, 100, size=500),
+        })
+
+    def test_matches_mask_path_for_all_operators(self) -> None:
+        """Range-index selections equal whole-column masks, NaN included."""
+        df = self._frame()
+        indexed = FilterEngine(range_index=True)
+        plain = FilterEngine()
+
+        for operator in ("between", "not_between", "between_blanks", "not_between_blanks"):
+            for min_val, max_val in ((-0.05, 0.05), (None, -2.5), (2.5, None)):
+                filters = [
+                    FilterCriteria(column="a", operator=operator, min_val=min_val, max_val=max_val),
+                    FilterCriteria(column="b", operator="between", min_val=10, max_val=90),
+                ]
+                assert (
+                    indexed.filter_rows(df, filters).tolist()
+                    == plain.filter_rows(df, filters).tolist()
+                )
+
+    def test_criteria_rows_resolves_slice(self) -> None:
+        """A between criterion resolves to the rows inside the range."""
+        df = pd.DataFrame({"a": [5.0, 1.0, np.nan, 3.0, 2.0]})
+        engine = FilterEngine(range_index=True)
+
+        rows = engine.criteria_rows(
+            df, FilterCriteria(column="a", operator="between", min_val=2, max_val=4)
+        )
+
+        assert rows.tolist() == [4, 3]
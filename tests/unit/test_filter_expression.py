@@ -0,0 +1,138 @@
+"""Unit tests for the filter expression language."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.exceptions import FilterExpressionError
+from src.core.filter_engine import FilterEngine
+from src.core.filter_expression import (
+    And,
+    Compare,
+    FilterExpression,
+    Literal,
+    _Evaluator,
+)
+from src.core.models import FilterCriteria
+from src.core.time_utils import TIME_MINUTES_COLUMN
+
+
+@pytest.fixture
+def trades() -> pd.DataFrame:
+    """Small trade frame with numeric, categorical and missing values."""
+    return pd.DataFrame({
+        "ticker": ["AAPL", "MSFT", "TSLA", "AAPL", None],
+        "gain_pct": [1.5, -2.0, 3.0, np.nan, 0.5],
+        "mae_pct": [1.0, 3.0, 1.0, 2.0, 0.2],
+        "mfe_pct": [2.5, 1.0, 4.0, 1.0, 0.6],
+        "time": ["09:31:00", "10:15:00", "11:00:00", "09:45:00", "15:30:00"],
+        "is_gap": [True, False, True, True, False],
+    })
+
+
+def rows(expression: str, df: pd.DataFrame, **kwargs) -> list[int]:
+    """Positions of the rows an expression selects."""
+    return np.flatnonzero(FilterExpression(expression).mask(df, **kwargs)).tolist()
+
+
+class TestFilterExpressionEvaluation:
+    """Tests for what expressions select."""
+
+    def test_boolean_operators_and_precedence(self, trades):
+        assert rows("gain_pct > 0 and mae_pct < 1.5 or ticker = 'MSFT'", trades) == [0, 1, 2, 4]
+        assert rows("gain_pct > 0 and (mae_pct < 0.5 or ticker = 'TSLA')", trades) == [2, 4]
+        assert rows("not gain_pct > 0", trades) == [1, 3]
+
+    def test_column_comparison_and_arithmetic(self, trades):
+        assert rows("mfe_pct >= 2 * mae_pct", trades) == [0, 2, 4]
+        assert rows("gain_pct - mae_pct > 0", trades) == [0, 2, 4]
+
+    def test_in_lists(self, trades):
+        assert rows("ticker in ('AAPL', 'TSLA')", trades) == [0, 2, 3]
+        # Missing values are in no list, and pass no "not in" either
+        assert rows("ticker not in ('AAPL')", trades) == [1, 2]
+
+    def test_between_matches_filter_criteria(self, trades):
+        criteria = FilterCriteria("gain_pct", "between", 0.5, 2.0)
+
+        expected = np.flatnonzero(criteria.apply(trades)).tolist()
+
+        assert rows("gain_pct between 0.5 and 2", trades) == expected
+
+    def test_missing_values(self, trades):
+        assert rows("gain_pct < 100", trades) == [0, 1, 2, 4]
+        assert rows("gain_pct is null", trades) == [3]
+        assert rows("ticker is not null and gain_pct is not null", trades) == [0, 1, 2]
+
+    def test_time_of_day_uses_mapped_time_column(self, trades):
+        assert rows("time_of_day < 10:00", trades, time_col="time") == [0, 3]
+        assert rows("time_of_day between 9:45 and 11:00", trades, time_col="time") == [1, 2, 3]
+
+    def test_time_of_day_prefers_minutes_column(self, trades):
+        trades[TIME_MINUTES_COLUMN] = [600.0, 600.0, 600.0, 600.0, 540.0]
+
+        assert rows("time_of_day < 10:00", trades) == [4]
+
+    def test_boolean_column_and_backquoted_name(self, trades):
+        trades["gain %"] = trades["gain_pct"]
+
+        assert rows("is_gap and `gain %` > 1", trades) == [0, 2]
+
+    def test_keywords_are_case_insensitive(self, trades):
+        assert rows("gain_pct > 0 AND NOT ticker IN ('AAPL')", trades) == [2, 4]
+
+    def test_uses_engine_column_cache(self, trades):
+        engine = FilterEngine()
+        FilterExpression("gain_pct > 0").mask(trades, engine)
+
+        assert engine.column_values(trades, "gain_pct") is engine.column_values(
+            trades, "gain_pct"
+        )
+
+
+class TestFilterExpressionCompilation:
+    """Tests for parsing, folding and ordering."""
+
+    def test_constant_folding(self):
+        expression = FilterExpression("gain_pct > 2 * 3 and (1 < 2 or mae_pct > 1)")
+
+        assert expression._root == Compare(">", expression._root.left, Literal(6.0))
+
+    def test_constant_on_left_is_flipped(self):
+        expression = FilterExpression("5 <= gain_pct")
+
+        assert expression._root.op == ">="
+        assert expression._root.right == Literal(5.0)
+
+    def test_always_false_expression_selects_nothing(self, trades):
+        assert rows("gain_pct > 0 and 1 > 2", trades) == []
+
+    def test_columns(self):
+        expression = FilterExpression("mfe_pct > mae_pct or ticker in ('AAPL')")
+
+        assert expression.columns == ["mae_pct", "mfe_pct", "ticker"]
+
+    def test_and_terms_ordered_by_selectivity(self, trades):
+        expression = FilterExpression("mae_pct < 100 and ticker = 'TSLA'")
+        evaluator = _Evaluator(trades, FilterEngine(), None)
+
+        ordered = evaluator.order(expression._root, np.arange(len(trades)))
+
+        assert isinstance(ordered, And)
+        assert ordered.terms[0].right == Literal("TSLA")
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "gain_pct >", "gain_pct > 1 and", "(gain_pct > 1", "ticker in 'AAPL'", "a $ b"],
+    )
+    def test_syntax_errors(self, text):
+        with pytest.raises(FilterExpressionError):
+            FilterExpression(text)
+
+    def test_unknown_column(self, trades):
+        with pytest.raises(FilterExpressionError, match="Unknown column"):
+            FilterExpression("missing > 1").mask(trades)
+
+    def test_type_mismatch(self, trades):
+        with pytest.raises(FilterExpressionError):
+            FilterExpression("ticker > 1").mask(trades)
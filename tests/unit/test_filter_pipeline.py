@@ -0,0 +1,207 @@
+"""Unit tests for the incremental FilterPipeline."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.filter_engine import FilterEngine
+from src.core.filter_expression import FilterExpression
+from src.core.filter_pipeline import FilterPipeline
+from src.core.first_trigger import FirstTriggerEngine, TriggerGroups
+from src.core.models import FilterCriteria
+
+FIRST_TRIGGER_COLS = ("ticker", "date", "time")
+
+
+@pytest.fixture
+def baseline() -> pd.DataFrame:
+    """Trades over a few tickers and days, with some missing values."""
+    rng = np.random.default_rng(7)
+    n = 400
+    gain = rng.normal(0, 5, n)
+    gain[::37] = np.nan
+    return pd.DataFrame({
+        "ticker": rng.choice(["AAPL", "MSFT", "TSLA", "NVDA"], n),
+        "date": rng.choice(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"], n),
+        "time": [
+            f"{h:02d}:{m:02d}:00"
+            for h, m in zip(rng.integers(9, 16, n), rng.integers(0, 60, n), strict=True)
+        ],
+        "gain_pct": gain,
+        "volume": rng.integers(0, 1000, n).astype(float),
+    })
+
+
+def full_chain(
+    df: pd.DataFrame,
+    filters: list[FilterCriteria],
+    date_range: tuple[str | None, str | None] | None = None,
+    time_range: tuple[str | None, str | None] | None = None,
+    first_trigger: bool = False,
+) -> pd.DataFrame:
+    """Recompute the explorer's chain from scratch."""
+    engine = FilterEngine()
+    result = engine.apply_filters(df, filters)
+    if date_range is not None:
+        result = engine.apply_date_range(result, "date", *date_range)
+    if time_range is not None:
+        result = FilterEngine.apply_time_range(result, "time", *time_range)
+    if first_trigger:
+        result = FirstTriggerEngine().apply_filtered(result, *FIRST_TRIGGER_COLS)
+    return result
+
+
+def run(
+    pipeline: FilterPipeline,
+    df: pd.DataFrame,
+    filters: list[FilterCriteria],
+    date_range: tuple[str | None, str | None] | None = None,
+    time_range: tuple[str | None, str | None] | None = None,
+    first_trigger: bool = False,
+) -> pd.DataFrame:
+    """Update the pipeline and return its view."""
+    rows = pipeline.update(
+        df,
+        filters,
+        date_col="date" if date_range else None,
+        date_start=date_range[0] if date_range else None,
+        date_end=date_range[1] if date_range else None,
+        time_col="time" if time_range else None,
+        time_start=time_range[0] if time_range else None,
+        time_end=time_range[1] if time_range else None,
+        first_trigger_cols=FIRST_TRIGGER_COLS if first_trigger else None,
+    )
+    return df.take(rows)
+
+
+class TestFilterPipeline:
+    """The pipeline matches the full chain after every kind of change."""
+
+    @pytest.mark.parametrize("first_trigger", [False, True])
+    def test_sequence_of_changes_matches_full_chain(self, baseline, first_trigger):
+        steps = [
+            ([FilterCriteria("gain_pct", "between", -5.0, 5.0)], None, None),
+            # Tighten, then loosen past the original bound
+            ([FilterCriteria("gain_pct", "between", -2.0, 3.0)], None, None),
+            ([FilterCriteria("gain_pct", "between", -8.0, None)], None, None),
+            # Add a second filter and a date range
+            (
+                [
+                    FilterCriteria("gain_pct", "between", -8.0, None),
+                    FilterCriteria("volume", "not_between", 200.0, 600.0),
+                ],
+                ("2024-01-03", "2024-01-04"),
+                None,
+            ),
+            # Widen the excluded range of a not_between filter (narrows the view)
+            (
+                [
+                    FilterCriteria("gain_pct", "between", -8.0, None),
+                    FilterCriteria("volume", "not_between", 100.0, 700.0),
+                ],
+                ("2024-01-03", "2024-01-04"),
+                ("10:00:00", "14:00:00"),
+            ),
+            # Shift the time window (one bound up, one down)
+            (
+                [FilterCriteria("volume", "not_between", 100.0, 700.0)],
+                ("2024-01-03", None),
+                ("09:30:00", "12:00:00"),
+            ),
+            ([FilterCriteria("gain_pct", "between_blanks", 0.0, 4.0)], None, None),
+            ([], None, None),
+        ]
+        pipeline = FilterPipeline()
+
+        for filters, date_range, time_range in steps:
+            result = run(pipeline, baseline, filters, date_range, time_range, first_trigger)
+            expected = full_chain(baseline, filters, date_range, time_range, first_trigger)
+
+            assert result.index.tolist() == expected.index.tolist()
+
+    def test_narrowing_checks_only_passing_rows(self, baseline, monkeypatch):
+        engine = FilterEngine()
+        pipeline = FilterPipeline(engine)
+        run(pipeline, baseline, [FilterCriteria("volume", "between", 0.0, 100.0)])
+        passing = pipeline.filtered_count
+
+        checked = []
+        evaluate = engine.criteria_mask_at
+        monkeypatch.setattr(
+            engine,
+            "criteria_mask_at",
+            lambda df, criteria, rows: checked.append(len(rows)) or evaluate(df, criteria, rows),
+        )
+        run(pipeline, baseline, [FilterCriteria("volume", "between", 0.0, 50.0)])
+
+        assert checked == [passing]
+
+    def test_loosening_checks_only_excluded_rows(self, baseline, monkeypatch):
+        engine = FilterEngine()
+        pipeline = FilterPipeline(engine)
+        run(pipeline, baseline, [FilterCriteria("volume", "between", 0.0, 100.0)])
+        excluded = len(baseline) - pipeline.filtered_count
+
+        checked = []
+        evaluate = engine.criteria_mask_at
+        monkeypatch.setattr(
+            engine,
+            "criteria_mask_at",
+            lambda df, criteria, rows: checked.append(len(rows)) or evaluate(df, criteria, rows),
+        )
+        run(pipeline, baseline, [FilterCriteria("volume", "between", 0.0, 500.0)])
+
+        assert checked == [excluded]
+
+    def test_single_comparison_expression(self, baseline):
+        pipeline = FilterPipeline()
+        rows = pipeline.update(baseline, [], expression=FilterExpression("gain_pct > 0"))
+
+        expected = np.flatnonzero(baseline["gain_pct"].to_numpy() > 0)
+
+        assert rows.tolist() == expected.tolist()
+        assert pipeline.filtered_count == len(expected)
+
+    def test_new_baseline_starts_over(self, baseline):
+        pipeline = FilterPipeline()
+        filters = [FilterCriteria("gain_pct", "between", 0.0, None)]
+        run(pipeline, baseline, filters)
+
+        other = baseline.iloc[:100].copy()
+        result = run(pipeline, other, filters)
+
+        assert result.index.tolist() == full_chain(other, filters).index.tolist()
+
+    def test_replaced_column_is_reevaluated(self, baseline):
+        pipeline = FilterPipeline()
+        filters = [FilterCriteria("gain_pct", "between", 0.0, None)]
+        run(pipeline, baseline, filters)
+
+        baseline["gain_pct"] = -baseline["gain_pct"]
+        result = run(pipeline, baseline, filters)
+
+        assert result.index.tolist() == full_chain(baseline, filters).index.tolist()
+
+
+class TestTriggerGroups:
+    """Tests for the precomputed ticker-date groups."""
+
+    def test_first_rows_match_apply_filtered(self, baseline):
+        groups = TriggerGroups.build(baseline, *FIRST_TRIGGER_COLS)
+        mask = (baseline["volume"] > 300).to_numpy()
+
+        expected = FirstTriggerEngine().apply_filtered(baseline[mask], *FIRST_TRIGGER_COLS)
+
+        assert groups.first_rows(mask).tolist() == expected.index.tolist()
+
+    def test_first_positions_for_subset_of_groups(self, baseline):
+        groups = TriggerGroups.build(baseline, *FIRST_TRIGGER_COLS)
+        mask = (baseline["gain_pct"] > 0).to_numpy()
+        all_found, all_positions = groups.first_positions(mask)
+
+        subset = np.array([0, 3, groups.num_groups - 1])
+        found, positions = groups.first_positions(mask, subset)
+
+        keep = np.isin(all_found, subset)
+        assert found.tolist() == all_found[keep].tolist()
+        assert positions.tolist() == all_positions[keep].tolist()
@@ -75,6 +75,24 @@ class TestFilterPresetManager:
         assert loaded.time_range == sample_preset.time_range
         assert loaded.first_trigger_only == sample_preset.first_trigger_only
 
+    def test_expression_round_trip(self, manager, sample_preset):
+        """Test that a filter expression is saved and loaded."""
+        sample_preset.expression = "gain_pct > 0 and ticker in ('AAPL', 'MSFT')"
+        manager.save(sample_preset)
+
+        loaded = manager.load("Test Preset")
+
+        assert loaded.expression == sample_preset.expression
+
+    def test_load_preset_without_expression(self, manager, sample_preset, temp_dir):
+        """Test that presets saved before expressions load with none."""
+        path = manager.save(sample_preset)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        del data["filters"]["expression"]
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert manager.load("Test Preset").expression is None
+
     def test_load_nonexistent_raises(self, manager):
         """Test that loading nonexistent preset raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
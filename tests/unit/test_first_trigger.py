@@ -6,7 +6,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.core.first_trigger import FirstTriggerEngine
+from src.core.first_trigger import TRIGGER_GROUP_COLUMN, FirstTriggerEngine, TriggerGroups
 
 
 @pytest.fixture
@@ -214,6 +214,82 @@ class TestFirstTriggerApplyFiltered:
         assert "custom_col" in result.columns
 
 
+class TestFirstTriggerStoredKeys:
+    """Tests for first trigger on frames carrying mapping-time group keys."""
+
+    @pytest.fixture
+    def mapped(self, engine: FirstTriggerEngine) -> pd.DataFrame:
+        """Baseline with trigger numbers and group ids assigned."""
+        rng = np.random.default_rng(3)
+        n_rows = 300
+        df = pd.DataFrame(
+            {
+                "ticker": rng.choice(["AAPL", "MSFT", "TSLA"], n_rows),
+                "date": rng.choice(["2024-01-01", "2024-01-02", "2024-01-03"], n_rows),
+                "time": rng.choice(["09:30", "09:45", "10:00", "10:15", None], n_rows),
+                "gain_pct": rng.normal(0, 3, n_rows),
+            }
+        )
+        return engine.assign_trigger_numbers(df, "ticker", "date", "time")
+
+    def test_assign_numbers_groups_in_sort_order(
+        self, engine: FirstTriggerEngine, mapped: pd.DataFrame
+    ) -> None:
+        """Group ids are dense and follow ticker/date order."""
+        keys = mapped.sort_values(["ticker", "date"])[TRIGGER_GROUP_COLUMN]
+
+        assert keys.is_monotonic_increasing
+        assert sorted(keys.unique()) == list(range(keys.nunique()))
+
+    def test_apply_filtered_matches_sorted_selection(
+        self, engine: FirstTriggerEngine, mapped: pd.DataFrame
+    ) -> None:
+        """Stored keys give the same rows, in the same order, as sorting."""
+        filtered = mapped[mapped["gain_pct"] > 0]
+
+        result = engine.apply_filtered(filtered, "ticker", "date", "time")
+        expected = (
+            filtered.sort_values(["ticker", "date", "time"], na_position="first", kind="stable")
+            .drop_duplicates(subset=["ticker", "date"], keep="first")
+        )
+
+        assert result.index.tolist() == expected.index.tolist()
+
+    def test_apply_filtered_does_not_sort_with_stored_keys(
+        self, engine: FirstTriggerEngine, mapped: pd.DataFrame, monkeypatch
+    ) -> None:
+        """Subsets of the mapped baseline reuse the stored keys."""
+        def fail(*args, **kwargs):
+            raise AssertionError("key columns were sorted")
+
+        monkeypatch.setattr(TriggerGroups, "build", fail)
+        mask = engine.first_trigger_mask(mapped[mapped["gain_pct"] < 1], "ticker", "date", "time")
+
+        assert mask.sum() > 0
+
+    def test_from_keys_rejects_subset(self, mapped: pd.DataFrame) -> None:
+        """Keys of a subset do not rank every group completely."""
+        subset = mapped.iloc[::2]
+
+        groups = TriggerGroups.from_keys(
+            subset[TRIGGER_GROUP_COLUMN].to_numpy(),
+            subset["trigger_number"].to_numpy() - 1,
+        )
+
+        assert groups is None
+
+    def test_from_keys_rebuilds_sort_order(self, mapped: pd.DataFrame) -> None:
+        """Full keys reproduce the order of sorting the key columns."""
+        rebuilt = TriggerGroups.from_keys(
+            mapped[TRIGGER_GROUP_COLUMN].to_numpy(),
+            mapped["trigger_number"].to_numpy() - 1,
+        )
+        sorted_groups = TriggerGroups.build(mapped, "ticker", "date", "time")
+
+        assert rebuilt is not None
+        assert rebuilt.order.tolist() == sorted_groups.order.tolist()
+
+
 class TestFirstTriggerPerformance:
     """Performance tests for FirstTriggerEngine."""
 
@@ -28,3 +28,61 @@ def test_change_columns_computed_from_price_mapping():
     assert "change_30_min" in result.columns
     # (100 - 98) / 100 = 0.02
     assert abs(result["change_10_min"].iloc[0] - 0.02) < 0.001
+
+
+def _run_worker(worker):
+    """Run a MappingWorker synchronously and return its MappingResult."""
+    results = []
+    errors = []
+    worker.finished.connect(results.append)
+    worker.error.connect(errors.append)
+    worker.run()
+    assert errors == []
+    return results[0]
+
+
+def test_derived_columns_restored_from_cache(tmp_path):
+    """A second run on the same file reuses cached trigger/derived columns."""
+    from unittest.mock import patch
+
+    from src.core.cache_manager import CacheManager
+    from src.core.mapping_worker import MappingWorker
+    from src.core.models import AdjustmentParams
+
+    df = pd.DataFrame({
+        "ticker": ["AAA", "AAA", "BBB", "AAA"],
+        "date": ["01/01/2024", "01/01/2024", "01/01/2024", "02/01/2024"],
+        "time": ["10:00:00", "09:30:00", "09:45:00", "09:31:00"],
+        "gain_pct": [0.05, -0.02, 0.10, -0.08],
+        "mae_pct": [3.0, 12.0, 1.0, 40.0],
+        "mfe_pct": [8.0, 2.0, 15.0, 1.0],
+        "trigger_price_unadjusted": [10.0, 10.0, 20.0, 5.0],
+        "price_10m": [9.5, 10.5, 19.0, 5.5],
+    })
+    mapping = ColumnMapping(
+        ticker="ticker", date="date", time="time",
+        gain_pct="gain_pct", mae_pct="mae_pct", mfe_pct="mfe_pct",
+        price_10_min_after="price_10m",
+    )
+    source = tmp_path / "trades.csv"
+    df.to_csv(source, index=False)
+    cache = CacheManager(cache_dir=tmp_path / "cache")
+
+    def make_worker():
+        return MappingWorker(
+            df, mapping, AdjustmentParams(stop_loss=20, efficiency=5),
+            flat_stake=1000.0, start_capital=10000.0,
+            source_path=source, cache_manager=cache,
+        )
+
+    first = _run_worker(make_worker())
+    with patch(
+        "src.core.mapping_worker.FirstTriggerEngine.assign_trigger_numbers"
+    ) as assign:
+        second = _run_worker(make_worker())
+
+    assign.assert_not_called()
+    pd.testing.assert_frame_equal(second.baseline_df, first.baseline_df)
+    pd.testing.assert_frame_equal(second.first_triggers_df, first.first_triggers_df)
+    assert second.metrics == first.metrics
+    assert first.baseline_df["trigger_number"].tolist() == [2, 1, 1, 1]
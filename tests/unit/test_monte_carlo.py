@@ -9,7 +9,12 @@ from src.core.monte_carlo import (
     MonteCarloEngine,
     MonteCarloResults,
     PositionSizingMode,
+    _auto_block_length,
+    _day_group_indices,
+    _moving_block_indices,
+    _stationary_block_indices,
     extract_gains_from_app_state,
+    extract_trade_days_from_app_state,
 )
 
 
@@ -683,3 +688,430 @@ class TestFractionalKellyPositionSizing:
         # The difference should be dramatic
         difference = low_kelly_equity[9] - high_kelly_equity[9]
         assert difference > 15000  # At least $15k difference
+
+
+def _reference_metrics(
+    engine: MonteCarloEngine, sampled: np.ndarray, initial_capital: float
+) -> dict[str, float]:
+    """Per-simulation metrics computed the scalar way, one path at a time."""
+    equity = engine._simulate_equity_curve(sampled, initial_capital)
+    running_max = np.maximum.accumulate(equity)
+    max_dd = float(np.max((running_max - equity) / running_max))
+    years = len(sampled) / 252.0
+    cagr = (equity[-1] / initial_capital) ** (1 / years) - 1
+
+    mean_return = np.mean(sampled)
+    std_return = np.std(sampled)
+    downside = sampled[sampled < 0]
+    downside_std = np.std(downside) if len(downside) > 0 else np.nan
+    if downside_std > 0 and not np.isnan(downside_std):
+        sortino = mean_return / downside_std * np.sqrt(252)
+    else:
+        sortino = 0.0 if mean_return <= 0 else np.inf
+
+    def longest_run(mask: np.ndarray) -> int:
+        best = current = 0
+        for value in mask:
+            current = current + 1 if value else 0
+            best = max(best, current)
+        return best
+
+    in_dd = equity < running_max
+    durations = []
+    current = 0
+    for value in in_dd:
+        if value:
+            current += 1
+        elif current:
+            durations.append(current)
+            current = 0
+    if current:
+        durations.append(current)
+
+    winners = sampled[sampled > 0].sum()
+    losers = abs(sampled[sampled < 0].sum())
+    return {
+        "max_dd": max_dd,
+        "final_equity": equity[-1],
+        "min_equity": equity.min(),
+        "cagr": cagr,
+        "sharpe": mean_return / std_return * np.sqrt(252) if std_return > 0 else 0.0,
+        "sortino": sortino,
+        "calmar": cagr / max_dd if max_dd > 0 else (np.inf if cagr > 0 else 0.0),
+        "win_streak": longest_run(sampled > 0),
+        "loss_streak": longest_run(sampled < 0),
+        "profit_factor": winners / losers if losers > 0 else (np.inf if winners > 0 else 0.0),
+        "avg_dd_duration": float(np.mean(durations)) if durations else 0.0,
+        "max_dd_duration": max(durations) if durations else 0,
+    }
+
+
+class TestBatchedEngine:
+    """Tests for the batched (vectorized) simulation path."""
+
+    @pytest.mark.parametrize(
+        "mode",
+        [
+            PositionSizingMode.COMPOUNDED_KELLY,
+            PositionSizingMode.COMPOUNDED_CUSTOM,
+            PositionSizingMode.FLAT_STAKE,
+        ],
+    )
+    def test_batch_metrics_match_scalar_path(self, mode: PositionSizingMode) -> None:
+        """Batched metrics match a per-simulation scalar computation."""
+        config = MonteCarloConfig(num_simulations=100, position_sizing_mode=mode, seed=7)
+        engine = MonteCarloEngine(config)
+        gains = np.random.default_rng(1).normal(0.002, 0.03, 300)
+        sampled = engine._sample_batch(gains, 50)
+
+        _, batch = engine._calculate_batch_metrics(sampled, config.initial_capital)
+
+        for row in range(len(sampled)):
+            expected = _reference_metrics(engine, sampled[row], config.initial_capital)
+            for name, value in expected.items():
+                np.testing.assert_allclose(
+                    getattr(batch, name)[row], value, rtol=1e-9, err_msg=name
+                )
+
+    def test_seeded_runs_are_reproducible(self) -> None:
+        """Two runs with the same seed produce identical distributions."""
+        gains = np.random.default_rng(3).normal(0.005, 0.02, 200)
+        config = MonteCarloConfig(num_simulations=500, seed=123)
+
+        first = MonteCarloEngine(config).run(gains)
+        second = MonteCarloEngine(config).run(gains)
+
+        np.testing.assert_array_equal(first.max_dd_distribution, second.max_dd_distribution)
+        np.testing.assert_array_equal(first.equity_percentiles, second.equity_percentiles)
+
+    def test_results_independent_of_memory_budget_layout(self) -> None:
+        """Small memory budgets split the run into more batches without errors."""
+        gains = np.random.default_rng(4).normal(0.005, 0.02, 500)
+        config = MonteCarloConfig(num_simulations=300, memory_budget_mb=0.5)
+        engine = MonteCarloEngine(config)
+
+        progress_calls = []
+        results = engine.run(gains, progress_callback=lambda c, t: progress_calls.append(c))
+
+        assert engine._batch_size(300, 500) < 300
+        assert len(progress_calls) > 1
+        assert progress_calls[-1] == 300
+        assert np.all(results.final_equity_distribution > 0)
+
+    def test_batch_size_respects_memory_budget(self) -> None:
+        """Batch size shrinks as the number of trades grows."""
+        engine = MonteCarloEngine(MonteCarloConfig(memory_budget_mb=64.0))
+        assert engine._batch_size(5000, 100) == 1000
+        assert engine._batch_size(5000, 100_000) == 10
+        assert engine._batch_size(5000, 10_000_000) == 1
+
+    def test_invalid_memory_budget(self) -> None:
+        """Validation rejects non-positive memory budget."""
+        with pytest.raises(ValueError, match="memory_budget_mb must be positive"):
+            MonteCarloConfig(memory_budget_mb=0)
+
+
+class TestParallelEngine:
+    """Tests for multi-process execution with per-batch seed streams."""
+
+    @pytest.fixture
+    def gains(self) -> np.ndarray:
+        """Gains array large enough to span several batches."""
+        return np.random.default_rng(11).normal(0.004, 0.025, 400)
+
+    @pytest.fixture(autouse=True)
+    def force_parallel(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Use the process pool even for small test workloads."""
+        from src.core import monte_carlo
+
+        monkeypatch.setattr(monte_carlo, "_MIN_PARALLEL_CELLS", 0)
+
+    def test_results_identical_for_any_worker_count(self, gains: np.ndarray) -> None:
+        """A seed reproduces bit-identical results for 1 and several workers."""
+        base = dict(num_simulations=600, seed=2024, memory_budget_mb=0.5)
+        serial = MonteCarloEngine(MonteCarloConfig(**base, num_workers=1)).run(gains)
+        parallel = MonteCarloEngine(MonteCarloConfig(**base, num_workers=3)).run(gains)
+
+        np.testing.assert_array_equal(serial.max_dd_distribution, parallel.max_dd_distribution)
+        np.testing.assert_array_equal(
+            serial.final_equity_distribution, parallel.final_equity_distribution
+        )
+        np.testing.assert_array_equal(serial.equity_percentiles, parallel.equity_percentiles)
+
+    def test_parallel_progress_reaches_total(self, gains: np.ndarray) -> None:
+        """Progress is reported monotonically across workers and ends at total."""
+        config = MonteCarloConfig(num_simulations=500, memory_budget_mb=0.5, num_workers=2)
+        progress_calls = []
+
+        MonteCarloEngine(config).run(gains, progress_callback=lambda c, t: progress_calls.append(c))
+
+        assert progress_calls == sorted(progress_calls)
+        assert progress_calls[-1] == 500
+
+    def test_parallel_cancellation_stops_early(self, gains: np.ndarray) -> None:
+        """Cancelling stops a parallel run before all batches are evaluated."""
+        config = MonteCarloConfig(num_simulations=50000, memory_budget_mb=0.5, num_workers=2)
+        engine = MonteCarloEngine(config)
+        completed_count = 0
+
+        def progress_callback(completed: int, total: int) -> None:
+            nonlocal completed_count
+            completed_count = completed
+            engine.cancel()
+
+        engine.run(gains, progress_callback=progress_callback)
+
+        assert completed_count < 50000
+
+    def test_invalid_num_workers(self) -> None:
+        """Validation rejects fewer than one worker."""
+        with pytest.raises(ValueError, match="num_workers must be at least 1"):
+            MonteCarloConfig(num_workers=0)
+
+
+class TestStreamingEquityPercentiles:
+    """Tests for histogram-sketch equity percentile bands."""
+
+    @pytest.fixture
+    def gains(self) -> np.ndarray:
+        """Gains array for percentile comparisons."""
+        return np.random.default_rng(21).normal(0.005, 0.03, 250)
+
+    def test_histogram_matches_exact_within_reported_error(self, gains: np.ndarray) -> None:
+        """Histogram bands stay within the reported resolution of the exact bands."""
+        base = dict(num_simulations=2000, seed=5)
+        exact = MonteCarloEngine(
+            MonteCarloConfig(**base, equity_percentile_method="exact")
+        ).run(gains)
+        approx = MonteCarloEngine(
+            MonteCarloConfig(**base, equity_percentile_method="histogram")
+        ).run(gains)
+
+        assert exact.equity_percentiles_error == 0.0
+        assert 0 < approx.equity_percentiles_error < 0.01
+        median = exact.equity_percentiles[:, 2:3]
+        relative_error = np.abs(approx.equity_percentiles - exact.equity_percentiles) / median
+        assert relative_error.max() <= 2 * approx.equity_percentiles_error
+
+    def test_histogram_does_not_change_other_metrics(self, gains: np.ndarray) -> None:
+        """Only the percentile bands depend on the percentile method."""
+        base = dict(num_simulations=500, seed=9)
+        exact = MonteCarloEngine(
+            MonteCarloConfig(**base, equity_percentile_method="exact")
+        ).run(gains)
+        approx = MonteCarloEngine(
+            MonteCarloConfig(**base, equity_percentile_method="histogram")
+        ).run(gains)
+
+        np.testing.assert_array_equal(exact.max_dd_distribution, approx.max_dd_distribution)
+        assert approx.equity_percentiles.shape == (len(gains), 5)
+
+    def test_auto_uses_exact_for_small_runs(self, gains: np.ndarray) -> None:
+        """Auto mode keeps exact percentiles when the curve matrix is small."""
+        engine = MonteCarloEngine(MonteCarloConfig(num_simulations=100))
+        assert not engine._use_percentile_sketch(100, len(gains))
+        assert engine._use_percentile_sketch(50000, 20000)
+
+    def test_invalid_percentile_method(self) -> None:
+        """Validation rejects unknown percentile methods."""
+        with pytest.raises(ValueError, match="equity_percentile_method must be"):
+            MonteCarloConfig(equity_percentile_method="tdigest")
+
+
+class TestConvergenceMode:
+    """Tests for early stopping once target statistics have converged."""
+
+    @pytest.fixture
+    def gains(self) -> np.ndarray:
+        """Gains array with a stable drawdown distribution."""
+        return np.random.default_rng(31).normal(0.004, 0.02, 200)
+
+    def test_loose_tolerance_stops_early(self, gains: np.ndarray) -> None:
+        """A loose tolerance converges well before num_simulations."""
+        config = MonteCarloConfig(
+            num_simulations=20000, seed=3, memory_budget_mb=1.0, convergence_tolerance=0.01
+        )
+        results = MonteCarloEngine(config).run(gains)
+
+        assert results.converged is True
+        assert results.num_simulations_run < 20000
+        assert len(results.max_dd_distribution) == results.num_simulations_run
+        assert set(results.convergence_precision) == set(config.convergence_targets)
+        assert all(w <= 0.01 for w in results.convergence_precision.values())
+
+    def test_tight_tolerance_runs_all_simulations(self, gains: np.ndarray) -> None:
+        """An unreachable tolerance runs every simulation and reports precision."""
+        config = MonteCarloConfig(num_simulations=1000, seed=3, convergence_tolerance=1e-9)
+        results = MonteCarloEngine(config).run(gains)
+
+        assert results.converged is False
+        assert results.num_simulations_run == 1000
+        assert results.convergence_precision["median_max_dd"] > 0
+
+    def test_convergence_off_by_default(self, gains: np.ndarray) -> None:
+        """Without a tolerance every simulation runs and convergence is not reported."""
+        results = MonteCarloEngine(MonteCarloConfig(num_simulations=300)).run(gains)
+
+        assert results.converged is None
+        assert results.convergence_precision == {}
+        assert results.num_simulations_run == 300
+
+    def test_custom_targets(self, gains: np.ndarray) -> None:
+        """Only the configured targets are monitored."""
+        config = MonteCarloConfig(
+            num_simulations=5000,
+            seed=3,
+            memory_budget_mb=1.0,
+            convergence_tolerance=0.02,
+            convergence_targets=("probability_of_profit",),
+        )
+        results = MonteCarloEngine(config).run(gains)
+
+        assert list(results.convergence_precision) == ["probability_of_profit"]
+
+    def test_invalid_convergence_settings(self) -> None:
+        """Validation rejects out-of-range tolerances and unknown targets."""
+        with pytest.raises(ValueError, match="convergence_tolerance must be between"):
+            MonteCarloConfig(convergence_tolerance=0)
+        with pytest.raises(ValueError, match="convergence_targets must be"):
+            MonteCarloConfig(convergence_targets=("mean_sharpe",))
+
+
+class TestBlockResampling:
+    """Tests for block bootstrap and date-grouped resampling modes."""
+
+    @pytest.fixture
+    def streaky_gains(self) -> np.ndarray:
+        """AR(1) gains with strong positive serial correlation."""
+        rng = np.random.default_rng(17)
+        gains = np.zeros(2000)
+        for i in range(1, len(gains)):
+            gains[i] = 0.8 * gains[i - 1] + rng.normal(0, 0.01)
+        return gains
+
+    def test_moving_block_indices_are_consecutive_within_blocks(self) -> None:
+        """Moving blocks are runs of consecutive trade indices."""
+        indices = _moving_block_indices(np.random.default_rng(0), 20, 103, 10)
+
+        assert indices.shape == (20, 103)
+        assert indices.min() >= 0 and indices.max() < 103
+        within_block = np.arange(103) % 10 != 0
+        steps = np.diff(indices, axis=1)[:, within_block[1:]]
+        assert np.all(steps == 1)
+
+    def test_stationary_block_mean_length(self) -> None:
+        """Stationary blocks wrap around and have the requested mean length."""
+        indices = _stationary_block_indices(np.random.default_rng(1), 200, 500, 8)
+
+        assert indices.shape == (200, 500)
+        assert indices.min() >= 0 and indices.max() < 500
+        continues = np.diff(indices, axis=1) % 500 == 1
+        n_blocks = (~continues).sum() + len(indices)
+        assert indices.size / n_blocks == pytest.approx(8, rel=0.1)
+
+    def test_day_group_indices_keep_whole_days(self) -> None:
+        """Date-grouped paths are built from complete days (the last may be cut)."""
+        trade_days = np.repeat(np.arange(30), np.random.default_rng(2).integers(1, 6, 30))
+        indices = _day_group_indices(np.random.default_rng(3), 50, trade_days)
+
+        assert indices.shape == (50, len(trade_days))
+        for row in indices:
+            days = trade_days[row]
+            boundaries = np.flatnonzero(np.diff(days) != 0) + 1
+            segments = np.split(row, boundaries)[:-1]
+            for segment in segments:
+                # The same day drawn twice in a row forms one longer segment
+                day_size = np.sum(trade_days == trade_days[segment[0]])
+                assert len(segment) % day_size == 0
+
+    def test_auto_block_length_tracks_serial_correlation(
+        self, streaky_gains: np.ndarray
+    ) -> None:
+        """Correlated gains get long blocks, independent gains get short ones."""
+        iid_gains = np.random.default_rng(4).normal(0, 0.01, 2000)
+
+        assert _auto_block_length(streaky_gains, "stationary_block") > 5
+        assert _auto_block_length(iid_gains, "stationary_block") <= 3
+
+    def test_block_bootstrap_preserves_streaks(self, streaky_gains: np.ndarray) -> None:
+        """Block modes keep longer streaks than i.i.d. resampling."""
+        streaks = {}
+        for simulation_type in ("resample", "moving_block", "stationary_block"):
+            config = MonteCarloConfig(
+                num_simulations=200, seed=5, simulation_type=simulation_type
+            )
+            results = MonteCarloEngine(config).run(streaky_gains)
+            streaks[simulation_type] = results.mean_max_win_streak
+
+        assert streaks["moving_block"] > 2 * streaks["resample"]
+        assert streaks["stationary_block"] > 2 * streaks["resample"]
+
+    def test_configured_block_length_is_used(self) -> None:
+        """An explicit block length overrides automatic selection."""
+        engine = MonteCarloEngine(
+            MonteCarloConfig(simulation_type="moving_block", block_length=25)
+        )
+        assert engine._resolve_block_length(np.zeros(100)) == 25
+
+    def test_date_grouped_run(self) -> None:
+        """date_grouped runs with trade days and rejects runs without them."""
+        gains = np.random.default_rng(6).normal(0.003, 0.02, 120)
+        trade_days = np.arange(120) // 4
+        engine = MonteCarloEngine(
+            MonteCarloConfig(num_simulations=100, simulation_type="date_grouped")
+        )
+
+        results = engine.run(gains, trade_days=trade_days)
+        assert results.num_trades == 120
+
+        with pytest.raises(ValueError, match="requires a trade day"):
+            engine.run(gains)
+
+    def test_extract_trade_days_from_app_state(self) -> None:
+        """Trade days align with extracted gains and group same-day trades."""
+
+        class Mapping:
+            gain_pct = "gain_pct"
+            date = "date"
+
+        df = pd.DataFrame(
+            {
+                "gain_pct": np.linspace(-0.02, 0.02, 12),
+                "date": ["02/01/2024"] * 4 + ["03/01/2024"] * 4 + ["01/01/2024"] * 4,
+                "trigger_number": [1] * 12,
+            }
+        )
+
+        gains = extract_gains_from_app_state(df, Mapping())
+        trade_days = extract_trade_days_from_app_state(df, Mapping())
+
+        # Both are in chronological order
+        np.testing.assert_array_equal(gains, df["gain_pct"].to_numpy()[[*range(8, 12), *range(8)]])
+        assert trade_days.tolist() == [0] * 4 + [1] * 4 + [2] * 4
+
+    def test_extracted_gains_are_chronological(self) -> None:
+        """Gains are ordered by date and entry time, not file order."""
+
+        class Mapping:
+            gain_pct = "gain_pct"
+            date = "date"
+            time = "time"
+
+        df = pd.DataFrame(
+            {
+                "gain_pct": np.arange(10) / 100,
+                "date": ["02/01/2024"] * 5 + ["01/01/2024"] * 5,
+                "time": ["10:00", "09:30", "11:00", "09:00", "15:00"] * 2,
+            }
+        )
+
+        gains = extract_gains_from_app_state(df, Mapping())
+
+        assert (gains * 100).round().astype(int).tolist() == [8, 6, 5, 7, 9, 3, 1, 0, 2, 4]
+
+    def test_invalid_block_settings(self) -> None:
+        """Validation rejects unknown simulation types and block lengths < 1."""
+        with pytest.raises(ValueError, match="block_length must be at least 1"):
+            MonteCarloConfig(block_length=0)
+        with pytest.raises(ValueError, match="simulation_type must be"):
+            MonteCarloConfig(simulation_type="circular_block")
@@ -204,3 +204,22 @@ def test_run_clicked_applies_date_time_filters(
         
         # first_trigger_enabled should be False (disabled in AppState)
         assert call_kwargs["first_trigger_enabled"] is False
+
+
+def test_expression_note_tracks_filter_expression(qtbot, qapp):
+    """The sidebar notes a Feature Explorer expression the analysis leaves out."""
+    from src.tabs.parameter_sensitivity import ParameterSensitivityTab
+
+    app_state = AppState()
+    tab = ParameterSensitivityTab(app_state)
+    qtbot.addWidget(tab)
+    assert tab._expression_note.isHidden()
+
+    app_state.filter_expression = "gap_pct > 3"
+    app_state.filtered_data_updated.emit(pd.DataFrame())
+    assert not tab._expression_note.isHidden()
+    assert "gap_pct > 3" in tab._expression_note.text()
+
+    app_state.filter_expression = ""
+    app_state.filtered_data_updated.emit(pd.DataFrame())
+    assert tab._expression_note.isHidden()
@@ -0,0 +1,128 @@
+"""Unit tests for PortfolioLoadWorker."""
+
+import pandas as pd
+import pytest
+
+from src.core.cache_manager import CacheManager
+from src.core.portfolio_load_worker import PortfolioLoadWorker, _load_strategy_file
+
+
+@pytest.fixture()
+def strategy_files(tmp_path):
+    """Create one CSV and one Excel strategy file."""
+    csv_path = tmp_path / "alpha.csv"
+    pd.DataFrame({"date": ["2024-01-01", "2024-01-02"], "gain_pct": [1.5, -0.5]}).to_csv(
+        csv_path, index=False
+    )
+    xlsx_path = tmp_path / "beta.xlsx"
+    pd.DataFrame({"date": ["2024-01-03"], "gain_pct": [2.0]}).to_excel(
+        xlsx_path, index=False, sheet_name="Trades"
+    )
+    return csv_path, xlsx_path
+
+
+def _collect(qtbot, worker):
+    """Run a worker and collect its loaded and failed strategies."""
+    loaded: dict[str, pd.DataFrame] = {}
+    failed: dict[str, str] = {}
+    worker.strategy_loaded.connect(lambda name, df: loaded.__setitem__(name, df))
+    worker.strategy_failed.connect(lambda name, msg: failed.__setitem__(name, msg))
+    with qtbot.waitSignal(worker.finished, timeout=60000):
+        worker.start()
+    worker.wait()
+    return loaded, failed
+
+
+class TestLoadStrategyFile:
+    """Tests for the per-file load function."""
+
+    def test_populates_and_reuses_cache(self, strategy_files, tmp_path):
+        csv_path, _ = strategy_files
+        cache_dir = tmp_path / "cache"
+
+        first = _load_strategy_file(str(csv_path), None, str(cache_dir))
+
+        assert CacheManager(cache_dir=cache_dir).is_cache_valid(csv_path)
+        second = _load_strategy_file(str(csv_path), None, str(cache_dir))
+        pd.testing.assert_frame_equal(first, second)
+
+
+class TestPortfolioLoadWorker:
+    """Tests for PortfolioLoadWorker."""
+
+    def test_loads_in_process(self, strategy_files, tmp_path, qtbot):
+        csv_path, xlsx_path = strategy_files
+        worker = PortfolioLoadWorker(
+            [("Alpha", str(csv_path), None), ("Beta", str(xlsx_path), "Trades")],
+            cache_dir=tmp_path / "cache",
+            max_workers=1,
+        )
+
+        loaded, failed = _collect(qtbot, worker)
+
+        assert failed == {}
+        assert len(loaded["Alpha"]) == 2
+        assert loaded["Beta"]["gain_pct"].tolist() == [2.0]
+
+    def test_loads_in_process_pool(self, strategy_files, tmp_path, qtbot):
+        csv_path, xlsx_path = strategy_files
+        worker = PortfolioLoadWorker(
+            [("Alpha", str(csv_path), None), ("Beta", str(xlsx_path), "Trades")],
+            cache_dir=tmp_path / "cache",
+            max_workers=2,
+        )
+        progress: list[tuple[int, int]] = []
+        worker.progress.connect(lambda done, total: progress.append((done, total)))
+
+        loaded, failed = _collect(qtbot, worker)
+
+        assert failed == {}
+        assert set(loaded) == {"Alpha", "Beta"}
+        assert progress[-1] == (2, 2)
+
+    def test_shared_file_loaded_once(self, strategy_files, tmp_path, qtbot):
+        csv_path, _ = strategy_files
+        worker = PortfolioLoadWorker(
+            [("Alpha", str(csv_path), None), ("Alpha copy", str(csv_path), None)],
+            cache_dir=tmp_path / "cache",
+        )
+        progress: list[tuple[int, int]] = []
+        worker.progress.connect(lambda done, total: progress.append((done, total)))
+
+        loaded, _ = _collect(qtbot, worker)
+
+        assert progress[-1] == (1, 1)
+        assert loaded["Alpha"] is not loaded["Alpha copy"]
+        pd.testing.assert_frame_equal(loaded["Alpha"], loaded["Alpha copy"])
+
+    def test_cache_hits_skip_process_pool(self, strategy_files, tmp_path, qtbot, monkeypatch):
+        csv_path, xlsx_path = strategy_files
+        cache_dir = tmp_path / "cache"
+        _load_strategy_file(str(csv_path), None, str(cache_dir))
+        _load_strategy_file(str(xlsx_path), "Trades", str(cache_dir))
+        monkeypatch.setattr(
+            "src.core.portfolio_load_worker.ProcessPoolExecutor",
+            lambda *args, **kwargs: pytest.fail("cache hits must not start a process pool"),
+        )
+        worker = PortfolioLoadWorker(
+            [("Alpha", str(csv_path), None), ("Beta", str(xlsx_path), "Trades")],
+            cache_dir=cache_dir,
+            max_workers=2,
+        )
+
+        loaded, failed = _collect(qtbot, worker)
+
+        assert failed == {}
+        assert loaded["Beta"]["gain_pct"].tolist() == [2.0]
+
+    def test_reports_failed_file(self, tmp_path, qtbot):
+        bad_path = tmp_path / "broken.xlsx"
+        bad_path.write_text("not a workbook")
+        worker = PortfolioLoadWorker(
+            [("Broken", str(bad_path), None)], cache_dir=tmp_path / "cache"
+        )
+
+        loaded, failed = _collect(qtbot, worker)
+
+        assert loaded == {}
+        assert "Broken" in failed
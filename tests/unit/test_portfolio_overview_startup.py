@@ -10,6 +10,8 @@ from src.core.app_state import AppState
 from src.core.portfolio_config_manager import PortfolioConfigManager
 from src.tabs.portfolio_overview import PortfolioOverviewTab
 
+pytestmark = pytest.mark.usefixtures("isolated_cache_dir")
+
 
 @pytest.fixture(scope="module")
 def qapp():
@@ -82,9 +84,9 @@ class TestPortfolioOverviewStartup:
         tab = PortfolioOverviewTab(app_state, config_manager=config_manager)
         qtbot.addWidget(tab)
 
-        # Strategy should be added with data
+        # Strategy row is added straight away, data arrives from the worker
         assert tab._strategy_table.rowCount() == 1
-        assert "ValidStrategy" in tab._strategy_data
+        qtbot.waitUntil(lambda: "ValidStrategy" in tab._strategy_data, timeout=10000)
         assert len(tab._strategy_data["ValidStrategy"]) == 2
 
     def test_cleans_up_config_when_invalid_entries_removed(self, tmp_path, qapp, qtbot):
@@ -126,7 +128,7 @@ class TestPortfolioOverviewStartup:
 
         # Only valid strategy should be loaded
         assert tab._strategy_table.rowCount() == 1
-        assert "ValidStrategy" in tab._strategy_data
+        qtbot.waitUntil(lambda: "ValidStrategy" in tab._strategy_data, timeout=10000)
         assert "MissingFile" not in tab._strategy_data
 
         # Config should be updated (reload and check)
@@ -135,3 +137,74 @@ class TestPortfolioOverviewStartup:
 
         assert len(saved_config["strategies"]) == 1
         assert saved_config["strategies"][0]["name"] == "ValidStrategy"
+
+    def test_drops_strategies_whose_file_fails_to_load(self, tmp_path, qapp, qtbot):
+        """Strategies whose file cannot be parsed are removed once loading fails."""
+        csv_file = tmp_path / "valid.csv"
+        csv_file.write_text("date,gain_pct\n2024-01-01,1.5\n")
+        bad_file = tmp_path / "broken.xlsx"
+        bad_file.write_text("not a workbook")
+
+        config_file = tmp_path / "portfolio_config.json"
+        mapping = {"date_col": "date", "gain_pct_col": "gain_pct"}
+        config_data = {
+            "account_start": 100000,
+            "strategies": [
+                {"name": "ValidStrategy", "file_path": str(csv_file), "column_mapping": mapping},
+                {"name": "Broken", "file_path": str(bad_file), "column_mapping": mapping},
+            ],
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f)
+
+        config_manager = PortfolioConfigManager(config_file)
+        tab = PortfolioOverviewTab(AppState(), config_manager=config_manager)
+        qtbot.addWidget(tab)
+
+        qtbot.waitUntil(lambda: tab._load_worker is None, timeout=30000)
+
+        assert tab._strategy_table.rowCount() == 1
+        assert "ValidStrategy" in tab._strategy_data
+        assert "Broken" not in tab._strategy_data
+
+        with open(config_file) as f:
+            saved_config = json.load(f)
+        assert [s["name"] for s in saved_config["strategies"]] == ["ValidStrategy"]
+
+    def _write_config(self, tmp_path: Path) -> PortfolioConfigManager:
+        csv_file = tmp_path / "valid.csv"
+        csv_file.write_text("date,gain_pct\n2024-01-01,1.5\n")
+        config_file = tmp_path / "portfolio_config.json"
+        mapping = {"date_col": "date", "gain_pct_col": "gain_pct"}
+        config_data = {
+            "account_start": 100000,
+            "strategies": [
+                {"name": "ValidStrategy", "file_path": str(csv_file), "column_mapping": mapping},
+            ],
+        }
+        with open(config_file, "w") as f:
+            json.dump(config_data, f)
+        return PortfolioConfigManager(config_file)
+
+    def test_deleting_loading_strategy_drops_it(self, tmp_path, qapp, qtbot):
+        """A strategy deleted while loading is not stored when its file arrives."""
+        tab = PortfolioOverviewTab(AppState(), config_manager=self._write_config(tmp_path))
+        qtbot.addWidget(tab)
+
+        tab._strategy_table.remove_strategy(0)
+
+        assert tab._loading_names == {}
+        qtbot.waitUntil(lambda: tab._load_worker is None, timeout=30000)
+        assert tab._strategy_data == {}
+
+    def test_cleanup_stops_loader(self, tmp_path, qapp, qtbot):
+        """cleanup() cancels the loader and waits for its thread to exit."""
+        tab = PortfolioOverviewTab(AppState(), config_manager=self._write_config(tmp_path))
+        qtbot.addWidget(tab)
+        worker = tab._load_worker
+
+        tab.cleanup()
+
+        assert worker.isFinished()
+        assert tab._load_worker is None
+        assert tab._loading_names == {}
@@ -0,0 +1,236 @@
+"""Unit tests for StateExporter and the shared Arrow state files."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.core.state_exporter as state_exporter
+from src.core.app_state import AppState
+from src.core.column_store import ColumnStore
+from src.core.models import ColumnMapping, FilterCriteria
+from src.core.state_exporter import StateExporter
+from src.core.state_files import (
+    frame_to_table,
+    read_frame,
+    read_metadata,
+    read_rows,
+    take_rows,
+    write_table,
+)
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Redirect the exporter to a temporary state directory."""
+    directory = tmp_path / "state"
+    monkeypatch.setattr(state_exporter, "STATE_DIR", directory)
+    return directory
+
+
+@pytest.fixture
+def app_state(qtbot):
+    state = AppState()
+    state.baseline_df = pd.DataFrame({
+        "ticker": ["A", "B", "C", "D"],
+        "gain_pct": [0.1, np.nan, -0.2, 0.3],
+        "mixed": [1, "x", None, 2.5],
+    })
+    state.column_mapping = ColumnMapping(
+        ticker="ticker", date="date", time="time",
+        gain_pct="gain_pct", mae_pct="mae_pct", mfe_pct="mfe_pct",
+    )
+    return state
+
+
+def _read_meta(state_dir):
+    return json.loads((state_dir / "gui_state.json").read_text(encoding="utf-8"))
+
+
+class TestStateFiles:
+    """Tests for Arrow IPC state file helpers."""
+
+    def test_frame_round_trip_keeps_nan_and_stringifies_mixed(self, tmp_path, app_state):
+        path = tmp_path / "frame.arrow"
+        write_table(frame_to_table(app_state.baseline_df), path)
+
+        df = read_frame(path)
+
+        assert df["gain_pct"].isna().tolist() == [False, True, False, False]
+        assert df["mixed"].tolist() == ["1", "x", "None", "2.5"]
+        assert not path.with_name("frame.arrow.tmp").exists()
+
+    def test_take_rows_keeps_view_order(self, app_state):
+        df = take_rows(app_state.baseline_df, np.array([3, 0], dtype=np.int32))
+
+        assert df["ticker"].tolist() == ["D", "A"]
+        assert df.index.tolist() == [0, 1]
+
+
+class TestStateExporter:
+    """Tests for StateExporter."""
+
+    def test_filter_change_writes_rows_not_baseline(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        exporter._export()
+        baseline_file = _read_meta(state_dir)["baseline_file"]
+
+        app_state.filtered_df = app_state.baseline_df.iloc[[2, 0]]
+        exporter._export()
+        meta = _read_meta(state_dir)
+
+        assert meta["baseline_file"] == baseline_file
+        assert meta["filtered"]["kind"] == "rows"
+        assert read_rows(state_dir / meta["filtered"]["file"]).tolist() == [2, 0]
+
+    def test_selection_records_baseline_version_and_filters(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filters = [
+            FilterCriteria(column="gain_pct", operator="between", min_val=0, max_val=1)
+        ]
+        app_state.filtered_df = app_state.baseline_df.iloc[[0, 3]]
+        exporter._export()
+        meta = _read_meta(state_dir)
+
+        metadata = read_metadata(state_dir / meta["filtered"]["file"])
+
+        assert metadata["baseline_file"] == meta["baseline_file"]
+        assert metadata["version"] == str(meta["filtered"]["version"])
+        assert json.loads(metadata["filters"])[0]["column"] == "gain_pct"
+
+    def test_filter_expression_recorded(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filtered_df = app_state.baseline_df.iloc[[0, 3]]
+        exporter._export()
+        first = _read_meta(state_dir)["filtered"]
+
+        # Same rows, different expression: the selection describes a new view
+        app_state.filter_expression = "gain_pct > 0"
+        exporter._export()
+        meta = _read_meta(state_dir)
+
+        metadata = read_metadata(state_dir / meta["filtered"]["file"])
+
+        assert meta["filter_expression"] == "gain_pct > 0"
+        assert metadata["filter_expression"] == "gain_pct > 0"
+        assert meta["filtered"]["version"] == first["version"] + 1
+
+    def test_internal_columns_not_exported(self, state_dir, app_state):
+        app_state.baseline_df["_trigger_group"] = [0, 1, 2, 3]
+        exporter = StateExporter(app_state)
+        exporter._export()
+        meta = _read_meta(state_dir)
+
+        baseline = read_frame(state_dir / meta["baseline_file"])
+
+        assert baseline.columns.tolist() == ["ticker", "gain_pct", "mixed"]
+
+    def test_columns_left_on_disk_are_exported(self, state_dir, app_state, tmp_path):
+        full = app_state.baseline_df.assign(feature_a=[1.0, 2.0, 3.0, 4.0])
+        path = tmp_path / "data.parquet"
+        full.drop(columns="mixed").to_parquet(path, index=False)
+        app_state.column_store = ColumnStore(path)
+        exporter = StateExporter(app_state)
+        exporter._export()
+        meta = _read_meta(state_dir)
+
+        baseline = read_frame(state_dir / meta["baseline_file"])
+
+        assert baseline["feature_a"].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+    def test_unchanged_selection_not_rewritten(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filtered_df = app_state.baseline_df.iloc[[1, 2]]
+        exporter._export()
+        first = _read_meta(state_dir)["filtered"]
+
+        # Metrics-only update: same rows, same filters
+        app_state.filtered_df = app_state.baseline_df.iloc[[1, 2]]
+        exporter._export()
+        second = _read_meta(state_dir)["filtered"]
+
+        app_state.filtered_df = app_state.baseline_df.iloc[[1]]
+        exporter._export()
+        third = _read_meta(state_dir)["filtered"]
+
+        assert second == first
+        assert third["version"] == first["version"] + 1
+        assert not (state_dir / first["file"]).exists()
+
+    def test_reload_rewrites_baseline_and_removes_old_file(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        exporter._export()
+        old_file = _read_meta(state_dir)["baseline_file"]
+
+        app_state.baseline_df = app_state.baseline_df.iloc[:2].copy()
+        exporter._schedule_baseline()
+        exporter._export()
+        new_file = _read_meta(state_dir)["baseline_file"]
+
+        assert new_file != old_file
+        assert not (state_dir / old_file).exists()
+        assert len(read_frame(state_dir / new_file)) == 2
+
+    def test_non_subset_filtered_written_as_frame(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filtered_df = app_state.baseline_df.reset_index(drop=True).iloc[:2].copy()
+        app_state.filtered_df["extra"] = 1.0
+        exporter._export()
+
+        filtered = _read_meta(state_dir)["filtered"]
+
+        assert filtered["kind"] == "frame"
+        assert "extra" in read_frame(state_dir / filtered["file"]).columns
+
+    def test_cleanup_removes_all_files(self, state_dir, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filtered_df = app_state.baseline_df.iloc[[1]]
+        exporter._export()
+
+        exporter.cleanup()
+
+        assert not state_dir.exists()
+
+
+class TestSyncFromGui:
+    """Tests for lumen_sync_from_gui reading the exported state."""
+
+    @pytest.fixture
+    def server(self, state_dir, monkeypatch):
+        import mcp_server.server as server
+
+        monkeypatch.setattr(server, "_get_gui_state_dir", lambda: state_dir)
+        monkeypatch.setattr(server, "_datasets", {})
+        monkeypatch.setattr(server, "_gui_synced_files", {})
+        return server
+
+    def _sync(self, server):
+        import asyncio
+
+        return json.loads(asyncio.run(server.lumen_sync_from_gui(server.SyncFromGuiInput())))
+
+    def test_rebuilds_filtered_from_baseline_rows(self, server, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filtered_df = app_state.baseline_df.iloc[[3, 1]]
+        exporter._export()
+
+        result = self._sync(server)
+
+        assert [entry["reused"] for entry in result["synced"]] == [False, False]
+        assert server._datasets["gui_filtered"].df["ticker"].tolist() == ["D", "B"]
+
+    def test_reuses_loaded_baseline_when_only_filter_changes(self, server, app_state):
+        exporter = StateExporter(app_state)
+        app_state.filtered_df = app_state.baseline_df.iloc[[0]]
+        exporter._export()
+        self._sync(server)
+        baseline = server._datasets["gui_baseline"].df
+
+        app_state.filtered_df = app_state.baseline_df.iloc[[2, 3]]
+        exporter._export()
+        result = self._sync(server)
+
+        assert result["synced"][0]["reused"] is True
+        assert server._datasets["gui_baseline"].df is baseline
+        assert server._datasets["gui_filtered"].df["ticker"].tolist() == ["C", "D"]
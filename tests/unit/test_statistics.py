@@ -1,20 +1,24 @@
 """Unit tests for statistics calculations."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.core.models import AdjustmentParams, ColumnMapping
 from src.core.statistics import (
+    OFFSET_SWEEP_LEVELS,
     _calculate_offset_level_row,
     _calculate_stop_level_row,
     calculate_loss_chance_table,
     calculate_mae_before_win,
     calculate_mfe_before_loss,
+    calculate_offset_scenario_grid,
     calculate_offset_table,
     calculate_partial_cover_table,
     calculate_profit_chance_table,
     calculate_scaling_table,
     calculate_stop_loss_table,
+    calculate_stop_scenario_grid,
 )
 
 
@@ -2352,3 +2356,171 @@ def test_calculate_time_stop_table():
     assert "Blended Win %" in result.columns
     assert "Full Hold Win %" in result.columns
     assert "Blended EV %" in result.columns
+
+
+# =============================================================================
+# Tests for the stop loss scenario grid
+# =============================================================================
+
+
+def _random_stop_frame(num_trades: int, seed: int = 0) -> pd.DataFrame:
+    """Random trades with day-first date strings, including same-day ties."""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2023-01-01", periods=num_trades // 3 + 1, freq="D")
+    return pd.DataFrame({
+        "gain_pct": rng.normal(0.02, 0.15, num_trades),
+        "mae_pct": np.abs(rng.normal(15.0, 20.0, num_trades)),
+        "date": days.strftime("%d/%m/%Y").to_numpy()[
+            rng.integers(0, len(days), num_trades)
+        ],
+    })
+
+
+def test_stop_scenario_grid_matches_kelly_curve_per_level():
+    """Grid rows match a chronological Kelly curve built level by level."""
+    from src.core.equity import EquityCalculator
+
+    df = _random_stop_frame(400, seed=5)
+    adjusted = AdjustmentParams(stop_loss=30, efficiency=5).calculate_adjusted_gains(
+        df, "gain_pct", "mae_pct"
+    )
+    levels = [5, 12.5, 30, 100]
+
+    rows = calculate_stop_scenario_grid(
+        df, adjusted, "mae_pct", levels, 5.0,
+        start_capital=100000.0, fractional_kelly_pct=25.0, date_col="date",
+    )
+
+    assert [row["Stop %"] for row in rows] == levels
+    for stop_level, row in zip(levels, rows, strict=True):
+        returns = adjusted.where(df["mae_pct"] <= stop_level, -(stop_level + 5.0) / 100)
+        assert row["Win %"] == pytest.approx((returns > 0).mean() * 100)
+        assert row["Median Gain %"] == pytest.approx(returns.median() * 100)
+        assert row["Max Loss %"] == pytest.approx((df["mae_pct"] > stop_level).mean() * 100)
+
+        if row["Full Kelly (Stop Adj)"] is None:
+            assert row["Total Kelly $"] is None
+            continue
+        kelly_df = df.assign(_gains_pct=returns * 100)
+        expected = EquityCalculator().calculate_kelly_metrics(
+            kelly_df, "_gains_pct", 100000.0, 25.0,
+            row["Full Kelly (Stop Adj)"], date_col="date",
+        )
+        assert row["Total Kelly $"] == pytest.approx(expected["pnl"])
+        assert row["Max DD %"] == pytest.approx(expected["max_dd_pct"])
+
+
+def test_stop_scenario_grid_fine_grid_matches_single_rows(monkeypatch):
+    """Chunked fine-grained grids equal the single-level rows."""
+    import src.core.statistics as statistics
+
+    # Force several level chunks on a small frame
+    monkeypatch.setattr(statistics, "_SCENARIO_GRID_MAX_CELLS", 500)
+    df = _random_stop_frame(200, seed=9)
+    adjusted = AdjustmentParams(stop_loss=40, efficiency=2).calculate_adjusted_gains(
+        df, "gain_pct", "mae_pct"
+    )
+    levels = list(range(1, 101))
+
+    rows = calculate_stop_scenario_grid(
+        df, adjusted, "mae_pct", levels, 2.0, start_capital=50000.0, date_col="date"
+    )
+
+    assert len(rows) == 100
+    for stop_level in (1, 37, 100):
+        single = _calculate_stop_level_row(
+            df, adjusted, "mae_pct", stop_level, 2.0, start_capital=50000.0, date_col="date"
+        )
+        assert rows[stop_level - 1] == single
+
+
+def test_stop_scenario_grid_rejects_non_positive_levels():
+    """A zero stop level has no defined stop-adjusted Kelly."""
+    df = _random_stop_frame(10)
+    with pytest.raises(ValueError, match="positive"):
+        calculate_stop_scenario_grid(df, df["gain_pct"], "mae_pct", [0, 10], 5.0)
+
+
+# =============================================================================
+# Tests for the entry offset scenario grid
+# =============================================================================
+
+
+def _random_offset_frame(num_trades: int, seed: int = 0) -> pd.DataFrame:
+    """Random trades with MFE for offset qualification."""
+    df = _random_stop_frame(num_trades, seed=seed)
+    df["mfe_pct"] = np.abs(np.random.default_rng(seed + 1).normal(15.0, 15.0, num_trades))
+    return df
+
+
+def test_offset_scenario_grid_matches_qualifying_kelly_curve():
+    """Zero-return padding for non-qualifying trades keeps Kelly metrics exact."""
+    from src.core.equity import EquityCalculator
+
+    df = _random_offset_frame(400, seed=4)
+    params = AdjustmentParams(stop_loss=30, efficiency=5)
+    offsets = [-10, 0, 7.5, 20]
+
+    rows = calculate_offset_scenario_grid(
+        df, "gain_pct", "mae_pct", "mfe_pct", offsets, params,
+        start_capital=100000.0, date_col="date",
+    )
+
+    for offset, row in zip(offsets, rows, strict=True):
+        assert row["Offset %"] == offset
+        qualifying = df["mfe_pct"] >= abs(offset) if offset < 0 else df["mae_pct"] >= offset
+        assert row["# of Trades"] == qualifying.sum()
+        if row["Total Kelly $"] is None:
+            continue
+
+        # Rebuild the returns of the qualifying trades only
+        qualified = df[qualifying]
+        new_entry = 1 + offset / 100
+        new_mae = ((1 + qualified["mae_pct"] / 100) - new_entry) / new_entry * 100
+        returns = (new_entry - (1 - qualified["gain_pct"])) / new_entry * 100
+        returns = returns.where(new_mae <= 30, -30.0).clip(lower=-30.0) - 5.0
+        assert row["Total Gain %"] == pytest.approx(returns.sum())
+
+        win_rate = (returns > 0).mean()
+        profit_ratio = returns[returns > 0].mean() / abs(returns[returns < 0].mean())
+        full_kelly = ((profit_ratio + 1) * win_rate - 1) / profit_ratio / 0.30 * 100
+        expected = EquityCalculator().calculate_kelly_metrics(
+            qualified.assign(_gains_pct=returns), "_gains_pct", 100000.0, 25.0,
+            full_kelly, date_col="date",
+        )
+        assert row["Total Kelly $"] == pytest.approx(expected["pnl"])
+        assert row["Max DD %"] == pytest.approx(expected["max_dd_pct"])
+
+
+def test_offset_table_sweep_levels(sample_mapping):
+    """Offset table accepts the fine-grained sweep and keeps default levels."""
+    df = _random_offset_frame(300, seed=8)
+    params = AdjustmentParams(stop_loss=40, efficiency=2)
+
+    sweep = calculate_offset_table(
+        df, sample_mapping, params, start_capital=10000.0, offsets=OFFSET_SWEEP_LEVELS
+    )
+
+    assert len(sweep) == 161
+    assert sweep["Offset %"].iloc[0] == -30.0
+    assert sweep["Offset %"].iloc[-1] == 50.0
+    for offset in (-20, 0, 40):
+        single = _calculate_offset_level_row(
+            df, "gain_pct", "mae_pct", "mfe_pct", offset, params,
+            start_capital=10000.0, date_col="date",
+        )
+        row = sweep[sweep["Offset %"] == offset].iloc[0].to_dict()
+        for key, value in single.items():
+            if value is None:
+                assert pd.isna(row[key])
+            else:
+                assert row[key] == pytest.approx(value)
+
+
+def test_offset_scenario_grid_rejects_invalid_offsets():
+    """Offsets at or below -100% have no entry price."""
+    df = _random_offset_frame(10)
+    with pytest.raises(ValueError, match="-100"):
+        calculate_offset_scenario_grid(
+            df, "gain_pct", "mae_pct", "mfe_pct", [-100], AdjustmentParams()
+        )
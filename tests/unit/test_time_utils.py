@@ -0,0 +1,115 @@
+"""Unit tests for vectorized time-of-day normalization."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.core.filter_engine import FilterEngine
+from src.core.time_utils import TIME_MINUTES_COLUMN, time_bound_to_minutes, time_to_minutes
+
+
+class TestTimeToMinutes:
+    """Tests for formats not covered by the filter engine tests."""
+
+    def test_datetime64_uses_time_of_day(self):
+        series = pd.Series(pd.to_datetime(["2024-01-02 09:30:00", None, "2024-01-03 16:00:30"]))
+
+        result = time_to_minutes(series)
+
+        assert result.iloc[0] == 570.0
+        assert pd.isna(result.iloc[1])
+        assert result.iloc[2] == 960.5
+
+    def test_datetime_objects(self):
+        series = pd.Series([datetime(2024, 1, 2, 9, 30), datetime(2024, 1, 2, 10, 15)])
+
+        assert time_to_minutes(series).tolist() == [570.0, 615.0]
+
+    def test_float_hhmmss_with_missing_values(self):
+        series = pd.Series([93000.0, np.nan, 144530.0])
+
+        result = time_to_minutes(series)
+
+        assert result.iloc[0] == 570.0
+        assert pd.isna(result.iloc[1])
+        assert result.iloc[2] == 885.5
+
+    def test_excel_serial_rounded_to_seconds(self):
+        series = pd.Series([0.666667, 0.395833])
+
+        assert time_to_minutes(series).tolist() == [960.0, 570.0]
+
+    def test_digit_strings_and_unparseable_values(self):
+        series = pd.Series(["093000", "", "not a time", "9:05"])
+
+        result = time_to_minutes(series)
+
+        assert result.iloc[0] == 570.0
+        assert result.iloc[1:3].isna().all()
+        assert result.iloc[3] == 545.0
+
+    def test_datetime_strings(self):
+        series = pd.Series(["2024-01-02 09:30:00", "2024-01-03 16:00:30", None])
+
+        result = time_to_minutes(series)
+
+        assert result.iloc[:2].tolist() == [570.0, 960.5]
+        assert pd.isna(result.iloc[2])
+
+    def test_am_pm_strings(self):
+        series = pd.Series(["9:30 AM", "1:15 PM", "12:00 AM"])
+
+        assert time_to_minutes(series).tolist() == [570.0, 795.0, 0.0]
+
+    def test_keeps_index_and_name(self):
+        series = pd.Series(["09:30:00", "10:00:00"], index=[7, 3], name="time")
+
+        result = time_to_minutes(series)
+
+        assert result.index.tolist() == [7, 3]
+        assert result.name == "time"
+
+
+class TestTimeBoundToMinutes:
+    """Tests for time_bound_to_minutes."""
+
+    def test_string_and_time_bounds(self):
+        assert time_bound_to_minutes("09:30:30") == 570.5
+        assert time_bound_to_minutes(datetime(2024, 1, 1, 16, 0).time()) == 960.0
+
+
+class TestApplyTimeRangeMinutesColumn:
+    """Tests for filtering on a precomputed minutes column."""
+
+    def test_uses_minutes_column_when_present(self):
+        df = pd.DataFrame({
+            "time": ["ignored", "ignored", "ignored"],
+            TIME_MINUTES_COLUMN: [540.0, 600.0, np.nan],
+        })
+
+        result = FilterEngine.apply_time_range(
+            df, "time", "09:30:00", "10:30:00", minutes_col=TIME_MINUTES_COLUMN
+        )
+
+        assert result.index.tolist() == [1]
+
+    def test_falls_back_to_time_column(self):
+        df = pd.DataFrame({"time": ["09:00:00", "10:00:00"]})
+
+        result = FilterEngine.apply_time_range(
+            df, "time", "09:30:00", None, minutes_col=TIME_MINUTES_COLUMN
+        )
+
+        assert result["time"].tolist() == ["10:00:00"]
+
+    def test_datetime_and_am_pm_strings(self):
+        for times in (
+            ["2024-01-02 09:00:00", "2024-01-02 09:45:00", "2024-01-02 11:00:00"],
+            ["9:00 AM", "9:45 AM", "11:00 AM"],
+        ):
+            df = pd.DataFrame({"time": times})
+
+            result = FilterEngine.apply_time_range(df, "time", "09:30:00", "10:30:00")
+
+            assert result["time"].tolist() == [times[1]]
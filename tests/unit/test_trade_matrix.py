@@ -0,0 +1,249 @@
+"""Unit tests for the TradeMatrix columnar view."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.models import AdjustmentParams, ColumnMapping
+from src.core.statistics import (
+    OFFSET_SWEEP_LEVELS,
+    calculate_offset_table,
+    calculate_stop_loss_table,
+)
+from src.core.trade_matrix import TradeMatrix
+
+
+@pytest.fixture
+def mapping():
+    """Column mapping matching the sample frames below."""
+    return ColumnMapping(
+        ticker="ticker",
+        date="date",
+        time="time",
+        gain_pct="gain_pct",
+        mae_pct="mae_pct",
+        mfe_pct="mfe_pct",
+    )
+
+
+@pytest.fixture
+def trades():
+    """Small mapped frame with a non-default index and an unparseable date."""
+    return pd.DataFrame(
+        {
+            "ticker": ["AAA", "BBB", "CCC", "DDD", "EEE"],
+            "date": ["02/01/2024", "01/01/2024", "not a date", "01/01/2024", "03/01/2024"],
+            "time": ["09:45:00", "10:30:00", "09:30:00", "09:31:00", "09:30:00"],
+            "gain_pct": [0.05, -0.02, "n/a", 0.10, -0.08],
+            "mae_pct": [3.0, 12.0, 5.0, 1.0, 40.0],
+            "mfe_pct": [8.0, 2.0, 4.0, 15.0, 1.0],
+            "change_10_min": [0.01, -0.01, 0.0, 0.02, -0.03],
+            "volume": [100, 200, 300, 400, 500],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+
+def _random_frame(num_trades: int, seed: int = 0) -> pd.DataFrame:
+    """Random trades with day-first dates (no time column, so ties keep file order)."""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2023-01-01", periods=num_trades // 3 + 1, freq="D")
+    return pd.DataFrame({
+        "ticker": "TST",
+        "date": days.strftime("%d/%m/%Y").to_numpy()[rng.integers(0, len(days), num_trades)],
+        "gain_pct": rng.normal(0.02, 0.15, num_trades),
+        "mae_pct": np.abs(rng.normal(15.0, 20.0, num_trades)),
+        "mfe_pct": np.abs(rng.normal(15.0, 15.0, num_trades)),
+    })
+
+
+class TestFromFrame:
+    """Tests for TradeMatrix.from_frame."""
+
+    def test_numeric_columns_are_float_arrays(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+
+        assert len(matrix) == 5
+        assert matrix.index.equals(trades.index)
+        assert matrix.gain.dtype == np.float64
+        assert matrix.gain.flags.c_contiguous
+        assert np.isnan(matrix.gain[2])
+        np.testing.assert_array_equal(matrix.mae, [3.0, 12.0, 5.0, 1.0, 40.0])
+        np.testing.assert_array_equal(matrix.changes[10], trades["change_10_min"])
+
+    def test_date_key_includes_time_and_sorts_nat_last(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+
+        assert matrix.dates[0] == np.datetime64("2024-01-02T09:45")
+        assert np.isnat(matrix.dates[2])
+        # 01/01 09:31 before 01/01 10:30, unparseable date last
+        np.testing.assert_array_equal(matrix.order, [3, 1, 0, 4, 2])
+
+    def test_missing_mapped_column_is_nan(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades.drop(columns=["mfe_pct", "time"]), mapping)
+
+        assert np.isnan(matrix.mfe).all()
+        assert np.isnan(matrix.time_minutes).all()
+
+    def test_empty_frame(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades.iloc[:0], mapping)
+
+        assert len(matrix) == 0
+        assert len(matrix.order) == 0
+
+
+class TestAdjustedGains:
+    """Tests for TradeMatrix.adjusted_gains."""
+
+    def test_matches_adjustment_params(self, mapping):
+        df = _random_frame(300, seed=1)
+        df.loc[5, "gain_pct"] = np.nan
+        matrix = TradeMatrix.from_frame(df, mapping)
+        params = AdjustmentParams(stop_loss=20, efficiency=5)
+
+        expected = params.calculate_adjusted_gains(df, "gain_pct", "mae_pct")
+
+        np.testing.assert_allclose(matrix.adjusted_gains(params), expected.to_numpy())
+
+
+class TestSelection:
+    """Tests for select, take and lazy features."""
+
+    def test_select_same_index_returns_self(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+
+        assert matrix.select(trades.index) is matrix
+
+    def test_select_filtered_rows(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+        filtered = trades.loc[[14, 10, 13]]
+
+        subset = matrix.select(filtered.index)
+
+        assert subset.index.equals(filtered.index)
+        np.testing.assert_array_equal(subset.mae, [40.0, 3.0, 1.0])
+        np.testing.assert_array_equal(subset.order, [2, 1, 0])
+        np.testing.assert_array_equal(subset.changes[10], [-0.03, 0.01, 0.02])
+
+    def test_select_unknown_label_raises(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+
+        with pytest.raises(KeyError):
+            matrix.select(pd.Index([10, 99]))
+
+    def test_select_rejects_reset_labels(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades.reset_index(drop=True), mapping)
+        filtered = trades.loc[[13, 14]].reset_index(drop=True)
+
+        with pytest.raises(KeyError):
+            matrix.select(filtered.index, filtered["gain_pct"])
+
+    def test_select_checks_gains(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+        filtered = trades.loc[[12, 13]]
+
+        subset = matrix.select(filtered.index, filtered["gain_pct"])
+
+        np.testing.assert_array_equal(subset.mae, [5.0, 1.0])
+
+    def test_feature_is_lazy_and_cached(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+        subset = matrix.take(np.array([4, 0]))
+
+        np.testing.assert_array_equal(subset.feature("volume"), [500.0, 100.0])
+        assert "volume" in matrix._features
+        assert subset.feature("volume") is subset.feature("volume")
+
+    def test_feature_unknown_column_raises(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+
+        with pytest.raises(KeyError):
+            matrix.feature("missing")
+
+    def test_feature_block_is_column_major(self, trades, mapping):
+        matrix = TradeMatrix.from_frame(trades, mapping)
+
+        block = matrix.feature_block(["volume", "mae_pct"])
+
+        assert block.shape == (5, 2)
+        assert block.flags.f_contiguous
+        np.testing.assert_array_equal(block[:, 0], trades["volume"])
+
+
+class TestScenarioTables:
+    """The matrix path produces the same scenario tables as the DataFrame path."""
+
+    def test_stop_loss_table_matches_dataframe_path(self, mapping):
+        df = _random_frame(500, seed=2)
+        params = AdjustmentParams(stop_loss=30, efficiency=5)
+        subset = df[df["mae_pct"] < 60]
+        matrix = TradeMatrix.from_frame(df, mapping).select(subset.index)
+
+        expected = calculate_stop_loss_table(subset, mapping, params, start_capital=100000.0)
+        result = calculate_stop_loss_table(
+            subset, mapping, params, start_capital=100000.0, matrix=matrix
+        )
+
+        pd.testing.assert_frame_equal(result, expected, rtol=1e-9)
+
+    def test_offset_table_matches_dataframe_path(self, mapping):
+        df = _random_frame(500, seed=3)
+        params = AdjustmentParams(stop_loss=30, efficiency=5)
+        matrix = TradeMatrix.from_frame(df, mapping)
+
+        expected = calculate_offset_table(
+            df, mapping, params, start_capital=100000.0, offsets=OFFSET_SWEEP_LEVELS
+        )
+        result = calculate_offset_table(
+            df, mapping, params, start_capital=100000.0,
+            offsets=OFFSET_SWEEP_LEVELS, matrix=matrix,
+        )
+
+        pd.testing.assert_frame_equal(result, expected, rtol=1e-9)
+
+    def test_same_day_trades_ordered_by_time_in_both_paths(self, mapping):
+        df = _random_frame(500, seed=5)
+        rng = np.random.default_rng(5)
+        df["time"] = [
+            f"{h:02d}:{m:02d}:00"
+            for h, m in zip(rng.integers(9, 16, len(df)), rng.integers(0, 60, len(df)), strict=True)
+        ]
+        params = AdjustmentParams(stop_loss=30, efficiency=5)
+        matrix = TradeMatrix.from_frame(df, mapping)
+
+        expected_stops = calculate_stop_loss_table(df, mapping, params, start_capital=100000.0)
+        expected_offsets = calculate_offset_table(df, mapping, params, start_capital=100000.0)
+
+        pd.testing.assert_frame_equal(
+            calculate_stop_loss_table(
+                df, mapping, params, start_capital=100000.0, matrix=matrix
+            ),
+            expected_stops,
+            rtol=1e-9,
+        )
+        pd.testing.assert_frame_equal(
+            calculate_offset_table(df, mapping, params, start_capital=100000.0, matrix=matrix),
+            expected_offsets,
+            rtol=1e-9,
+        )
+
+    def test_metrics_calculator_scenarios_match_dataframe_path(self, mapping):
+        from src.core.metrics import MetricsCalculator
+
+        df = _random_frame(300, seed=4)
+        params = AdjustmentParams(stop_loss=30, efficiency=5)
+        matrix = TradeMatrix.from_frame(df, mapping)
+        calculator = MetricsCalculator()
+
+        expected = calculator.calculate_stop_scenarios(
+            df, mapping, params, start_capital=100000.0
+        )
+        result = calculator.calculate_stop_scenarios(
+            df, mapping, params, start_capital=100000.0, matrix=matrix
+        )
+
+        assert len(result) == len(expected)
+        for got, want in zip(result, expected, strict=True):
+            assert got.num_trades == want.num_trades
+            assert got.win_pct == pytest.approx(want.win_pct)
+            assert got.kelly_pnl == pytest.approx(want.kelly_pnl)
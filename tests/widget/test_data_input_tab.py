@@ -1,6 +1,7 @@
 """Widget tests for DataInputTab."""
 
 import pandas as pd
+import pytest
 from PyQt6.QtWidgets import QComboBox, QLineEdit, QPushButton
 from pytestqt.qtbot import QtBot
 
@@ -106,6 +107,7 @@ class TestDataInputTabAdjustmentPanel:
         assert tab._pending_adjustment_params is None
 
 
+@pytest.mark.usefixtures("isolated_cache_dir")
 class TestBaselineMetricsFirstTriggersIntegration:
     """Integration tests verifying baseline metrics use first triggers only."""
 
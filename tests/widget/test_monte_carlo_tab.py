@@ -266,6 +266,23 @@ class TestMonteCarloConfigPanel:
         assert result.var_confidence_pct == 10
         assert result.simulation_type == "reshuffle"
 
+    def test_resampling_unit_and_block_length(self, qtbot):
+        """Block and trading-day modes are selectable and round-trip."""
+        panel = MonteCarloConfigPanel()
+        qtbot.addWidget(panel)
+
+        panel.set_config(MonteCarloConfig(simulation_type="stationary_block", block_length=8))
+        config = panel.get_config()
+        assert config.simulation_type == "stationary_block"
+        assert config.block_length == 8
+
+        panel._unit_combo.setCurrentIndex(panel._unit_combo.findData("date_grouped"))
+        assert panel.get_config().simulation_type == "date_grouped"
+
+        panel.set_config(MonteCarloConfig(simulation_type="reshuffle"))
+        assert panel.get_config().simulation_type == "reshuffle"
+        assert not panel._unit_combo.isEnabled()
+
     def test_custom_position_button_exists(self, qtbot):
         """Test that Custom % button exists in position sizing section."""
         panel = MonteCarloConfigPanel()